@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Compare scalar interval helpers with the IntervalSet engine.
+
+Run from apps/api:
+  PYTHONPATH=src .venv/bin/python scripts/benchmark_interval_set.py \
+    [--segments 50000] [--removed-ratio 0.3] [--seed 31]
+
+Builds a synthetic review timeline (back-to-back segments with gaps and a
+share of removed ranges), then times the per-segment ``any()`` overlap scan
+and merge/invert used before IntervalSet against the vectorized equivalents
+and checks both produce the same keep ranges and segment states.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from eogum.services.interval_set import IntervalSet  # noqa: E402
+
+
+def _scalar_merge(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    valid_ranges = sorted((start, end) for start, end in ranges if end > start)
+    merged: list[tuple[int, int]] = []
+    for start, end in valid_ranges:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _scalar_invert(removed: list[tuple[int, int]], total_ms: int) -> list[tuple[int, int]]:
+    keep: list[tuple[int, int]] = []
+    cursor = 0
+    for start, end in removed:
+        start, end = max(0, min(start, total_ms)), max(0, min(end, total_ms))
+        if end <= start:
+            continue
+        if start > cursor:
+            keep.append((cursor, start))
+        cursor = max(cursor, end)
+    if cursor < total_ms:
+        keep.append((cursor, total_ms))
+    return keep
+
+
+def _timeline(segment_count: int, removed_ratio: float, seed: int):
+    rng = random.Random(seed)
+    segments: list[tuple[int, int]] = []
+    removed: list[tuple[int, int]] = []
+    cursor = 0
+    for _ in range(segment_count):
+        start = cursor + rng.randrange(0, 400)
+        end = start + rng.randrange(300, 6000)
+        segments.append((start, end))
+        if rng.random() < removed_ratio:
+            removed.append((start + rng.randrange(0, 200), end + rng.randrange(-200, 200)))
+        cursor = end
+    return segments, removed, cursor
+
+
+def _scalar(segments, removed, total_ms):
+    merged = _scalar_merge(removed)
+    states = [
+        any(start < range_end and range_start < end for range_start, range_end in merged)
+        for start, end in segments
+    ]
+    return states, _scalar_invert(merged, total_ms)
+
+
+def _vectorized(segments, removed, total_ms):
+    removed_set = IntervalSet.from_ranges(removed)
+    states = removed_set.overlaps([start for start, _end in segments], [end for _start, end in segments]).tolist()
+    return states, removed_set.invert(0, total_ms).to_list()
+
+
+def _time(function, *args) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - started, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs IntervalSet timeline interval algebra.")
+    parser.add_argument("--segments", type=int, default=50_000)
+    parser.add_argument("--removed-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=31)
+    args = parser.parse_args()
+
+    segments, removed, total_ms = _timeline(args.segments, args.removed_ratio, args.seed)
+    scalar_seconds, scalar_result = _time(_scalar, segments, removed, total_ms)
+    vector_seconds, vector_result = _time(_vectorized, segments, removed, total_ms)
+    if scalar_result != vector_result:
+        raise SystemExit("IntervalSet result differs from the scalar helpers")
+
+    print(json.dumps(
+        {
+            "segments": len(segments),
+            "removed_ranges": len(removed),
+            "scalar_seconds": round(scalar_seconds, 3),
+            "interval_set_seconds": round(vector_seconds, 4),
+            "speedup": round(scalar_seconds / max(vector_seconds, 1e-9), 1),
+        },
+        indent=2,
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
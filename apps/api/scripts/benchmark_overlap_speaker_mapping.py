@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Show how overlap speaker mapping scales with segments and intervals.
+
+Run from apps/api:
+  PYTHONPATH=src .venv/bin/python scripts/benchmark_overlap_speaker_mapping.py \
+    [--segments 10000] [--intervals 10000] [--seed 32]
+
+Builds a synthetic multi-speaker podcast (back-to-back segments, some of
+them merged "mixed" overlap segments, plus a few very long segments) and
+times enrich_overlap_speaker_mapping against the previous per-interval scan
+over every segment at several sizes up to the requested one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from eogum.services import overlap_speaker_mapping  # noqa: E402
+
+
+def _fixture(segment_count: int, interval_count: int, seed: int) -> tuple[dict, dict]:
+    rng = random.Random(seed)
+    segments = []
+    cursor = 0
+    for index in range(segment_count):
+        start = cursor + rng.randrange(0, 300)
+        end = start + rng.randrange(500, 8000)
+        segments.append({"index": index, "start_ms": start, "end_ms": end, "speaker_id": f"speaker_{rng.randrange(4)}"})
+        cursor = end
+    for index in range(3):
+        segments.append({"index": segment_count + index, "start_ms": 0, "end_ms": cursor, "speaker_id": "music"})
+
+    intervals = []
+    step = max(1, cursor // max(1, interval_count))
+    for index in range(interval_count):
+        start = index * step + rng.randrange(0, max(1, step // 2))
+        intervals.append({"start_ms": start, "end_ms": start + rng.randrange(200, 2000), "speakers": ["SPEAKER_00"]})
+    for segment in segments[: segment_count // 10]:
+        segment["speaker_id"] = "mixed"
+        segment["overlap_protection"] = {
+            "speaker_ids": ["speaker_0", "speaker_1"],
+            "overlap_intervals_ms": [dict(item) for item in intervals[: 2]],
+        }
+    return {"intervals": intervals}, {"segments": segments}
+
+
+def _scan_mapping(overlap_payload: dict, segments_payload: dict) -> list[list[str]]:
+    normalized = [
+        overlap_speaker_mapping._normalize_segment(segment)
+        for segment in segments_payload["segments"]
+    ]
+    normalized = [segment for segment in normalized if segment is not None]
+    result = []
+    for item in overlap_payload["intervals"]:
+        speakers: set[str] = set()
+        for segment in normalized:
+            if segment["start_ms"] < item["end_ms"] and segment["end_ms"] > item["start_ms"]:
+                speakers.update(segment["speakers"])
+        result.append(sorted(speakers))
+    return result
+
+
+def _time(function, *args) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - started, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark overlap-to-segment speaker mapping.")
+    parser.add_argument("--segments", type=int, default=10_000)
+    parser.add_argument("--intervals", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=32)
+    args = parser.parse_args()
+
+    results = []
+    for scale in (0.1, 0.3, 1.0):
+        overlap_payload, segments_payload = _fixture(
+            max(1, int(args.segments * scale)),
+            max(1, int(args.intervals * scale)),
+            args.seed,
+        )
+        join_seconds, (enriched_overlap, _segments, _summary) = _time(
+            overlap_speaker_mapping.enrich_overlap_speaker_mapping,
+            overlap_payload,
+            segments_payload,
+        )
+        scan_seconds, expected = _time(_scan_mapping, overlap_payload, segments_payload)
+        if [item["mapped_speakers"] for item in enriched_overlap["intervals"]] != expected:
+            raise SystemExit("joined speaker mapping differs from the per-interval scan")
+        results.append({
+            "segments": len(segments_payload["segments"]),
+            "intervals": len(overlap_payload["intervals"]),
+            "scan_seconds": round(scan_seconds, 3),
+            "join_seconds": round(join_seconds, 3),
+        })
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
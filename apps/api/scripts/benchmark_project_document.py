@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Compare repeated json.loads of a project JSON with one ProjectDocument parse.
+
+Run from apps/api:
+  PYTHONPATH=src .venv/bin/python scripts/benchmark_project_document.py \
+    [--project-json <path>] [--segments 30000] [--words-per-segment 12]
+
+Without --project-json a synthetic project is generated. The "dict" run
+parses the JSON three times, as the final-preview job and review route used
+to (timeline planning, caption writing, source duration); the "document"
+run parses it once into compact records. Each run reports wall time, peak
+traced allocation during parsing and the size retained afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from eogum.services.project_document import ProjectDocument  # noqa: E402
+
+
+def _synthetic_project(segment_count: int, words_per_segment: int) -> bytes:
+    segments = []
+    decisions = []
+    for index in range(segment_count):
+        start_ms = index * 4000
+        segments.append({
+            "index": index + 1,
+            "start_ms": start_ms,
+            "end_ms": start_ms + 3500,
+            "text": "안녕하세요 오늘은 편집 테스트를 합니다",
+            "speaker": f"speaker_{index % 3}",
+            "words": [
+                {
+                    "text": "단어",
+                    "start_ms": start_ms + word * 250,
+                    "end_ms": start_ms + word * 250 + 200,
+                    "confidence": 0.98,
+                }
+                for word in range(words_per_segment)
+            ],
+        })
+        if index % 4 == 0:
+            decisions.append({
+                "range": {"start_ms": start_ms, "end_ms": start_ms + 3500},
+                "edit_type": "cut",
+                "reason": "filler",
+                "confidence": 0.9,
+                "active_video_track_id": "source_video",
+                "active_audio_track_ids": ["source_audio"],
+                "source_segment_index": index + 1,
+            })
+    return json.dumps({
+        "source_files": [{"id": "source", "info": {"duration_ms": segment_count * 4000}}],
+        "tracks": [{"id": "source_video", "source_file_id": "source", "track_type": "video"}],
+        "transcription": {"segments": segments},
+        "edit_decisions": decisions,
+    }, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_three_times(raw: bytes) -> dict:
+    project_data: dict = {}
+    for _ in range(3):
+        project_data = {}
+        project_data = json.loads(raw)
+    return project_data
+
+
+def _measure(label: str, parse) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    retained = parse()
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return {
+        "mode": label,
+        "seconds": round(elapsed, 3),
+        "peak_bytes": peak,
+        "retained_bytes": current,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark project JSON parsing strategies.")
+    parser.add_argument("--project-json", type=Path)
+    parser.add_argument("--segments", type=int, default=30_000)
+    parser.add_argument("--words-per-segment", type=int, default=12)
+    args = parser.parse_args()
+
+    raw = (
+        args.project_json.read_bytes()
+        if args.project_json
+        else _synthetic_project(args.segments, args.words_per_segment)
+    )
+    results = [
+        _measure("dict", lambda: _parse_three_times(raw)),
+        _measure("document", lambda: ProjectDocument.from_bytes(raw)),
+    ]
+    print(json.dumps({"project_json_bytes": len(raw), "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Compare disk usage of segment-file and streaming interval renders.
+
+Run from apps/api:
+  PYTHONPATH=src .venv/bin/python scripts/benchmark_render_intervals.py \
+    [--source <video>] [--intervals 40] [--profile web_1080p_v2]
+
+Without --source a synthetic 1080p clip is generated with ffmpeg. For each
+mode the script reports wall time, peak bytes on disk in the work directory,
+and bytes written by ffmpeg child processes (from getrusage block counts).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from eogum.services import media_render  # noqa: E402
+
+
+def _make_source(path: Path, duration: int) -> None:
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", f"testsrc2=duration={duration}:size=1920x1080:rate=30",
+            "-f", "lavfi", "-i", f"sine=frequency=440:duration={duration}:sample_rate=48000",
+            "-c:v", "libx264", "-preset", "veryfast", "-b:v", "6M",
+            "-pix_fmt", "yuv420p", "-c:a", "aac", "-shortest", str(path),
+        ],
+        check=True,
+    )
+
+
+def _directory_bytes(path: Path) -> int:
+    total = 0
+    for child in path.rglob("*"):
+        try:
+            if child.is_file():
+                total += child.stat().st_size
+        except FileNotFoundError:
+            continue
+    return total
+
+
+def _measure(source: Path, intervals: list[tuple[float, float]], profile: str, *, streaming: bool) -> dict:
+    with tempfile.TemporaryDirectory(prefix="render-bench-") as work:
+        work_dir = Path(work)
+        output_path = work_dir / "output.mp4"
+        peak = 0
+        done = threading.Event()
+
+        def sample() -> None:
+            nonlocal peak
+            while not done.is_set():
+                peak = max(peak, _directory_bytes(work_dir))
+                time.sleep(0.05)
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        blocks_before = resource.getrusage(resource.RUSAGE_CHILDREN).ru_oublock
+        started = time.monotonic()
+        sampler.start()
+        try:
+            media_render.render_intervals(source, intervals, output_path, profile=profile, streaming=streaming)
+        finally:
+            done.set()
+            sampler.join()
+        elapsed = time.monotonic() - started
+        peak = max(peak, _directory_bytes(work_dir))
+        return {
+            "mode": "streaming" if streaming else "segments",
+            "seconds": round(elapsed, 2),
+            "peak_disk_bytes": peak,
+            "child_bytes_written": (resource.getrusage(resource.RUSAGE_CHILDREN).ru_oublock - blocks_before) * 512,
+            "output_bytes": output_path.stat().st_size,
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark render_intervals disk usage by concat mode.")
+    parser.add_argument("--source", type=Path)
+    parser.add_argument("--intervals", type=int, default=40)
+    parser.add_argument("--profile", default=media_render.WEB_1080P_PROFILE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="render-bench-source-") as source_dir:
+        source = args.source
+        if source is None:
+            source = Path(source_dir) / "source.mp4"
+            _make_source(source, duration=args.intervals * 3)
+        duration_s = media_render.probe_duration_ms(source) / 1000
+        step = duration_s / args.intervals
+        intervals = [(index * step, step * 0.6) for index in range(args.intervals)]
+
+        results = [
+            _measure(source, intervals, args.profile, streaming=False),
+            _measure(source, intervals, args.profile, streaming=True),
+        ]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Compare review payload serialization through response_model vs json_response.
+
+Run from apps/api:
+  PYTHONPATH=src .venv/bin/python scripts/benchmark_review_responses.py \
+    [--segments 5000] [--requests 200]
+
+Serves one synthetic 5k-segment review payload from an in-process FastAPI
+app: the previous route shape (return the dict, let response_model validate
+and encode it), json_response validating through the model, json_response
+encoding a pre-validated dict with orjson, and a cached body. Reports
+p50/p99 latency plus bytes on the wire for identity, gzip and an ETag
+revalidation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "benchmark")
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from eogum.models.schemas import SegmentsResponse  # noqa: E402
+from eogum.responses import cached_json_body, encode_json, json_response  # noqa: E402
+
+
+def _payload(segment_count: int) -> dict:
+    return {
+        "schema_version": "review-segments/v1",
+        "review_scope": "segments",
+        "join_strategy": "speaker_turns",
+        "source_duration_ms": segment_count * 4000,
+        "segments": [
+            {
+                "index": index + 1,
+                "start_ms": index * 4000,
+                "end_ms": index * 4000 + 3500,
+                "text": "안녕하세요 오늘은 편집 테스트를 합니다",
+                "speaker": f"speaker_{index % 3}",
+                "ai": {
+                    "action": "cut" if index % 4 == 0 else "keep",
+                    "reason": "filler" if index % 4 == 0 else "",
+                    "confidence": 0.91,
+                    "edit_type": "cut" if index % 4 == 0 else None,
+                    "source_segment_index": index + 1,
+                },
+                "human": None,
+            }
+            for index in range(segment_count)
+        ],
+    }
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _measure(client: TestClient, path: str, requests: int, headers: dict) -> dict:
+    samples = []
+    response = None
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.get(path, headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "p50_ms": round(statistics.median(samples), 2),
+        "p99_ms": round(_percentile(samples, 0.99), 2),
+        "wire_bytes": int(response.headers.get("content-length") or len(response.content)),
+        "status": response.status_code,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark review payload response serialization.")
+    parser.add_argument("--segments", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = _payload(args.segments)
+    app = FastAPI()
+
+    @app.get("/response-model", response_model=SegmentsResponse)
+    def response_model_route():
+        return payload
+
+    @app.get("/validated", response_model=SegmentsResponse)
+    def validated_route(request: Request):
+        return json_response(request, payload, SegmentsResponse)
+
+    @app.get("/prevalidated", response_model=SegmentsResponse)
+    def prevalidated_route(request: Request):
+        return json_response(request, payload)
+
+    @app.get("/cached", response_model=SegmentsResponse)
+    def cached_route(request: Request):
+        return json_response(request, cached_json_body("benchmark", lambda: encode_json(payload, SegmentsResponse)))
+
+    client = TestClient(app)
+    identity = {"Accept-Encoding": "identity"}
+    gzip_headers = {"Accept-Encoding": "gzip"}
+    etag = client.get("/cached", headers=gzip_headers).headers["etag"]
+    results = {
+        "segments": args.segments,
+        "response_model": _measure(client, "/response-model", args.requests, identity),
+        "validated": _measure(client, "/validated", args.requests, identity),
+        "prevalidated": _measure(client, "/prevalidated", args.requests, identity),
+        "cached": _measure(client, "/cached", args.requests, identity),
+        "cached_gzip": _measure(client, "/cached", args.requests, gzip_headers),
+        "cached_304": _measure(client, "/cached", args.requests, {**gzip_headers, "If-None-Match": etag}),
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,10 +6,13 @@ Run from apps/api:
     --project-id <project-id> \
     --segment-id <segment-index>
 
+Segment timings come from the artifact's transcript sidecar, falling back to
+its project JSON when the artifact predates the sidecar.
+
 Outputs:
   /tmp/eogum/segment_boundary_debug/<project-id>/segment_<segment-id>/
     metadata.json
-    project.avid.json
+    project.avid.json             (with --with-project-json)
     review_segments.json
     source.<ext>
     source.scribe.raw.json        (when a completed Scribe cache exists)
@@ -37,6 +40,8 @@ from eogum.config import settings  # noqa: E402
 from eogum.services import r2, scribe_v2_cache  # noqa: E402
 from eogum.services.artifacts import get_latest_artifact_job  # noqa: E402
 from eogum.services.database import get_db  # noqa: E402
+from eogum.services.project_document import ProjectDocument  # noqa: E402
+from eogum.services.transcript_sidecar import load_transcript_document  # noqa: E402
 
 MAX_GAP_PADDING_MS = 500
 
@@ -103,53 +108,46 @@ def _download_once(r2_key: str, local_path: Path, *, force: bool, label: str) ->
     r2.download_file(r2_key, str(local_path))
 
 
-def _segment_identity(segment: dict, position: int) -> int:
-    value = segment.get("index")
-    return _require_int(value, field="segment.index") if value is not None else position
-
-
-def _build_local_review_segments(project_json: dict) -> dict:
-    transcription = project_json.get("transcription") or {}
-    source_segments = transcription.get("segments") or []
-    if not source_segments:
+def _build_local_review_segments(document: ProjectDocument) -> dict:
+    if not document.segments:
         raise RuntimeError("project JSON has no transcription.segments")
 
     valid_segments: list[dict] = []
     skipped_invalid_segments: list[dict] = []
-    for zero_based_position, segment in enumerate(source_segments):
-        position = zero_based_position + 1
+    for segment in document.segments:
+        position = segment.position + 1
         try:
-            raw_start = _require_int(segment.get("start_ms"), field="segment.start_ms")
-            raw_end = _require_int(segment.get("end_ms"), field="segment.end_ms")
+            raw_start = _require_int(segment.start_ms, field="segment.start_ms")
+            raw_end = _require_int(segment.end_ms, field="segment.end_ms")
         except RuntimeError as exc:
             skipped_invalid_segments.append({
-                "index": segment.get("index"),
+                "index": segment.index,
                 "position": position,
-                "start_ms": segment.get("start_ms"),
-                "end_ms": segment.get("end_ms"),
-                "text": segment.get("text") or "",
+                "start_ms": segment.start_ms,
+                "end_ms": segment.end_ms,
+                "text": segment.text,
                 "error": str(exc),
             })
             continue
 
         if raw_end <= raw_start:
             skipped_invalid_segments.append({
-                "index": segment.get("index"),
+                "index": segment.index,
                 "position": position,
                 "start_ms": raw_start,
                 "end_ms": raw_end,
-                "text": segment.get("text") or "",
+                "text": segment.text,
                 "error": "end_ms must be greater than start_ms",
             })
             continue
 
         valid_segments.append({
-            "index": _segment_identity(segment, position),
+            "index": segment.index if segment.index is not None else position,
             "position": position,
             "raw_start_ms": raw_start,
             "raw_end_ms": raw_end,
-            "text": segment.get("text") or "",
-            "speaker": segment.get("speaker"),
+            "text": segment.text,
+            "speaker": segment.speaker,
         })
 
     if not valid_segments:
@@ -209,7 +207,7 @@ def _find_review_segment(review_payload: dict, segment_id: int) -> dict:
         if segment.get("index") == segment_id or segment.get("position") == segment_id:
             raise RuntimeError(
                 f"segment {segment_id} has an invalid range and was skipped: "
-                f"{segment.get("start_ms")}-{segment.get("end_ms")} ({segment.get("error")})"
+                f"{segment.get('start_ms')}-{segment.get('end_ms')} ({segment.get('error')})"
             )
     raise RuntimeError(f"segment not found in review payload: {segment_id}")
 
@@ -421,9 +419,10 @@ def _download_segment(args: argparse.Namespace) -> Path:
     review_segments_path = segment_dir / "review_segments.json"
     metadata_path = segment_dir / "metadata.json"
 
-    _download_once(project_json_key, project_json_path, force=args.force, label="project_json")
-    project_json = json.loads(project_json_path.read_text(encoding="utf-8"))
-    review_payload = _build_local_review_segments(project_json)
+    if args.with_project_json:
+        _download_once(project_json_key, project_json_path, force=args.force, label="project_json")
+    document = load_transcript_document(artifact_job.get("result_r2_keys") or {})
+    review_payload = _build_local_review_segments(document)
     skipped_invalid_segments = review_payload.get("skipped_invalid_segments") or []
     if skipped_invalid_segments:
         print(f"skip invalid transcript segments: {len(skipped_invalid_segments)}")
@@ -486,7 +485,7 @@ def _download_segment(args: argparse.Namespace) -> Path:
         "segment_index": int(args.segment_id),
         "input": {
             "project_id": args.project_id,
-            "project_json_path": str(project_json_path),
+            "project_json_path": str(project_json_path) if project_json_path.exists() else None,
             "project_json_r2_key": project_json_key,
             "artifact_job": {
                 "id": artifact_job.get("id"),
@@ -549,6 +548,11 @@ def main() -> int:
     parser.add_argument("--force", action="store_true", help="Redownload inputs even when local files exist")
     parser.add_argument("--skip-source", action="store_true", help="Reuse an existing local source file")
     parser.add_argument("--skip-raw-scribe", action="store_true", help="Do not download raw Scribe cache JSON")
+    parser.add_argument(
+        "--with-project-json",
+        action="store_true",
+        help="Also download the full project JSON for inspection",
+    )
     args = parser.parse_args()
 
     if args.margin_ms < 0:
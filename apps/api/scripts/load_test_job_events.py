@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Hold many idle job-event SSE subscribers against a running API.
+
+Run from apps/api:
+  .venv/bin/python scripts/load_test_job_events.py \
+    --project-id <project uuid> [--token <user access token>] \
+    [--api-url http://localhost:8000/api/v1] [--subscribers 2000] [--hold 60]
+
+Opens ``--subscribers`` concurrent ``/projects/{id}/events`` streams, waits
+for each snapshot, keeps them open for ``--hold`` seconds and reports how
+many stayed connected, snapshot latency, the events and keepalives they
+received, and the server's subscriber count halfway through the hold.
+Raise the open-file limit (``ulimit -n``) on both ends first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+
+async def _subscriber(client: httpx.AsyncClient, path: str, hold_seconds: float, stats: dict) -> None:
+    started = time.perf_counter()
+    try:
+        async with client.stream("GET", path) as response:
+            response.raise_for_status()
+            stop_at = time.monotonic() + hold_seconds
+            first = True
+            async for line in response.aiter_lines():
+                if line.startswith("event: "):
+                    if first:
+                        stats["snapshot_ms"].append((time.perf_counter() - started) * 1000)
+                        stats["connected"] += 1
+                        first = False
+                    else:
+                        stats["events"] += 1
+                elif line.startswith(":"):
+                    stats["keepalives"] += 1
+                if time.monotonic() >= stop_at:
+                    break
+            stats["held"] += 0 if first else 1
+    except Exception as exc:
+        stats["errors"] += 1
+        stats["last_error"] = repr(exc)
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.subscribers, max_keepalive_connections=0)
+    timeout = httpx.Timeout(30.0, read=None)
+    stats = {"connected": 0, "held": 0, "events": 0, "keepalives": 0, "errors": 0, "snapshot_ms": []}
+    path = f"/projects/{args.project_id}/events"
+
+    async with httpx.AsyncClient(base_url=args.api_url, headers=headers, limits=limits, timeout=timeout) as client:
+        tasks = []
+        for index in range(args.subscribers):
+            tasks.append(asyncio.create_task(_subscriber(client, path, args.hold, stats)))
+            if args.ramp and index % args.ramp == args.ramp - 1:
+                await asyncio.sleep(0.05)
+        await asyncio.sleep(args.hold / 2)
+        async with httpx.AsyncClient(base_url=args.api_url, timeout=10) as probe:
+            stats["server_job_events"] = (await probe.get("/health")).json().get("job_events")
+        await asyncio.gather(*tasks)
+
+    samples = stats.pop("snapshot_ms")
+    if samples:
+        ordered = sorted(samples)
+        stats["snapshot_p50_ms"] = round(statistics.median(ordered), 2)
+        stats["snapshot_p99_ms"] = round(ordered[min(len(ordered) - 1, int(0.99 * (len(ordered) - 1)))], 2)
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test job-event SSE subscribers.")
+    parser.add_argument("--api-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--token", default="")
+    parser.add_argument("--project-id", required=True)
+    parser.add_argument("--subscribers", type=int, default=2000)
+    parser.add_argument("--hold", type=float, default=60.0)
+    parser.add_argument("--ramp", type=int, default=200, help="Pause briefly after every N connections")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(_run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Load-test project listing and detail against a running API.
+
+Run from apps/api:
+  PYTHONPATH=src .venv/bin/python scripts/load_test_project_listing.py \
+    --token <user access token> --user-id <user uuid> \
+    [--api-url http://localhost:8000/api/v1] [--seed 1000] [--requests 50] [--cleanup]
+
+``--seed`` inserts synthetic completed projects for the user through the
+service-role client so the listing has realistic depth; ``--cleanup``
+deletes them again. Reports p50/p99 latency and response size for the first
+page, a page deep in the keyset, a full walk of every page, a source-hash
+lookup and one project detail.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+SEED_NAME_PREFIX = "load-test project"
+SEED_BATCH_SIZE = 500
+
+
+def _seed(user_id: str, count: int) -> None:
+    from eogum.services.database import get_db
+
+    db = get_db()
+    started_at = datetime.now(timezone.utc) - timedelta(days=count)
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "name": f"{SEED_NAME_PREFIX} {index}",
+            "status": "completed",
+            "cut_type": "subtitle_cut",
+            "language": "ko",
+            "source_filename": "load-test.mp4",
+            "source_duration_seconds": 600,
+            "source_sha256": f"load-test-{index % 50}",
+            "settings": {"edit_intensity": "normal"},
+            "created_at": (started_at + timedelta(minutes=index)).isoformat(),
+        }
+        for index in range(count)
+    ]
+    for start in range(0, len(rows), SEED_BATCH_SIZE):
+        db.table("projects").insert(rows[start:start + SEED_BATCH_SIZE]).execute()
+
+
+def _cleanup(user_id: str) -> None:
+    from eogum.services.database import get_db
+
+    get_db().table("projects").delete().eq("user_id", user_id).like("name", f"{SEED_NAME_PREFIX} %").execute()
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _measure(client: httpx.Client, path: str, params: dict, requests: int) -> dict:
+    samples = []
+    response = None
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.get(path, params=params)
+        samples.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    return {
+        "p50_ms": round(statistics.median(samples), 2),
+        "p99_ms": round(_percentile(samples, 0.99), 2),
+        "bytes": len(response.content),
+    }
+
+
+def _walk(client: httpx.Client, limit: int) -> tuple[dict, str | None, str | None]:
+    started = time.perf_counter()
+    pages = 0
+    projects = 0
+    deep_cursor = None
+    first_project_id = None
+    cursor = None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/projects", params=params)
+        page.raise_for_status()
+        body = page.json()
+        pages += 1
+        projects += len(body["items"])
+        first_project_id = first_project_id or (body["items"][0]["id"] if body["items"] else None)
+        cursor = body["next_cursor"]
+        if pages == 10:
+            deep_cursor = cursor
+        if not cursor:
+            break
+    walk = {"pages": pages, "projects": projects, "total_ms": round((time.perf_counter() - started) * 1000, 2)}
+    return walk, deep_cursor, first_project_id
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test keyset project listing.")
+    parser.add_argument("--api-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--user-id", required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    if args.seed:
+        _seed(args.user_id, args.seed)
+
+    headers = {"Authorization": f"Bearer {args.token}", "Accept-Encoding": "gzip"}
+    try:
+        with httpx.Client(base_url=args.api_url, headers=headers, timeout=30) as client:
+            walk, deep_cursor, first_project_id = _walk(client, args.limit)
+            results = {
+                "limit": args.limit,
+                "full_walk": walk,
+                "first_page": _measure(client, "/projects", {"limit": args.limit}, args.requests),
+                "source_sha256_lookup": _measure(
+                    client, "/projects", {"source_sha256": "load-test-0"}, args.requests
+                ),
+            }
+            if deep_cursor:
+                results["page_10"] = _measure(
+                    client, "/projects", {"limit": args.limit, "cursor": deep_cursor}, args.requests
+                )
+            if first_project_id:
+                results["project_detail"] = _measure(client, f"/projects/{first_project_id}", {}, args.requests)
+    finally:
+        if args.cleanup:
+            _cleanup(args.user_id)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Report (and optionally delete) R2 objects no database row references.
+
+Run from apps/api:
+  PYTHONPATH=src .venv/bin/python scripts/reconcile_r2_orphans.py \
+    [--prefix results/ --prefix cache/] [--min-age-hours 24] \
+    [--max-deletes 10000] [--apply] [--drain]
+
+Without ``--apply`` this is a dry run that only prints the report. With it,
+orphans are added to ``r2_deletion_queue``; ``--drain`` also deletes the
+queued objects now instead of leaving them to the API's background worker.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from eogum.config import settings  # noqa: E402
+from eogum.services import storage_gc  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reconcile R2 objects against database references.")
+    parser.add_argument("--prefix", action="append", dest="prefixes", help="R2 prefix to scan (repeatable)")
+    parser.add_argument("--min-age-hours", type=float, default=settings.storage_gc_reconcile_min_age_seconds / 3600)
+    parser.add_argument("--max-deletes", type=int, default=settings.storage_gc_reconcile_max_deletes)
+    parser.add_argument("--apply", action="store_true", help="Queue orphans for deletion")
+    parser.add_argument("--drain", action="store_true", help="Delete queued objects before exiting")
+    args = parser.parse_args()
+
+    report = storage_gc.reconcile_orphans(
+        prefixes=args.prefixes,
+        dry_run=not args.apply,
+        min_age_seconds=args.min_age_hours * 3600,
+        max_deletes=args.max_deletes,
+    )
+    if args.apply and args.drain:
+        report["drain"] = storage_gc.drain_deletion_queue()
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,12 @@
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 
-import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jwt import PyJWKClient, PyJWKClientError
 
 from eogum.config import settings
 
@@ -12,7 +14,127 @@ logger = logging.getLogger(__name__)
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
-_jwks_client = PyJWKClient(f"{settings.supabase_url}/auth/v1/.well-known/jwks.json")
+_jwks_client = None
+_jwks_client_lock = threading.Lock()
+
+
+def _get_jwks_client():
+    """Create the JWKS client on first use; PyJWT's crypto backend is slow to import."""
+    global _jwks_client
+    if _jwks_client is None:
+        with _jwks_client_lock:
+            if _jwks_client is None:
+                from jwt import PyJWKClient
+
+                # The background refresher renews the key set well before this
+                # lifespan runs out, so requests only fetch JWKS themselves for
+                # a kid they have never seen.
+                _jwks_client = PyJWKClient(
+                    f"{settings.supabase_url}/auth/v1/.well-known/jwks.json",
+                    lifespan=settings.jwks_refresh_interval_seconds * 4,
+                )
+    return _jwks_client
+
+
+class AuthMetrics:
+    """Counters for token verification and the verified-token cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.verifications = 0
+        self.failures = 0
+        self.total_verify_seconds = 0.0
+        self.max_verify_seconds = 0.0
+        self.jwks_refreshes = 0
+        self.jwks_refresh_failures = 0
+
+    def increment(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def record_verification(self, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self.verifications += 1
+            if not ok:
+                self.failures += 1
+            self.total_verify_seconds += seconds
+            self.max_verify_seconds = max(self.max_verify_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lookups = self.cache_hits + self.cache_misses
+            return {
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "hit_rate": round(self.cache_hits / lookups, 3) if lookups else 0.0,
+                "verifications": self.verifications,
+                "failures": self.failures,
+                "avg_verify_ms": (
+                    round(self.total_verify_seconds / self.verifications * 1000, 2) if self.verifications else 0.0
+                ),
+                "max_verify_ms": round(self.max_verify_seconds * 1000, 2),
+                "jwks_refreshes": self.jwks_refreshes,
+                "jwks_refresh_failures": self.jwks_refresh_failures,
+            }
+
+
+class VerifiedTokenCache:
+    """LRU of verified JWT payloads keyed by the token's SHA-256 digest.
+
+    An entry never outlives the token's ``exp`` (nor ``max_ttl_seconds``),
+    so a cached token expires exactly when a fresh verification would
+    reject it. Only successful verifications are cached.
+    """
+
+    def __init__(self, max_entries: int, max_ttl_seconds: float, clock=time.time):
+        self.max_entries = max_entries
+        self.max_ttl_seconds = max_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(payload)
+
+    def put(self, key: str, payload: dict) -> None:
+        exp = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)):
+            return
+        expires_at = min(float(exp), self._clock() + self.max_ttl_seconds)
+        with self._lock:
+            self._entries[key] = (dict(payload), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+auth_metrics = AuthMetrics()
+_token_cache = VerifiedTokenCache(
+    max_entries=settings.jwt_cache_max_entries,
+    max_ttl_seconds=settings.jwt_cache_max_ttl_seconds,
+)
 
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
@@ -30,8 +152,30 @@ def verify_optional_token(
 
 
 def _decode_token(token: str) -> dict:
+    cache_key = _token_cache.key(token)
+    payload = _token_cache.get(cache_key)
+    if payload is not None:
+        auth_metrics.increment("cache_hits")
+        return payload
+    auth_metrics.increment("cache_misses")
+
+    started = time.perf_counter()
+    ok = False
     try:
-        signing_key = _jwks_client.get_signing_key_from_jwt(token)
+        payload = _verify_token(token)
+        ok = True
+    finally:
+        auth_metrics.record_verification(time.perf_counter() - started, ok)
+    _token_cache.put(cache_key, payload)
+    return payload
+
+
+def _verify_token(token: str) -> dict:
+    import jwt
+    from jwt import PyJWKClientError
+
+    try:
+        signing_key = _get_jwks_client().get_signing_key_from_jwt(token)
         payload = jwt.decode(
             token,
             signing_key.key,
@@ -49,6 +193,39 @@ def _decode_token(token: str) -> dict:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
 
+def refresh_jwks() -> None:
+    """Fetch the JWKS key set now so requests keep hitting a warm cache."""
+    try:
+        _get_jwks_client().get_jwk_set(refresh=True)
+    except Exception:
+        auth_metrics.increment("jwks_refresh_failures")
+        logger.exception("JWKS refresh failed; keeping the cached key set")
+        return
+    auth_metrics.increment("jwks_refreshes")
+
+
+def start_jwks_refresher(interval_seconds: float | None = None) -> threading.Event:
+    """Start a background thread that refreshes the JWKS key set periodically.
+
+    A rotated signing key is picked up here instead of on the request path.
+    """
+    interval = settings.jwks_refresh_interval_seconds if interval_seconds is None else interval_seconds
+    stop_event = threading.Event()
+
+    def _loop() -> None:
+        refresh_jwks()
+        while not stop_event.wait(interval):
+            refresh_jwks()
+
+    thread = threading.Thread(target=_loop, name="jwks-refresher", daemon=True)
+    thread.start()
+    return stop_event
+
+
+def auth_stats() -> dict:
+    return {**auth_metrics.snapshot(), "cached_tokens": len(_token_cache)}
+
+
 @dataclass(frozen=True)
 class CurrentUser:
     id: str
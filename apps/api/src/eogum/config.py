@@ -28,6 +28,25 @@ class Settings(BaseSettings):
     supabase_url: str
     supabase_service_key: str
     supabase_jwt_secret: str = ""  # Not needed for ES256 (JWKS used instead)
+    supabase_max_connections: int = 32  # Shared by every thread in the process
+    supabase_max_keepalive_connections: int = 16
+    supabase_pool_timeout_seconds: float = 30.0
+    supabase_http2: bool = False  # Multiplex PostgREST requests over HTTP/2
+    supabase_retry_max_attempts: int = 4
+    supabase_retry_base_delay_seconds: float = 0.25
+    supabase_retry_max_delay_seconds: float = 5.0
+    supabase_operation_deadline_seconds: float = 60.0
+    supabase_request_deadline_seconds: float = 15.0  # Budget for all DB work of one API request
+    supabase_breaker_failure_threshold: int = 8
+    supabase_breaker_cooldown_seconds: float = 10.0
+    supabase_hedge_after_seconds: float = 0.75  # 0 disables hedged reads
+    supabase_hedge_max_in_flight: int = 8
+    jwt_cache_max_entries: int = 4096  # Verified-token LRU; 0 disables it
+    jwt_cache_max_ttl_seconds: float = 300.0  # Entries also expire with the token's exp
+    jwks_refresh_interval_seconds: float = 240.0
+    # Direct Postgres DSN for LISTEN/NOTIFY job events across API nodes.
+    # Empty keeps job events in-process (single node).
+    supabase_db_url: str = ""
     admin_user_ids: str = ""
     admin_emails: str = ""
     public_project_ids: str = ""
@@ -58,6 +77,15 @@ class Settings(BaseSettings):
 
     # Tools
     yt_dlp_bin: Path | None = None
+    youtube_download_concurrency: int = 2  # Concurrent yt-dlp downloads per node
+    youtube_task_ttl_seconds: float = 3600.0  # Keep finished tasks in memory this long
+    youtube_heartbeat_interval_seconds: float = 30.0  # Owner refreshes jobs.heartbeat_at this often
+    youtube_heartbeat_stale_seconds: float = 120.0  # Recovery claims downloads silent this long
+    youtube_streaming_import: bool = True  # Upload to R2 while downloading instead of after
+    youtube_stream_part_size_bytes: int = 16 * 1024**2  # R2 multipart part size (min 5 MiB)
+    youtube_stream_parts_in_flight: int = 3  # Concurrent part uploads per download
+    youtube_info_cache_max_entries: int = 512  # In-process LRU of yt-dlp metadata
+    youtube_info_cache_ttl_seconds: float = 86400.0  # Memory and DB metadata freshness
 
     # Email
     resend_api_key: str = ""
@@ -67,6 +95,8 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     api_public_url: str = ""
+    response_gzip_min_bytes: int = 1024
+    job_events_keepalive_seconds: float = 15.0
 
     # Job workers
     project_worker_count: int = 1
@@ -74,10 +104,26 @@ class Settings(BaseSettings):
     source_derive_worker_count: int = 1
     cut_decision_worker_count: int = 1
     final_preview_worker_count: int = 1
+    final_preview_speculative_enabled: bool = True
+    render_streaming_concat: bool = True
+    final_preview_incremental_render: bool = True
 
     # Local preview cache
     final_preview_cache_dir: Path = Path("/tmp/eogum/final-previews")
     source_cache_dir: Path = Path("/tmp/eogum/sources")
+    source_cache_max_bytes: int = 100 * 1024**3
+    final_preview_plan_max_bytes: int = 20 * 1024**3  # Segment files kept for incremental previews
+
+    # R2 garbage collection
+    storage_gc_interval_seconds: float = 60.0  # Deletion queue drain interval
+    storage_gc_delete_batch_size: int = 200  # Keys per R2 DeleteObjects call
+    storage_gc_max_deletes_per_minute: int = 2000
+    storage_gc_max_attempts: int = 8  # Then the row is marked failed
+    storage_gc_reconcile_interval_seconds: float = 6 * 3600.0  # 0 disables the reconciler
+    storage_gc_reconcile_prefixes: list[str] = ["results/", "cache/", "sources/", "derived/"]
+    storage_gc_reconcile_min_age_seconds: float = 24 * 3600.0  # Never touch newer objects
+    storage_gc_reconcile_max_deletes: int = 10000  # Per reconciler run
+    storage_gc_dry_run: bool = True  # Reconciler only reports orphans until disabled
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
@@ -1,10 +1,11 @@
 import logging
 from contextlib import asynccontextmanager
 
-import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from eogum.auth import start_jwks_refresher
 from eogum.config import settings
 from eogum.routes import (
     credits,
@@ -17,6 +18,11 @@ from eogum.routes import (
     upload,
     youtube,
 )
+from eogum.services.database import DatabaseUnavailable, close_db, operation_deadline
+from eogum.services.job_events import start_remote_job_event_listener
+from eogum.services.request_db import track_round_trips
+from eogum.services.storage_gc import start_storage_gc
+from eogum.startup import start_startup_recovery, startup_state
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -24,47 +30,25 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    from eogum.services.job_runner import (
-        recover_stuck_ai_cut_renders,
-        recover_stuck_final_previews,
-        recover_stuck_projects,
-        recover_stuck_source_derivatives,
-        start_stuck_project_sweeper,
-    )
-
-    try:
-        recovered = recover_stuck_projects(recover_running=True)
-        if recovered:
-            logger.info("Recovered %d stuck project(s) on startup", recovered)
-    except Exception:
-        logger.exception("Startup stuck project recovery failed")
-
-    try:
-        recovered_previews = recover_stuck_final_previews(recover_running=True)
-        if recovered_previews:
-            logger.info("Recovered %d stuck final-preview job(s) on startup", recovered_previews)
-    except Exception:
-        logger.exception("Startup final-preview recovery failed")
-
-    try:
-        recovered_ai_renders = recover_stuck_ai_cut_renders(recover_running=True)
-        if recovered_ai_renders:
-            logger.info("Recovered %d stuck AI-cut render job(s) on startup", recovered_ai_renders)
-    except Exception:
-        logger.exception("Startup AI-cut render recovery failed")
-
-    try:
-        recovered_derivatives = recover_stuck_source_derivatives(recover_running=True)
-        if recovered_derivatives:
-            logger.info("Recovered %d stuck source-derive job(s) on startup", recovered_derivatives)
-    except Exception:
-        logger.exception("Startup source-derive recovery failed")
+    from eogum.services.job_runner import start_stuck_project_sweeper
 
+    # Serve first; requeueing what a previous process left behind scans whole
+    # tables and runs in the background (progress is reported on /health).
+    start_startup_recovery()
     sweeper_stop = start_stuck_project_sweeper(interval_seconds=60)
+    jwks_stop = start_jwks_refresher()
+    storage_gc_stop = start_storage_gc()
+    job_event_listener = start_remote_job_event_listener()
+    startup_state.mark_serving()
     try:
         yield
     finally:
+        if job_event_listener is not None:
+            job_event_listener.cancel()
+        jwks_stop.set()
+        storage_gc_stop.set()
         sweeper_stop.set()
+        close_db()
 
 app = FastAPI(
     title="어검 (eogum) API",
@@ -86,6 +70,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def count_db_round_trips(request: Request, call_next):
+    with track_round_trips() as counter, operation_deadline(settings.supabase_request_deadline_seconds):
+        response = await call_next(request)
+    response.headers["X-DB-Round-Trips"] = str(counter.count)
+    logger.debug("%s %s used %d DB round trip(s)", request.method, request.url.path, counter.count)
+    return response
+
+
+@app.exception_handler(DatabaseUnavailable)
+async def database_unavailable(request: Request, exc: DatabaseUnavailable):
+    logger.warning("%s %s failed fast: %s", request.method, request.url.path, exc)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "데이터베이스에 일시적으로 연결할 수 없습니다. 잠시 후 다시 시도해주세요"},
+        headers={"Retry-After": str(int(settings.supabase_breaker_cooldown_seconds))},
+    )
+
+
 app.include_router(health.router, prefix="/api/v1")
 app.include_router(upload.router, prefix="/api/v1")
 app.include_router(projects.router, prefix="/api/v1")
@@ -98,6 +102,8 @@ app.include_router(youtube.router, prefix="/api/v1")
 
 
 def run():
+    import uvicorn
+
     uvicorn.run("eogum.main:app", host=settings.host, port=settings.port, reload=True)
 
 
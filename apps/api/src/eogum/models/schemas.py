@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 CutType = Literal["subtitle_cut", "podcast_cut", "ai_frontier_cut"]
@@ -84,10 +84,16 @@ class ProjectResponse(BaseModel):
     source_derived: dict = {}
     extra_sources: list[dict] = []
     multicam_state: dict = {}
+    settings: dict = {}
     created_at: datetime
     updated_at: datetime
 
 
+class ProjectPage(BaseModel):
+    items: list[ProjectResponse]
+    next_cursor: str | None = None
+
+
 class ProjectDetailResponse(ProjectResponse):
     source_r2_key: str | None
     source_size_bytes: int | None
@@ -98,7 +104,8 @@ class ProjectDetailResponse(ProjectResponse):
 
 # ── Source Cache ──
 class SourceLookupRequest(BaseModel):
-    sha256: str
+    sha256: str | None = None
+    fingerprint: str | None = None  # sampled fingerprint, see services/source_cache.py
     size_bytes: int
 
 
@@ -106,6 +113,7 @@ class SourceLookupResponse(BaseModel):
     hit: bool
     r2_key: str | None = None
     source_asset_id: str | None = None
+    sha256: str | None = None
 
 
 # ── Jobs ──
@@ -120,10 +128,15 @@ class JobResponse(BaseModel):
     started_at: datetime | None
     completed_at: datetime | None
     created_at: datetime
+
+
+class JobDetailResponse(JobResponse):
     pipeline_stages: list[dict] = []
     external_task_ids: dict = {}
     processing_metadata: dict = {}
     result_r2_keys: dict | None = None
+    source_job_id: str | None = None
+    input_payload: dict | None = None
 
 
 # ── Credits ──
@@ -141,6 +154,11 @@ class CreditTransactionResponse(BaseModel):
     created_at: datetime
 
 
+class CreditTransactionPage(BaseModel):
+    items: list[CreditTransactionResponse]
+    next_cursor: str | None = None
+
+
 # ── Edit Reports ──
 class EditReportResponse(BaseModel):
     total_duration_seconds: int
@@ -223,11 +241,29 @@ class EvaluationResponse(ReviewPayload):
     version: str
     avid_version: str | None
     eogum_version: str | None
+    revision: int | None = None
     segments: list[EvalSegment]
     created_at: datetime
     updated_at: datetime
 
 
+class EvaluationSegmentChange(BaseModel):
+    index: int
+    human: HumanDecision | None = None
+    ai: AiDecision | None = None
+
+
+class EvaluationDeltaSave(BaseModel):
+    base_revision: int
+    changes: list[EvaluationSegmentChange] = Field(min_length=1)
+
+
+class EvaluationDeltaResponse(BaseModel):
+    id: str
+    revision: int
+    updated_at: datetime
+
+
 class VideoUrlResponse(BaseModel):
     video_url: str
     duration_ms: int
@@ -246,6 +282,8 @@ class FinalPreviewJobResponse(BaseModel):
     captions_url: str | None = None
     timeline_map_url: str | None = None
     duration_ms: int | None = None
+    # Revision of the review snapshot an owner's request just saved.
+    evaluation_revision: int | None = None
 
 
 class AiCutRenderJobResponse(BaseModel):
@@ -395,9 +433,19 @@ class YouTubeTaskResponse(BaseModel):
     filename: str | None = None
     duration_seconds: int
     filesize_bytes: int
+    source_sha256: str | None = None
+    queue_position: int | None = None  # 1-based while waiting for a download slot
 
 
 # ── Health ──
 class HealthResponse(BaseModel):
     status: str
     version: str
+    ready: bool = True
+    startup: dict | None = None
+    db_pool: dict | None = None
+    db_retry: dict | None = None
+    auth: dict | None = None
+    job_events: dict | None = None
+    youtube_downloads: dict | None = None
+    storage_gc: dict | None = None
@@ -0,0 +1,61 @@
+"""Keyset pagination over ``(created_at desc, id desc)``.
+
+Cursors are opaque base64url tokens holding the sort key of the last row
+of a page, so the next page is an index range scan instead of an ``offset``
+that re-reads every earlier row.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+import orjson
+from fastapi import HTTPException
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+
+def encode_cursor(row: dict) -> str:
+    raw = orjson.dumps([str(row["created_at"]), str(row["id"])])
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Return the normalized ``(created_at, id)`` of a cursor.
+
+    Both values are re-rendered from parsed types because they end up inside
+    a PostgREST filter expression.
+    """
+    try:
+        created_at, row_id = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(created_at, str) or not isinstance(row_id, str):
+            raise TypeError("cursor fields must be strings")
+        return datetime.fromisoformat(created_at).isoformat(), str(uuid.UUID(row_id))
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다") from None
+
+
+def keyset_page(query, *, limit: int, cursor: str | None):
+    """Order ``query`` newest first and restrict it to one page after ``cursor``.
+
+    One extra row is requested so ``page_items`` can tell whether another
+    page exists.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.or_(
+            f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{row_id}")'
+        )
+    return query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1)
+
+
+def page_items(rows: list[dict], limit: int) -> tuple[list[dict], str | None]:
+    """Split a ``keyset_page`` result into the page and the next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    items = rows[:limit]
+    return items, encode_cursor(items[-1])
@@ -0,0 +1,110 @@
+"""JSON fast path for large read endpoints.
+
+Routes that return big review payloads hand back a ready ``Response``
+instead of letting FastAPI validate and encode them again:
+
+- bodies derived from immutable inputs (review segments of one project
+  JSON, one revision of an evaluation row) are validated and encoded once
+  and kept in a small LRU;
+- everything else is validated once into its response model and written
+  by pydantic's serializer.
+
+Each body gets a strong ETag, so revalidating an unchanged payload is an
+empty 304, and bodies above ``settings.response_gzip_min_bytes`` are
+gzipped for clients that accept it. This is done per route rather than in
+middleware, so video and range responses are never compressed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from eogum.config import settings
+
+JSON_MEDIA_TYPE = "application/json"
+GZIP_COMPRESS_LEVEL = 5
+CACHE_CONTROL = "private, no-cache"
+RESPONSE_BODY_CACHE_MAX_ENTRIES = 16
+
+_body_cache: OrderedDict[Hashable, bytes] = OrderedDict()
+_body_cache_lock = threading.Lock()
+
+
+def encode_json(content: BaseModel | dict | list, model: type[BaseModel] | None = None) -> bytes:
+    """Encode ``content``; dicts are validated only when ``model`` is given."""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode("utf-8")
+    if model is not None:
+        return model.model_validate(content).model_dump_json().encode("utf-8")
+    return orjson.dumps(content)
+
+
+def cached_json_body(key: Hashable, build: Callable[[], bytes]) -> bytes:
+    """Return an encoded body for ``key``, building it at most once while cached."""
+    with _body_cache_lock:
+        body = _body_cache.get(key)
+        if body is not None:
+            _body_cache.move_to_end(key)
+            return body
+
+    body = build()
+    with _body_cache_lock:
+        _body_cache[key] = body
+        _body_cache.move_to_end(key)
+        while len(_body_cache) > RESPONSE_BODY_CACHE_MAX_ENTRIES:
+            _body_cache.popitem(last=False)
+    return body
+
+
+def clear_response_body_cache() -> None:
+    with _body_cache_lock:
+        _body_cache.clear()
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in {"gzip", "*"} and params.replace(" ", "") not in {"q=0", "q=0.0"}:
+            return True
+    return False
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def json_response(
+    request: Request,
+    content: BaseModel | dict | list | bytes,
+    model: type[BaseModel] | None = None,
+) -> Response:
+    """Return ``content`` as JSON with ETag, 304 and gzip handling.
+
+    ``bytes`` are sent as an already encoded body; other content goes
+    through ``encode_json``.
+    """
+    body = content if isinstance(content, bytes) else encode_json(content, model)
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    compress = len(body) >= settings.response_gzip_min_bytes and _accepts_gzip(request)
+    # The gzip representation gets its own strong validator.
+    etag = f'"{digest}-gzip"' if compress else f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    if compress:
+        body = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from eogum.auth import get_user_id
-from eogum.models.schemas import CreditBalanceResponse, CreditTransactionResponse
+from eogum.models.schemas import CreditBalanceResponse, CreditTransactionPage
+from eogum.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, keyset_page, page_items
 from eogum.services.credit import get_balance
 from eogum.services.database import get_db
 
@@ -13,15 +14,17 @@ def get_credit_balance(user_id: str = Depends(get_user_id)):
     return get_balance(user_id)
 
 
-@router.get("/transactions", response_model=list[CreditTransactionResponse])
-def get_transactions(user_id: str = Depends(get_user_id), limit: int = 50, offset: int = 0):
+@router.get("/transactions", response_model=CreditTransactionPage)
+def get_transactions(
+    user_id: str = Depends(get_user_id),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+):
     db = get_db()
-    result = (
+    query = (
         db.table("credit_transactions")
-        .select("*")
+        .select("id, amount_seconds, type, description, created_at")
         .eq("user_id", user_id)
-        .order("created_at", desc=True)
-        .range(offset, offset + limit - 1)
-        .execute()
     )
-    return result.data
+    rows, next_cursor = page_items(keyset_page(query, limit=limit, cursor=cursor).execute().data or [], limit)
+    return {"items": rows, "next_cursor": next_cursor}
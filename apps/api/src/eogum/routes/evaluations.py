@@ -1,7 +1,6 @@
 """Evaluation routes for segment review and feedback."""
 
 from collections import Counter
-import json
 import logging
 from pathlib import Path
 import tempfile
@@ -17,6 +16,8 @@ from eogum.models.schemas import (
     DisagreementDetail,
     EvalMetrics,
     EvalReportResponse,
+    EvaluationDeltaResponse,
+    EvaluationDeltaSave,
     EvaluationResponse,
     EvaluationSave,
     FinalPreviewJobResponse,
@@ -26,16 +27,22 @@ from eogum.models.schemas import (
     VideoUrlResponse,
 )
 from eogum.public_access import is_public_project_id
+from eogum.responses import cached_json_body, encode_json, json_response
 from eogum.services import avid
-from eogum.services.artifacts import get_latest_artifact_job
 from eogum.services.database import get_db
+from eogum.services.evaluation_store import append_evaluation_delta, save_evaluation_snapshot
 from eogum.services.final_preview_cache import (
+    ai_decision_preview_hash,
     final_preview_decision_hash,
     preview_cache_paths,
     preview_cache_ready,
 )
-from eogum.services.review_payload import merge_saved_review_preferences
+from eogum.services.final_preview_plan import cached_review_segments
+from eogum.services.project_document import ProjectDocument, load_project_document, project_json_digest
+from eogum.services.review_payload import has_review_overrides, merge_saved_review_preferences
 from eogum.services.r2 import download_to_bytes, generate_presigned_stream
+from eogum.services.request_db import RequestDb
+from eogum.services.transcript_sidecar import load_transcript_sidecar
 from eogum.services.job_runner import enqueue_final_preview
 
 logger = logging.getLogger(__name__)
@@ -63,26 +70,33 @@ def _has_project_owner_access(project: dict, current_user: CurrentUser | None) -
 
 
 def _get_accessible_project(
-    db,
+    db: RequestDb,
     project_id: str,
     current_user: CurrentUser | None,
     select: str = "*",
     *,
     allow_public_read: bool = False,
+    with_artifact_job: bool = False,
+    with_evaluation: bool = False,
 ) -> dict:
-    project = (
-        db.table("projects")
-        .select(_select_with_access_columns(select))
-        .eq("id", project_id)
-        .single()
-        .execute()
+    """Load a project the viewer may access.
+
+    ``with_artifact_job`` / ``with_evaluation`` embed the owner's latest
+    artifact job and evaluation in the same query; read them back through
+    ``db.latest_artifact_job`` and ``db.evaluation``.
+    """
+    project = db.project(
+        project_id,
+        _select_with_access_columns(select),
+        with_artifact_job=with_artifact_job,
+        with_evaluation=with_evaluation,
     )
-    if not project.data:
+    if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
-    if _has_project_owner_access(project.data, current_user):
-        return project.data
+    if _has_project_owner_access(project, current_user):
+        return project
     if allow_public_read and is_public_project_id(project_id):
-        return project.data
+        return project
     raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
 
 
@@ -178,6 +192,19 @@ def _find_reusable_preview_job(db, project_id: str, user_id: str, hash_value: st
     return None
 
 
+def _find_ai_decision_preview_job(db: RequestDb, project_id: str, user_id: str) -> dict | None:
+    """Return the speculative AI-decision preview for the current artifacts."""
+    artifact_job = db.latest_artifact_job(project_id, user_id)
+    project_json_key = (artifact_job or {}).get("result_r2_keys", {}).get("project_json")
+    if not project_json_key:
+        return None
+    hash_value = ai_decision_preview_hash(project_json_key)
+    return (
+        _find_completed_cached_preview_job(db, project_id, user_id, hash_value)
+        or _find_reusable_preview_job(db, project_id, user_id, hash_value)
+    )
+
+
 def _active_public_readonly_preview_count(db, project_id: str, user_id: str) -> int:
     result = (
         db.table("jobs")
@@ -198,7 +225,7 @@ def _active_public_readonly_preview_count(db, project_id: str, user_id: str) ->
 
 
 def _verify_cached_preview_job(project_id: str, job_id: str, token: str) -> tuple[Path, Path, Path]:
-    db = get_db()
+    db = RequestDb(get_db())
     job = (
         db.table("jobs")
         .select("id,project_id,type,status,result_r2_keys")
@@ -289,61 +316,84 @@ def _normalize_evaluation_payload(segments_value) -> dict:
     return {"segments": segments_value or []}
 
 
-def _source_duration_ms(avid_data: dict) -> int:
-    source_duration_ms = 0
-    for sf in avid_data.get("source_files", []):
-        info = sf.get("info", {})
-        if info.get("duration_ms"):
-            source_duration_ms = max(source_duration_ms, info["duration_ms"])
-    return source_duration_ms
+def _review_source(r2_keys: dict) -> tuple[str, ProjectDocument, bytes | None]:
+    """Digest, transcript document and (when downloaded) bytes of an artifact's project JSON.
 
+    A transcript sidecar that records the digest of its project JSON stands
+    in for it, so a warm review payload never downloads the full JSON.
+    """
+    project_json_key = r2_keys.get("project_json")
+    if not project_json_key:
+        raise HTTPException(status_code=404, detail="프로젝트 JSON을 찾을 수 없습니다")
+    sidecar = load_transcript_sidecar(r2_keys)
+    if sidecar is not None and sidecar.project_json_digest:
+        return sidecar.project_json_digest, sidecar.document, None
+    raw = download_to_bytes(project_json_key)
+    return project_json_digest(raw), load_project_document(project_json_key, raw), raw
 
-def _review_segments_payload_from_project_json(project_id: str, raw: bytes) -> dict:
-    avid_data = json.loads(raw)
 
-    transcription = avid_data.get("transcription")
-    if not transcription or not transcription.get("segments"):
+def _review_segments_payload(
+    project_id: str,
+    r2_keys: dict,
+    source: tuple[str, ProjectDocument, bytes | None] | None = None,
+) -> dict:
+    """Base review payload of an artifact.
+
+    The AI decisions and join strategy come from the avid engine, which this
+    service must not re-derive, so the payload is built by ``avid-cli
+    review-segments``. The result is shared with the preview worker through
+    ``cached_review_segments``, so the subprocess runs once per artifact.
+    """
+    digest, document, raw = source or _review_source(r2_keys)
+    if not document.segments:
         raise HTTPException(status_code=404, detail="자막 데이터가 없습니다")
 
-    settings.avid_temp_dir.mkdir(parents=True, exist_ok=True)
-    with tempfile.TemporaryDirectory(prefix=f"review_segments_{project_id}_", dir=str(settings.avid_temp_dir)) as temp_dir:
-        local_project_json = Path(temp_dir) / "input.project.avid.json"
-        local_project_json.write_bytes(raw)
-        payload = avid.review_segments(str(local_project_json))
-
-    payload["source_duration_ms"] = _source_duration_ms(avid_data)
+    def build() -> dict:
+        project_json = raw if raw is not None else download_to_bytes(r2_keys["project_json"])
+        settings.avid_temp_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(
+            prefix=f"review_segments_{project_id}_",
+            dir=str(settings.avid_temp_dir),
+        ) as temp_dir:
+            local_project_json = Path(temp_dir) / "input.project.avid.json"
+            local_project_json.write_bytes(project_json)
+            return avid.review_segments(str(local_project_json))
+
+    payload = dict(cached_review_segments(project_id, digest, build))
+    payload["source_duration_ms"] = document.max_source_file_duration_ms()
     return payload
 
 
-def _owner_evaluation_payload(db, project_id: str, owner_user_id: str) -> dict | None:
-    result = (
-        db.table("evaluations")
-        .select("segments")
-        .eq("project_id", project_id)
-        .eq("evaluator_id", owner_user_id)
-        .limit(1)
-        .execute()
-    )
-    if not result.data:
+def _owner_evaluation_payload(db: RequestDb, project_id: str, owner_user_id: str) -> dict | None:
+    evaluation = db.evaluation(project_id, owner_user_id)
+    if not evaluation:
         return None
-    return _normalize_evaluation_payload(result.data[0].get("segments"))
+    return _normalize_evaluation_payload(evaluation.get("segments"))
 
 
-def _canonical_final_preview_payload(db, project_id: str, owner_user_id: str) -> dict:
-    job = get_latest_artifact_job(db, project_id, user_id=owner_user_id, select="result_r2_keys")
+def _base_review_payload(db: RequestDb, project_id: str, owner_user_id: str) -> dict:
+    job = db.latest_artifact_job(project_id, owner_user_id)
     if not job:
         raise HTTPException(status_code=404, detail="완료된 작업이 없습니다")
+    return _review_segments_payload(project_id, job.get("result_r2_keys") or {})
 
-    project_json_key = (job.get("result_r2_keys") or {}).get("project_json")
-    if not project_json_key:
-        raise HTTPException(status_code=404, detail="프로젝트 JSON을 찾을 수 없습니다")
 
-    base_payload = _review_segments_payload_from_project_json(project_id, download_to_bytes(project_json_key))
+def _canonical_final_preview_payload(db: RequestDb, project_id: str, owner_user_id: str) -> dict:
+    base_payload = _base_review_payload(db, project_id, owner_user_id)
     owner_payload = _owner_evaluation_payload(db, project_id, owner_user_id)
-
     return merge_saved_review_preferences(base_payload, owner_payload)
 
 
+def _renders_ai_decisions(db: RequestDb, project_id: str, owner_user_id: str, payload: dict) -> bool:
+    """Whether ``payload`` renders exactly what the speculative AI-decision preview did."""
+    if has_review_overrides({"segments": payload.get("segments")}):
+        return False
+    if not has_review_overrides(payload):
+        return True
+    # Only review metadata is set; it matches when it equals the project JSON's.
+    return not has_review_overrides(payload, _base_review_payload(db, project_id, owner_user_id))
+
+
 def _effective_ai_decision(ai: dict | None) -> dict:
     if not isinstance(ai, dict):
         return {}
@@ -475,32 +525,33 @@ def _build_junction_preview_payload(payload: dict) -> tuple[dict, list[dict]]:
     return synthetic_payload, pairs
 
 
-def _evaluation_response_from_row(row: dict) -> EvaluationResponse:
+def _evaluation_response_payload(row: dict) -> dict:
+    """EvaluationResponse fields for a stored row, as a plain dict."""
     payload = _normalize_evaluation_payload(row.get("segments"))
-    extra_payload = {
-        key: value
-        for key, value in payload.items()
-        if key not in {"schema_version", "review_scope", "join_strategy", "segments"}
+    return {
+        **payload,
+        "id": row["id"],
+        "project_id": row["project_id"],
+        "evaluator_id": row["evaluator_id"],
+        "version": row["version"],
+        "avid_version": row.get("avid_version"),
+        "eogum_version": row.get("eogum_version"),
+        "revision": row.get("revision"),
+        "schema_version": payload.get("schema_version"),
+        "review_scope": payload.get("review_scope"),
+        "join_strategy": payload.get("join_strategy"),
+        "segments": payload.get("segments") or [],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
     }
-    return EvaluationResponse(
-        id=row["id"],
-        project_id=row["project_id"],
-        evaluator_id=row["evaluator_id"],
-        version=row["version"],
-        avid_version=row.get("avid_version"),
-        eogum_version=row.get("eogum_version"),
-        schema_version=payload.get("schema_version"),
-        review_scope=payload.get("review_scope"),
-        join_strategy=payload.get("join_strategy"),
-        segments=payload.get("segments") or [],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
-        **extra_payload,
-    )
+
+
+def _evaluation_response_from_row(row: dict) -> EvaluationResponse:
+    return EvaluationResponse.model_validate(_evaluation_response_payload(row))
 
 
 def _get_completed_job(
-    db,
+    db: RequestDb,
     project_id: str,
     current_user: CurrentUser | None,
     project_select: str = "id, user_id",
@@ -514,9 +565,10 @@ def _get_completed_job(
         current_user,
         project_select,
         allow_public_read=allow_public_read,
+        with_artifact_job=True,
     )
 
-    job = get_latest_artifact_job(db, project_id, user_id=project_data["user_id"], select="result_r2_keys")
+    job = db.latest_artifact_job(project_id, project_data["user_id"])
     if not job:
         raise HTTPException(status_code=404, detail="완료된 작업이 없습니다")
 
@@ -524,23 +576,27 @@ def _get_completed_job(
 
 
 @router.get("/segments", response_model=SegmentsResponse)
-def get_segments(project_id: str, current_user: CurrentUser | None = Depends(get_optional_current_user)):
+def get_segments(
+    project_id: str,
+    request: Request,
+    current_user: CurrentUser | None = Depends(get_optional_current_user),
+):
     """Get engine-native review segments from avid-cli."""
-    db = get_db()
+    db = RequestDb(get_db())
     r2_keys, _ = _get_completed_job(db, project_id, current_user, allow_public_read=True)
 
-    project_json_key = r2_keys.get("project_json")
-    if not project_json_key:
-        raise HTTPException(status_code=404, detail="프로젝트 JSON을 찾을 수 없습니다")
-
-    raw = download_to_bytes(project_json_key)
-    return _review_segments_payload_from_project_json(project_id, raw)
+    source = _review_source(r2_keys)
+    body = cached_json_body(
+        ("segments", r2_keys["project_json"], source[0]),
+        lambda: encode_json(_review_segments_payload(project_id, r2_keys, source), SegmentsResponse),
+    )
+    return json_response(request, body)
 
 
 @router.get("/video-url", response_model=VideoUrlResponse)
 def get_video_url(project_id: str, current_user: CurrentUser | None = Depends(get_optional_current_user)):
     """Get presigned streaming URL for the preview video."""
-    db = get_db()
+    db = RequestDb(get_db())
     r2_keys, project_data = _get_completed_job(
         db,
         project_id,
@@ -562,9 +618,13 @@ def get_video_url(project_id: str, current_user: CurrentUser | None = Depends(ge
 
 
 @router.get("/evaluation", response_model=EvaluationResponse)
-def get_evaluation(project_id: str, current_user: CurrentUser | None = Depends(get_optional_current_user)):
+def get_evaluation(
+    project_id: str,
+    request: Request,
+    current_user: CurrentUser | None = Depends(get_optional_current_user),
+):
     """Get existing evaluation for this project owner."""
-    db = get_db()
+    db = RequestDb(get_db())
 
     project_data = _get_accessible_project(
         db,
@@ -572,24 +632,25 @@ def get_evaluation(project_id: str, current_user: CurrentUser | None = Depends(g
         current_user,
         "id, user_id",
         allow_public_read=True,
+        with_evaluation=True,
     )
     owner_user_id = project_data["user_id"]
 
-    result = (
-        db.table("evaluations")
-        .select("*")
-        .eq("project_id", project_id)
-        .eq("evaluator_id", owner_user_id)
-        .limit(1)
-        .execute()
-    )
-    if not result.data:
+    evaluation = db.evaluation(project_id, owner_user_id)
+    if not evaluation:
         raise HTTPException(status_code=404, detail="평가 데이터가 없습니다")
 
-    return _evaluation_response_from_row(result.data[0])
+    # Rows predating a schema change or rewritten by deltas are not trusted
+    # as-is: the body is validated through EvaluationResponse once per stored
+    # revision and reused until the row changes.
+    body = cached_json_body(
+        ("evaluation", evaluation["id"], evaluation.get("revision"), str(evaluation.get("updated_at"))),
+        lambda: encode_json(_evaluation_response_payload(evaluation), EvaluationResponse),
+    )
+    return json_response(request, body)
 
 
-def _save_evaluation_payload(db, project_id: str, user_id: str, payload: dict) -> EvaluationResponse:
+def _save_evaluation_payload(db: RequestDb, project_id: str, user_id: str, payload: dict) -> EvaluationResponse:
     avid_version = avid.get_version()
     eogum_version = None
 
@@ -607,21 +668,16 @@ def _save_evaluation_payload(db, project_id: str, user_id: str, payload: dict) -
     except Exception:
         pass
 
-    result = (
-        db.table("evaluations")
-        .upsert(
-            {
-                "project_id": project_id,
-                "evaluator_id": user_id,
-                "segments": payload,
-                "avid_version": avid_version,
-                "eogum_version": eogum_version,
-            },
-            on_conflict="project_id,evaluator_id",
-        )
-        .execute()
+    row = save_evaluation_snapshot(
+        db,
+        project_id,
+        user_id,
+        payload,
+        avid_version=avid_version,
+        eogum_version=eogum_version,
     )
-    return _evaluation_response_from_row(result.data[0])
+    db.remember_evaluation(project_id, user_id, row)
+    return _evaluation_response_from_row(row)
 
 
 @router.post("/evaluation", response_model=EvaluationResponse)
@@ -631,12 +687,38 @@ def save_evaluation(
     current_user: CurrentUser = Depends(get_current_user),
 ):
     """Save or update evaluation (upsert on project_id + owner evaluator_id)."""
-    db = get_db()
+    db = RequestDb(get_db())
 
     project_data = _get_accessible_project(db, project_id, current_user, "id, user_id")
     return _save_evaluation_payload(db, project_id, project_data["user_id"], req.model_dump())
 
 
+@router.patch("/evaluation", response_model=EvaluationDeltaResponse)
+def patch_evaluation(
+    project_id: str,
+    req: EvaluationDeltaSave,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """Apply per-segment decision changes on top of the saved evaluation.
+
+    ``base_revision`` must match the stored revision; otherwise the client is
+    editing a stale copy and gets a 409.
+    """
+    db = RequestDb(get_db())
+
+    project_data = _get_accessible_project(db, project_id, current_user, "id, user_id")
+    # Top-level include keeps unset fields out of the delta while nested
+    # decisions are dumped in full, like a POST snapshot.
+    changes = [change.model_dump(include={"index", *change.model_fields_set}) for change in req.changes]
+    row = append_evaluation_delta(db, project_id, project_data["user_id"], req.base_revision, changes)
+    db.forget_evaluation(project_id, project_data["user_id"])
+    if not row:
+        raise HTTPException(status_code=404, detail="평가 데이터가 없습니다")
+    if not row.get("applied"):
+        raise HTTPException(status_code=409, detail="평가가 다른 곳에서 수정되었습니다. 새로고침 후 다시 시도하세요")
+    return EvaluationDeltaResponse(id=row["id"], revision=row["revision"], updated_at=row["updated_at"])
+
+
 @router.post("/final-preview", response_model=FinalPreviewJobResponse)
 def start_final_preview(
     project_id: str,
@@ -644,21 +726,26 @@ def start_final_preview(
     request: Request,
     current_user: CurrentUser | None = Depends(get_optional_current_user),
 ):
-    db = get_db()
+    db = RequestDb(get_db())
 
+    # Anonymous viewers always build the payload from the owner's saved
+    # review, so prefetch it with the project.
     project_data = _get_accessible_project(
         db,
         project_id,
         current_user,
         "id, user_id, source_duration_seconds",
         allow_public_read=True,
+        with_artifact_job=True,
+        with_evaluation=current_user is None,
     )
     owner_user_id = project_data["user_id"]
     viewer_can_edit = _has_project_owner_access(project_data, current_user)
 
+    evaluation_revision = None
     if viewer_can_edit:
         payload = req.model_dump()
-        _save_evaluation_payload(db, project_id, owner_user_id, payload)
+        evaluation_revision = _save_evaluation_payload(db, project_id, owner_user_id, payload).revision
         preview_scope = "owner"
     else:
         payload = _canonical_final_preview_payload(db, project_id, owner_user_id)
@@ -666,8 +753,11 @@ def start_final_preview(
     hash_value = final_preview_decision_hash(payload)
 
     reusable_job = _find_reusable_preview_job(db, project_id, owner_user_id, hash_value)
+    if not reusable_job and _renders_ai_decisions(db, project_id, owner_user_id, payload):
+        reusable_job = _find_ai_decision_preview_job(db, project_id, owner_user_id)
     if reusable_job:
-        return _response_from_final_preview_job(reusable_job, request, project_id)
+        response = _response_from_final_preview_job(reusable_job, request, project_id)
+        return response.model_copy(update={"evaluation_revision": evaluation_revision})
 
     if not viewer_can_edit:
         active_count = _active_public_readonly_preview_count(db, project_id, owner_user_id)
@@ -700,6 +790,7 @@ def start_final_preview(
         status=job["status"],
         progress=job["progress"],
         duration_ms=(project_data.get("source_duration_seconds") or 0) * 1000,
+        evaluation_revision=evaluation_revision,
     )
 
 
@@ -710,7 +801,7 @@ def start_junction_preview(
     request: Request,
     current_user: CurrentUser = Depends(get_current_user),
 ):
-    db = get_db()
+    db = RequestDb(get_db())
 
     project_data = _get_accessible_project(db, project_id, current_user, "id, user_id, source_duration_seconds")
     owner_user_id = project_data["user_id"]
@@ -755,7 +846,7 @@ def start_junction_preview(
 
 @router.get("/final-preview/{job_id}", response_model=FinalPreviewJobResponse)
 def get_final_preview(project_id: str, job_id: str, request: Request, current_user: CurrentUser | None = Depends(get_optional_current_user)):
-    db = get_db()
+    db = RequestDb(get_db())
 
     project_data = _get_accessible_project(
         db,
@@ -815,9 +906,13 @@ def stream_final_preview_timeline_map(
 
 
 @router.get("/eval-report", response_model=EvalReportResponse)
-def get_eval_report(project_id: str, current_user: CurrentUser | None = Depends(get_optional_current_user)):
+def get_eval_report(
+    project_id: str,
+    request: Request,
+    current_user: CurrentUser | None = Depends(get_optional_current_user),
+):
     """Compare AI decisions vs human ground truth and produce a report."""
-    db = get_db()
+    db = RequestDb(get_db())
 
     project_data = _get_accessible_project(
         db,
@@ -825,21 +920,14 @@ def get_eval_report(project_id: str, current_user: CurrentUser | None = Depends(
         current_user,
         "id, user_id",
         allow_public_read=True,
+        with_evaluation=True,
     )
 
     # Get evaluation
-    eval_result = (
-        db.table("evaluations")
-        .select("*")
-        .eq("project_id", project_id)
-        .eq("evaluator_id", project_data["user_id"])
-        .limit(1)
-        .execute()
-    )
-    if not eval_result.data:
+    evaluation = db.evaluation(project_id, project_data["user_id"])
+    if not evaluation:
         raise HTTPException(status_code=404, detail="평가 데이터가 없습니다")
 
-    evaluation = eval_result.data[0]
     payload = _normalize_evaluation_payload(evaluation["segments"])
     segments = payload.get("segments") or []
 
@@ -927,7 +1015,7 @@ def get_eval_report(project_id: str, current_user: CurrentUser | None = Depends(
 
     human_reviewed = sum(1 for s in segments if s.get("human"))
 
-    return EvalReportResponse(
+    report = EvalReportResponse(
         project_id=project_id,
         avid_version=evaluation.get("avid_version"),
         eogum_version=evaluation.get("eogum_version"),
@@ -956,3 +1044,4 @@ def get_eval_report(project_id: str, current_user: CurrentUser | None = Depends(
         ),
         disagreements=sorted(disagreements, key=lambda x: x.index),
     )
+    return json_response(request, report)
@@ -1,10 +1,37 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 
+from eogum.auth import auth_stats
 from eogum.models.schemas import HealthResponse
+from eogum.services.database import db_pool_stats, db_retry_stats
+from eogum.services.job_events import job_event_broker
+from eogum.services.storage_gc import storage_gc_stats
+from eogum.services.youtube import download_queue_stats
+from eogum.startup import startup_state
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health", response_model=HealthResponse)
 def health():
-    return HealthResponse(status="ok", version="0.1.0")
+    return HealthResponse(
+        status="ok",
+        version="0.1.0",
+        ready=startup_state.ready,
+        startup=startup_state.snapshot(),
+        db_pool=db_pool_stats(),
+        db_retry=db_retry_stats(),
+        auth=auth_stats(),
+        job_events=job_event_broker.stats(),
+        youtube_downloads=download_queue_stats(),
+        storage_gc=storage_gc_stats(),
+    )
+
+
+@router.get("/health/ready")
+def readiness():
+    """503 until startup recovery has finished; for deploys that gate on it."""
+    snapshot = startup_state.snapshot()
+    if not startup_state.ready:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=snapshot)
+    return snapshot
@@ -3,12 +3,17 @@ import hashlib
 import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from eogum.auth import CurrentUser, get_current_user, get_optional_current_user
+from eogum.config import settings
 from eogum.models.schemas import (
+    JobDetailResponse,
     ProjectCreate,
     ProjectDetailResponse,
+    ProjectPage,
     ProjectResponse,
     ProjectUpdateRequest,
     ProjectVariantCreate,
@@ -16,10 +21,14 @@ from eogum.models.schemas import (
     UpdateExtraSourcesRequest,
     UpdateMulticamSettingsRequest,
 )
+from eogum.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, keyset_page, page_items
 from eogum.public_access import is_public_project_id
+from eogum.responses import json_response
 from eogum.services.artifacts import get_latest_artifact_job
 from eogum.services.credit import get_balance
 from eogum.services.database import get_db
+from eogum.services.evaluation_store import fetch_evaluation_row
+from eogum.services.job_events import JOB_EVENT_COLUMNS, Subscription, format_sse, job_event_broker
 from eogum.services.job_runner import (
     create_cut_decision_job,
     create_initial_job,
@@ -29,9 +38,11 @@ from eogum.services.job_runner import (
     enqueue_reprocess,
     enqueue_source_derive,
 )
-from eogum.services.r2 import delete_objects, download_to_bytes, object_exists
+from eogum.services.r2 import object_exists
 from eogum.services import source_derivatives
 from eogum.services.source_cache import lookup_source_asset, upsert_source_asset
+from eogum.services.storage_gc import enqueue_deletions
+from eogum.services.transcript_sidecar import load_transcript_document
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 logger = logging.getLogger(__name__)
@@ -55,6 +66,25 @@ EDIT_INTENSITY_LABELS = {
     "heavy": "많이 편집",
 }
 
+# Explicit projections so list/detail reads skip large columns (project_json
+# and friends on projects, input_payload on jobs) that the responses never use.
+# Project detail lists jobs by their summary columns only; stages, metadata and
+# result keys are read per job from GET /projects/{id}/jobs/{job_id}.
+PROJECT_LIST_COLUMNS = (
+    "id, user_id, name, status, cut_type, language, source_filename, source_duration_seconds, "
+    "source_sha256, source_derived, extra_sources, multicam_state, settings, created_at, updated_at"
+)
+PROJECT_DETAIL_COLUMNS = f"{PROJECT_LIST_COLUMNS}, source_r2_key, source_size_bytes"
+JOB_SUMMARY_COLUMNS = (
+    "id, type, retry_of_job_id, attempt_number, status, progress, error_message, started_at, "
+    "completed_at, created_at"
+)
+JOB_DETAIL_COLUMNS = (
+    f"{JOB_SUMMARY_COLUMNS}, pipeline_stages, external_task_ids, processing_metadata, result_r2_keys, "
+    "source_job_id, input_payload"
+)
+EDIT_REPORT_COLUMNS = "total_duration_seconds, cut_duration_seconds, cut_percentage, edit_summary, report_markdown"
+
 
 def _extra_sources_hash(extra_sources: list[dict]) -> str | None:
     if not extra_sources:
@@ -251,20 +281,22 @@ def _sanitize_public_project_detail(project: dict) -> dict:
     public_project["source_r2_key"] = None
     public_project["source_derived"] = _public_source_derived(public_project.get("source_derived"))
     public_project["extra_sources"] = _public_extra_sources(public_project.get("extra_sources") or [])
-    public_jobs = []
-    for job in public_project.get("jobs") or []:
-        public_job = dict(job)
-        public_job["external_task_ids"] = {}
-        public_job["result_r2_keys"] = None
-        if public_job.get("type") == "ai_cut_render":
-            metadata = dict(public_job.get("processing_metadata") or {})
-            metadata.pop("output_r2_key", None)
-            public_job["processing_metadata"] = metadata
-        public_jobs.append(public_job)
-    public_project["jobs"] = public_jobs
     return public_project
 
 
+def _public_job(job: dict) -> dict:
+    public_job = dict(job)
+    public_job["external_task_ids"] = {}
+    public_job["result_r2_keys"] = None
+    if "input_payload" in public_job:
+        public_job["input_payload"] = None
+    if public_job.get("type") == "ai_cut_render":
+        metadata = dict(public_job.get("processing_metadata") or {})
+        metadata.pop("output_r2_key", None)
+        public_job["processing_metadata"] = metadata
+    return public_job
+
+
 def _upsert_project_source_asset_best_effort(db, project: dict) -> None:
     source_sha256 = project.get("source_sha256")
     source_size_bytes = project.get("source_size_bytes")
@@ -794,16 +826,34 @@ def create_project_variant(project_id: str, req: ProjectVariantCreate, current_u
     return _annotate_project_access(project, current_user)
 
 
-@router.get("", response_model=list[ProjectResponse])
-def list_projects(current_user: CurrentUser = Depends(get_current_user)):
+@router.get("", response_model=ProjectPage)
+def list_projects(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    source_sha256: str | None = None,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """List projects newest first, one keyset page at a time."""
     db = get_db()
-    result = _project_access_query(db, current_user).order("created_at", desc=True).execute()
-    return [_annotate_project_access(project, current_user) for project in result.data or []]
+    query = _project_access_query(db, current_user, PROJECT_LIST_COLUMNS)
+    if source_sha256:
+        query = query.eq("source_sha256", source_sha256)
+    rows, next_cursor = page_items(keyset_page(query, limit=limit, cursor=cursor).execute().data or [], limit)
+    return json_response(
+        request,
+        {
+            "items": [_annotate_project_access(project, current_user) for project in rows],
+            "next_cursor": next_cursor,
+        },
+        ProjectPage,
+    )
 
 
 @router.get("/{project_id}", response_model=ProjectDetailResponse)
 def get_project(
     project_id: str,
+    request: Request,
     current_user: CurrentUser | None = Depends(get_optional_current_user),
 ):
     db = get_db()
@@ -812,11 +862,12 @@ def get_project(
         db,
         project_id,
         current_user,
+        PROJECT_DETAIL_COLUMNS,
         allow_public_read=True,
     )
 
-    jobs = db.table("jobs").select("*").eq("project_id", project_id).order("created_at").execute()
-    report = db.table("edit_reports").select("*").eq("project_id", project_id).limit(1).execute()
+    jobs = db.table("jobs").select(JOB_SUMMARY_COLUMNS).eq("project_id", project_id).order("created_at").execute()
+    report = db.table("edit_reports").select(EDIT_REPORT_COLUMNS).eq("project_id", project_id).limit(1).execute()
 
     data = dict(project_data)
     data["jobs"] = jobs.data
@@ -824,7 +875,91 @@ def get_project(
     data = _annotate_project_access(data, current_user)
     if not _has_project_owner_access(project_data, current_user):
         data = _sanitize_public_project_detail(data)
-    return data
+    return json_response(request, data, ProjectDetailResponse)
+
+
+@router.get("/{project_id}/jobs/{job_id}", response_model=JobDetailResponse)
+def get_project_job(
+    project_id: str,
+    job_id: str,
+    request: Request,
+    current_user: CurrentUser | None = Depends(get_optional_current_user),
+):
+    """Full job row: stages, metadata, result keys and the request payload left out of project detail."""
+    db = get_db()
+
+    project_data = _get_accessible_project(db, project_id, current_user, "id, user_id", allow_public_read=True)
+    job = (
+        db.table("jobs")
+        .select(JOB_DETAIL_COLUMNS)
+        .eq("id", job_id)
+        .eq("project_id", project_id)
+        .limit(1)
+        .execute()
+        .data
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    job = job[0]
+    if not _has_project_owner_access(project_data, current_user):
+        job = _public_job(job)
+    return json_response(request, job, JobDetailResponse)
+
+
+@router.get("/{project_id}/events")
+async def stream_project_events(
+    project_id: str,
+    current_user: CurrentUser | None = Depends(get_optional_current_user),
+):
+    """Server-Sent Events for the project's jobs.
+
+    Sends a ``jobs`` snapshot first, then a ``job`` event whenever a job's
+    status, progress or pipeline stages change, with comment keepalives in
+    between. Replaces polling the project detail for progress.
+    """
+    db = get_db()
+    await run_in_threadpool(
+        _get_accessible_project,
+        db,
+        project_id,
+        current_user,
+        "id, user_id",
+        allow_public_read=True,
+    )
+    # Subscribe before the snapshot so no change between the two is lost.
+    subscription = job_event_broker.subscribe(project_id)
+    try:
+        jobs = await run_in_threadpool(
+            lambda: (
+                db.table("jobs")
+                .select(JOB_EVENT_COLUMNS)
+                .eq("project_id", project_id)
+                .order("created_at")
+                .execute()
+            )
+        )
+    except BaseException:
+        job_event_broker.unsubscribe(subscription)
+        raise
+    return StreamingResponse(
+        _job_event_stream(subscription, jobs.data or []),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _job_event_stream(subscription: Subscription, jobs: list[dict]):
+    try:
+        yield format_sse("jobs", jobs)
+        while True:
+            events = await subscription.next_events(settings.job_events_keepalive_seconds)
+            if not events:
+                yield ": keepalive\n\n"
+                continue
+            for event in events:
+                yield format_sse("job", event)
+    finally:
+        job_event_broker.unsubscribe(subscription)
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
@@ -1186,28 +1321,20 @@ def multicam_reprocess(project_id: str, current_user: CurrentUser = Depends(get_
     if not project_json_key:
         raise HTTPException(status_code=404, detail="프로젝트 JSON이 없습니다. 전체 재처리가 필요합니다.")
 
-    project_json_bytes = download_to_bytes(project_json_key)
     try:
-        stored_project_json = json.loads(project_json_bytes.decode("utf-8"))
-    except Exception as exc:
+        stored_document = load_transcript_document(r2_keys)
+    except (ValueError, OSError, KeyError) as exc:
         raise HTTPException(status_code=500, detail="저장된 프로젝트 JSON을 읽을 수 없습니다") from exc
 
-    eval_result = (
-        db.table("evaluations")
-        .select("segments")
-        .eq("project_id", project_id)
-        .eq("evaluator_id", owner_user_id)
-        .limit(1)
-        .execute()
-    )
-    evaluation_payload = eval_result.data[0]["segments"] if eval_result.data else None
+    evaluation = fetch_evaluation_row(db, project_id, owner_user_id, "segments")
+    evaluation_payload = evaluation["segments"] if evaluation else None
     if isinstance(evaluation_payload, dict):
         eval_segments = evaluation_payload.get("segments") or []
     else:
         eval_segments = evaluation_payload
 
     has_extra_sources = bool(project_data.get("extra_sources"))
-    current_project_has_extra_sources = len(stored_project_json.get("source_files") or []) > 1
+    current_project_has_extra_sources = len(stored_document.source_files) > 1
     if not eval_segments and not has_extra_sources and not current_project_has_extra_sources:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1274,15 +1401,8 @@ def regenerate_exports(project_id: str, current_user: CurrentUser = Depends(get_
     if not job or not (job["result_r2_keys"] or {}).get("project_json"):
         raise HTTPException(status_code=404, detail="프로젝트 JSON이 없습니다. 전체 재처리가 필요합니다.")
 
-    eval_result = (
-        db.table("evaluations")
-        .select("segments")
-        .eq("project_id", project_id)
-        .eq("evaluator_id", owner_user_id)
-        .limit(1)
-        .execute()
-    )
-    evaluation_payload = eval_result.data[0]["segments"] if eval_result.data else None
+    evaluation = fetch_evaluation_row(db, project_id, owner_user_id, "segments")
+    evaluation_payload = evaluation["segments"] if evaluation else None
     eval_segments = (
         evaluation_payload.get("segments") if isinstance(evaluation_payload, dict)
         else evaluation_payload
@@ -1414,8 +1534,9 @@ def delete_project(project_id: str, current_user: CurrentUser = Depends(get_curr
             if isinstance(output_key, str):
                 r2_keys.append(output_key)
     try:
-        delete_objects([key for key in r2_keys if key])
+        enqueue_deletions(db, r2_keys, reason="project_delete", project_id=project_id)
     except Exception:
-        logger.exception("Best-effort R2 cleanup failed for project %s", project_id)
+        # The orphan reconciler reclaims these objects later.
+        logger.exception("Failed to queue R2 cleanup for project %s", project_id)
 
     db.table("projects").delete().eq("id", project_id).execute()
@@ -1,12 +1,17 @@
 import logging
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from eogum.auth import get_user_id
 from eogum.models.schemas import SourceLookupRequest, SourceLookupResponse
 from eogum.services.database import get_db
 from eogum.services.r2 import object_exists
-from eogum.services.source_cache import delete_source_asset, lookup_source_asset, touch_source_asset
+from eogum.services.source_cache import (
+    delete_source_asset,
+    lookup_source_asset,
+    lookup_source_asset_by_fingerprint,
+    touch_source_asset,
+)
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 logger = logging.getLogger(__name__)
@@ -14,9 +19,18 @@ logger = logging.getLogger(__name__)
 
 @router.post("/lookup", response_model=SourceLookupResponse)
 def lookup_source(req: SourceLookupRequest, user_id: str = Depends(get_user_id)):
+    """Find an uploaded copy of a file by full SHA-256 or sampled fingerprint."""
     del user_id
     db = get_db()
-    asset = lookup_source_asset(db, sha256=req.sha256, size_bytes=req.size_bytes)
+    if req.sha256:
+        asset = lookup_source_asset(db, sha256=req.sha256, size_bytes=req.size_bytes)
+    elif req.fingerprint:
+        asset = lookup_source_asset_by_fingerprint(db, fingerprint=req.fingerprint, size_bytes=req.size_bytes)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="sha256 또는 fingerprint 중 하나가 필요합니다",
+        )
     if not asset:
         return SourceLookupResponse(hit=False)
 
@@ -31,4 +45,5 @@ def lookup_source(req: SourceLookupRequest, user_id: str = Depends(get_user_id))
         hit=True,
         r2_key=r2_key,
         source_asset_id=asset.get("id"),
+        sha256=asset.get("sha256"),
     )
@@ -80,4 +80,6 @@ def get_download_status(task_id: str, user_id: str = Depends(get_user_id)):
         "filename": task.filename or None,
         "duration_seconds": task.duration_seconds,
         "filesize_bytes": task.filesize_bytes,
+        "source_sha256": task.sha256 or None,
+        "queue_position": task.queue_position,
     }
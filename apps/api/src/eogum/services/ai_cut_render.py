@@ -46,6 +46,7 @@ def get_latest_ai_source_job(
     result = execute_with_retry(
         lambda: query.execute(),
         operation_name=f"jobs.select.latest_ai_source project_id={project_id}",
+        hedge=True,
     )
     for row in result.data or []:
         if (row.get("result_r2_keys") or {}).get("project_json"):
@@ -38,6 +38,7 @@ def get_latest_artifact_job(
     result = execute_with_retry(
         lambda: query.execute(),
         operation_name=f"jobs.select.latest_artifact project_id={project_id}",
+        hedge=True,
     )
     row = result.data[0] if result.data else None
     if not row or not row.get("result_r2_keys"):
@@ -1,49 +1,367 @@
+import contextvars
 import logging
+import random
 import threading
 import time
-from collections.abc import Callable
-from typing import TypeVar
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
-from postgrest.exceptions import APIError
-from supabase import Client, ClientOptions, create_client
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 from eogum.config import settings
 
 logger = logging.getLogger(__name__)
 
-_thread_local = threading.local()
 T = TypeVar("T")
 
-_SUPABASE_MAX_RETRIES = 3
-_SUPABASE_RETRY_DELAY_SECONDS = 5
+_SUPABASE_TIMEOUT_SECONDS = 120.0
+
+
+class PoolMetrics:
+    """Counters for the shared Supabase connection budget."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.in_flight = 0
+            self.peak_in_flight = 0
+            self.requests = 0
+            self.waited_requests = 0
+            self.timeouts = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record_acquire(self, wait_seconds: float, waited: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if waited:
+                self.waited_requests += 1
+                self.total_wait_seconds += wait_seconds
+                self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def record_release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def record_timeout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.waited_requests += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def snapshot(self, capacity: int) -> dict:
+        with self._lock:
+            return {
+                "capacity": capacity,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "saturation": round(self.in_flight / capacity, 3) if capacity else 0.0,
+                "requests": self.requests,
+                "waited_requests": self.waited_requests,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait_seconds * 1000, 1),
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 1),
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response body that gives its request slot back once closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class MeteredTransport(httpx.BaseTransport):
+    """Bound concurrent Supabase requests and measure time spent waiting.
+
+    httpx already caps connections, but it waits silently. Taking a slot here
+    first makes pool saturation and wait time visible in ``pool_metrics``.
+    A slot is held until the response body is closed.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        *,
+        max_requests: int,
+        pool_timeout_seconds: float,
+        metrics: PoolMetrics = pool_metrics,
+    ):
+        self._transport = transport
+        self._slots = threading.BoundedSemaphore(max_requests)
+        self._pool_timeout_seconds = pool_timeout_seconds
+        self._metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        waited = not self._slots.acquire(blocking=False)
+        if waited and not self._slots.acquire(timeout=self._pool_timeout_seconds):
+            self._metrics.record_timeout(time.perf_counter() - started)
+            raise httpx.PoolTimeout("Supabase connection pool is saturated", request=request)
+        self._metrics.record_acquire(time.perf_counter() - started, waited)
+
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            self._release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # Already buffered; no connection is held for the body.
+            self._release()
+        else:
+            response.stream = _ReleasingStream(response.stream, self._release)
+        return response
+
+    def _release(self) -> None:
+        self._metrics.record_release()
+        self._slots.release()
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+_client: "ResilientClient | None" = None
+_client_lock = threading.Lock()
+
 
+def _create_db_client() -> "ResilientClient":
+    # supabase pulls in every sub-client (auth, storage, realtime, ...);
+    # import it on first use so API startup does not pay for it.
+    from supabase import ClientOptions, create_client
 
-def _create_db_client() -> Client:
+    transport = MeteredTransport(
+        httpx.HTTPTransport(
+            http2=settings.supabase_http2,
+            limits=httpx.Limits(
+                max_connections=settings.supabase_max_connections,
+                max_keepalive_connections=settings.supabase_max_keepalive_connections,
+            ),
+        ),
+        max_requests=settings.supabase_max_connections,
+        pool_timeout_seconds=settings.supabase_pool_timeout_seconds,
+    )
     http_client = httpx.Client(
-        http2=False,
-        timeout=httpx.Timeout(120.0),
-        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        transport=transport,
+        timeout=httpx.Timeout(_SUPABASE_TIMEOUT_SECONDS),
     )
     options = ClientOptions(
-        postgrest_client_timeout=httpx.Timeout(120.0),
-        storage_client_timeout=120,
+        postgrest_client_timeout=httpx.Timeout(_SUPABASE_TIMEOUT_SECONDS),
+        storage_client_timeout=int(_SUPABASE_TIMEOUT_SECONDS),
         httpx_client=http_client,
     )
-    return create_client(settings.supabase_url, settings.supabase_service_key, options)
+    return ResilientClient(create_client(settings.supabase_url, settings.supabase_service_key, options))
+
 
+def get_db() -> "ResilientClient":
+    """Get the process-wide Supabase client (service role for backend operations).
 
-def get_db() -> Client:
-    """Get Supabase client (service role for backend operations)."""
-    client = getattr(_thread_local, "client", None)
+    All threads share one client and therefore one bounded connection pool;
+    request builders are created per call, so sharing it is thread-safe.
+    """
+    global _client
+    client = _client
     if client is None:
-        client = _create_db_client()
-        _thread_local.client = client
+        with _client_lock:
+            if _client is None:
+                _client = _create_db_client()
+            client = _client
     return client
 
 
+def close_db() -> None:
+    """Close the shared client's connections; the next ``get_db`` reconnects."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    http_client = getattr(getattr(client, "options", None), "httpx_client", None)
+    if http_client is not None:
+        http_client.close()
+
+
+def db_pool_stats() -> dict:
+    return pool_metrics.snapshot(settings.supabase_max_connections)
+
+
+class DatabaseUnavailable(RuntimeError):
+    """Raised without contacting Supabase while the circuit breaker is open."""
+
+
+class DatabaseDeadlineExceeded(DatabaseUnavailable):
+    """Raised when a hedged read is still unanswered at its deadline.
+
+    The caller ran out of time, which says nothing about Supabase's health,
+    so it is neither retried nor counted against the breaker.
+    """
+
+
+class CircuitBreaker:
+    """Process-wide breaker shared by every Supabase operation.
+
+    It opens after ``failure_threshold`` consecutive transient failures.
+    While open, operations fail fast with ``DatabaseUnavailable`` instead of
+    queueing retries. After ``cooldown_seconds`` one probe is let through;
+    its success closes the breaker, and its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        cooldown_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN:
+                if self._clock() - self.opened_at < self.cooldown_seconds:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                logger.info("Supabase circuit breaker closed")
+            self.state = self.CLOSED
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Hand back a half-open probe that ended without a verdict."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a transient failure; return True while the breaker is open."""
+        with self._lock:
+            self.consecutive_failures += 1
+            should_open = self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold
+            )
+            if not should_open:
+                return self.state == self.OPEN
+            self.state = self.OPEN
+            self.opened_at = self._clock()
+            self.opens += 1
+            self._probe_in_flight = False
+        logger.warning(
+            "Supabase circuit breaker opened after %d consecutive failure(s); failing fast for %ss",
+            self.consecutive_failures,
+            self.cooldown_seconds,
+        )
+        return True
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "opens": self.opens,
+            }
+
+
+class RetryMetrics:
+    """Counters for ``execute_with_retry``."""
+
+    FIELDS = (
+        "operations",
+        "retries",
+        "failures",
+        "fast_failures",
+        "deadline_exhausted",
+        "hedges",
+        "hedge_wins",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def increment(self, field: str) -> None:
+        with self._lock:
+            self._counts[field] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._counts)
+
+
+supabase_breaker = CircuitBreaker(
+    failure_threshold=settings.supabase_breaker_failure_threshold,
+    cooldown_seconds=settings.supabase_breaker_cooldown_seconds,
+)
+retry_metrics = RetryMetrics()
+
+_in_retry_scope: ContextVar[bool] = ContextVar("supabase_in_retry_scope", default=False)
+_scoped_deadline: ContextVar[float | None] = ContextVar("supabase_scoped_deadline", default=None)
+_hedge_slots = threading.BoundedSemaphore(settings.supabase_hedge_max_in_flight)
+_hedge_executor = ThreadPoolExecutor(
+    max_workers=settings.supabase_hedge_max_in_flight,
+    thread_name_prefix="supabase-hedge",
+)
+
+
+@contextmanager
+def operation_deadline(seconds: float) -> Iterator[None]:
+    """Cap every Supabase operation started inside the block at ``seconds`` from now."""
+    token = _scoped_deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _scoped_deadline.reset(token)
+
+
 def _is_retryable_supabase_error(exc: Exception) -> bool:
-    if isinstance(exc, httpx.HTTPError):
+    from postgrest.exceptions import APIError
+
+    if isinstance(exc, (httpx.HTTPError, TimeoutError)):
         return True
     if isinstance(exc, APIError):
         try:
@@ -56,16 +374,125 @@ def _is_retryable_supabase_error(exc: Exception) -> bool:
     return False
 
 
-def execute_with_retry(operation: Callable[[], T], *, operation_name: str) -> T:
-    """Run a Supabase/PostgREST operation with retries for transient transport/server errors."""
-    max_attempts = _SUPABASE_MAX_RETRIES + 1
+def _request_was_not_sent(exc: Exception) -> bool:
+    """True when the request never reached Supabase, so re-sending is safe."""
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the sleep after ``attempt``."""
+    ceiling = min(
+        settings.supabase_retry_max_delay_seconds,
+        settings.supabase_retry_base_delay_seconds * (2 ** (attempt - 1)),
+    )
+    return random.uniform(0, ceiling)
+
+
+def _submit_hedge_slot(operation: Callable[[], T]) -> Future:
+    future = _hedge_executor.submit(contextvars.copy_context().run, operation)
+    future.add_done_callback(lambda _future: _hedge_slots.release())
+    return future
+
+
+def _run_hedged(operation: Callable[[], T], operation_name: str, deadline: float) -> T:
+    """Run a read, starting a duplicate if it is slower than the hedge threshold.
+
+    The first successful result wins. Without a free hedge slot the read
+    simply runs inline. ``execute_with_retry`` only calls this while the
+    deadline is still ahead.
+    """
+    hedge_after = settings.supabase_hedge_after_seconds
+    if hedge_after <= 0 or not _hedge_slots.acquire(blocking=False):
+        return operation()
+
+    primary = _submit_hedge_slot(operation)
+    done, _ = wait([primary], timeout=min(hedge_after, max(0.0, deadline - time.monotonic())))
+    if done:
+        return primary.result()
+
+    pending = {primary}
+    if _hedge_slots.acquire(blocking=False):
+        retry_metrics.increment("hedges")
+        hedge = _submit_hedge_slot(operation)
+        pending.add(hedge)
+    else:
+        hedge = None
+
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            if future.exception() is None:
+                if future is hedge:
+                    retry_metrics.increment("hedge_wins")
+                return future.result()
+            error = future.exception()
+    if error is not None:
+        raise error
+    raise DatabaseDeadlineExceeded(f"Supabase read exceeded its deadline: {operation_name}")
+
+
+def execute_with_retry(
+    operation: Callable[[], T],
+    *,
+    operation_name: str,
+    idempotent: bool = True,
+    hedge: bool = False,
+    deadline_seconds: float | None = None,
+    breaker: CircuitBreaker | None = None,
+) -> T:
+    """Run a Supabase/PostgREST operation with backoff, a deadline and the shared breaker.
+
+    Transient transport/server errors are retried with full-jitter
+    exponential backoff until ``supabase_retry_max_attempts`` or the
+    deadline runs out. Operations that are not ``idempotent`` are re-sent
+    only when the request never left this process. ``hedge`` duplicates
+    slow reads. Supabase calls made inside ``operation`` run exactly once;
+    this call owns their retries.
+    """
+    breaker = breaker or supabase_breaker
+    deadline = time.monotonic() + (
+        settings.supabase_operation_deadline_seconds if deadline_seconds is None else deadline_seconds
+    )
+    scoped_deadline = _scoped_deadline.get()
+    if scoped_deadline is not None:
+        deadline = min(deadline, scoped_deadline)
+
+    max_attempts = max(1, settings.supabase_retry_max_attempts)
+    retry_metrics.increment("operations")
     for attempt in range(1, max_attempts + 1):
+        if not breaker.allow():
+            retry_metrics.increment("fast_failures")
+            raise DatabaseUnavailable(f"Supabase circuit breaker is open: {operation_name}")
+
+        # Once the deadline has passed a hedge would only double the load of
+        # a read that can no longer wait for either copy; run it inline.
+        hedged = hedge and time.monotonic() < deadline
+        token = _in_retry_scope.set(True)
         try:
-            return operation()
+            result = _run_hedged(operation, operation_name, deadline) if hedged else operation()
+        except DatabaseDeadlineExceeded:
+            breaker.release_probe()
+            retry_metrics.increment("failures")
+            retry_metrics.increment("deadline_exhausted")
+            logger.warning("Supabase read abandoned at its deadline: %s attempt=%s", operation_name, attempt)
+            raise
         except Exception as exc:
             retryable = _is_retryable_supabase_error(exc)
-            is_last_attempt = attempt == max_attempts
-            if not retryable or is_last_attempt:
+            breaker_open = False
+            if retryable:
+                breaker_open = breaker.record_failure()
+            else:
+                breaker.record_success()
+            resendable = retryable and not breaker_open and (idempotent or _request_was_not_sent(exc))
+            delay = _backoff_delay(attempt)
+            out_of_time = time.monotonic() + delay >= deadline
+            if not resendable or attempt == max_attempts or out_of_time:
+                retry_metrics.increment("failures")
+                if resendable and attempt < max_attempts:
+                    retry_metrics.increment("deadline_exhausted")
                 logger.exception(
                     "Supabase operation failed: %s attempt=%s/%s retryable=%s",
                     operation_name,
@@ -75,14 +502,126 @@ def execute_with_retry(operation: Callable[[], T], *, operation_name: str) -> T:
                 )
                 raise
 
+            retry_metrics.increment("retries")
             logger.warning(
-                "Supabase operation failed; retrying in %ss: %s attempt=%s/%s error=%r",
-                _SUPABASE_RETRY_DELAY_SECONDS,
+                "Supabase operation failed; retrying in %.2fs: %s attempt=%s/%s error=%r",
+                delay,
                 operation_name,
                 attempt,
                 max_attempts,
                 exc,
             )
-            time.sleep(_SUPABASE_RETRY_DELAY_SECONDS)
+            time.sleep(delay)
+            continue
+        finally:
+            _in_retry_scope.reset(token)
+
+        breaker.record_success()
+        return result
 
     raise RuntimeError(f"unreachable Supabase retry state: {operation_name}")
+
+
+def db_retry_stats() -> dict:
+    return {**retry_metrics.snapshot(), "breaker": supabase_breaker.snapshot()}
+
+
+class QueryProxy:
+    """Wrap a PostgREST request builder so ``execute`` goes through ``run``.
+
+    Chained builder methods return proxies as well, so queries are built
+    exactly as on the plain client. ``run(query, execute)`` receives the
+    final builder and a zero-argument callable that sends it.
+    """
+
+    __slots__ = ("_query", "_run")
+
+    def __init__(self, query: Any, run: Callable[[Any, Callable[[], Any]], Any]):
+        self._query = query
+        self._run = run
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._query, name)
+        if name == "execute":
+            return lambda *args, **kwargs: self._run(self._query, lambda: attr(*args, **kwargs))
+        if not callable(attr):
+            return attr
+
+        def chain(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return QueryProxy(result, self._run) if hasattr(result, "execute") else result
+
+        return chain
+
+
+def _http_method(query: Any) -> str:
+    method = getattr(getattr(query, "request", None), "http_method", None)
+    return str(getattr(method, "value", method) or "").upper()
+
+
+class ResilientClient:
+    """Supabase client whose queries all run through ``execute_with_retry``.
+
+    Reads are retried and hedged. Writes get the breaker and are re-sent
+    only when they never reached Supabase, because CAS-style updates, inserts
+    and credit RPCs are not safe to replay. Call sites that know a write is
+    idempotent wrap it in ``execute_with_retry`` themselves.
+    """
+
+    def __init__(self, client: "Client"):
+        self.client = client
+
+    def table(self, name: str) -> QueryProxy:
+        return QueryProxy(self.client.table(name), partial(_execute_resilient, name))
+
+    from_ = table
+
+    def rpc(self, fn: str, params: dict | None = None, **kwargs) -> QueryProxy:
+        return QueryProxy(self.client.rpc(fn, params or {}, **kwargs), partial(_execute_resilient, f"rpc.{fn}"))
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
+
+
+_write_listeners: dict[str, list[Callable[[list[dict]], None]]] = {}
+
+
+def add_write_listener(table: str, listener: Callable[[list[dict]], None]) -> None:
+    """Call ``listener`` with the returned rows after each insert/update/upsert on ``table``.
+
+    Listeners run on the writing thread and must be cheap; their errors are
+    logged and never fail the write.
+    """
+    _write_listeners.setdefault(table, []).append(listener)
+
+
+def _notify_write_listeners(target: str, method: str, result: Any) -> None:
+    listeners = _write_listeners.get(target)
+    if not listeners or method not in {"POST", "PATCH"}:
+        return
+    rows = getattr(result, "data", None)
+    if isinstance(rows, dict):
+        rows = [rows]
+    if not rows:
+        return
+    for listener in listeners:
+        try:
+            listener(rows)
+        except Exception:
+            logger.exception("Write listener failed for %s", target)
+
+
+def _execute_resilient(target: str, query: Any, execute: Callable[[], T]) -> T:
+    method = _http_method(query)
+    if _in_retry_scope.get():
+        result = execute()
+    else:
+        read = method in {"GET", "HEAD"}
+        result = execute_with_retry(
+            execute,
+            operation_name=f"{target} {method or 'execute'}",
+            idempotent=read,
+            hedge=read,
+        )
+    _notify_write_listeners(target, method, result)
+    return result
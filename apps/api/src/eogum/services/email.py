@@ -1,7 +1,5 @@
 import logging
 
-import resend
-
 from eogum.config import settings
 
 logger = logging.getLogger(__name__)
@@ -12,6 +10,8 @@ def _send(to: str, subject: str, html: str) -> None:
         logger.warning("RESEND_API_KEY not set, skipping email to %s: %s", to, subject)
         return
 
+    import resend
+
     resend.api_key = settings.resend_api_key
     resend.Emails.send({
         "from": settings.email_from,
@@ -0,0 +1,250 @@
+"""Evaluation snapshots plus the per-segment deltas appended on top of them.
+
+``evaluations.segments`` holds a full review snapshot as of
+``snapshot_revision``. Each review action appends a small delta row to
+``evaluation_deltas`` and bumps ``revision`` through the
+``append_evaluation_delta`` RPC, so a save costs a write proportional to
+the change instead of a full snapshot rewrite. Full saves go through the
+``save_evaluation_snapshot`` RPC (migration 022). Readers replay deltas above
+the snapshot, and the snapshot is compacted once enough deltas pile up.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+EVALUATION_DELTA_FIELDS = ("human", "ai")
+EVALUATION_COMPACTION_THRESHOLD = 50
+
+_REVISION_COLUMNS = ("id", "revision", "snapshot_revision")
+
+
+def _first_row(data) -> dict | None:
+    if isinstance(data, list):
+        return data[0] if data else None
+    return data if isinstance(data, dict) else None
+
+
+def _revision(row: dict, column: str) -> int:
+    return int(row.get(column) or 0)
+
+
+def apply_segment_deltas(segments_value, deltas: Iterable[list[dict] | None]):
+    """Return ``segments_value`` with delta changes replayed in order.
+
+    ``segments_value`` is the stored ``evaluations.segments`` value (a review
+    payload dict or a legacy bare segment list). Each change is
+    ``{"index": <segment index>, "human": ..., "ai": ...}`` and replaces only
+    the decision fields it carries; unknown segment indexes are ignored. The
+    input is left untouched and only the changed segments are copied.
+    """
+    segments = segments_value.get("segments") if isinstance(segments_value, dict) else segments_value
+    if not isinstance(segments, list):
+        return segments_value
+
+    positions = {
+        segment.get("index"): position
+        for position, segment in enumerate(segments)
+        if isinstance(segment, dict)
+    }
+    updated: list | None = None
+    copied: set[int] = set()
+    for changes in deltas:
+        for change in changes or []:
+            if not isinstance(change, dict):
+                continue
+            position = positions.get(change.get("index"))
+            if position is None:
+                continue
+            if updated is None:
+                updated = list(segments)
+            if position not in copied:
+                updated[position] = dict(updated[position])
+                copied.add(position)
+            for field in EVALUATION_DELTA_FIELDS:
+                if field in change:
+                    updated[position][field] = change[field]
+
+    if updated is None:
+        return segments_value
+    if isinstance(segments_value, dict):
+        return {**segments_value, "segments": updated}
+    return updated
+
+
+def _with_revision_columns(select: str) -> str:
+    if select.strip() == "*":
+        return select
+    columns = [column.strip() for column in select.split(",") if column.strip()]
+    return ", ".join(columns + [column for column in _REVISION_COLUMNS if column not in columns])
+
+
+def _pending_deltas(db, evaluation_id: str, after_revision: int, up_to_revision: int | None = None) -> list[dict]:
+    query = (
+        db.table("evaluation_deltas")
+        .select("revision, changes")
+        .eq("evaluation_id", evaluation_id)
+        .gt("revision", after_revision)
+    )
+    if up_to_revision is not None:
+        query = query.lte("revision", up_to_revision)
+    return query.order("revision").execute().data or []
+
+
+def has_pending_deltas(row: dict) -> bool:
+    return _revision(row, "revision") > _revision(row, "snapshot_revision") and "segments" in row
+
+
+def evaluation_row_with_deltas(row: dict, deltas: Iterable[dict]) -> dict:
+    """Replay the ``deltas`` rows that sit between the snapshot and ``revision``.
+
+    ``deltas`` may hold rows outside that window (for example when they were
+    embedded in the evaluation query); those are ignored.
+    """
+    if not has_pending_deltas(row):
+        return row
+    snapshot_revision = _revision(row, "snapshot_revision")
+    revision = _revision(row, "revision")
+    pending = sorted(
+        (delta for delta in deltas if snapshot_revision < _revision(delta, "revision") <= revision),
+        key=lambda delta: _revision(delta, "revision"),
+    )
+    return {
+        **row,
+        "segments": apply_segment_deltas(row["segments"], (delta.get("changes") for delta in pending)),
+    }
+
+
+def _merge_pending_deltas(db, row: dict) -> dict:
+    if not has_pending_deltas(row):
+        return row
+    deltas = _pending_deltas(db, row["id"], _revision(row, "snapshot_revision"), _revision(row, "revision"))
+    return evaluation_row_with_deltas(row, deltas)
+
+
+def fetch_evaluation_row(db, project_id: str, evaluator_id: str, select: str = "*") -> dict | None:
+    """Return an evaluation row with its ``segments`` brought up to ``revision``."""
+    result = (
+        db.table("evaluations")
+        .select(_with_revision_columns(select))
+        .eq("project_id", project_id)
+        .eq("evaluator_id", evaluator_id)
+        .limit(1)
+        .execute()
+    )
+    if not result.data:
+        return None
+    return _merge_pending_deltas(db, result.data[0])
+
+
+def save_evaluation_snapshot(
+    db,
+    project_id: str,
+    evaluator_id: str,
+    segments,
+    *,
+    avid_version: str | None = None,
+    eogum_version: str | None = None,
+) -> dict:
+    """Replace the snapshot through the ``save_evaluation_snapshot`` RPC.
+
+    A full save is last-write-wins like before. The RPC holds the same row
+    lock as ``append_evaluation_delta`` while it bumps ``revision`` and drops
+    the superseded deltas, so a concurrent delta either lands before the
+    save or conflicts with the new revision.
+    """
+    result = db.rpc(
+        "save_evaluation_snapshot",
+        {
+            "p_project_id": project_id,
+            "p_evaluator_id": evaluator_id,
+            "p_segments": segments,
+            "p_avid_version": avid_version,
+            "p_eogum_version": eogum_version,
+        },
+    ).execute()
+    row = _first_row(result.data)
+    if not row:
+        raise RuntimeError(f"save_evaluation_snapshot returned no row for project {project_id}")
+    return row
+
+
+def append_evaluation_delta(
+    db,
+    project_id: str,
+    evaluator_id: str,
+    expected_revision: int,
+    changes: list[dict],
+) -> dict | None:
+    """Append one delta if ``expected_revision`` is still current.
+
+    Returns ``None`` when the evaluation does not exist. Otherwise returns
+    ``{"id", "revision", "snapshot_revision", "applied", "updated_at"}``;
+    ``applied`` is false on a revision conflict.
+    """
+    result = db.rpc(
+        "append_evaluation_delta",
+        {
+            "p_project_id": project_id,
+            "p_evaluator_id": evaluator_id,
+            "p_expected_revision": expected_revision,
+            "p_changes": changes,
+        },
+    ).execute()
+    row = _first_row(result.data)
+    if not row:
+        return None
+
+    if row.get("applied") and (
+        _revision(row, "revision") - _revision(row, "snapshot_revision") >= EVALUATION_COMPACTION_THRESHOLD
+    ):
+        try:
+            compact_evaluation(db, row["id"])
+        except Exception:
+            logger.warning("Evaluation compaction failed for %s", row["id"], exc_info=True)
+    return row
+
+
+def compact_evaluation(db, evaluation_id: str) -> bool:
+    """Fold pending deltas into the ``segments`` snapshot.
+
+    The update is guarded on the snapshot revision that was read, so a
+    concurrent full save or compaction wins and this call becomes a no-op.
+    Deltas appended while compacting stay pending for the next pass.
+    """
+    row = _first_row(
+        db.table("evaluations")
+        .select("id, segments, revision, snapshot_revision")
+        .eq("id", evaluation_id)
+        .limit(1)
+        .execute()
+        .data
+    )
+    if not row:
+        return False
+    snapshot_revision = _revision(row, "snapshot_revision")
+    revision = _revision(row, "revision")
+    if revision <= snapshot_revision:
+        return False
+
+    merged = _merge_pending_deltas(db, row)
+    result = (
+        db.table("evaluations")
+        .update({"segments": merged["segments"], "snapshot_revision": revision})
+        .eq("id", evaluation_id)
+        .eq("snapshot_revision", snapshot_revision)
+        .execute()
+    )
+    if not result.data:
+        return False
+    (
+        db.table("evaluation_deltas")
+        .delete()
+        .eq("evaluation_id", evaluation_id)
+        .lte("revision", revision)
+        .execute()
+    )
+    return True
@@ -2,12 +2,21 @@
 
 import hashlib
 import json
+import logging
+import os
 import secrets
+import time
 from pathlib import Path
+from typing import Callable
 
 from eogum.config import settings
 
+logger = logging.getLogger(__name__)
+
 FINAL_PREVIEW_RENDER_VERSION = 3
+# Entries read this recently may still be open by a render that reopens the
+# source per interval, so the byte budget never evicts them.
+SOURCE_CACHE_MIN_IDLE_SECONDS = 2 * 60 * 60
 
 
 def decision_hash(payload: dict) -> str:
@@ -22,6 +31,14 @@ def final_preview_decision_hash(payload: dict) -> str:
     })
 
 
+def ai_decision_preview_hash(project_json_key: str) -> str:
+    """Hash for a preview that applies only the AI decisions of one artifact."""
+    return final_preview_decision_hash({
+        "decision_source": "ai",
+        "project_json": project_json_key,
+    })
+
+
 def preview_cache_key(project_id: str, hash_value: str) -> str:
     return f"{project_id}/{hash_value}"
 
@@ -53,3 +70,110 @@ def source_cache_path(r2_key: str, suffix: str) -> Path:
     digest = hashlib.sha256(r2_key.encode("utf-8")).hexdigest()
     safe_suffix = suffix if suffix.startswith(".") else f".{suffix}" if suffix else ".mp4"
     return settings.source_cache_dir / f"{digest}{safe_suffix}"
+
+
+def touch_source_cache_entry(path: Path) -> None:
+    """Mark a cached source as recently used without changing its mtime.
+
+    The FFprobe cache keys on mtime, so recency is tracked through atime.
+    """
+    try:
+        stat = path.stat()
+        os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
+    except OSError:
+        pass
+
+
+def link_cached_source(r2_key: str, destination: Path) -> bool:
+    """Hardlink a warm cached source into a job directory."""
+    cached_path = source_cache_path(r2_key, destination.suffix)
+    try:
+        if not cached_path.is_file() or cached_path.stat().st_size <= 0:
+            return False
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.unlink(missing_ok=True)
+        os.link(cached_path, destination)
+    except OSError:
+        return False
+    touch_source_cache_entry(cached_path)
+    return True
+
+
+def adopt_source_cache_file(local_path: Path, r2_key: str) -> Path | None:
+    """Hand a downloaded source over to the shared source cache.
+
+    The job keeps its own hardlink, so removing the job directory later leaves
+    the cache entry in place. Sources on another filesystem are not copied.
+    """
+    cached_path = source_cache_path(r2_key, local_path.suffix)
+    try:
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        if cached_path.is_file() and cached_path.stat().st_size == local_path.stat().st_size:
+            touch_source_cache_entry(cached_path)
+            return cached_path
+        link_tmp_path = cached_path.with_name(f"{cached_path.name}.{os.getpid()}.link")
+        link_tmp_path.unlink(missing_ok=True)
+        os.link(local_path, link_tmp_path)
+        link_tmp_path.replace(cached_path)
+    except OSError:
+        logger.info("Could not hand %s over to the source cache", local_path, exc_info=True)
+        return None
+    touch_source_cache_entry(cached_path)
+    enforce_source_cache_budget(keep=cached_path)
+    return cached_path
+
+
+def evict_least_recently_used(
+    entries: list[tuple[float, int, Path]],
+    budget: int,
+    remove: Callable[[Path], bool],
+    *,
+    keep: Path | None = None,
+) -> int:
+    """Remove ``(last_used, size_bytes, path)`` entries, oldest first, until they fit ``budget``.
+
+    Entries used within ``SOURCE_CACHE_MIN_IDLE_SECONDS`` and ``keep`` are never
+    removed; ``remove`` returns False for an entry it could not remove.
+    """
+    total_bytes = sum(size_bytes for _, size_bytes, _ in entries)
+    evicted = 0
+    now = time.time()
+    for last_used, size_bytes, path in sorted(entries, key=lambda entry: entry[0]):
+        if total_bytes <= budget:
+            break
+        if path == keep or now - last_used < SOURCE_CACHE_MIN_IDLE_SECONDS:
+            continue
+        if not remove(path):
+            continue
+        total_bytes -= size_bytes
+        evicted += 1
+    return evicted
+
+
+def enforce_source_cache_budget(*, keep: Path | None = None) -> int:
+    """Evict least recently used sources until the cache fits its byte budget."""
+    budget = settings.source_cache_max_bytes
+    cache_dir = settings.source_cache_dir
+    if budget <= 0 or not cache_dir.is_dir():
+        return 0
+
+    entries = []
+    for path in cache_dir.iterdir():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if not path.is_file() or path.name.endswith((".tmp", ".link")):
+            continue
+        entries.append((stat.st_atime, stat.st_size, path))
+    return evict_least_recently_used(entries, budget, _remove_cached_source, keep=keep)
+
+
+def _remove_cached_source(path: Path) -> bool:
+    try:
+        size_bytes = path.stat().st_size
+        path.unlink()
+    except OSError:
+        return False
+    logger.info("Evicted cached source %s (%d bytes)", path.name, size_bytes)
+    return True
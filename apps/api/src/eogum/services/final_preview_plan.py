@@ -0,0 +1,297 @@
+"""Per-project render plan that lets final previews re-render only what changed.
+
+The last completed preview of a project leaves its keep intervals, the
+encoded segment file of every interval and the review payload of its base
+artifact under ``<final_preview_cache_dir>/<project_id>/plan``. The next
+render diffs its intervals against that plan: the unchanged prefix and
+suffix reuse their encoded segments (and so the same timeline map entries,
+shifted by the change in length), and only the middle is encoded again
+before the stream-copy concat.
+
+A render that shares no interval with the previous plan (including a
+project's first preview) takes the streaming path and records only its
+intervals; segment files are kept once a project is being re-rendered.
+Plans count against ``FINAL_PREVIEW_PLAN_MAX_BYTES`` and the least recently
+rendered ones are evicted like cached sources.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable
+
+from eogum.config import settings
+from eogum.services import media_render
+from eogum.services.final_preview_cache import FINAL_PREVIEW_RENDER_VERSION, evict_least_recently_used
+
+logger = logging.getLogger(__name__)
+
+FINAL_PREVIEW_PLAN_VERSION = 1
+PLAN_FILENAME = "plan.json"
+REVIEW_SEGMENTS_FILENAME = "review_segments.json"
+
+_plan_locks: dict[str, threading.Lock] = {}
+_plan_locks_guard = threading.Lock()
+
+
+def preview_plan_dir(project_id: str) -> Path:
+    return settings.final_preview_cache_dir / project_id / "plan"
+
+
+def _plan_lock(project_id: str) -> threading.Lock:
+    with _plan_locks_guard:
+        return _plan_locks.setdefault(project_id, threading.Lock())
+
+
+def _interval_key(start: float, duration: float) -> tuple[int, int]:
+    # Same rounding as the render manifest's source_start/requested_duration.
+    return int(round(start * 1000)), int(round(duration * 1000))
+
+
+def _source_identity(source_path: Path) -> dict:
+    stat = source_path.stat()
+    return {"path": str(source_path.resolve()), "size_bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def diff_intervals(
+    previous: list[tuple[int, int]],
+    current: list[tuple[int, int]],
+) -> tuple[int, int]:
+    """Return the lengths of the common prefix and suffix of two interval lists.
+
+    The two never overlap, so ``current[prefix:len(current) - suffix]`` is the
+    region that has to be rendered again.
+    """
+    limit = min(len(previous), len(current))
+    prefix = 0
+    while prefix < limit and previous[prefix] == current[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and previous[-1 - suffix] == current[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _load_plan(plan_dir: Path, source: dict) -> list[dict]:
+    plan = _read_json(plan_dir / PLAN_FILENAME)
+    if (
+        not plan
+        or plan.get("version") != FINAL_PREVIEW_PLAN_VERSION
+        or plan.get("render_version") != FINAL_PREVIEW_RENDER_VERSION
+        or plan.get("profile") != media_render.FINAL_PREVIEW_PROFILE
+        or plan.get("source") != source
+    ):
+        return []
+    return [item for item in plan.get("intervals") or [] if isinstance(item, dict)]
+
+
+def _remove_unreferenced_segments(plan_dir: Path, keep: set[str]) -> None:
+    for path in plan_dir.glob("*.mp4"):
+        if path.name not in keep:
+            path.unlink(missing_ok=True)
+
+
+def render_with_plan(
+    project_id: str,
+    source_path: Path,
+    intervals: list[tuple[float, float]],
+    output_path: Path,
+) -> dict:
+    """Render keep intervals, reusing segments from the project's last plan.
+
+    Returns the same manifest as ``media_render.render_intervals`` plus
+    ``reused_intervals``. The plan is replaced by this render's intervals
+    once the concat succeeds.
+    """
+    plan_dir = preview_plan_dir(project_id)
+    with _plan_lock(project_id):
+        plan_dir.mkdir(parents=True, exist_ok=True)
+        source = _source_identity(source_path)
+        previous = _load_plan(plan_dir, source)
+        valid_intervals = [(start, duration) for start, duration in intervals if duration > 0]
+        prefix, suffix = diff_intervals(
+            [(int(item.get("source_start_ms", -1)), int(item.get("requested_duration_ms", -1))) for item in previous],
+            [_interval_key(start, duration) for start, duration in valid_intervals],
+        )
+        if prefix + suffix == 0:
+            manifest = _render_streaming(project_id, plan_dir, source, source_path, valid_intervals, output_path)
+        else:
+            manifest = _render_segments(
+                project_id, plan_dir, source, source_path, valid_intervals, output_path, previous, prefix, suffix
+            )
+    enforce_plan_budget(keep_project_id=project_id)
+    return manifest
+
+
+def _render_streaming(
+    project_id: str,
+    plan_dir: Path,
+    source: dict,
+    source_path: Path,
+    intervals: list[tuple[float, float]],
+    output_path: Path,
+) -> dict:
+    logger.info(
+        "Final preview plan for project %s: no matching plan, streaming %d intervals",
+        project_id,
+        len(intervals),
+    )
+    manifest = media_render.render_intervals(
+        source_path,
+        intervals,
+        output_path,
+        profile=media_render.FINAL_PREVIEW_PROFILE,
+        streaming=settings.render_streaming_concat,
+    )
+    _write_plan(plan_dir, source, manifest["intervals"])
+    _remove_unreferenced_segments(plan_dir, set())
+    return {**manifest, "reused_intervals": 0}
+
+
+def _render_segments(
+    project_id: str,
+    plan_dir: Path,
+    source: dict,
+    source_path: Path,
+    intervals: list[tuple[float, float]],
+    output_path: Path,
+    previous: list[dict],
+    prefix: int,
+    suffix: int,
+) -> dict:
+    segment_paths: list[Path] = []
+    reused_durations_ms: dict[int, int] = {}
+    new_paths: list[Path] = []
+    for position in range(len(intervals)):
+        if position < prefix:
+            reusable = previous[position]
+        elif position >= len(intervals) - suffix:
+            reusable = previous[position - len(intervals)]
+        else:
+            reusable = None
+        reusable_path = plan_dir / str(reusable.get("file") or "") if reusable else None
+        if reusable_path is not None and reusable_path.is_file() and int(reusable.get("actual_duration_ms") or 0) > 0:
+            segment_paths.append(reusable_path)
+            reused_durations_ms[position] = int(reusable["actual_duration_ms"])
+        else:
+            path = plan_dir / f"{uuid.uuid4().hex}.mp4"
+            segment_paths.append(path)
+            new_paths.append(path)
+
+    logger.info(
+        "Final preview plan for project %s: reusing %d of %d intervals (prefix=%d, suffix=%d)",
+        project_id,
+        len(reused_durations_ms),
+        len(intervals),
+        prefix,
+        suffix,
+    )
+    try:
+        manifest = media_render.render_intervals(
+            source_path,
+            intervals,
+            output_path,
+            profile=media_render.FINAL_PREVIEW_PROFILE,
+            segment_paths=segment_paths,
+            reused_durations_ms=reused_durations_ms,
+        )
+    except BaseException:
+        for path in new_paths:
+            path.unlink(missing_ok=True)
+        raise
+
+    _write_plan(plan_dir, source, [
+        {**interval, "file": segment_path.name}
+        for interval, segment_path in zip(manifest["intervals"], segment_paths)
+    ])
+    _remove_unreferenced_segments(plan_dir, {segment_path.name for segment_path in segment_paths})
+    return {**manifest, "reused_intervals": len(reused_durations_ms)}
+
+
+def _write_plan(plan_dir: Path, source: dict, intervals: list[dict]) -> None:
+    _write_json(plan_dir / PLAN_FILENAME, {
+        "version": FINAL_PREVIEW_PLAN_VERSION,
+        "render_version": FINAL_PREVIEW_RENDER_VERSION,
+        "profile": media_render.FINAL_PREVIEW_PROFILE,
+        "source": source,
+        "intervals": intervals,
+    })
+
+
+def enforce_plan_budget(*, keep_project_id: str | None = None) -> int:
+    """Evict the least recently rendered plans until all fit their byte budget."""
+    budget = settings.final_preview_plan_max_bytes
+    cache_dir = settings.final_preview_cache_dir
+    if budget <= 0 or not cache_dir.is_dir():
+        return 0
+
+    entries = []
+    for plan_dir in cache_dir.glob("*/plan"):
+        size_bytes = 0
+        last_used = 0.0
+        try:
+            for path in plan_dir.iterdir():
+                stat = path.stat()
+                size_bytes += stat.st_size
+                last_used = max(last_used, stat.st_mtime)
+        except OSError:
+            continue
+        entries.append((last_used, size_bytes, plan_dir))
+    keep = preview_plan_dir(keep_project_id) if keep_project_id else None
+    return evict_least_recently_used(entries, budget, _remove_plan, keep=keep)
+
+
+def _remove_plan(plan_dir: Path) -> bool:
+    lock = _plan_lock(plan_dir.parent.name)
+    if not lock.acquire(blocking=False):
+        return False
+    try:
+        shutil.rmtree(plan_dir, ignore_errors=True)
+    finally:
+        lock.release()
+    logger.info("Evicted final preview plan of project %s", plan_dir.parent.name)
+    return True
+
+
+def cached_review_segments(
+    project_id: str,
+    digest: str,
+    build: Callable[[], dict],
+) -> dict:
+    """Return the base review payload of an artifact, building it at most once.
+
+    Keyed by ``project_json_digest`` of the project JSON, since reprocessing
+    rewrites the artifact under the same R2 key.
+    """
+    path = preview_plan_dir(project_id) / REVIEW_SEGMENTS_FILENAME
+    cached = _read_json(path)
+    if cached and cached.get("project_json_digest") == digest and isinstance(cached.get("payload"), dict):
+        return cached["payload"]
+
+    payload = build()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _plan_lock(project_id):
+            _write_json(path, {"project_json_digest": digest, "payload": payload})
+    except OSError:
+        logger.warning("Could not cache review segments for project %s", project_id, exc_info=True)
+    return payload
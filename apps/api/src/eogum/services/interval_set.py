@@ -0,0 +1,238 @@
+"""Vectorized half-open millisecond interval algebra."""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+def _as_int64(values: Iterable[int] | np.ndarray) -> np.ndarray:
+    return np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=np.int64).reshape(-1)
+
+
+class IntervalSet:
+    """Normalized set of ``[start, end)`` integer intervals.
+
+    Intervals are stored as two sorted int64 arrays. Normalized means every
+    interval is non-empty and separated from its neighbour by a positive gap;
+    touching or overlapping input ranges are merged on construction.
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray):
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def empty(cls) -> IntervalSet:
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def from_arrays(cls, starts: Iterable[int] | np.ndarray, ends: Iterable[int] | np.ndarray) -> IntervalSet:
+        start_values = _as_int64(starts)
+        end_values = _as_int64(ends)
+        valid = end_values > start_values
+        start_values = start_values[valid]
+        end_values = end_values[valid]
+        if start_values.size == 0:
+            return cls.empty()
+
+        order = np.argsort(start_values, kind="stable")
+        start_values = start_values[order]
+        end_values = end_values[order]
+        running_end = np.maximum.accumulate(end_values)
+        group_starts = np.empty(start_values.size, dtype=bool)
+        group_starts[0] = True
+        group_starts[1:] = start_values[1:] > running_end[:-1]
+        first = np.flatnonzero(group_starts)
+        last = np.append(first[1:] - 1, start_values.size - 1)
+        return cls(start_values[first], running_end[last])
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int]]) -> IntervalSet:
+        pairs = list(ranges)
+        if not pairs:
+            return cls.empty()
+        values = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        return cls.from_arrays(values[:, 0], values[:, 1])
+
+    @classmethod
+    def coverage_at_least(
+        cls,
+        starts: Iterable[int] | np.ndarray,
+        ends: Iterable[int] | np.ndarray,
+        depth: int,
+    ) -> IntervalSet:
+        """Return where at least ``depth`` of the given (possibly overlapping) ranges are active."""
+        start_values = _as_int64(starts)
+        end_values = _as_int64(ends)
+        valid = end_values > start_values
+        start_values = start_values[valid]
+        end_values = end_values[valid]
+        if start_values.size == 0:
+            return cls.empty()
+
+        boundaries = np.unique(np.concatenate([start_values, end_values]))
+        delta = np.zeros(boundaries.size, dtype=np.int64)
+        np.add.at(delta, np.searchsorted(boundaries, start_values), 1)
+        np.add.at(delta, np.searchsorted(boundaries, end_values), -1)
+        active = np.cumsum(delta)[:-1]
+        selected = np.flatnonzero(active >= depth)
+        return cls.from_arrays(boundaries[selected], boundaries[selected + 1])
+
+    def __len__(self) -> int:
+        return int(self.starts.size)
+
+    def __bool__(self) -> bool:
+        return self.starts.size > 0
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self.to_list())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.starts, other.starts) and np.array_equal(self.ends, other.ends)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.to_list()!r})"
+
+    def to_list(self) -> list[tuple[int, int]]:
+        return list(zip(self.starts.tolist(), self.ends.tolist()))
+
+    def total(self) -> int:
+        return int((self.ends - self.starts).sum())
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return IntervalSet.from_arrays(
+            np.concatenate([self.starts, other.starts]),
+            np.concatenate([self.ends, other.ends]),
+        )
+
+    def clip(self, start: int, end: int) -> IntervalSet:
+        starts = np.maximum(self.starts, start)
+        ends = np.minimum(self.ends, end)
+        valid = ends > starts
+        return IntervalSet(starts[valid], ends[valid])
+
+    def invert(self, start: int, end: int) -> IntervalSet:
+        """Return the gaps of this set inside ``[start, end)``."""
+        if end <= start:
+            return IntervalSet.empty()
+        clipped = self.clip(start, end)
+        gap_starts = np.concatenate([[start], clipped.ends]).astype(np.int64)
+        gap_ends = np.concatenate([clipped.starts, [end]]).astype(np.int64)
+        valid = gap_ends > gap_starts
+        return IntervalSet(gap_starts[valid], gap_ends[valid])
+
+    def intersect(self, other: IntervalSet) -> IntervalSet:
+        left, right = overlap_pairs(self.starts, self.ends, other.starts, other.ends, sorted_disjoint=True)
+        starts = np.maximum(self.starts[left], other.starts[right])
+        ends = np.minimum(self.ends[left], other.ends[right])
+        valid = ends > starts
+        return IntervalSet.from_arrays(starts[valid], ends[valid])
+
+    def subtract(self, other: IntervalSet) -> IntervalSet:
+        if not self or not other:
+            return self
+        return self.intersect(other.invert(int(self.starts[0]), int(self.ends[-1])))
+
+    def overlaps(self, starts: Iterable[int] | np.ndarray, ends: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Return, per query range, whether it shares a positive length with this set."""
+        query_starts = _as_int64(starts)
+        query_ends = _as_int64(ends)
+        if self.starts.size == 0:
+            return np.zeros(query_starts.size, dtype=bool)
+        candidate = np.searchsorted(self.ends, query_starts, side="right")
+        in_range = candidate < self.starts.size
+        result = np.zeros(query_starts.size, dtype=bool)
+        result[in_range] = (
+            (self.starts[candidate[in_range]] < query_ends[in_range])
+            & (query_starts[in_range] < query_ends[in_range])
+        )
+        return result
+
+    def overlaps_range(self, start: int, end: int) -> bool:
+        return bool(self.overlaps([start], [end])[0])
+
+
+def overlap_pairs(
+    left_starts: np.ndarray,
+    left_ends: np.ndarray,
+    right_starts: np.ndarray,
+    right_ends: np.ndarray,
+    *,
+    sorted_disjoint: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return index pairs ``(i, j)`` where left ``i`` and right ``j`` overlap.
+
+    Pairs are ordered by left index, then right index. The right side may
+    contain overlapping ranges in any order. Right ranges are bucketed by
+    power-of-two length and each bucket is joined with binary searches over
+    its sorted starts, using the bucket's longest range as the look-behind
+    window. A few very long ranges therefore cannot widen the window for
+    the rest, and the cost stays proportional to the matches rather than
+    ``len(left) * len(right)``. With ``sorted_disjoint`` both sides are
+    normalized and a single exact window is used.
+    """
+    left_starts = _as_int64(left_starts)
+    left_ends = _as_int64(left_ends)
+    right_starts = _as_int64(right_starts)
+    right_ends = _as_int64(right_ends)
+    empty = np.empty(0, dtype=np.int64)
+    if left_starts.size == 0 or right_starts.size == 0:
+        return empty, empty
+
+    if sorted_disjoint:
+        low = np.searchsorted(right_ends, left_starts, side="right")
+        return _window_pairs(left_starts, left_ends, right_starts, right_ends, np.arange(right_starts.size), low)
+
+    lengths = right_ends - right_starts
+    valid = np.flatnonzero(lengths > 0)
+    if valid.size == 0:
+        return empty, empty
+    length_class = np.floor(np.log2(lengths[valid])).astype(np.int64)
+    left_parts: list[np.ndarray] = []
+    right_parts: list[np.ndarray] = []
+    for bucket in np.unique(length_class):
+        members = valid[length_class == bucket]
+        order = members[np.argsort(right_starts[members], kind="stable")]
+        longest = int(lengths[members].max())
+        low = np.searchsorted(right_starts[order], left_starts - longest, side="left")
+        left_index, right_index = _window_pairs(left_starts, left_ends, right_starts, right_ends, order, low)
+        left_parts.append(left_index)
+        right_parts.append(right_index)
+
+    left_index = np.concatenate(left_parts)
+    right_index = np.concatenate(right_parts)
+    ordering = np.lexsort((right_index, left_index))
+    return left_index[ordering], right_index[ordering]
+
+
+def _window_pairs(
+    left_starts: np.ndarray,
+    left_ends: np.ndarray,
+    right_starts: np.ndarray,
+    right_ends: np.ndarray,
+    order: np.ndarray,
+    low: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    high = np.searchsorted(right_starts[order], left_ends, side="left")
+    counts = np.maximum(high - low, 0)
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    left_index = np.repeat(np.arange(left_starts.size), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    right_index = order[np.repeat(low, counts) + offsets]
+    keep = (
+        (right_starts[right_index] < left_ends[left_index])
+        & (left_starts[left_index] < right_ends[right_index])
+        & (left_starts[left_index] < left_ends[left_index])
+        & (right_starts[right_index] < right_ends[right_index])
+    )
+    return left_index[keep], right_index[keep]
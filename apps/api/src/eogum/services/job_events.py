@@ -0,0 +1,183 @@
+"""Push job progress to Server-Sent Events subscribers.
+
+Workers update ``jobs`` rows through the shared Supabase client; every such
+write is turned into a job event here, so no worker code has to publish
+explicitly. Events are fanned out to the SSE subscribers of the job's
+project in this process.
+
+With ``SUPABASE_DB_URL`` set, a LISTEN connection on ``job_events``
+(fed by the trigger in migration 017) also delivers events written by other
+API nodes. Without it, or without ``asyncpg`` installed, events stay
+in-process, which is complete for a single node.
+
+While that listener runs, local writes arrive over both paths; events carry
+the job's current state, so applying one twice is harmless.
+
+Subscribers hold only the latest event per job, so a slow client skips
+intermediate progress values instead of growing a queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from contextlib import suppress
+
+from eogum.config import settings
+from eogum.services.database import add_write_listener
+
+logger = logging.getLogger(__name__)
+
+JOB_EVENT_COLUMNS = (
+    "id, project_id, type, status, progress, error_message, pipeline_stages, started_at, completed_at, created_at"
+)
+_JOB_EVENT_FIELDS = tuple(column.strip() for column in JOB_EVENT_COLUMNS.split(","))
+NOTIFY_CHANNEL = "job_events"
+_LISTEN_RECONNECT_SECONDS = 5.0
+
+
+def job_event(row: dict) -> dict:
+    """The public, SSE-safe subset of a ``jobs`` row."""
+    return {field: row[field] for field in _JOB_EVENT_FIELDS if field in row}
+
+
+class Subscription:
+    """One SSE client's view of a project's job events."""
+
+    def __init__(self, project_id: str):
+        self.project_id = project_id
+        self._pending: dict[str, dict] = {}
+        self._ready = asyncio.Event()
+
+    def push(self, event: dict) -> None:
+        job_id = event.get("id")
+        if not job_id:
+            return
+        pending = self._pending.get(job_id)
+        self._pending[job_id] = {**pending, **event} if pending else event
+        self._ready.set()
+
+    async def next_events(self, timeout: float) -> list[dict]:
+        """Wait up to ``timeout`` seconds; return the pending events, if any."""
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        self._ready.clear()
+        events, self._pending = list(self._pending.values()), {}
+        return events
+
+
+class JobEventBroker:
+    """Fan job events out to subscriptions on the API event loop.
+
+    ``publish`` may be called from any thread; delivery always happens on
+    the loop that owns the subscriptions, so subscriptions need no locks.
+    """
+
+    def __init__(self):
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+
+    def subscribe(self, project_id: str) -> Subscription:
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(project_id)
+        with self._lock:
+            self._subscriptions.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.project_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.project_id]
+
+    def publish(self, event: dict) -> None:
+        """Thread-safe; events for projects nobody watches are dropped."""
+        loop = self._loop
+        if loop is None or event.get("project_id") not in self._subscriptions:
+            return
+        self.published += 1
+        with suppress(RuntimeError):  # loop already closed during shutdown
+            loop.call_soon_threadsafe(self.dispatch, event)
+
+    def publish_rows(self, rows: list[dict]) -> None:
+        for row in rows:
+            if isinstance(row, dict) and row.get("id") and row.get("project_id"):
+                self.publish(job_event(row))
+
+    def dispatch(self, event: dict) -> None:
+        """Deliver on the event loop thread."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.get("project_id"), ()))
+        for subscription in subscriptions:
+            subscription.push(event)
+        self.delivered += len(subscriptions)
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscribers = sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+            projects = len(self._subscriptions)
+        return {
+            "subscribers": subscribers,
+            "projects": projects,
+            "published": self.published,
+            "delivered": self.delivered,
+        }
+
+
+job_event_broker = JobEventBroker()
+add_write_listener("jobs", job_event_broker.publish_rows)
+
+
+def format_sse(event: str, data) -> str:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def listen_for_remote_job_events(broker: JobEventBroker = job_event_broker) -> None:
+    """Relay Postgres NOTIFY job events from other nodes until cancelled."""
+    try:
+        import asyncpg
+    except ImportError:
+        logger.warning("SUPABASE_DB_URL is set but asyncpg is not installed; job events stay in-process")
+        return
+
+    def on_notify(connection, pid, channel, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed job event payload")
+            return
+        if isinstance(event, dict) and event.get("project_id"):
+            broker.dispatch(event)
+
+    while True:
+        connection = None
+        try:
+            connection = await asyncpg.connect(settings.supabase_db_url)
+            await connection.add_listener(NOTIFY_CHANNEL, on_notify)
+            logger.info("Listening for job events on %s", NOTIFY_CHANNEL)
+            while not connection.is_closed():
+                await asyncio.sleep(_LISTEN_RECONNECT_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Job event listener failed; reconnecting in %ss", _LISTEN_RECONNECT_SECONDS)
+        finally:
+            if connection is not None and not connection.is_closed():
+                with suppress(Exception):
+                    await connection.close()
+        await asyncio.sleep(_LISTEN_RECONNECT_SECONDS)
+
+
+def start_remote_job_event_listener() -> asyncio.Task | None:
+    if not settings.supabase_db_url:
+        return None
+    return asyncio.get_running_loop().create_task(listen_for_remote_job_events())
@@ -3,7 +3,6 @@
 import json
 import logging
 import hashlib
-import subprocess
 import threading
 from collections import deque
 from datetime import datetime, timedelta, timezone
@@ -18,6 +17,7 @@ from eogum.services import (
     chalna,
     credit,
     email,
+    final_preview_plan,
     media_render,
     overlap_protection as overlap_detection,
     overlap_speaker_mapping,
@@ -28,15 +28,29 @@ from eogum.services import (
 )
 from eogum.services.artifacts import get_latest_artifact_job
 from eogum.services.database import execute_with_retry, get_db
+from eogum.services.evaluation_store import fetch_evaluation_row
 from eogum.services.final_preview_cache import (
+    adopt_source_cache_file,
+    ai_decision_preview_hash,
+    enforce_source_cache_budget,
     final_preview_decision_hash,
+    link_cached_source,
     new_cache_token,
     preview_cache_key,
     preview_cache_paths,
     preview_cache_ready,
     source_cache_path,
+    touch_source_cache_entry,
 )
+from eogum.services.interval_set import IntervalSet
+from eogum.services.project_document import ProjectDocument, project_json_digest
 from eogum.services.review_payload import merge_saved_review_preferences
+from eogum.services.timeline_map import TimelineMap, map_source_cues
+from eogum.services.transcript_sidecar import (
+    TRANSCRIPT_SIDECAR_RESULT_KEY,
+    load_transcript_document,
+    write_transcript_sidecar,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +73,9 @@ _PODCAST_PROMPT_PROFILES = {
 _initial_job_types = {"subtitle_cut", *PODCAST_LIKE_CUT_TYPES}
 _incomplete_job_statuses = ["queued", "pending", "running"]
 _stale_running_after = timedelta(hours=6)
+# Startup recovery runs while the API already serves; "recover running jobs"
+# must only mean jobs a previous process left behind, not ones started since.
+_process_started_at = datetime.now(timezone.utc)
 _PODCAST_CUT_RESUME_MARKER = "resume_state.json"
 ALLOWED_SEGMENTATION_BOUNDARY_RULES = {
     "word_boundary",
@@ -67,6 +84,8 @@ ALLOWED_SEGMENTATION_BOUNDARY_RULES = {
 }
 DEFAULT_SEGMENTATION_BOUNDARY_RULE = "word_boundary"
 FINAL_PREVIEW_MERGE_GAP_MS = 500
+SPECULATIVE_PREVIEW_KIND = "speculative_ai"
+_low_priority_kinds = frozenset({"speculative_final_preview"})
 CHALNA_MAX_INPUT_BYTES = 2 * 1024 * 1024 * 1024
 
 
@@ -107,6 +126,11 @@ def enqueue_final_preview(project_id: str, job_id: str) -> None:
     _enqueue("final_preview", project_id, job_id)
 
 
+def enqueue_speculative_final_preview(project_id: str, job_id: str) -> None:
+    """Add a low-priority AI-decision preview render to the render lane."""
+    _enqueue("speculative_final_preview", project_id, job_id)
+
+
 def enqueue_ai_cut_render(project_id: str, job_id: str) -> None:
     """Add an AI-only MP4 render to the shared CPU render lane."""
     _enqueue("ai_cut_render", project_id, job_id)
@@ -124,7 +148,7 @@ def _lane_for_kind(kind: str) -> str:
         return "source_derive"
     if kind == "cut_decision":
         return "cut_decision"
-    if kind in {"final_preview", "ai_cut_render"}:
+    if kind in {"final_preview", "speculative_final_preview", "ai_cut_render"}:
         return "final_preview"
     return "project"
 
@@ -161,13 +185,23 @@ def _maybe_start_workers(lane: str) -> None:
         thread.start()
 
 
+def _pop_next_item(lane: str) -> dict[str, str | None]:
+    """Pop the oldest regular item, falling back to low-priority work."""
+    queue = _queues[lane]
+    for position, item in enumerate(queue):
+        if item["kind"] not in _low_priority_kinds:
+            del queue[position]
+            return item
+    return queue.popleft()
+
+
 def _worker_loop(lane: str) -> None:
     while True:
         with _lock:
             if not _queues[lane]:
                 _running_lanes[lane] -= 1
                 return
-            item = _queues[lane].popleft()
+            item = _pop_next_item(lane)
         project_id = item["project_id"]
         try:
             if item["kind"] == "reprocess":
@@ -176,7 +210,7 @@ def _worker_loop(lane: str) -> None:
                 _derive_project_sources(project_id, item["job_id"])
             elif item["kind"] == "cut_decision":
                 _cut_decision_project(project_id, item["job_id"])
-            elif item["kind"] == "final_preview":
+            elif item["kind"] in {"final_preview", "speculative_final_preview"}:
                 _render_final_preview(project_id, item["job_id"])
             elif item["kind"] == "ai_cut_render":
                 _render_ai_cut(project_id, item["job_id"])
@@ -283,7 +317,7 @@ def recover_stuck_final_previews(*, recover_running: bool = False) -> int:
     db = get_db()
     jobs = (
         db.table("jobs")
-        .select("id, project_id, status, started_at, created_at")
+        .select("id, project_id, status, started_at, created_at, result_r2_keys")
         .eq("type", "final_preview")
         .in_("status", _incomplete_job_statuses)
         .order("created_at")
@@ -304,7 +338,10 @@ def recover_stuck_final_previews(*, recover_running: bool = False) -> int:
                 "started_at": None,
                 "completed_at": None,
             }).eq("id", job["id"]).execute()
-            enqueue_final_preview(job["project_id"], job["id"])
+            if (job.get("result_r2_keys") or {}).get("preview_kind") == SPECULATIVE_PREVIEW_KIND:
+                enqueue_speculative_final_preview(job["project_id"], job["id"])
+            else:
+                enqueue_final_preview(job["project_id"], job["id"])
             recovered += 1
             logger.info(
                 "Requeued stuck final-preview job %s for project %s",
@@ -523,9 +560,9 @@ def _recover_stuck_project(db, project: dict, *, recover_running: bool) -> bool:
 
 
 def _should_recover_running_job(job: dict, recover_running: bool) -> bool:
-    if recover_running:
-        return True
     started_at = _parse_datetime(job.get("started_at") or job.get("created_at"))
+    if recover_running:
+        return started_at is None or started_at < _process_started_at
     if not started_at:
         return False
     return datetime.now(timezone.utc) - started_at > _stale_running_after
@@ -637,7 +674,7 @@ def _process_project(project_id: str, job_id: str | None) -> None:
         if resume_state and _local_source_matches_resume_state(source_path_obj, resume_state):
             logger.info("Reusing local source for podcast-cut retry project %s", project_id)
         else:
-            r2.download_file(project["source_r2_key"], source_path)
+            _download_source_via_cache(project["source_r2_key"], source_path_obj)
         source_sha256 = _register_source_identity(
             db,
             project_id=project_id,
@@ -705,7 +742,8 @@ def _process_project(project_id: str, job_id: str | None) -> None:
                 )
         if resume_state and overlap_protection_enabled:
             logger.info(
-                "Ignoring podcast-cut resume state for project %s because overlap protection requires segments metadata",
+                "Ignoring podcast-cut resume state for project %s "
+                "because overlap protection requires segments metadata",
                 project_id,
             )
             resume_state = None
@@ -835,6 +873,7 @@ def _process_project(project_id: str, job_id: str | None) -> None:
 
         if llm_log_path.exists() and llm_log_path.stat().st_size > 0:
             result_paths["llm_io_log"] = str(llm_log_path)
+        _add_transcript_sidecar(result_paths)
 
         # 6. Upload results to R2
         r2_keys = {}
@@ -869,6 +908,7 @@ def _process_project(project_id: str, job_id: str | None) -> None:
             "completed_at": "now()",
         }).eq("id", job_id).execute()
         db.table("projects").update({"status": "completed"}).eq("id", project_id).execute()
+        _schedule_speculative_final_preview(db, project_id, user_id, job_id, r2_keys)
 
         # 10. Send email
         try:
@@ -934,7 +974,9 @@ def _derive_project_sources(project_id: str, job_id: str | None) -> None:
     input_payload = job.get("input_payload") or {}
     force = bool(input_payload.get("force"))
     project = db.table("projects").select("*").eq("id", project_id).single().execute().data
-    source_keys = input_payload.get("source_keys") or source_derivatives.source_keys_needing_derivatives(project, force=force)
+    source_keys = input_payload.get("source_keys") or source_derivatives.source_keys_needing_derivatives(
+        project, force=force
+    )
     source_keys = [str(key) for key in source_keys if key]
     if not source_keys:
         db.table("jobs").update({
@@ -1553,6 +1595,7 @@ def _is_job_canceled(db, job_id: str) -> bool:
     row = execute_with_retry(
         lambda: db.table("jobs").select("status").eq("id", job_id).maybe_single().execute(),
         operation_name=f"jobs.select.cancel_status job_id={job_id}",
+        hedge=True,
     )
     return bool(row.data and row.data.get("status") in {"cancel_requested", "canceled"})
 
@@ -1566,6 +1609,7 @@ def _update_multicam_state(db, project_id: str, **updates) -> None:
     project = execute_with_retry(
         lambda: db.table("projects").select("multicam_state").eq("id", project_id).maybe_single().execute(),
         operation_name=f"projects.select.multicam_state project_id={project_id}",
+        hedge=True,
     )
     state = dict(project.data.get("multicam_state") or {}) if project.data else {}
     state.update(updates)
@@ -1670,6 +1714,7 @@ def _reprocess_project(project_id: str, job_id: str | None) -> None:
     project = execute_with_retry(
         lambda: db.table("projects").select("*").eq("id", project_id).single().execute(),
         operation_name=f"projects.select.reprocess project_id={project_id}",
+        hedge=True,
     ).data
     user_id = project["user_id"]
 
@@ -1710,6 +1755,7 @@ def _reprocess_project(project_id: str, job_id: str | None) -> None:
             .execute()
         ),
         operation_name=f"jobs.claim.reprocess job_id={job_id} project_id={project_id}",
+        idempotent=False,
     )
     if not claimed.data:
         logger.info("Reprocess job %s for project %s was already claimed or finished", job_id, project_id)
@@ -1747,18 +1793,12 @@ def _reprocess_project(project_id: str, job_id: str | None) -> None:
         stored_project_json = json.loads(project_json_bytes.decode("utf-8"))
         current_project_has_extra_sources = len(stored_project_json.get("source_files") or []) > 1
 
-        eval_result = execute_with_retry(
-            lambda: (
-                db.table("evaluations")
-                .select("segments")
-                .eq("project_id", project_id)
-                .eq("evaluator_id", user_id)
-                .limit(1)
-                .execute()
-            ),
+        evaluation = execute_with_retry(
+            lambda: fetch_evaluation_row(db, project_id, user_id, "segments"),
             operation_name=f"evaluations.select.segments project_id={project_id}",
+            hedge=True,
         )
-        evaluation_payload = eval_result.data[0]["segments"] if eval_result.data else None
+        evaluation_payload = evaluation["segments"] if evaluation else None
         if isinstance(evaluation_payload, dict):
             eval_segments = evaluation_payload.get("segments") or []
         else:
@@ -1886,6 +1926,14 @@ def _reprocess_project(project_id: str, job_id: str | None) -> None:
         _raise_if_canceled(db, job_id)
         r2.upload_file(str(updated_json), pj_r2_key, "application/json")
         new_r2_keys["project_json"] = pj_r2_key
+        sidecar_paths = {"project_json": str(updated_json)}
+        _add_transcript_sidecar(sidecar_paths)
+        new_r2_keys.pop(TRANSCRIPT_SIDECAR_RESULT_KEY, None)
+        if TRANSCRIPT_SIDECAR_RESULT_KEY in sidecar_paths:
+            sidecar_path = Path(sidecar_paths[TRANSCRIPT_SIDECAR_RESULT_KEY])
+            sidecar_r2_key = f"results/{project_id}/{sidecar_path.name}"
+            r2.upload_file(str(sidecar_path), sidecar_r2_key, _guess_content_type(TRANSCRIPT_SIDECAR_RESULT_KEY))
+            new_r2_keys[TRANSCRIPT_SIDECAR_RESULT_KEY] = sidecar_r2_key
 
         fcpxml_r2_key = f"results/{project_id}/{fcpxml_path.name}"
         _raise_if_canceled(db, job_id)
@@ -2083,7 +2131,7 @@ def _cut_decision_project(project_id: str, job_id: str | None) -> None:
             raise RuntimeError("원본 소스 정보가 없어 cut decision을 다시 실행할 수 없습니다")
         source_ext = Path(project.get("source_filename") or "source.mp4").suffix or ".mp4"
         source_path = temp_dir / f"source{source_ext}"
-        r2.download_file(source_r2_key, str(source_path))
+        _download_source_via_cache(source_r2_key, source_path)
 
         extra_source_paths: list[str] = []
         used_extra_names: set[str] = set()
@@ -2114,6 +2162,7 @@ def _cut_decision_project(project_id: str, job_id: str | None) -> None:
         )
         if llm_log_path.exists() and llm_log_path.stat().st_size > 0:
             result_paths["llm_io_log"] = str(llm_log_path)
+        _add_transcript_sidecar(result_paths)
 
         _update_cut_decision_progress(db, job_id, 75, "upload_results", 1)
 
@@ -2125,6 +2174,8 @@ def _cut_decision_project(project_id: str, job_id: str | None) -> None:
             new_r2_keys[key] = r2_key
         if "sync_diagnostics" not in result_paths:
             new_r2_keys.pop("sync_diagnostics", None)
+        if TRANSCRIPT_SIDECAR_RESULT_KEY not in result_paths:
+            new_r2_keys.pop(TRANSCRIPT_SIDECAR_RESULT_KEY, None)
 
         if "report" in result_paths:
             report_text = Path(result_paths["report"]).read_text(encoding="utf-8")
@@ -2140,6 +2191,7 @@ def _cut_decision_project(project_id: str, job_id: str | None) -> None:
         }).eq("id", job_id).execute()
         db.table("projects").update({"status": "completed"}).eq("id", project_id).execute()
         logger.info("Cut decision rerun completed for project %s", project_id)
+        _schedule_speculative_final_preview(db, project_id, project["user_id"], job_id, new_r2_keys)
     except Exception as exc:
         logger.exception("Cut decision rerun failed for project %s", project_id)
         db.table("jobs").update({
@@ -2227,115 +2279,50 @@ def _int_value(value: object) -> int | None:
         return None
 
 
-def _merge_time_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
-    valid_ranges = sorted((start, end) for start, end in ranges if end > start)
-    if not valid_ranges:
-        return []
-
-    merged: list[tuple[int, int]] = []
-    current_start, current_end = valid_ranges[0]
-    for start, end in valid_ranges[1:]:
-        if start <= current_end:
-            current_end = max(current_end, end)
-            continue
-        merged.append((current_start, current_end))
-        current_start, current_end = start, end
-    merged.append((current_start, current_end))
-    return merged
-
-
-def _subtract_time_ranges(
-    start_ms: int,
-    end_ms: int,
-    protected_ranges: list[tuple[int, int]],
-) -> list[tuple[int, int]]:
-    pieces: list[tuple[int, int]] = []
-    cursor = start_ms
-    for protected_start, protected_end in protected_ranges:
-        if protected_end <= cursor:
-            continue
-        if protected_start >= end_ms:
-            break
-        if protected_start > cursor:
-            pieces.append((cursor, min(protected_start, end_ms)))
-        cursor = max(cursor, protected_end)
-        if cursor >= end_ms:
-            break
-    if cursor < end_ms:
-        pieces.append((cursor, end_ms))
-    return pieces
-
-
-def _range_overlaps_any(start_ms: int, end_ms: int, ranges: list[tuple[int, int]]) -> bool:
-    return any(range_start < end_ms and start_ms < range_end for range_start, range_end in ranges)
-
-
-def _primary_video_track(project_data: dict) -> dict | None:
-    source_files = project_data.get("source_files") or []
-    primary_source_id = source_files[0].get("id") if source_files else None
-    if primary_source_id is not None:
-        for track in project_data.get("tracks") or []:
-            if track.get("track_type") == "video" and track.get("source_file_id") == primary_source_id:
-                return track
-    for track in project_data.get("tracks") or []:
-        if track.get("track_type") == "video":
-            return track
-    return None
-
-
-def _source_duration_ms(project_data: dict, primary_track: dict | None) -> int:
+def _source_duration_ms(document: ProjectDocument, primary_track: dict | None) -> int:
     source_file_id = primary_track.get("source_file_id") if primary_track else None
     duration_candidates: list[int] = []
 
-    for source_file in project_data.get("source_files") or []:
-        info = source_file.get("info") or {}
-        duration_ms = _int_value(info.get("duration_ms"))
+    for file_id, duration_ms in document.source_files:
         if duration_ms and duration_ms > 0:
             duration_candidates.append(duration_ms)
-            if source_file_id and source_file.get("id") == source_file_id:
+            if source_file_id and file_id == source_file_id:
                 return duration_ms
 
-    transcription = project_data.get("transcription") or {}
-    for segment in transcription.get("segments") or []:
-        end_ms = _int_value(segment.get("end_ms"))
-        if end_ms and end_ms > 0:
-            duration_candidates.append(end_ms)
+    for segment in document.segments:
+        if segment.end_ms and segment.end_ms > 0:
+            duration_candidates.append(segment.end_ms)
 
-    for decision in project_data.get("edit_decisions") or []:
-        range_data = decision.get("range") or {}
-        end_ms = _int_value(range_data.get("end_ms"))
-        if end_ms and end_ms > 0:
-            duration_candidates.append(end_ms)
+    for decision in document.edit_decisions:
+        if decision.end_ms and decision.end_ms > 0:
+            duration_candidates.append(decision.end_ms)
 
     return max(duration_candidates, default=0)
 
 
-def _review_segment_ranges(project_data: dict) -> list[tuple[int, int, int, str | None]]:
-    transcription = project_data.get("transcription") or {}
-    raw_segments = transcription.get("segments") or []
+def _review_segment_ranges(document: ProjectDocument) -> list[tuple[int, int, int, str | None]]:
     valid_segments: list[tuple[int, int, int, int, str | None]] = []
 
-    for position, segment in enumerate(raw_segments):
-        start_ms = _int_value(segment.get("start_ms"))
-        end_ms = _int_value(segment.get("end_ms"))
+    for segment in document.segments:
+        start_ms = segment.start_ms
+        end_ms = segment.end_ms
         if start_ms is None or end_ms is None or end_ms <= start_ms:
             continue
-        segment_index = _int_value(segment.get("index"))
+        segment_index = segment.index
         if segment_index is None:
-            segment_index = position + 1
-        speaker = segment.get("speaker")
+            segment_index = segment.position + 1
         valid_segments.append((
-            position,
+            segment.position,
             segment_index,
             start_ms,
             end_ms,
-            str(speaker) if speaker else None,
+            segment.speaker,
         ))
 
     if not valid_segments:
         return []
 
-    if project_data.get("segmentation_boundary_rule") != "word_boundary":
+    if document.segmentation_boundary_rule != "word_boundary":
         return [
             (segment_index, start_ms, end_ms, speaker)
             for _, segment_index, start_ms, end_ms, speaker in valid_segments
@@ -2363,44 +2350,45 @@ def _review_segment_ranges(project_data: dict) -> list[tuple[int, int, int, str
 
 
 def _final_preview_removed_ranges(
-    project_data: dict,
+    document: ProjectDocument,
     primary_track_id: str,
     review_ranges: list[tuple[int, int, int, str | None]],
-) -> list[tuple[int, int]]:
+) -> IntervalSet:
     ranges_by_index = {
         segment_index: (start_ms, end_ms)
         for segment_index, start_ms, end_ms, _speaker in review_ranges
     }
-    protected_ranges = _merge_time_ranges([
+    protected_ranges = IntervalSet.from_ranges(
         (start_ms, end_ms)
         for _segment_index, start_ms, end_ms, _speaker in review_ranges
-    ])
+    )
 
+    silence_ranges: list[tuple[int, int]] = []
     removed_ranges: list[tuple[int, int]] = []
-    for decision in project_data.get("edit_decisions") or []:
-        if decision.get("active_video_track_id") != primary_track_id:
+    for decision in document.edit_decisions:
+        if decision.active_video_track_id != primary_track_id:
             continue
-        if decision.get("edit_type") not in {"cut", "mute"}:
+        if decision.edit_type not in {"cut", "mute"}:
             continue
 
-        range_data = decision.get("range") or {}
-        start_ms = _int_value(range_data.get("start_ms"))
-        end_ms = _int_value(range_data.get("end_ms"))
+        start_ms = decision.start_ms
+        end_ms = decision.end_ms
         if start_ms is None or end_ms is None or end_ms <= start_ms:
             continue
 
-        if decision.get("reason") == "silence":
-            removed_ranges.extend(_subtract_time_ranges(start_ms, end_ms, protected_ranges))
+        if decision.reason == "silence":
+            silence_ranges.append((start_ms, end_ms))
             continue
 
-        source_segment_index = _int_value(decision.get("source_segment_index"))
+        source_segment_index = decision.source_segment_index
         review_range = ranges_by_index.get(source_segment_index) if source_segment_index is not None else None
         if review_range is not None:
             removed_ranges.append(review_range)
         else:
             removed_ranges.append((start_ms, end_ms))
 
-    return _merge_time_ranges(removed_ranges)
+    removed_silence = IntervalSet.from_ranges(silence_ranges).subtract(protected_ranges)
+    return IntervalSet.from_ranges(removed_ranges).union(removed_silence)
 
 
 def _merge_adjacent_final_preview_segments(
@@ -2428,28 +2416,12 @@ def _merge_adjacent_final_preview_segments(
     return [(start_ms, end_ms, state) for _index, start_ms, end_ms, state, _speaker in merged]
 
 
-def _invert_removed_ranges(
-    removed_ranges: list[tuple[int, int]],
-    total_duration_ms: int,
-) -> list[tuple[int, int]]:
-    keep_ranges: list[tuple[int, int]] = []
-    cursor = 0
-    for start_ms, end_ms in _merge_time_ranges(removed_ranges):
-        start_ms = max(0, min(start_ms, total_duration_ms))
-        end_ms = max(0, min(end_ms, total_duration_ms))
-        if end_ms <= start_ms:
-            continue
-        if start_ms > cursor:
-            keep_ranges.append((cursor, start_ms))
-        cursor = max(cursor, end_ms)
-    if cursor < total_duration_ms:
-        keep_ranges.append((cursor, total_duration_ms))
-    return keep_ranges
+def _review_timeline_intervals_from_project_json(project_json_path: Path) -> list[tuple[float, float]]:
+    return _review_timeline_intervals(ProjectDocument.from_path(project_json_path))
 
 
-def _review_timeline_intervals_from_project_json(project_json_path: Path) -> list[tuple[float, float]]:
-    project_data = json.loads(project_json_path.read_text(encoding="utf-8"))
-    primary_track = _primary_video_track(project_data)
+def _review_timeline_intervals(document: ProjectDocument) -> list[tuple[float, float]]:
+    primary_track = document.primary_video_track()
     if not primary_track:
         return []
 
@@ -2457,20 +2429,27 @@ def _review_timeline_intervals_from_project_json(project_json_path: Path) -> lis
     if not primary_track_id:
         return []
 
-    total_duration_ms = _source_duration_ms(project_data, primary_track)
-    review_ranges = _review_segment_ranges(project_data)
-    removed_ranges = _final_preview_removed_ranges(project_data, primary_track_id, review_ranges)
+    total_duration_ms = _source_duration_ms(document, primary_track)
+    review_ranges = _review_segment_ranges(document)
+    removed_ranges = _final_preview_removed_ranges(document, primary_track_id, review_ranges)
 
     if review_ranges:
-        review_segments: list[tuple[int, int, int, str, str | None]] = []
+        clamped_ranges = []
         for segment_index, start_ms, end_ms, speaker in review_ranges:
             if total_duration_ms > 0:
                 start_ms = max(0, min(start_ms, total_duration_ms))
                 end_ms = max(0, min(end_ms, total_duration_ms))
             if end_ms <= start_ms:
                 continue
-            state = "removed" if _range_overlaps_any(start_ms, end_ms, removed_ranges) else "enabled"
-            review_segments.append((segment_index, start_ms, end_ms, state, speaker))
+            clamped_ranges.append((segment_index, start_ms, end_ms, speaker))
+        removed_flags = removed_ranges.overlaps(
+            [start_ms for _index, start_ms, _end_ms, _speaker in clamped_ranges],
+            [end_ms for _index, _start_ms, end_ms, _speaker in clamped_ranges],
+        ).tolist()
+        review_segments: list[tuple[int, int, int, str, str | None]] = [
+            (segment_index, start_ms, end_ms, "removed" if removed else "enabled", speaker)
+            for (segment_index, start_ms, end_ms, speaker), removed in zip(clamped_ranges, removed_flags)
+        ]
 
         keep_ranges = [
             (start_ms, end_ms)
@@ -2478,7 +2457,7 @@ def _review_timeline_intervals_from_project_json(project_json_path: Path) -> lis
             if state != "removed"
         ]
     else:
-        keep_ranges = _invert_removed_ranges(removed_ranges, total_duration_ms)
+        keep_ranges = removed_ranges.invert(0, total_duration_ms).to_list()
 
     return [
         (start_ms / 1000.0, (end_ms - start_ms) / 1000.0)
@@ -2487,18 +2466,27 @@ def _review_timeline_intervals_from_project_json(project_json_path: Path) -> lis
     ]
 
 
-def _render_intervals(source_path: Path, intervals: list[tuple[float, float]], output_path: Path) -> dict:
+def _render_intervals(
+    source_path: Path,
+    intervals: list[tuple[float, float]],
+    output_path: Path,
+    *,
+    subtitles_path: Path | None = None,
+) -> dict:
     """Render keep intervals without building one large ffmpeg filter graph.
 
     A single trim/atrim/concat graph keeps many decoded streams alive at once and
     can consume tens of GB for ordinary review timelines. Render each interval
-    independently, then concatenate the normalized segment files.
+    independently, then concatenate the normalized segment files. Burned-in
+    subtitles (source-timeline SRT) are applied in that same encode.
     """
     manifest = media_render.render_intervals(
         source_path,
         intervals,
         output_path,
         profile=media_render.FINAL_PREVIEW_PROFILE,
+        subtitles_path=subtitles_path,
+        streaming=settings.render_streaming_concat,
     )
     return {
         "version": manifest["version"],
@@ -2506,43 +2494,6 @@ def _render_intervals(source_path: Path, intervals: list[tuple[float, float]], o
     }
 
 
-def _burn_subtitles(input_path: Path, srt_path: Path | None, output_path: Path) -> None:
-    import shutil
-
-    if not srt_path or not srt_path.exists() or not srt_path.read_text(encoding="utf-8").strip():
-        shutil.copyfile(input_path, output_path)
-        return
-
-    subtitle_filter = f"subtitles={srt_path}:charenc=UTF-8"
-    result = subprocess.run(
-        [
-            "ffmpeg",
-            "-hide_banner",
-            "-y",
-            "-i",
-            str(input_path),
-            "-vf",
-            subtitle_filter,
-            "-c:v",
-            "libx264",
-            "-preset",
-            "veryfast",
-            "-crf",
-            "26",
-            "-c:a",
-            "copy",
-            "-movflags",
-            "+faststart",
-            str(output_path),
-        ],
-        capture_output=True,
-        text=True,
-        timeout=7200,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"subtitle burn-in failed: {result.stderr[-1000:]}")
-
-
 def _write_webvtt_from_srt(srt_path: Path | None, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     if not srt_path or not srt_path.exists() or not srt_path.read_text(encoding="utf-8").strip():
@@ -2565,57 +2516,44 @@ def _format_webvtt_time(ms: int | float) -> str:
 
 
 def _write_final_preview_webvtt_from_source_segments(
-    applied_project_json: Path,
-    render_manifest: dict,
+    document: ProjectDocument,
+    timeline_map: TimelineMap,
     output_path: Path,
 ) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    project_data = json.loads(applied_project_json.read_text(encoding="utf-8"))
-    transcription = project_data.get("transcription") or {}
-    source_segments = transcription.get("segments") or []
-    render_intervals = render_manifest.get("intervals") or []
+    source_cues = [
+        (segment.start_ms, segment.end_ms, segment.text)
+        for segment in document.segments
+        if segment.text
+        and segment.start_ms is not None
+        and segment.end_ms is not None
+        and segment.end_ms > segment.start_ms
+    ]
 
     lines = ["WEBVTT", ""]
-    cue_index = 1
-    for segment in source_segments:
-        try:
-            cue_start_ms = int(segment.get("start_ms"))
-            cue_end_ms = int(segment.get("end_ms"))
-        except (TypeError, ValueError):
-            continue
-        text = str(segment.get("text") or "").strip()
-        if not text or cue_end_ms <= cue_start_ms:
-            continue
-
-        for interval in render_intervals:
-            source_start_ms = int(interval.get("source_start_ms") or 0)
-            source_end_ms = int(interval.get("source_end_ms") or 0)
-            requested_duration_ms = int(interval.get("requested_duration_ms") or 0)
-            actual_duration_ms = int(interval.get("actual_duration_ms") or 0)
-            preview_start_ms = int(interval.get("preview_start_ms") or 0)
-            if source_end_ms <= source_start_ms or requested_duration_ms <= 0 or actual_duration_ms <= 0:
-                continue
+    for cue_index, (mapped_start_ms, mapped_end_ms, text) in enumerate(
+        map_source_cues(timeline_map, source_cues),
+        start=1,
+    ):
+        lines.append(str(cue_index))
+        lines.append(f"{_format_webvtt_time(mapped_start_ms)} --> {_format_webvtt_time(mapped_end_ms)}")
+        lines.append(text)
+        lines.append("")
 
-            overlap_start_ms = max(cue_start_ms, source_start_ms)
-            overlap_end_ms = min(cue_end_ms, source_end_ms)
-            if overlap_end_ms <= overlap_start_ms:
-                continue
+    output_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
 
-            scale = actual_duration_ms / requested_duration_ms
-            mapped_start_ms = preview_start_ms + (overlap_start_ms - source_start_ms) * scale
-            mapped_end_ms = preview_start_ms + (overlap_end_ms - source_start_ms) * scale
-            if mapped_end_ms <= mapped_start_ms:
-                mapped_end_ms = mapped_start_ms + 1
 
-            lines.append(str(cue_index))
-            lines.append(
-                f"{_format_webvtt_time(mapped_start_ms)} --> {_format_webvtt_time(mapped_end_ms)}"
-            )
-            lines.append(text)
-            lines.append("")
-            cue_index += 1
+def _download_source_via_cache(r2_key: str, destination: Path) -> None:
+    """Fetch a source into a job directory, reusing and warming the source cache.
 
-    output_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    The job's copy is a hardlink of the cache entry, so the later temp-dir
+    cleanup leaves a warm entry behind for preview and AI-cut renders.
+    """
+    if link_cached_source(r2_key, destination):
+        logger.info("Reusing cached source for %s", r2_key)
+        return
+    r2.download_file(r2_key, str(destination))
+    adopt_source_cache_file(destination, r2_key)
 
 
 def _get_cached_source_video(project: dict, temp_dir: Path) -> Path:
@@ -2623,14 +2561,79 @@ def _get_cached_source_video(project: dict, temp_dir: Path) -> Path:
     cached_path = source_cache_path(project["source_r2_key"], source_ext)
     cached_path.parent.mkdir(parents=True, exist_ok=True)
     if cached_path.is_file() and cached_path.stat().st_size > 0:
-        return cached_path
-
-    download_path = temp_dir / f"source_download{source_ext}"
-    r2.download_file(project["source_r2_key"], str(download_path))
-    download_path.replace(cached_path)
+        touch_source_cache_entry(cached_path)
+    else:
+        download_path = temp_dir / f"source_download{source_ext}"
+        r2.download_file(project["source_r2_key"], str(download_path))
+        download_path.replace(cached_path)
+        enforce_source_cache_budget(keep=cached_path)
+    source_derivatives.seed_probe_cache_from_media_info(cached_path, project.get("source_derived"))
     return cached_path
 
 
+def _speculative_result_keys(result_keys: dict) -> dict:
+    if result_keys.get("preview_kind") != SPECULATIVE_PREVIEW_KIND:
+        return {}
+    return {
+        "preview_kind": SPECULATIVE_PREVIEW_KIND,
+        "artifact_job_id": result_keys.get("artifact_job_id"),
+    }
+
+
+def _final_preview_lane_idle() -> bool:
+    with _lock:
+        return not _queues["final_preview"] and _running_lanes["final_preview"] == 0
+
+
+def _schedule_speculative_final_preview(
+    db,
+    project_id: str,
+    user_id: str,
+    artifact_job_id: str,
+    r2_keys: dict,
+) -> None:
+    """Pre-render the AI-decision preview while the render lane has spare capacity.
+
+    Most reviewers open the final preview before changing anything, so the
+    result is keyed by ``ai_decision_preview_hash`` and picked up by
+    ``start_final_preview`` as a cache hit. Never raises: this is best effort.
+    """
+    if not settings.final_preview_speculative_enabled:
+        return
+    project_json_key = r2_keys.get("project_json")
+    if not project_json_key:
+        return
+    try:
+        if not _final_preview_lane_idle():
+            logger.info("Skipping speculative final preview for project %s: render lane busy", project_id)
+            return
+        hash_value = ai_decision_preview_hash(project_json_key)
+        if preview_cache_ready(project_id, hash_value):
+            return
+        job = (
+            db.table("jobs")
+            .insert({
+                "project_id": project_id,
+                "user_id": user_id,
+                "type": "final_preview",
+                "status": "pending",
+                "progress": 0,
+                "input_payload": {"segments": []},
+                "result_r2_keys": {
+                    "decision_hash": hash_value,
+                    "preview_kind": SPECULATIVE_PREVIEW_KIND,
+                    "artifact_job_id": artifact_job_id,
+                },
+            })
+            .execute()
+            .data[0]
+        )
+        enqueue_speculative_final_preview(project_id, job["id"])
+        logger.info("Queued speculative final preview %s for project %s", job["id"], project_id)
+    except Exception:
+        logger.exception("Failed to queue speculative final preview for project %s", project_id)
+
+
 def _render_final_preview(project_id: str, job_id: str | None) -> None:
     import shutil
 
@@ -2695,6 +2698,7 @@ def _render_final_preview(project_id: str, job_id: str | None) -> None:
                     "decision_hash": hash_value,
                     "cache_token": cache_token,
                     "duration_ms": existing_result_keys.get("duration_ms"),
+                    **_speculative_result_keys(existing_result_keys),
                 },
                 "completed_at": "now()",
             }).eq("id", job_id).execute()
@@ -2715,6 +2719,17 @@ def _render_final_preview(project_id: str, job_id: str | None) -> None:
         completed_job = get_latest_artifact_job(db, project_id, select="id, result_r2_keys")
         if not completed_job:
             raise RuntimeError("완료된 기준 산출물이 없습니다")
+        if (
+            existing_result_keys.get("preview_kind") == SPECULATIVE_PREVIEW_KIND
+            and completed_job["id"] != existing_result_keys.get("artifact_job_id")
+        ):
+            db.table("jobs").update({
+                "status": "canceled",
+                "error_message": "superseded by a newer artifact job",
+                "completed_at": "now()",
+            }).eq("id", job_id).execute()
+            logger.info("Dropped superseded speculative preview %s for project %s", job_id, project_id)
+            return
         project_json_key = completed_job["result_r2_keys"].get("project_json")
         if not project_json_key:
             raise RuntimeError("프로젝트 JSON이 없습니다")
@@ -2725,7 +2740,11 @@ def _render_final_preview(project_id: str, job_id: str | None) -> None:
 
         evaluation_path = temp_dir / "evaluation.json"
         if existing_result_keys.get("preview_kind") != "junction":
-            base_review_payload = avid.review_segments(str(input_project_json))
+            base_review_payload = final_preview_plan.cached_review_segments(
+                project_id,
+                project_json_digest(project_json_bytes),
+                lambda: avid.review_segments(str(input_project_json)),
+            )
             evaluation_payload = merge_saved_review_preferences(
                 base_review_payload,
                 evaluation_payload,
@@ -2744,7 +2763,8 @@ def _render_final_preview(project_id: str, job_id: str | None) -> None:
         )
         db.table("jobs").update({"progress": 35}).eq("id", job_id).execute()
 
-        intervals = _review_timeline_intervals_from_project_json(applied_project_json)
+        applied_document = ProjectDocument.from_path(applied_project_json)
+        intervals = _review_timeline_intervals(applied_document)
         if not intervals:
             raise RuntimeError("미리보기로 렌더링할 keep 구간이 없습니다")
         db.table("jobs").update({"progress": 50}).eq("id", job_id).execute()
@@ -2752,21 +2772,22 @@ def _render_final_preview(project_id: str, job_id: str | None) -> None:
         source_path = _get_cached_source_video(project, temp_dir)
 
         no_subs_path = output_dir / "final_preview_no_subs.mp4"
-        render_manifest = _render_intervals(source_path, intervals, no_subs_path)
+        if settings.final_preview_incremental_render:
+            render_manifest = final_preview_plan.render_with_plan(project_id, source_path, intervals, no_subs_path)
+        else:
+            render_manifest = _render_intervals(source_path, intervals, no_subs_path)
         duration_ms = int((render_manifest.get("intervals") or [])[-1]["preview_end_ms"])
         db.table("jobs").update({"progress": 80}).eq("id", job_id).execute()
 
+        timeline_map = TimelineMap.from_manifest(render_manifest)
         captions_tmp_path = output_dir / "captions.vtt"
         _write_final_preview_webvtt_from_source_segments(
-            applied_project_json,
-            render_manifest,
+            applied_document,
+            timeline_map,
             captions_tmp_path,
         )
         timeline_map_tmp_path = output_dir / "timeline_map.json"
-        timeline_map_tmp_path.write_text(
-            json.dumps(render_manifest, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        timeline_map.write(timeline_map_tmp_path)
 
         cache_video_path.parent.mkdir(parents=True, exist_ok=True)
         video_tmp_path = cache_video_path.with_suffix(".mp4.tmp")
@@ -2787,6 +2808,7 @@ def _render_final_preview(project_id: str, job_id: str | None) -> None:
                 "decision_hash": hash_value,
                 "cache_token": cache_token,
                 "duration_ms": duration_ms,
+                **_speculative_result_keys(existing_result_keys),
             },
             "completed_at": "now()",
         }).eq("id", job_id).execute()
@@ -2892,8 +2914,8 @@ def _render_ai_cut(project_id: str, job_id: str | None) -> None:
             or source_job.get("type") not in ai_cut_render.AI_SOURCE_JOB_TYPES
         ):
             raise RuntimeError("완료된 AI 기준 작업을 찾을 수 없습니다")
-        project_json_key = (source_job.get("result_r2_keys") or {}).get("project_json")
-        if not project_json_key:
+        source_r2_keys = source_job.get("result_r2_keys") or {}
+        if not source_r2_keys.get("project_json"):
             raise RuntimeError("AI 기준 작업에 프로젝트 JSON이 없습니다")
 
         expected_dedupe = ai_cut_render.render_dedupe_key(project, source_job)
@@ -2904,8 +2926,6 @@ def _render_ai_cut(project_id: str, job_id: str | None) -> None:
         temp_dir.mkdir(parents=True, exist_ok=True)
         output_dir = temp_dir / "output"
         output_dir.mkdir(exist_ok=True)
-        project_json_path = temp_dir / "source.project.avid.json"
-        project_json_path.write_bytes(r2.download_to_bytes(project_json_key))
 
         source_path = _get_cached_source_video(project, temp_dir)
         source_metadata = media_render.probe_media(source_path)
@@ -2913,7 +2933,8 @@ def _render_ai_cut(project_id: str, job_id: str | None) -> None:
 
         # Keep AI decisions as the source of truth, but plan their rendered
         # timeline exactly like final preview so both outputs share boundaries.
-        intervals = _review_timeline_intervals_from_project_json(project_json_path)
+        # Planning reads only timings and decisions, so the sidecar is enough.
+        intervals = _review_timeline_intervals(load_transcript_document(source_r2_keys))
         if not intervals:
             raise RuntimeError("AI 컷편집 영상으로 렌더링할 keep 구간이 없습니다")
         db.table("jobs").update({"progress": 25}).eq("id", job_id).eq("status", "running").execute()
@@ -2929,6 +2950,7 @@ def _render_ai_cut(project_id: str, job_id: str | None) -> None:
             output_path,
             profile=media_render.WEB_1080P_PROFILE,
             progress_callback=update_render_progress,
+            streaming=settings.render_streaming_concat,
         )
         expected_duration_ms = sum(int(round(duration * 1000)) for _start, duration in intervals)
         rendered_metadata = media_render.validate_output(
@@ -3029,6 +3051,7 @@ def _register_source_identity(
         r2_key=project["source_r2_key"],
         filename=project.get("source_filename"),
         duration_seconds=project.get("source_duration_seconds"),
+        fingerprint=source_cache.sample_fingerprint_file(path),
     )
     return source_sha256
 
@@ -4098,6 +4121,21 @@ def _save_report(db, project_id: str, total_duration: int, report_markdown: str)
     }).execute()
 
 
+def _add_transcript_sidecar(result_paths: dict) -> None:
+    """Write the columnar transcript sidecar next to an emitted project JSON.
+
+    The sidecar is an optimization for readers, so a failure here is logged
+    and the artifact is published without it.
+    """
+    project_json_path = result_paths.get("project_json")
+    if not project_json_path:
+        return
+    try:
+        result_paths[TRANSCRIPT_SIDECAR_RESULT_KEY] = str(write_transcript_sidecar(Path(project_json_path)))
+    except Exception:
+        logger.warning("Transcript sidecar generation failed for %s", project_json_path, exc_info=True)
+
+
 def _guess_content_type(key: str) -> str:
     types = {
         "fcpxml": "application/xml",
@@ -4111,5 +4149,6 @@ def _guess_content_type(key: str) -> str:
         "sync_diagnostics": "application/json",
         "llm_io_log": "application/x-ndjson",
         "preview": "video/mp4",
+        TRANSCRIPT_SIDECAR_RESULT_KEY: "application/x-npz",
     }
     return types.get(key, "application/octet-stream")
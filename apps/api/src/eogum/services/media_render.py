@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+import shutil
 import subprocess
-from typing import Callable
+import threading
+from collections import OrderedDict
+from typing import Callable, Mapping
 
 
 FINAL_PREVIEW_PROFILE = "final_preview_v1"
 WEB_1080P_PROFILE = "web_1080p_v2"
 WEB_VIDEO_BITRATE_TOLERANCE_RATIO = 0.10
+STREAM_CONTAINER_FORMAT = "mpegts"
+STREAM_COPY_CHUNK_BYTES = 1024 * 1024
+PROBE_CACHE_MAX_ENTRIES = 256
+
+_probe_cache: OrderedDict[tuple[str, int, int], dict] = OrderedDict()
+_probe_cache_lock = threading.Lock()
 
 
 def _run(command: list[str], *, timeout: int, description: str) -> subprocess.CompletedProcess[str]:
@@ -40,7 +49,45 @@ def _positive_int(value: object) -> int | None:
     return parsed if parsed > 0 else None
 
 
+def _file_identity(path: Path) -> tuple[str, int, int]:
+    stat = path.stat()
+    return str(path.resolve()), stat.st_size, stat.st_mtime_ns
+
+
+def _cache_probe(identity: tuple[str, int, int], metadata: dict) -> None:
+    with _probe_cache_lock:
+        _probe_cache[identity] = dict(metadata)
+        _probe_cache.move_to_end(identity)
+        while len(_probe_cache) > PROBE_CACHE_MAX_ENTRIES:
+            _probe_cache.popitem(last=False)
+
+
+def seed_probe_cache(path: Path, ffprobe_payload: dict) -> dict:
+    """Cache metadata from an ffprobe JSON document already stored elsewhere."""
+    metadata = _media_metadata(path, ffprobe_payload)
+    _cache_probe(_file_identity(path), metadata)
+    return dict(metadata)
+
+
+def has_cached_probe(path: Path) -> bool:
+    with _probe_cache_lock:
+        return _file_identity(path) in _probe_cache
+
+
+def clear_probe_cache() -> None:
+    with _probe_cache_lock:
+        _probe_cache.clear()
+
+
 def probe_media(path: Path) -> dict:
+    """Return normalized FFprobe metadata, cached by (path, size, mtime_ns)."""
+    identity = _file_identity(path)
+    with _probe_cache_lock:
+        cached = _probe_cache.get(identity)
+        if cached is not None:
+            _probe_cache.move_to_end(identity)
+            return dict(cached)
+
     result = _run(
         [
             "ffprobe",
@@ -55,7 +102,12 @@ def probe_media(path: Path) -> dict:
         timeout=30,
         description=f"ffprobe {path}",
     )
-    payload = json.loads(result.stdout)
+    metadata = _media_metadata(path, json.loads(result.stdout))
+    _cache_probe(identity, metadata)
+    return dict(metadata)
+
+
+def _media_metadata(path: Path, payload: dict) -> dict:
     streams = payload.get("streams") or []
     video = next((stream for stream in streams if stream.get("codec_type") == "video"), None)
     audio = next((stream for stream in streams if stream.get("codec_type") == "audio"), None)
@@ -127,9 +179,12 @@ def _encoding_args(
     *,
     has_audio: bool,
     target_video_bitrate: int | None = None,
+    video_filters: list[str] | None = None,
 ) -> list[str]:
+    video_filters = list(video_filters or [])
     if profile == FINAL_PREVIEW_PROFILE:
-        args = [
+        args = ["-vf", ",".join(video_filters)] if video_filters else []
+        args += [
             "-c:v",
             "libx264",
             "-preset",
@@ -149,9 +204,12 @@ def _encoding_args(
         target_video_bitrate = _positive_int(target_video_bitrate)
         if target_video_bitrate is None:
             raise RuntimeError("source video bitrate is unavailable for web render")
+        scale_filter = (
+            "scale=min(1920\\,iw):min(1080\\,ih):force_original_aspect_ratio=decrease:force_divisible_by=2"
+        )
         args = [
             "-vf",
-            "scale=min(1920\\,iw):min(1080\\,ih):force_original_aspect_ratio=decrease:force_divisible_by=2",
+            ",".join([scale_filter, *video_filters]),
             "-c:v",
             "libx264",
             "-preset",
@@ -178,6 +236,69 @@ def _encoding_args(
     raise ValueError(f"Unsupported render profile: {profile}")
 
 
+def _srt_time_ms(value: str) -> int:
+    hours, minutes, rest = value.strip().replace(".", ",").split(":")
+    seconds, _, millis = rest.partition(",")
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(millis or 0)
+
+
+def _format_srt_time(ms: int) -> str:
+    hours, rest = divmod(max(0, ms), 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    seconds, millis = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
+
+
+def read_srt_cues(path: Path) -> list[tuple[int, int, str]]:
+    """Parse an SRT file into ``(start_ms, end_ms, text)`` cues."""
+    cues: list[tuple[int, int, str]] = []
+    text = path.read_text(encoding="utf-8-sig").replace("\r\n", "\n")
+    for block in text.split("\n\n"):
+        lines = [line for line in block.strip().splitlines()]
+        timing_index = next((i for i, line in enumerate(lines) if "-->" in line), None)
+        if timing_index is None:
+            continue
+        start_text, _, end_text = lines[timing_index].partition("-->")
+        try:
+            start_ms = _srt_time_ms(start_text)
+            end_ms = _srt_time_ms(end_text.split()[0])
+        except (IndexError, ValueError):
+            continue
+        cue_text = "\n".join(lines[timing_index + 1:]).strip()
+        if cue_text and end_ms > start_ms:
+            cues.append((start_ms, end_ms, cue_text))
+    return cues
+
+
+def _write_interval_subtitles(
+    cues: list[tuple[int, int, str]],
+    start_ms: int,
+    end_ms: int,
+    output_path: Path,
+) -> bool:
+    """Write the cues visible in one source interval, rebased to its start."""
+    blocks = []
+    for cue_start_ms, cue_end_ms, text in cues:
+        overlap_start_ms = max(cue_start_ms, start_ms)
+        overlap_end_ms = min(cue_end_ms, end_ms)
+        if overlap_end_ms <= overlap_start_ms:
+            continue
+        blocks.append(
+            f"{len(blocks) + 1}\n"
+            f"{_format_srt_time(overlap_start_ms - start_ms)} --> {_format_srt_time(overlap_end_ms - start_ms)}\n"
+            f"{text}\n"
+        )
+    if not blocks:
+        return False
+    output_path.write_text("\n".join(blocks), encoding="utf-8")
+    return True
+
+
+def _subtitles_filter(path: Path) -> str:
+    escaped = str(path).replace("\\", "\\\\").replace(":", "\\:").replace("'", "\\'")
+    return f"subtitles={escaped}:charenc=UTF-8"
+
+
 def validate_output(
     output_path: Path,
     *,
@@ -226,6 +347,169 @@ def validate_output(
     return metadata
 
 
+def _interval_encode_command(
+    source_path: Path,
+    start: float,
+    duration: float,
+    *,
+    profile: str,
+    has_audio: bool,
+    target_video_bitrate: int | None,
+    video_filters: list[str],
+) -> list[str]:
+    command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostdin",
+        "-y",
+        "-ss",
+        f"{max(0.0, start):.6f}",
+        "-i",
+        str(source_path),
+        "-t",
+        f"{duration:.6f}",
+        "-map",
+        "0:v:0",
+    ]
+    if has_audio:
+        command += ["-map", "0:a:0"]
+    command += _encoding_args(
+        profile,
+        has_audio=has_audio,
+        target_video_bitrate=target_video_bitrate,
+        video_filters=video_filters,
+    )
+    return command
+
+
+def _progress_duration_ms(progress_output: str, fps: float | None) -> int | None:
+    """Read the encoded duration from FFmpeg ``-progress`` key=value output.
+
+    ``out_time_us`` trails the last frame (it is a muxed timestamp), so the
+    final ``frame`` count at the source frame rate is preferred when known.
+    """
+    values: dict[str, str] = {}
+    for line in progress_output.splitlines():
+        key, separator, value = line.partition("=")
+        if separator:
+            values[key.strip()] = value.strip()
+    durations = []
+    try:
+        out_time_us = int(values.get("out_time_us", ""))
+        if out_time_us >= 0:
+            durations.append(out_time_us / 1000)
+    except ValueError:
+        pass
+    try:
+        frame_count = int(values.get("frame", ""))
+        if frame_count > 0 and fps:
+            durations.append(frame_count * 1000 / fps)
+    except ValueError:
+        pass
+    return int(round(max(durations))) if durations else None
+
+
+def _drain(stream, chunks: list[bytes]) -> threading.Thread:
+    thread = threading.Thread(target=lambda: chunks.append(stream.read()), daemon=True)
+    thread.start()
+    return thread
+
+
+def _stream_intervals(
+    interval_commands: list[tuple[list[str], str]],
+    output_path: Path,
+    *,
+    has_audio: bool,
+    fps: float | None,
+    requested_durations_ms: list[int],
+    progress_callback: Callable[[float], None] | None,
+) -> list[int]:
+    """Pipe interval encoders into one muxer; only the final file hits disk."""
+    muxer_command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-y",
+        "-f",
+        STREAM_CONTAINER_FORMAT,
+        "-i",
+        "pipe:0",
+        "-c",
+        "copy",
+    ]
+    if has_audio:
+        muxer_command += ["-bsf:a", "aac_adtstoasc"]
+    muxer_command += ["-movflags", "+faststart", str(output_path)]
+    muxer = subprocess.Popen(muxer_command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    muxer_stderr: list[bytes] = []
+    muxer_drain = _drain(muxer.stderr, muxer_stderr)
+
+    durations_ms: list[int] = []
+    cursor_ms = 0
+    try:
+        for index, (command, description) in enumerate(interval_commands):
+            encoder = subprocess.Popen(
+                [
+                    *command,
+                    "-loglevel",
+                    "error",
+                    "-nostats",
+                    "-progress",
+                    "pipe:2",
+                    "-output_ts_offset",
+                    f"{cursor_ms / 1000:.6f}",
+                    "-muxdelay",
+                    "0",
+                    "-muxpreload",
+                    "0",
+                    "-f",
+                    STREAM_CONTAINER_FORMAT,
+                    "pipe:1",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            encoder_stderr: list[bytes] = []
+            encoder_drain = _drain(encoder.stderr, encoder_stderr)
+            try:
+                shutil.copyfileobj(encoder.stdout, muxer.stdin, STREAM_COPY_CHUNK_BYTES)
+            except BrokenPipeError:
+                encoder.kill()
+                encoder.wait()
+                muxer_drain.join(timeout=5)
+                raise RuntimeError(
+                    f"render mux failed: {b''.join(muxer_stderr).decode(errors='replace')[-1000:]}"
+                ) from None
+            returncode = encoder.wait(timeout=7200)
+            encoder_drain.join()
+            progress_output = b"".join(encoder_stderr).decode(errors="replace")
+            if returncode != 0:
+                raise RuntimeError(f"{description} failed: {progress_output[-1000:]}")
+
+            duration_ms = _progress_duration_ms(progress_output, fps) or requested_durations_ms[index]
+            durations_ms.append(duration_ms)
+            cursor_ms += duration_ms
+            if progress_callback:
+                progress_callback((index + 1) / len(interval_commands))
+
+        muxer.stdin.close()
+        if muxer.wait(timeout=7200) != 0:
+            muxer_drain.join(timeout=5)
+            raise RuntimeError(
+                f"render mux failed: {b''.join(muxer_stderr).decode(errors='replace')[-1000:]}"
+            )
+        muxer_drain.join()
+    except BaseException:
+        if muxer.poll() is None:
+            muxer.kill()
+            muxer.wait()
+        output_path.unlink(missing_ok=True)
+        raise
+    return durations_ms
+
+
 def render_intervals(
     source_path: Path,
     intervals: list[tuple[float, float]],
@@ -233,8 +517,27 @@ def render_intervals(
     *,
     profile: str,
     progress_callback: Callable[[float], None] | None = None,
+    subtitles_path: Path | None = None,
+    streaming: bool = False,
+    segment_paths: list[Path] | None = None,
+    reused_durations_ms: Mapping[int, int] | None = None,
 ) -> dict:
-    """Encode keep intervals independently, then stream-copy concatenate them."""
+    """Encode keep intervals independently, then stream-copy concatenate them.
+
+    ``subtitles_path`` is an SRT on the source timeline. When given, each
+    interval burns in its own rebased cues during the same encode, so burned
+    output never needs a second full re-encode.
+
+    With ``streaming`` the encoders write MPEG-TS to a pipe read in order by a
+    single muxer, so no per-interval MP4 or concat list is written and the
+    final file is the only video that touches disk.
+
+    ``segment_paths`` (one per keep interval) makes each interval encode to a
+    caller-owned file that is left in place after concatenation, which
+    disables streaming. Positions listed in ``reused_durations_ms`` already
+    hold an encoded file at that path with the given duration and are not
+    encoded again.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     segment_dir = output_path.parent / f"{output_path.stem}_segments"
     segment_dir.mkdir(parents=True, exist_ok=True)
@@ -244,46 +547,71 @@ def render_intervals(
         source_metadata.get("video_bitrate") if profile == WEB_1080P_PROFILE else None
     )
     valid_intervals = [(start, duration) for start, duration in intervals if duration > 0]
+    if not valid_intervals:
+        raise RuntimeError("렌더링할 keep 구간이 없습니다")
+    if segment_paths is not None and len(segment_paths) != len(valid_intervals):
+        raise ValueError("segment_paths must have one path per keep interval")
+    subtitle_cues = (
+        read_srt_cues(subtitles_path)
+        if subtitles_path is not None and subtitles_path.exists()
+        else []
+    )
 
-    segment_paths: list[Path] = []
-    manifest_intervals: list[dict] = []
-    preview_cursor_ms = 0
+    interval_commands: list[tuple[list[str], str]] = []
     for index, (start, duration) in enumerate(valid_intervals):
-        segment_path = segment_dir / f"segment_{index:04d}.mp4"
-        command = [
-            "ffmpeg",
-            "-hide_banner",
-            "-nostdin",
-            "-y",
-            "-ss",
-            f"{max(0.0, start):.6f}",
-            "-i",
-            str(source_path),
-            "-t",
-            f"{duration:.6f}",
-            "-map",
-            "0:v:0",
-        ]
-        if has_audio:
-            command += ["-map", "0:a:0"]
-        command += _encoding_args(
-            profile,
+        source_start_ms = int(round(start * 1000))
+        video_filters = []
+        segment_subtitles_path = segment_dir / f"segment_{index:04d}.srt"
+        if subtitle_cues and _write_interval_subtitles(
+            subtitle_cues,
+            source_start_ms,
+            source_start_ms + int(round(duration * 1000)),
+            segment_subtitles_path,
+        ):
+            video_filters.append(_subtitles_filter(segment_subtitles_path))
+        command = _interval_encode_command(
+            source_path,
+            start,
+            duration,
+            profile=profile,
             has_audio=has_audio,
             target_video_bitrate=target_video_bitrate,
+            video_filters=video_filters,
         )
-        command += ["-movflags", "+faststart", str(segment_path)]
-        _run(
-            command,
-            timeout=7200,
-            description=(
-                f"render interval {index + 1}/{len(valid_intervals)} "
-                f"(start={start:.3f}s, duration={duration:.3f}s)"
-            ),
+        description = (
+            f"render interval {index + 1}/{len(valid_intervals)} "
+            f"(start={start:.3f}s, duration={duration:.3f}s)"
         )
+        interval_commands.append((command, description))
 
-        actual_duration_ms = probe_duration_ms(segment_path)
+    requested_durations_ms = [int(round(duration * 1000)) for _start, duration in valid_intervals]
+    if streaming and segment_paths is None:
+        actual_durations_ms = _stream_intervals(
+            interval_commands,
+            output_path,
+            has_audio=has_audio,
+            fps=source_metadata.get("fps"),
+            requested_durations_ms=requested_durations_ms,
+            progress_callback=progress_callback,
+        )
+    else:
+        actual_durations_ms = _render_segments_and_concat(
+            interval_commands,
+            segment_paths or [segment_dir / f"segment_{index:04d}.mp4" for index in range(len(interval_commands))],
+            output_path,
+            fps=source_metadata.get("fps"),
+            progress_callback=progress_callback,
+            reused_durations_ms=reused_durations_ms or {},
+        )
+
+    manifest_intervals: list[dict] = []
+    preview_cursor_ms = 0
+    for (start, _duration), requested_duration_ms, actual_duration_ms in zip(
+        valid_intervals,
+        requested_durations_ms,
+        actual_durations_ms,
+    ):
         source_start_ms = int(round(start * 1000))
-        requested_duration_ms = int(round(duration * 1000))
         manifest_intervals.append({
             "source_start_ms": source_start_ms,
             "source_end_ms": source_start_ms + requested_duration_ms,
@@ -293,12 +621,38 @@ def render_intervals(
             "preview_end_ms": preview_cursor_ms + actual_duration_ms,
         })
         preview_cursor_ms += actual_duration_ms
-        segment_paths.append(segment_path)
-        if progress_callback:
-            progress_callback((index + 1) / len(valid_intervals))
+    return {
+        "version": 1,
+        "intervals": manifest_intervals,
+        "source": source_metadata,
+        "target_video_bitrate": target_video_bitrate,
+    }
 
-    if not segment_paths:
-        raise RuntimeError("렌더링할 keep 구간이 없습니다")
+
+def _render_segments_and_concat(
+    interval_commands: list[tuple[list[str], str]],
+    segment_paths: list[Path],
+    output_path: Path,
+    *,
+    fps: float | None,
+    progress_callback: Callable[[float], None] | None,
+    reused_durations_ms: Mapping[int, int],
+) -> list[int]:
+    durations_ms: list[int] = []
+    for index, ((command, description), segment_path) in enumerate(zip(interval_commands, segment_paths)):
+        if index in reused_durations_ms:
+            durations_ms.append(int(reused_durations_ms[index]))
+        else:
+            result = _run(
+                [*command, "-nostats", "-progress", "pipe:1", "-movflags", "+faststart", str(segment_path)],
+                timeout=7200,
+                description=description,
+            )
+            durations_ms.append(
+                _progress_duration_ms(result.stdout or "", fps) or probe_duration_ms(segment_path)
+            )
+        if progress_callback:
+            progress_callback((index + 1) / len(interval_commands))
 
     concat_list = output_path.with_suffix(".concat.txt")
     concat_list.write_text(
@@ -326,9 +680,4 @@ def render_intervals(
         timeout=7200,
         description="render concat",
     )
-    return {
-        "version": 1,
-        "intervals": manifest_intervals,
-        "source": source_metadata,
-        "target_video_bitrate": target_video_bitrate,
-    }
+    return durations_ms
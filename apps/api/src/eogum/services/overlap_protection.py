@@ -11,7 +11,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from eogum.config import settings
+from eogum.services.interval_set import IntervalSet, overlap_pairs
 
 DIARIZATION_MODEL_ID = "pyannote/speaker-diarization-community-1"
 
@@ -169,25 +172,26 @@ def _annotation_to_turns(annotation: Any) -> list[dict[str, Any]]:
 
 
 def _infer_overlaps_from_turns(turns: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    events: list[tuple[int, int, int]] = []
-    for index, turn in enumerate(turns):
-        events.append((turn["start_ms"], 1, index))
-        events.append((turn["end_ms"], -1, index))
-    events.sort(key=lambda event: (event[0], event[1]))
-
-    active: set[int] = set()
-    previous_time: int | None = None
-    overlaps: list[dict[str, Any]] = []
-    for current_time, kind, index in events:
-        if previous_time is not None and current_time > previous_time and len(active) >= 2:
-            speakers = sorted({str(turns[i]["speaker"]) for i in active if turns[i].get("speaker")})
-            overlaps.append(_interval(previous_time / 1000.0, current_time / 1000.0, speakers=speakers))
-        if kind == -1:
-            active.discard(index)
-        else:
-            active.add(index)
-        previous_time = current_time
-    return _merge_intervals(overlaps, require_same_models=False)
+    if not turns:
+        return []
+    turn_starts = np.fromiter((turn["start_ms"] for turn in turns), dtype=np.int64, count=len(turns))
+    turn_ends = np.fromiter((turn["end_ms"] for turn in turns), dtype=np.int64, count=len(turns))
+    regions = IntervalSet.coverage_at_least(turn_starts, turn_ends, 2)
+    region_index, turn_index = overlap_pairs(regions.starts, regions.ends, turn_starts, turn_ends)
+
+    speakers_by_region: list[set[str]] = [set() for _ in range(len(regions))]
+    for region, turn in zip(region_index.tolist(), turn_index.tolist()):
+        speaker = turns[turn].get("speaker")
+        if speaker:
+            speakers_by_region[region].add(str(speaker))
+
+    return [
+        {
+            **_interval(start_ms / 1000.0, end_ms / 1000.0, speakers=sorted(speakers)),
+            "models": [],
+        }
+        for (start_ms, end_ms), speakers in zip(regions, speakers_by_region)
+    ]
 
 
 def _interval(start: float, end: float, **extra: Any) -> dict[str, Any]:
@@ -209,22 +213,55 @@ def _merge_intervals(
     *,
     require_same_models: bool = False,
 ) -> list[dict[str, Any]]:
+    if require_same_models:
+        return _merge_intervals_with_same_models(intervals)
+
+    ordered = [
+        interval
+        for interval in sorted(intervals, key=lambda item: (item["start_ms"], item["end_ms"]))
+        if interval["end_ms"] > interval["start_ms"]
+    ]
+    if not ordered:
+        return []
+    starts = np.fromiter((item["start_ms"] for item in ordered), dtype=np.int64, count=len(ordered))
+    ends = np.fromiter((item["end_ms"] for item in ordered), dtype=np.int64, count=len(ordered))
+    groups = IntervalSet.from_arrays(starts, ends)
+    group_index = np.searchsorted(groups.starts, starts, side="right") - 1
+    group_first = np.searchsorted(group_index, np.arange(len(groups)), side="left").tolist()
+    group_stop = group_first[1:] + [len(ordered)]
+
+    merged: list[dict[str, Any]] = []
+    for first, stop, end_ms in zip(group_first, group_stop, groups.ends.tolist()):
+        members = ordered[first:stop]
+        models: set[str] = set()
+        for interval in members:
+            models.update(interval.get("models") or [])
+        result = {**members[0], "models": sorted(models)}
+        if len(members) > 1:
+            result["end_ms"] = end_ms
+            result["end"] = round(end_ms / 1000.0, 3)
+            result["duration_ms"] = end_ms - result["start_ms"]
+            later_speakers = [interval["speakers"] for interval in members[1:] if interval.get("speakers")]
+            if later_speakers:
+                speakers = set(result.get("speakers") or [])
+                for item in later_speakers:
+                    speakers.update(item)
+                result["speakers"] = sorted(speakers)
+        merged.append(result)
+    return merged
+
+
+def _merge_intervals_with_same_models(intervals: list[dict[str, Any]]) -> list[dict[str, Any]]:
     merged: list[dict[str, Any]] = []
     for interval in sorted(intervals, key=lambda item: (item["start_ms"], item["end_ms"])):
         if interval["end_ms"] <= interval["start_ms"]:
             continue
         models = set(interval.get("models") or [])
-        if not merged:
-            merged.append({**interval, "models": sorted(models)})
-            continue
-        previous = merged[-1]
-        previous_models = set(previous.get("models") or [])
-        same_models = previous_models == models if require_same_models else True
-        if same_models and interval["start_ms"] <= previous["end_ms"]:
+        if merged and set(merged[-1].get("models") or []) == models and interval["start_ms"] <= merged[-1]["end_ms"]:
+            previous = merged[-1]
             previous["end_ms"] = max(previous["end_ms"], interval["end_ms"])
             previous["end"] = round(previous["end_ms"] / 1000.0, 3)
             previous["duration_ms"] = previous["end_ms"] - previous["start_ms"]
-            previous["models"] = sorted(previous_models | models)
             if interval.get("speakers"):
                 previous["speakers"] = sorted(set(previous.get("speakers") or []) | set(interval["speakers"]))
         else:
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import json
-from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
+from eogum.services.interval_set import overlap_pairs
+
 
 def enrich_overlap_speaker_mapping_files(
     *,
@@ -39,8 +40,13 @@ def enrich_overlap_speaker_mapping(
     overlap_payload: dict[str, Any],
     segments_payload: dict[str, Any] | list[Any],
 ) -> tuple[dict[str, Any], dict[str, Any] | list[Any], dict[str, Any]]:
-    """Return copies of overlap/segments payloads with mapped speaker metadata."""
-    overlap = deepcopy(overlap_payload)
+    """Return copies of overlap/segments payloads with mapped speaker metadata.
+
+    Copies are copy-on-write: containers and the dicts that gain mapping keys
+    are copied, everything else is shared with the inputs and must be treated
+    as read-only.
+    """
+    overlap = dict(overlap_payload)
     segments_container, segments = _copy_segments_payload(segments_payload)
     normalized_segments = [
         _normalize_segment(segment)
@@ -50,20 +56,28 @@ def enrich_overlap_speaker_mapping(
     normalized_segments = [segment for segment in normalized_segments if segment is not None]
 
     raw_intervals = overlap.get("intervals")
-    intervals = raw_intervals if isinstance(raw_intervals, list) else []
+    intervals = list(raw_intervals) if isinstance(raw_intervals, list) else []
     interval_mapping: dict[tuple[int, int], dict[str, Any]] = {}
     mapped_interval_count = 0
 
-    for item in intervals:
+    valid_intervals: list[tuple[int, int, int]] = []
+    for position, item in enumerate(intervals):
         if not isinstance(item, dict):
             continue
         start_ms = _coerce_interval_ms(item, "start_ms", "start_time", "start")
         end_ms = _coerce_interval_ms(item, "end_ms", "end_time", "end")
         if start_ms is None or end_ms is None or end_ms <= start_ms:
             continue
+        valid_intervals.append((position, start_ms, end_ms))
 
+    mapped_speakers_by_interval = _mapped_speakers_for_intervals(
+        [(start_ms, end_ms) for _position, start_ms, end_ms in valid_intervals],
+        normalized_segments,
+    )
+    for (position, start_ms, end_ms), mapped_speakers in zip(valid_intervals, mapped_speakers_by_interval):
+        item = dict(intervals[position])
+        intervals[position] = item
         pyannote_speakers = _string_list(item.get("pyannote_speakers") or item.get("speakers"))
-        mapped_speakers = _mapped_speakers_for_interval(start_ms, end_ms, normalized_segments)
         mapping_method = "segment_intersection" if mapped_speakers else "none"
         if mapped_speakers:
             mapped_interval_count += 1
@@ -81,13 +95,15 @@ def enrich_overlap_speaker_mapping(
     overlap["intervals"] = intervals
 
     enriched_segment_count = 0
-    for segment in segments:
+    for position, segment in enumerate(segments):
         if not isinstance(segment, dict):
             continue
         overlap_meta = segment.get("overlap_protection")
         if not isinstance(overlap_meta, dict):
             continue
-        if _enrich_segment_overlap_metadata(overlap_meta, interval_mapping):
+        enriched_meta = _enriched_segment_overlap_metadata(overlap_meta, interval_mapping)
+        if enriched_meta is not None:
+            segments[position] = {**segment, "overlap_protection": enriched_meta}
             enriched_segment_count += 1
 
     summary = {
@@ -104,13 +120,13 @@ def enrich_overlap_speaker_mapping(
 
 def _copy_segments_payload(payload: dict[str, Any] | list[Any]) -> tuple[dict[str, Any] | list[Any], list[Any]]:
     if isinstance(payload, dict):
-        copied = deepcopy(payload)
+        copied = dict(payload)
         raw_segments = copied.get("segments")
-        segments = raw_segments if isinstance(raw_segments, list) else []
+        segments = list(raw_segments) if isinstance(raw_segments, list) else []
         copied["segments"] = segments
         return copied, segments
 
-    segments = deepcopy(payload) if isinstance(payload, list) else []
+    segments = list(payload) if isinstance(payload, list) else []
     return segments, segments
 
 
@@ -138,32 +154,38 @@ def _speaker_labels_for_segment(segment: dict[str, Any]) -> list[str]:
     return []
 
 
-def _mapped_speakers_for_interval(
-    start_ms: int,
-    end_ms: int,
+def _mapped_speakers_for_intervals(
+    intervals: list[tuple[int, int]],
     segments: list[dict[str, Any]],
-) -> list[str]:
-    speakers: set[str] = set()
-    for segment in segments:
-        if segment["start_ms"] < end_ms and segment["end_ms"] > start_ms:
-            speakers.update(segment["speakers"])
-    return sorted(speakers)
-
-
-def _enrich_segment_overlap_metadata(
+) -> list[list[str]]:
+    speakers: list[set[str]] = [set() for _ in intervals]
+    if intervals and segments:
+        interval_index, segment_index = overlap_pairs(
+            [start_ms for start_ms, _end_ms in intervals],
+            [end_ms for _start_ms, end_ms in intervals],
+            [segment["start_ms"] for segment in segments],
+            [segment["end_ms"] for segment in segments],
+        )
+        for interval, segment in zip(interval_index.tolist(), segment_index.tolist()):
+            speakers[interval].update(segments[segment]["speakers"])
+    return [sorted(item) for item in speakers]
+
+
+def _enriched_segment_overlap_metadata(
     overlap_meta: dict[str, Any],
     interval_mapping: dict[tuple[int, int], dict[str, Any]],
-) -> bool:
+) -> dict[str, Any] | None:
     raw_intervals = overlap_meta.get("overlap_intervals_ms")
     if not isinstance(raw_intervals, list):
-        return False
+        return None
 
+    enriched_intervals = list(raw_intervals)
     mapped_speakers: set[str] = set()
     pyannote_speakers: set[str] = set()
     touched = False
     any_mapped = False
 
-    for item in raw_intervals:
+    for position, item in enumerate(raw_intervals):
         if not isinstance(item, dict):
             continue
         start_ms = _coerce_interval_ms(item, "start_ms", "start_time", "start")
@@ -172,23 +194,31 @@ def _enrich_segment_overlap_metadata(
         if mapping is None:
             continue
 
-        item["mapped_speakers"] = list(mapping["mapped_speakers"])
-        item["speaker_mapping_method"] = mapping["speaker_mapping_method"]
+        enriched_item = {
+            **item,
+            "mapped_speakers": list(mapping["mapped_speakers"]),
+            "speaker_mapping_method": mapping["speaker_mapping_method"],
+        }
         if mapping["pyannote_speakers"]:
-            item["pyannote_speakers"] = list(mapping["pyannote_speakers"])
+            enriched_item["pyannote_speakers"] = list(mapping["pyannote_speakers"])
+        enriched_intervals[position] = enriched_item
         mapped_speakers.update(mapping["mapped_speakers"])
         pyannote_speakers.update(mapping["pyannote_speakers"])
         any_mapped = any_mapped or bool(mapping["mapped_speakers"])
         touched = True
 
     if not touched:
-        return False
+        return None
 
-    overlap_meta["mapped_speakers"] = sorted(mapped_speakers)
+    enriched_meta = {
+        **overlap_meta,
+        "overlap_intervals_ms": enriched_intervals,
+        "mapped_speakers": sorted(mapped_speakers),
+    }
     if pyannote_speakers:
-        overlap_meta["pyannote_speakers"] = sorted(pyannote_speakers)
-    overlap_meta["speaker_mapping_method"] = "segment_intersection" if any_mapped else "none"
-    return True
+        enriched_meta["pyannote_speakers"] = sorted(pyannote_speakers)
+    enriched_meta["speaker_mapping_method"] = "segment_intersection" if any_mapped else "none"
+    return enriched_meta
 
 
 def _coerce_interval_ms(item: dict[str, Any], ms_key: str, seconds_key: str, fallback_key: str) -> int | None:
@@ -0,0 +1,214 @@
+"""Parse-once view of an avid project JSON for preview and review code paths."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+import orjson
+
+PROJECT_DOCUMENT_CACHE_MAX_ENTRIES = 16
+
+_document_cache: OrderedDict[tuple[str, str], ProjectDocument] = OrderedDict()
+_document_cache_lock = threading.Lock()
+
+
+def _int_value(value: object) -> int | None:
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+class SegmentRecord:
+    """One transcript segment, without its word list."""
+
+    __slots__ = ("position", "index", "start_ms", "end_ms", "speaker", "text")
+
+    def __init__(
+        self,
+        position: int,
+        index: int | None,
+        start_ms: int | None,
+        end_ms: int | None,
+        speaker: str | None,
+        text: str,
+    ):
+        self.position = position
+        self.index = index
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.speaker = speaker
+        self.text = text
+
+
+class EditDecisionRecord:
+    """The edit decision fields the final-preview planner reads."""
+
+    __slots__ = ("start_ms", "end_ms", "edit_type", "reason", "active_video_track_id", "source_segment_index")
+
+    def __init__(
+        self,
+        start_ms: int | None,
+        end_ms: int | None,
+        edit_type: Any,
+        reason: Any,
+        active_video_track_id: Any,
+        source_segment_index: int | None,
+    ):
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.edit_type = edit_type
+        self.reason = reason
+        self.active_video_track_id = active_video_track_id
+        self.source_segment_index = source_segment_index
+
+
+class ProjectDocument:
+    """Compact records extracted from one project JSON parse.
+
+    Only the fields the preview planner, caption writer and review routes
+    read are kept; word lists and the rest of the dict tree are dropped as
+    soon as the records are built.
+    """
+
+    __slots__ = (
+        "source_files",
+        "tracks",
+        "segmentation_boundary_rule",
+        "segments",
+        "edit_decisions",
+    )
+
+    def __init__(
+        self,
+        source_files: list[tuple[Any, int | None]],
+        tracks: list[dict],
+        segmentation_boundary_rule: Any,
+        segments: list[SegmentRecord],
+        edit_decisions: list[EditDecisionRecord],
+    ):
+        self.source_files = source_files
+        self.tracks = tracks
+        self.segmentation_boundary_rule = segmentation_boundary_rule
+        self.segments = segments
+        self.edit_decisions = edit_decisions
+
+    @classmethod
+    def from_data(cls, project_data: dict) -> ProjectDocument:
+        source_files = [
+            (source_file.get("id"), _int_value((source_file.get("info") or {}).get("duration_ms")))
+            for source_file in project_data.get("source_files") or []
+            if isinstance(source_file, dict)
+        ]
+        tracks = [
+            {
+                "id": track.get("id"),
+                "track_type": track.get("track_type"),
+                "source_file_id": track.get("source_file_id"),
+            }
+            for track in project_data.get("tracks") or []
+            if isinstance(track, dict)
+        ]
+
+        transcription = project_data.get("transcription") or {}
+        segments: list[SegmentRecord] = []
+        for position, segment in enumerate(transcription.get("segments") or []):
+            if not isinstance(segment, dict):
+                continue
+            speaker = segment.get("speaker")
+            segments.append(SegmentRecord(
+                position,
+                _int_value(segment.get("index")),
+                _int_value(segment.get("start_ms")),
+                _int_value(segment.get("end_ms")),
+                str(speaker) if speaker else None,
+                str(segment.get("text") or "").strip(),
+            ))
+
+        edit_decisions: list[EditDecisionRecord] = []
+        for decision in project_data.get("edit_decisions") or []:
+            if not isinstance(decision, dict):
+                continue
+            range_data = decision.get("range") or {}
+            edit_decisions.append(EditDecisionRecord(
+                _int_value(range_data.get("start_ms")),
+                _int_value(range_data.get("end_ms")),
+                decision.get("edit_type"),
+                decision.get("reason"),
+                decision.get("active_video_track_id"),
+                _int_value(decision.get("source_segment_index")),
+            ))
+
+        return cls(
+            source_files,
+            tracks,
+            project_data.get("segmentation_boundary_rule"),
+            segments,
+            edit_decisions,
+        )
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> ProjectDocument:
+        return cls.from_data(orjson.loads(raw))
+
+    @classmethod
+    def from_path(cls, path: Path) -> ProjectDocument:
+        return cls.from_bytes(Path(path).read_bytes())
+
+    def primary_video_track(self) -> dict | None:
+        primary_source_id = self.source_files[0][0] if self.source_files else None
+        if primary_source_id is not None:
+            for track in self.tracks:
+                if track["track_type"] == "video" and track["source_file_id"] == primary_source_id:
+                    return track
+        for track in self.tracks:
+            if track["track_type"] == "video":
+                return track
+        return None
+
+    def max_source_file_duration_ms(self) -> int:
+        return max((duration_ms for _id, duration_ms in self.source_files if duration_ms), default=0)
+
+
+def load_project_document(artifact_key: str, raw: bytes) -> ProjectDocument:
+    """Return the parsed document for an artifact, reusing earlier parses.
+
+    Entries are keyed by the artifact key and a digest of its bytes, since
+    reprocessing rewrites result objects under the same key.
+    """
+    return cached_document(artifact_key, raw, ProjectDocument.from_bytes)
+
+
+def project_json_digest(raw: bytes) -> str:
+    """Content digest identifying one version of an artifact's bytes."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def cached_document(
+    artifact_key: str,
+    raw: bytes,
+    build: Callable[[bytes], ProjectDocument],
+) -> ProjectDocument:
+    cache_key = (artifact_key, project_json_digest(raw))
+    with _document_cache_lock:
+        document = _document_cache.get(cache_key)
+        if document is not None:
+            _document_cache.move_to_end(cache_key)
+            return document
+
+    document = build(raw)
+    with _document_cache_lock:
+        _document_cache[cache_key] = document
+        _document_cache.move_to_end(cache_key)
+        while len(_document_cache) > PROJECT_DOCUMENT_CACHE_MAX_ENTRIES:
+            _document_cache.popitem(last=False)
+    return document
+
+
+def clear_project_document_cache() -> None:
+    with _document_cache_lock:
+        _document_cache.clear()
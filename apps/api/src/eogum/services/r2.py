@@ -1,8 +1,9 @@
+import hashlib
+import threading
 import uuid
-
-import boto3
-from botocore.exceptions import ClientError
-from botocore.config import Config
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
 from eogum.config import settings
 
@@ -12,6 +13,10 @@ _client = None
 def get_r2_client():
     global _client
     if _client is None:
+        # boto3/botocore take ~100ms to import; defer them until R2 is used.
+        import boto3
+        from botocore.config import Config
+
         _client = boto3.client(
             "s3",
             endpoint_url=f"https://{settings.r2_account_id}.r2.cloudflarestorage.com",
@@ -107,6 +112,8 @@ def complete_multipart_upload(r2_key: str, upload_id: str, parts: list[dict]) ->
 
 def abort_multipart_upload(r2_key: str, upload_id: str) -> None:
     """Abort a multipart upload."""
+    from botocore.exceptions import ClientError
+
     client = get_r2_client()
     try:
         client.abort_multipart_upload(
@@ -138,6 +145,8 @@ def download_file(r2_key: str, local_path: str) -> str:
 
 def object_exists(r2_key: str) -> bool:
     """Return whether an object currently exists in the configured R2 bucket."""
+    from botocore.exceptions import ClientError
+
     client = get_r2_client()
     try:
         client.head_object(Bucket=settings.r2_bucket_name, Key=r2_key)
@@ -152,6 +161,8 @@ def object_exists(r2_key: str) -> bool:
 
 def head_object(r2_key: str) -> dict | None:
     """Return lightweight R2 object metadata, or ``None`` when absent."""
+    from botocore.exceptions import ClientError
+
     client = get_r2_client()
     try:
         response = client.head_object(Bucket=settings.r2_bucket_name, Key=r2_key)
@@ -194,16 +205,115 @@ def upload_file(local_path: str, r2_key: str, content_type: str = "application/o
     return r2_key
 
 
-def delete_objects(r2_keys: list[str]) -> None:
-    """Best-effort delete for a set of R2 objects."""
+def upload_stream(
+    stream: BinaryIO,
+    r2_key: str,
+    content_type: str = "application/octet-stream",
+    *,
+    part_size: int = 16 * 1024 * 1024,
+    max_in_flight: int = 3,
+    on_progress: Callable[[int], None] | None = None,
+) -> tuple[int, str]:
+    """Multipart-upload a stream of unknown length while it is being read.
+
+    Every part but the last is exactly ``part_size`` bytes (R2 requires equal
+    part sizes), and at most ``max_in_flight`` parts are uploading at once, so
+    memory stays bounded. Returns (size_bytes, sha256) of the uploaded bytes;
+    the multipart upload is aborted if reading or any part fails.
+    """
+    client = get_r2_client()
+    upload_id = create_multipart_upload(r2_key, content_type)
+    slots = threading.BoundedSemaphore(max_in_flight)
+    digest = hashlib.sha256()
+    size_bytes = 0
+
+    def upload_part(part_number: int, body: bytes) -> dict:
+        try:
+            resp = client.upload_part(
+                Bucket=settings.r2_bucket_name,
+                Key=r2_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            return {"PartNumber": part_number, "ETag": resp["ETag"]}
+        finally:
+            slots.release()
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="r2-part") as pool:
+            futures = []
+            while True:
+                chunk = _read_part(stream, part_size)
+                if not chunk:
+                    if not futures:
+                        raise ValueError("stream is empty")
+                    break
+                digest.update(chunk)
+                size_bytes += len(chunk)
+                slots.acquire()
+                futures.append(pool.submit(upload_part, len(futures) + 1, chunk))
+                if on_progress is not None:
+                    on_progress(size_bytes)
+                failed = next((future for future in futures if future.done() and future.exception()), None)
+                if failed is not None:
+                    raise failed.exception()
+                if len(chunk) < part_size:
+                    break
+            parts = [future.result() for future in futures]
+        complete_multipart_upload(r2_key, upload_id, parts)
+    except BaseException:
+        abort_multipart_upload(r2_key, upload_id)
+        raise
+    return size_bytes, digest.hexdigest()
+
+
+def _read_part(stream: BinaryIO, part_size: int) -> bytes:
+    """Read up to ``part_size`` bytes; pipes return short reads before EOF."""
+    buffer = bytearray()
+    while len(buffer) < part_size:
+        chunk = stream.read(part_size - len(buffer))
+        if not chunk:
+            break
+        buffer += chunk
+    return bytes(buffer)
+
+
+def list_objects(prefix: str, *, page_size: int = 1000, start_after: str | None = None):
+    """Yield pages of {"Key", "Size", "LastModified"} under ``prefix``."""
+    client = get_r2_client()
+    params = {"Bucket": settings.r2_bucket_name, "Prefix": prefix, "MaxKeys": page_size}
+    if start_after:
+        params["StartAfter"] = start_after
+    while True:
+        resp = client.list_objects_v2(**params)
+        page = resp.get("Contents") or []
+        if page:
+            yield page
+        if not resp.get("IsTruncated"):
+            return
+        params.pop("StartAfter", None)
+        params["ContinuationToken"] = resp["NextContinuationToken"]
+
+
+def delete_objects(r2_keys: list[str]) -> dict[str, str]:
+    """Delete a set of R2 objects; return the keys R2 refused, with its error.
+
+    Quiet mode only leaves out the deleted keys; per-key failures still come
+    back in the response's ``Errors``.
+    """
     keys = [key for key in dict.fromkeys(r2_keys) if key]
+    failed: dict[str, str] = {}
     if not keys:
-        return
+        return failed
 
     client = get_r2_client()
     for i in range(0, len(keys), 1000):
         batch = keys[i : i + 1000]
-        client.delete_objects(
+        resp = client.delete_objects(
             Bucket=settings.r2_bucket_name,
             Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
         )
+        for error in resp.get("Errors") or []:
+            failed[error.get("Key", "")] = f"{error.get('Code', 'Error')}: {error.get('Message', '')}"
+    return failed
@@ -0,0 +1,206 @@
+"""Request-scoped data access for route handlers.
+
+A route wraps the shared Supabase client in a ``RequestDb`` once per request
+and passes it wherever a ``db`` is expected. On top of the plain client it:
+
+- counts every PostgREST round trip, both on the instance and in the
+  enclosing ``track_round_trips`` scope that the API middleware opens per
+  request;
+- memoizes project, latest artifact job and evaluation lookups, so helpers
+  that each need one of them do not query it again;
+- can load the project together with its latest artifact job and the
+  owner's evaluation (plus pending deltas) in a single query through
+  PostgREST resource embedding.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from eogum.services.artifacts import ARTIFACT_JOB_TYPES, get_latest_artifact_job
+from eogum.services.database import QueryProxy
+from eogum.services.evaluation_store import evaluation_row_with_deltas, fetch_evaluation_row
+
+ARTIFACT_JOB_COLUMNS = "id, user_id, type, created_at, result_r2_keys"
+
+_ARTIFACT_JOBS_EMBED = "artifact_jobs"
+_EVALUATIONS_EMBED = "evaluations"
+_EVALUATION_DELTAS_EMBED = "evaluation_deltas"
+_PROJECT_KEY_COLUMNS = ("id", "user_id")
+
+
+@dataclass
+class RoundTripCounter:
+    count: int = 0
+
+
+_current_counter: ContextVar[RoundTripCounter | None] = ContextVar("db_round_trips", default=None)
+
+
+@contextmanager
+def track_round_trips() -> Iterator[RoundTripCounter]:
+    """Count the round trips of every ``RequestDb`` used inside the block."""
+    counter = RoundTripCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def _columns(select: str) -> list[str] | None:
+    """Column names of a flat ``select``; ``None`` means ``*``."""
+    if select.strip() == "*":
+        return None
+    return [column.strip() for column in select.split(",") if column.strip()]
+
+
+class RequestDb:
+    """Memoizing, round-trip counting wrapper around a Supabase client."""
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.round_trips = 0
+        self._projects: dict[str, dict] = {}
+        self._project_columns: dict[str, list[str] | None] = {}
+        self._artifact_jobs: dict[tuple[str, str], dict | None] = {}
+        self._evaluations: dict[tuple[str, str], dict | None] = {}
+
+    def table(self, name: str):
+        return QueryProxy(self.client.table(name), self._execute)
+
+    def rpc(self, fn: str, params: dict | None = None, **kwargs):
+        return QueryProxy(self.client.rpc(fn, params or {}, **kwargs), self._execute)
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
+
+    def _execute(self, query: Any, execute):
+        self.round_trips += 1
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.count += 1
+        return execute()
+
+    # ── Projects ──
+
+    def _has_columns(self, project_id: str, columns: list[str] | None) -> bool:
+        cached = self._project_columns.get(project_id, [])
+        if cached is None:
+            return True
+        return columns is not None and set(columns) <= set(cached)
+
+    def _select_for(self, project_id: str, columns: list[str] | None) -> list[str] | None:
+        cached = self._project_columns.get(project_id, [])
+        if columns is None or (project_id in self._project_columns and cached is None):
+            return None
+        merged = list(_PROJECT_KEY_COLUMNS)
+        for column in [*cached, *columns]:
+            if column not in merged:
+                merged.append(column)
+        return merged
+
+    def project(
+        self,
+        project_id: str,
+        select: str = "*",
+        *,
+        with_artifact_job: bool = False,
+        with_evaluation: bool = False,
+    ) -> dict | None:
+        """Return the project row, loading embedded lookups in the same query.
+
+        ``with_artifact_job`` / ``with_evaluation`` prefetch what
+        ``latest_artifact_job`` and ``evaluation`` would otherwise query
+        separately for the project owner.
+        """
+        columns = _columns(select)
+        cached = self._projects.get(project_id)
+        if cached is not None and self._has_columns(project_id, columns):
+            owner_key = (project_id, cached.get("user_id"))
+            with_artifact_job = with_artifact_job and owner_key not in self._artifact_jobs
+            with_evaluation = with_evaluation and owner_key not in self._evaluations
+            if not with_artifact_job and not with_evaluation:
+                return cached
+
+        merged_columns = self._select_for(project_id, columns)
+        select_parts = ["*" if merged_columns is None else ", ".join(merged_columns)]
+        if with_artifact_job:
+            select_parts.append(f"{_ARTIFACT_JOBS_EMBED}:jobs({ARTIFACT_JOB_COLUMNS})")
+        if with_evaluation:
+            select_parts.append(f"{_EVALUATIONS_EMBED}(*, {_EVALUATION_DELTAS_EMBED}(revision, changes))")
+
+        query = self.table("projects").select(", ".join(select_parts)).eq("id", project_id)
+        if with_artifact_job:
+            query = (
+                query.eq(f"{_ARTIFACT_JOBS_EMBED}.status", "completed")
+                .in_(f"{_ARTIFACT_JOBS_EMBED}.type", ARTIFACT_JOB_TYPES)
+                .order("created_at", desc=True, foreign_table=_ARTIFACT_JOBS_EMBED)
+                .limit(1, foreign_table=_ARTIFACT_JOBS_EMBED)
+            )
+        rows = query.limit(1).execute().data
+        if not rows:
+            return None
+
+        row = dict(rows[0])
+        artifact_jobs = row.pop(_ARTIFACT_JOBS_EMBED, None)
+        evaluations = row.pop(_EVALUATIONS_EMBED, None)
+        self._projects[project_id] = row
+        self._project_columns[project_id] = merged_columns
+        owner_key = (project_id, row.get("user_id"))
+        if artifact_jobs is not None:
+            self._remember_embedded_artifact_job(owner_key, artifact_jobs)
+        if evaluations is not None:
+            self._remember_embedded_evaluation(owner_key, evaluations)
+        return row
+
+    def _remember_embedded_artifact_job(self, owner_key: tuple[str, str], jobs: list[dict]) -> None:
+        job = jobs[0] if jobs else None
+        # The embed cannot filter on the owner; a job from another user falls
+        # back to the owner-scoped query in latest_artifact_job.
+        if job is not None and job.get("user_id") != owner_key[1]:
+            return
+        self._artifact_jobs[owner_key] = job if job and job.get("result_r2_keys") else None
+
+    def _remember_embedded_evaluation(self, owner_key: tuple[str, str], evaluations: list[dict]) -> None:
+        row = next((item for item in evaluations if item.get("evaluator_id") == owner_key[1]), None)
+        if row is None:
+            self._evaluations[owner_key] = None
+            return
+        row = dict(row)
+        if _EVALUATION_DELTAS_EMBED not in row:
+            return
+        deltas = row.pop(_EVALUATION_DELTAS_EMBED) or []
+        self._evaluations[owner_key] = evaluation_row_with_deltas(row, deltas)
+
+    # ── Jobs & evaluations ──
+
+    def latest_artifact_job(self, project_id: str, user_id: str) -> dict | None:
+        """Memoized ``get_latest_artifact_job`` for one owner."""
+        key = (project_id, user_id)
+        if key not in self._artifact_jobs:
+            self._artifact_jobs[key] = get_latest_artifact_job(
+                self,
+                project_id,
+                user_id=user_id,
+                select=ARTIFACT_JOB_COLUMNS,
+            )
+        return self._artifact_jobs[key]
+
+    def evaluation(self, project_id: str, evaluator_id: str) -> dict | None:
+        """Memoized ``fetch_evaluation_row`` with all columns."""
+        key = (project_id, evaluator_id)
+        if key not in self._evaluations:
+            self._evaluations[key] = fetch_evaluation_row(self, project_id, evaluator_id)
+        return self._evaluations[key]
+
+    def remember_evaluation(self, project_id: str, evaluator_id: str, row: dict | None) -> None:
+        """Replace the memoized evaluation after a write in this request."""
+        self._evaluations[(project_id, evaluator_id)] = row
+
+    def forget_evaluation(self, project_id: str, evaluator_id: str) -> None:
+        self._evaluations.pop((project_id, evaluator_id), None)
@@ -17,6 +17,33 @@ def _segment_index(segment: Any) -> int | None:
         return None
 
 
+def has_review_overrides(payload: dict | None, base_payload: dict | None = None) -> bool:
+    """Return whether a saved payload would change the AI-decision render when merged.
+
+    Human decisions, an explicit opt-out of a junction repair and any
+    ``REVIEW_METADATA_KEYS`` value that differs from ``base_payload`` survive
+    ``merge_saved_review_preferences``. Without a base, any saved metadata value
+    counts as an override.
+    """
+    if not isinstance(payload, dict):
+        return False
+    base = base_payload if isinstance(base_payload, dict) else {}
+    for key in REVIEW_METADATA_KEYS:
+        value = payload.get(key)
+        if value is not None and (base_payload is None or value != base.get(key)):
+            return True
+    for segment in payload.get("segments") or []:
+        if not isinstance(segment, dict):
+            continue
+        if isinstance(segment.get("human"), dict):
+            return True
+        ai = segment.get("ai")
+        repair = ai.get("junction_repair") if isinstance(ai, dict) else None
+        if isinstance(repair, dict) and repair.get("user_apply_junction_repair") is False:
+            return True
+    return False
+
+
 def merge_saved_review_preferences(
     base_payload: dict,
     saved_payload: dict | None,
@@ -1,4 +1,12 @@
-"""Global source file registry helpers."""
+"""Global source file registry helpers.
+
+Sources have two identities. The SHA-256 of the full file is the
+authority; the server computes it whenever it reads a source. The sampled
+fingerprint (size plus hashes of the head, the tail and evenly strided
+blocks) costs a few MiB of reads regardless of file size, so the browser
+can look a 20 GB recording up before uploading it. ``apps/web/src/lib/hash.ts``
+implements the same scheme; change both together and bump the version.
+"""
 
 from __future__ import annotations
 
@@ -22,6 +30,33 @@ def sha256_file(path: str | Path, *, chunk_size: int = 8 * 1024 * 1024) -> str:
             digest.update(chunk)
     return digest.hexdigest()
 
+FINGERPRINT_VERSION = "fp1"
+FINGERPRINT_BLOCK_BYTES = 1024 * 1024
+FINGERPRINT_STRIDED_BLOCKS = 16
+
+
+def fingerprint_ranges(size_bytes: int) -> list[tuple[int, int]]:
+    """(offset, length) of the sampled blocks; small files are read whole."""
+    block = FINGERPRINT_BLOCK_BYTES
+    if size_bytes <= block * (FINGERPRINT_STRIDED_BLOCKS + 2):
+        return [(0, size_bytes)]
+    last = size_bytes - block
+    strides = FINGERPRINT_STRIDED_BLOCKS + 1
+    strided = [(last * index // strides, block) for index in range(1, strides)]
+    return [(0, block), *strided, (last, block)]
+
+
+def sample_fingerprint_file(path: str | Path) -> str:
+    """Return the sampled fingerprint of a file; see the module docstring."""
+    path = Path(path)
+    size_bytes = path.stat().st_size
+    digest = hashlib.sha256(f"{FINGERPRINT_VERSION}:{size_bytes}:".encode())
+    with path.open("rb") as file_obj:
+        for offset, length in fingerprint_ranges(size_bytes):
+            file_obj.seek(offset)
+            digest.update(file_obj.read(length))
+    return f"{FINGERPRINT_VERSION}:{digest.hexdigest()}"
+
 
 def lookup_source_asset(db, *, sha256: str, size_bytes: int) -> dict | None:
     result = (
@@ -38,6 +73,22 @@ def lookup_source_asset(db, *, sha256: str, size_bytes: int) -> dict | None:
     return data if isinstance(data, dict) else None
 
 
+def lookup_source_asset_by_fingerprint(db, *, fingerprint: str, size_bytes: int) -> dict | None:
+    result = (
+        db.table("source_assets")
+        .select(SOURCE_ASSET_SELECT)
+        .eq("fingerprint", fingerprint)
+        .eq("size_bytes", size_bytes)
+        .order("last_used_at", desc=True)
+        .limit(1)
+        .execute()
+    )
+    data = getattr(result, "data", None)
+    if isinstance(data, list):
+        return data[0] if data else None
+    return data if isinstance(data, dict) else None
+
+
 def lookup_source_asset_by_r2_key(db, *, r2_key: str) -> dict | None:
     result = (
         db.table("source_assets")
@@ -52,6 +103,29 @@ def lookup_source_asset_by_r2_key(db, *, r2_key: str) -> dict | None:
     return data if isinstance(data, dict) else None
 
 
+def lookup_source_asset_by_youtube_video(db, *, video_id: str, format_selector: str) -> dict | None:
+    result = (
+        db.table("source_assets")
+        .select(SOURCE_ASSET_SELECT)
+        .eq("youtube_video_id", video_id)
+        .eq("youtube_format", format_selector)
+        .limit(1)
+        .execute()
+    )
+    data = getattr(result, "data", None)
+    if isinstance(data, list):
+        return data[0] if data else None
+    return data if isinstance(data, dict) else None
+
+
+def link_source_asset_youtube_video(db, *, asset_id: str, video_id: str, format_selector: str) -> None:
+    db.table("source_assets").update({
+        "youtube_video_id": video_id,
+        "youtube_format": format_selector,
+        "last_used_at": "now()",
+    }).eq("id", asset_id).execute()
+
+
 def touch_source_asset(db, *, asset_id: str) -> None:
     db.table("source_assets").update({"last_used_at": "now()"}).eq("id", asset_id).execute()
 
@@ -69,6 +143,9 @@ def upsert_source_asset(
     filename: str | None,
     duration_seconds: int | None,
     derived: dict | None = None,
+    youtube_video_id: str | None = None,
+    youtube_format: str | None = None,
+    fingerprint: str | None = None,
 ) -> dict | None:
     payload = {
         "sha256": sha256,
@@ -78,6 +155,10 @@ def upsert_source_asset(
         "duration_seconds": duration_seconds,
         "last_used_at": "now()",
     }
+    if youtube_video_id:
+        payload.update({"youtube_video_id": youtube_video_id, "youtube_format": youtube_format})
+    if fingerprint:
+        payload["fingerprint"] = fingerprint
     if derived is not None:
         payload.update({
             "derived_status": derived.get("status"),
@@ -11,7 +11,8 @@ from fractions import Fraction
 from pathlib import Path
 from typing import Any
 
-from eogum.services import r2, source_cache
+from eogum.services import media_render, r2, source_cache
+from eogum.services.final_preview_cache import adopt_source_cache_file, link_cached_source
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +100,12 @@ def source_keys_needing_derivatives(project: dict, *, force: bool = False) -> li
     return keys
 
 
-def set_project_source_snapshot(project: dict, source_key: str, snapshot: dict, source_sha256: str | None = None) -> dict:
+def set_project_source_snapshot(
+    project: dict,
+    source_key: str,
+    snapshot: dict,
+    source_sha256: str | None = None,
+) -> dict:
     updated = dict(project)
     if source_key == "primary":
         updated["source_derived"] = snapshot
@@ -203,6 +209,28 @@ def download_ready_derivatives(project: dict, temp_dir: Path) -> dict[str, dict[
     return local_sources
 
 
+def seed_probe_cache_from_media_info(source_path: Path, derived: dict | None) -> bool:
+    """Prime the FFprobe cache for a local source from its stored media_info.json.
+
+    The stored document is only trusted when its recorded size matches the
+    local file. Failures are logged and leave the cache untouched.
+    """
+    if not is_ready(derived) or media_render.has_cached_probe(source_path):
+        return False
+    try:
+        media_info_doc = json.loads(r2.download_to_bytes(derived["media_info_r2_key"]))
+        ffprobe_payload = media_info_doc.get("ffprobe")
+        if not isinstance(ffprobe_payload, dict):
+            return False
+        if int(media_info_doc.get("size_bytes") or 0) != source_path.stat().st_size:
+            return False
+        media_render.seed_probe_cache(source_path, ffprobe_payload)
+        return True
+    except Exception:
+        logger.warning("Failed to seed probe cache for %s", source_path, exc_info=True)
+        return False
+
+
 def derive_r2_source(ref: dict, temp_root: Path) -> tuple[dict, str]:
     r2_key = ref.get("r2_key")
     filename = ref.get("filename")
@@ -213,7 +241,9 @@ def derive_r2_source(ref: dict, temp_root: Path) -> tuple[dict, str]:
     with tempfile.TemporaryDirectory(prefix="source_derivative_", dir=str(temp_root)) as tmp:
         work_dir = Path(tmp)
         source_path = work_dir / f"source{suffix}"
-        r2.download_file(r2_key, str(source_path))
+        if not link_cached_source(r2_key, source_path):
+            r2.download_file(r2_key, str(source_path))
+            adopt_source_cache_file(source_path, r2_key)
         return derive_local_source(
             source_path=source_path,
             source_key=ref.get("source_key") or "source",
@@ -0,0 +1,376 @@
+"""Background deletion of R2 objects.
+
+Request handlers do not delete R2 objects inline. They enqueue keys in
+``r2_deletion_queue`` (migration 021), and a worker thread on each API node
+drains the queue in batches of ``STORAGE_GC_DELETE_BATCH_SIZE``, paced to
+``STORAGE_GC_MAX_DELETES_PER_MINUTE``. A failed batch, or a key R2 reports
+in the batch's ``Errors``, is retried with backoff until
+``STORAGE_GC_MAX_ATTEMPTS``. Before a batch is deleted its keys are checked
+again, since a row may have picked a key up after it was queued: sources
+and reconciler orphans against the scalar key columns with ``in_``
+filters, and orphans also against the JSON columns of rows that changed
+after the reconciler read its references (``scanned_at``, migration 024).
+
+The reconciler catches what never got enqueued: failed renders, retry
+attempts and Scribe attempt objects from lost owner races. It lists the
+configured prefixes page by page and compares each key with every key the
+database references. Unreferenced objects older than
+``STORAGE_GC_RECONCILE_MIN_AGE_SECONDS`` are orphans. With
+``STORAGE_GC_DRY_RUN`` (the default) it only reports them; otherwise it
+enqueues them.
+
+Nodes may drain the same rows concurrently; R2 deletes are idempotent, so
+that costs only a duplicate request.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from eogum.config import settings
+from eogum.services import r2
+from eogum.services.database import get_db
+
+logger = logging.getLogger(__name__)
+
+QUEUE_TABLE = "r2_deletion_queue"
+_ENQUEUE_CHUNK = 500
+_SCAN_PAGE_ROWS = 1000
+_MAX_RETRY_DELAY_SECONDS = 3600
+_ORPHAN_SAMPLE_SIZE = 20
+# Margin for clock skew between API nodes and the database row timestamps.
+_SCAN_CLOCK_SLACK = timedelta(minutes=5)
+# Orphans queued before migration 024 have no scan time; re-check every row.
+_EPOCH = "1970-01-01T00:00:00+00:00"
+
+# (table, columns) holding R2 keys, directly or anywhere inside JSON.
+REFERENCE_COLUMNS = (
+    ("projects", "id, source_r2_key, extra_sources, source_derived, multicam_state"),
+    ("jobs", "id, result_r2_keys, processing_metadata, input_payload"),
+    ("source_assets", "id, r2_key, media_info_r2_key, audio_proxy_r2_key"),
+    ("scribe_v2_cache_entries", "id, raw_json_r2_key, raw_srt_r2_key"),
+)
+
+# Columns that hold one key each, re-checked for queued keys with ``in_``.
+KEY_COLUMNS = (
+    ("projects", "source_r2_key"),
+    ("source_assets", "r2_key"),
+    ("source_assets", "media_info_r2_key"),
+    ("source_assets", "audio_proxy_r2_key"),
+    ("scribe_v2_cache_entries", "raw_json_r2_key"),
+    ("scribe_v2_cache_entries", "raw_srt_r2_key"),
+)
+
+# (table, JSON columns, timestamps that move when a row can gain a key).
+# Jobs have no updated_at; their keys are written on creation or completion.
+JSON_REFERENCE_COLUMNS = (
+    ("projects", "id, extra_sources, source_derived, multicam_state", ("updated_at",)),
+    ("jobs", "id, result_r2_keys, processing_metadata, input_payload", ("created_at", "completed_at")),
+)
+
+_wake = threading.Event()
+_stats_lock = threading.Lock()
+_stats: dict = {"enqueued": 0, "deleted": 0, "failed": 0, "last_drain_at": None, "last_reconcile": None}
+
+
+def enqueue_deletions(
+    db,
+    r2_keys,
+    *,
+    reason: str,
+    project_id: str | None = None,
+    scanned_at: str | None = None,
+) -> int:
+    """Queue keys for background deletion; re-queueing a key resets its retries.
+
+    ``scanned_at`` is when the caller read the references that showed the keys
+    as unreferenced; the drain re-checks JSON columns on rows changed since.
+    """
+    keys = [key for key in dict.fromkeys(r2_keys) if isinstance(key, str) and key]
+    for start in range(0, len(keys), _ENQUEUE_CHUNK):
+        rows = [
+            {
+                "r2_key": key,
+                "reason": reason,
+                "project_id": project_id,
+                "status": "pending",
+                "attempts": 0,
+                "last_error": None,
+                "not_before": "now()",
+                "scanned_at": scanned_at,
+            }
+            for key in keys[start : start + _ENQUEUE_CHUNK]
+        ]
+        db.table(QUEUE_TABLE).upsert(rows, on_conflict="r2_key").execute()
+    if keys:
+        _bump("enqueued", len(keys))
+        _wake.set()
+    return len(keys)
+
+
+def drain_deletion_queue(db=None, *, max_batches: int | None = None, sleep=time.sleep) -> dict:
+    """Delete due queue entries in rate-limited batches."""
+    db = db or get_db()
+    batch_size = max(1, min(1000, settings.storage_gc_delete_batch_size))
+    pause = batch_size * 60 / max(1, settings.storage_gc_max_deletes_per_minute)
+    result = {"deleted": 0, "skipped_in_use": 0, "failed": 0, "batches": 0}
+
+    while max_batches is None or result["batches"] < max_batches:
+        rows = (
+            db.table(QUEUE_TABLE)
+            .select("id, r2_key, reason, attempts, scanned_at")
+            .eq("status", "pending")
+            .lte("not_before", datetime.now(timezone.utc).isoformat())
+            .order("not_before")
+            .limit(batch_size)
+            .execute()
+            .data
+            or []
+        )
+        if not rows:
+            break
+        result["batches"] += 1
+
+        in_use = _keys_in_use(db, rows)
+        if in_use:
+            logger.info("Dropping %d queued deletion(s) for keys that are referenced again", len(in_use))
+            result["skipped_in_use"] += len(in_use)
+        due = [row for row in rows if row["r2_key"] not in in_use]
+        try:
+            errors = r2.delete_objects([row["r2_key"] for row in due])
+        except Exception as exc:
+            logger.exception("R2 deletion batch of %d key(s) failed", len(due))
+            _defer(db, due, exc)
+            result["failed"] += len(due)
+            _bump("failed", len(due))
+            break
+        refused = [row for row in due if row["r2_key"] in errors]
+        if refused:
+            logger.warning("R2 refused %d of %d deletion(s) in a batch", len(refused), len(due))
+            for row in refused:
+                _defer(db, [row], errors[row["r2_key"]])
+            result["failed"] += len(refused)
+            _bump("failed", len(refused))
+        refused_ids = {row["id"] for row in refused}
+        db.table(QUEUE_TABLE).delete().in_("id", [row["id"] for row in rows if row["id"] not in refused_ids]).execute()
+        result["deleted"] += len(due) - len(refused)
+        _bump("deleted", len(due) - len(refused))
+
+        if len(rows) < batch_size:
+            break
+        sleep(pause)
+
+    with _stats_lock:
+        _stats["last_drain_at"] = datetime.now(timezone.utc).isoformat()
+    return result
+
+
+def collect_referenced_keys(db, prefixes: list[str]) -> set[str]:
+    """Every key under ``prefixes`` that a database row points at."""
+    referenced: set[str] = set()
+    prefix_tuple = tuple(prefixes)
+    for table, columns in REFERENCE_COLUMNS:
+        for row in _scan(db, table, columns):
+            _collect_keys(row, prefix_tuple, referenced)
+    return referenced
+
+
+def reconcile_orphans(
+    db=None,
+    *,
+    prefixes: list[str] | None = None,
+    dry_run: bool | None = None,
+    min_age_seconds: float | None = None,
+    max_deletes: int | None = None,
+    page_size: int = 1000,
+) -> dict:
+    """List R2 prefixes, find objects no row references and (unless dry-run) enqueue them."""
+    db = db or get_db()
+    prefixes = list(prefixes if prefixes is not None else settings.storage_gc_reconcile_prefixes)
+    dry_run = settings.storage_gc_dry_run if dry_run is None else dry_run
+    min_age = settings.storage_gc_reconcile_min_age_seconds if min_age_seconds is None else min_age_seconds
+    max_deletes = settings.storage_gc_reconcile_max_deletes if max_deletes is None else max_deletes
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=min_age)
+    started = time.monotonic()
+    scanned_at = (datetime.now(timezone.utc) - _SCAN_CLOCK_SLACK).isoformat()
+
+    referenced = collect_referenced_keys(db, prefixes)
+    queued = {row["r2_key"] for row in _scan(db, QUEUE_TABLE, "id, r2_key")}
+    report = {
+        "dry_run": dry_run,
+        "referenced": len(referenced),
+        "scanned": 0,
+        "too_new": 0,
+        "orphans": 0,
+        "orphan_bytes": 0,
+        "enqueued": 0,
+        "by_prefix": {},
+        "sample": [],
+    }
+
+    for prefix in prefixes:
+        prefix_report = {"scanned": 0, "orphans": 0, "orphan_bytes": 0}
+        for page in r2.list_objects(prefix, page_size=page_size):
+            orphans = []
+            for obj in page:
+                prefix_report["scanned"] += 1
+                key = obj["Key"]
+                if key in referenced or key in queued:
+                    continue
+                if obj["LastModified"] > cutoff:
+                    report["too_new"] += 1
+                    continue
+                prefix_report["orphans"] += 1
+                prefix_report["orphan_bytes"] += int(obj.get("Size") or 0)
+                if len(report["sample"]) < _ORPHAN_SAMPLE_SIZE:
+                    report["sample"].append(key)
+                orphans.append(key)
+            budget = max_deletes - report["enqueued"]
+            if not dry_run and orphans and budget > 0:
+                report["enqueued"] += enqueue_deletions(
+                    db, orphans[:budget], reason="orphan", scanned_at=scanned_at
+                )
+        report["by_prefix"][prefix] = prefix_report
+        for field in ("scanned", "orphans", "orphan_bytes"):
+            report[field] += prefix_report[field]
+
+    report["seconds"] = round(time.monotonic() - started, 2)
+    with _stats_lock:
+        _stats["last_reconcile"] = {
+            field: report[field] for field in ("dry_run", "scanned", "orphans", "orphan_bytes", "enqueued", "seconds")
+        }
+    logger.info(
+        "R2 reconcile%s: scanned %d, %d orphan(s) (%d bytes), enqueued %d",
+        " (dry run)" if dry_run else "",
+        report["scanned"],
+        report["orphans"],
+        report["orphan_bytes"],
+        report["enqueued"],
+    )
+    return report
+
+
+def start_storage_gc(interval_seconds: float | None = None) -> threading.Event:
+    """Drain the deletion queue periodically (and when woken); reconcile less often."""
+    interval = settings.storage_gc_interval_seconds if interval_seconds is None else interval_seconds
+    reconcile_every = settings.storage_gc_reconcile_interval_seconds
+    stop_event = threading.Event()
+
+    def _loop() -> None:
+        next_reconcile = time.monotonic() + reconcile_every
+        while not stop_event.is_set():
+            _wake.wait(interval)
+            _wake.clear()
+            if stop_event.is_set():
+                return
+            try:
+                drain_deletion_queue()
+            except Exception:
+                logger.exception("R2 deletion queue drain failed")
+            if reconcile_every > 0 and time.monotonic() >= next_reconcile:
+                next_reconcile = time.monotonic() + reconcile_every
+                try:
+                    reconcile_orphans()
+                except Exception:
+                    logger.exception("R2 orphan reconcile failed")
+
+    thread = threading.Thread(target=_loop, name="storage-gc", daemon=True)
+    thread.start()
+    return stop_event
+
+
+def wake() -> None:
+    _wake.set()
+
+
+def storage_gc_stats() -> dict:
+    with _stats_lock:
+        return {**_stats, "dry_run": settings.storage_gc_dry_run}
+
+
+def _bump(field: str, count: int) -> None:
+    with _stats_lock:
+        _stats[field] += count
+
+
+def _defer(db, rows: list[dict], error: Exception | str) -> None:
+    now = datetime.now(timezone.utc)
+    for row in rows:
+        attempts = int(row.get("attempts") or 0) + 1
+        delay = min(_MAX_RETRY_DELAY_SECONDS, 30 * 2 ** (attempts - 1))
+        db.table(QUEUE_TABLE).update({
+            "attempts": attempts,
+            "last_error": str(error)[:500],
+            "not_before": (now + timedelta(seconds=delay)).isoformat(),
+            "status": "failed" if attempts >= settings.storage_gc_max_attempts else "pending",
+        }).eq("id", row["id"]).execute()
+
+
+def _keys_in_use(db, rows: list[dict]) -> set[str]:
+    """Queued keys that a database row references again."""
+    orphans = [row for row in rows if row.get("reason") == "orphan"]
+    orphan_keys = {row["r2_key"] for row in orphans}
+    keys = sorted(orphan_keys | {row["r2_key"] for row in rows if row["r2_key"].startswith("sources/")})
+    if not keys:
+        return set()
+    in_use = _key_columns_in_use(db, keys)
+    if orphan_keys - in_use:
+        since = min(row.get("scanned_at") or _EPOCH for row in orphans)
+        in_use |= _json_keys_changed_since(db, orphan_keys - in_use, since)
+    return in_use
+
+
+def _key_columns_in_use(db, keys: list[str]) -> set[str]:
+    """Keys that a scalar key column points at."""
+    in_use: set[str] = set()
+    for table, column in KEY_COLUMNS:
+        rows = db.table(table).select(column).in_(column, keys).execute().data or []
+        in_use.update(row[column] for row in rows)
+    return in_use
+
+
+def _json_keys_changed_since(db, keys: set[str], since: str) -> set[str]:
+    """Keys referenced from JSON columns of rows changed at or after ``since``."""
+    # Exact keys as prefixes; the intersection drops longer keys they prefix.
+    prefixes = tuple(sorted(keys))
+    found: set[str] = set()
+    for table, columns, timestamps in JSON_REFERENCE_COLUMNS:
+        for timestamp in timestamps:
+            for row in _scan(db, table, columns, since=(timestamp, since)):
+                _collect_keys(row, prefixes, found)
+    return found & keys
+
+
+def _scan(db, table: str, columns: str, *, since: tuple[str, str] | None = None):
+    """Yield every row of ``table`` in id-ordered keyset pages.
+
+    ``since`` is a ``(timestamp column, value)`` pair limiting the scan to rows
+    stamped at or after the value.
+    """
+    last_id = None
+    while True:
+        query = db.table(table).select(columns).order("id").limit(_SCAN_PAGE_ROWS)
+        if since is not None:
+            query = query.gte(*since)
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        rows = query.execute().data or []
+        yield from rows
+        if len(rows) < _SCAN_PAGE_ROWS:
+            return
+        last_id = rows[-1]["id"]
+
+
+def _collect_keys(value, prefixes: tuple[str, ...], found: set[str]) -> None:
+    if isinstance(value, str):
+        if value.startswith(prefixes):
+            found.add(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_keys(item, prefixes, found)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_keys(item, prefixes, found)
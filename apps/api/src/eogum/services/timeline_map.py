@@ -0,0 +1,143 @@
+"""Source-to-preview time mapping compiled from a render manifest."""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterable, Iterator
+
+TIMELINE_MAP_VERSION = 1
+
+
+def _manifest_int(interval: dict, key: str) -> int:
+    return int(interval.get(key) or 0)
+
+
+class TimelineMap:
+    """Sorted lookup tables for one rendered preview.
+
+    Built once from the ``render_intervals`` manifest: every numeric field is
+    coerced a single time and the intervals are kept in preview order (which
+    is also source order for keep-range renders). Lookups are ``bisect``
+    searches, so mapping a cue or a seek position costs O(log intervals)
+    plus the number of intervals it actually touches.
+    """
+
+    __slots__ = (
+        "version",
+        "intervals",
+        "source_starts",
+        "source_ends",
+        "source_end_prefix_max",
+        "preview_starts",
+        "preview_ends",
+        "scales",
+    )
+
+    def __init__(self, version: int, intervals: list[dict]):
+        self.version = version
+        self.intervals = intervals
+        ordered = sorted(
+            (
+                (
+                    _manifest_int(interval, "source_start_ms"),
+                    _manifest_int(interval, "source_end_ms"),
+                    _manifest_int(interval, "requested_duration_ms"),
+                    _manifest_int(interval, "actual_duration_ms"),
+                    _manifest_int(interval, "preview_start_ms"),
+                )
+                for interval in intervals
+            ),
+            key=lambda item: item[0],
+        )
+        ordered = [
+            item
+            for item in ordered
+            if item[1] > item[0] and item[2] > 0 and item[3] > 0
+        ]
+        self.source_starts = [item[0] for item in ordered]
+        self.source_ends = [item[1] for item in ordered]
+        self.preview_starts = [item[4] for item in ordered]
+        self.preview_ends = [item[4] + item[3] for item in ordered]
+        self.scales = [item[3] / item[2] for item in ordered]
+        self.source_end_prefix_max = []
+        running_end = None
+        for end_ms in self.source_ends:
+            running_end = end_ms if running_end is None else max(running_end, end_ms)
+            self.source_end_prefix_max.append(running_end)
+
+    @classmethod
+    def from_manifest(cls, manifest: dict) -> TimelineMap:
+        return cls(int(manifest.get("version") or TIMELINE_MAP_VERSION), list(manifest.get("intervals") or []))
+
+    @classmethod
+    def from_file(cls, path: Path) -> TimelineMap:
+        return cls.from_manifest(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def __len__(self) -> int:
+        return len(self.source_starts)
+
+    @property
+    def duration_ms(self) -> int:
+        return self.preview_ends[-1] if self.preview_ends else 0
+
+    def to_payload(self) -> dict:
+        """Return the ``timeline_map.json`` document served to the review page."""
+        return {"version": self.version, "intervals": self.intervals}
+
+    def write(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(self.to_payload(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def map_source_range(self, start_ms: int, end_ms: int) -> Iterator[tuple[float, float]]:
+        """Yield preview ``(start, end)`` pieces for each interval a source range overlaps."""
+        if end_ms <= start_ms:
+            return
+        position = bisect_right(self.source_end_prefix_max, start_ms)
+        count = len(self.source_starts)
+        while position < count and self.source_starts[position] < end_ms:
+            source_start_ms = self.source_starts[position]
+            overlap_start_ms = max(start_ms, source_start_ms)
+            overlap_end_ms = min(end_ms, self.source_ends[position])
+            if overlap_end_ms > overlap_start_ms:
+                scale = self.scales[position]
+                preview_start_ms = self.preview_starts[position]
+                yield (
+                    preview_start_ms + (overlap_start_ms - source_start_ms) * scale,
+                    preview_start_ms + (overlap_end_ms - source_start_ms) * scale,
+                )
+            position += 1
+
+    def source_to_preview(self, source_ms: float) -> float | None:
+        """Map a source position to the preview, snapping cut regions forward."""
+        if not self.source_starts:
+            return None
+        position = bisect_right(self.source_starts, source_ms) - 1
+        if position >= 0 and source_ms <= self.source_ends[position]:
+            return self.preview_starts[position] + (source_ms - self.source_starts[position]) * self.scales[position]
+        if position + 1 < len(self.source_starts):
+            return float(self.preview_starts[position + 1])
+        return float(self.preview_ends[-1])
+
+    def preview_to_source(self, preview_ms: float) -> float | None:
+        """Map a preview position back to the source timeline."""
+        if not self.preview_starts:
+            return None
+        if preview_ms >= self.preview_ends[-1]:
+            return float(self.source_ends[-1])
+        position = max(0, bisect_left(self.preview_ends, preview_ms))
+        if preview_ms < self.preview_starts[position]:
+            return float(self.source_starts[position])
+        return self.source_starts[position] + (preview_ms - self.preview_starts[position]) / self.scales[position]
+
+
+def map_source_cues(
+    timeline_map: TimelineMap,
+    cues: Iterable[tuple[int, int, str]],
+) -> Iterator[tuple[float, float, str]]:
+    """Yield preview-timed cues for source-timed ``(start_ms, end_ms, text)`` cues."""
+    for start_ms, end_ms, text in cues:
+        for mapped_start_ms, mapped_end_ms in timeline_map.map_source_range(start_ms, end_ms):
+            if mapped_end_ms <= mapped_start_ms:
+                mapped_end_ms = mapped_start_ms + 1
+            yield mapped_start_ms, mapped_end_ms, text
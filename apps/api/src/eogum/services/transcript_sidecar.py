@@ -0,0 +1,343 @@
+"""Columnar transcript sidecar stored next to an artifact's project JSON.
+
+The sidecar is an uncompressed ``.npz`` holding the transcript timings and
+edit decisions as flat arrays, so readers that only need timings skip
+downloading and parsing the full project JSON (word text, alignment
+metadata and so on). Readers fall back to the project JSON whenever the
+sidecar is missing, unreadable or from a different schema version.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import orjson
+
+from eogum.services import r2
+from eogum.services.project_document import (
+    EditDecisionRecord,
+    ProjectDocument,
+    SegmentRecord,
+    cached_document,
+    load_project_document,
+    project_json_digest,
+)
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_SIDECAR_VERSION = 1
+TRANSCRIPT_SIDECAR_RESULT_KEY = "transcript_sidecar"
+TRANSCRIPT_SIDECAR_SUFFIX = ".transcript.npz"
+
+NULL_INT = np.iinfo(np.int64).min
+SEGMENT_FLAG_CUT = 1
+SEGMENT_FLAG_MUTE = 2
+
+# Interned-string columns; the rest hold millisecond timings or indices.
+_INT32_COLUMNS = frozenset({"segment_speaker", "decision_edit_type", "decision_reason", "decision_track"})
+
+
+class TranscriptSidecarError(ValueError):
+    """Raised when a sidecar cannot be read as the current schema version."""
+
+
+def _int_or_null(value: object) -> int:
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return NULL_INT
+
+
+def _nullable(value: int) -> int | None:
+    return None if value == NULL_INT else int(value)
+
+
+class _Labels:
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def code(self, value: Any) -> int:
+        if value is None:
+            return -1
+        text = str(value)
+        code = self._codes.get(text)
+        if code is None:
+            code = len(self.values)
+            self._codes[text] = code
+            self.values.append(text)
+        return code
+
+    def array(self) -> np.ndarray:
+        return np.array(self.values, dtype=str) if self.values else np.empty(0, dtype="<U1")
+
+
+def _label(labels: np.ndarray, code: int) -> str | None:
+    return None if code < 0 else str(labels[code])
+
+
+def build_transcript_sidecar(project_data: dict, source_digest: str | None = None) -> dict[str, np.ndarray]:
+    """Return the sidecar arrays for a parsed project JSON.
+
+    ``source_digest`` is the ``project_json_digest`` of the JSON bytes, which
+    lets readers key project-JSON-derived caches without downloading it.
+    """
+    labels = _Labels()
+    speakers = _Labels()
+
+    segment_flags_by_index: dict[int, int] = {}
+    decision_columns: dict[str, list[int]] = {
+        "decision_start_ms": [],
+        "decision_end_ms": [],
+        "decision_segment_index": [],
+        "decision_edit_type": [],
+        "decision_reason": [],
+        "decision_track": [],
+    }
+    for decision in project_data.get("edit_decisions") or []:
+        if not isinstance(decision, dict):
+            continue
+        range_data = decision.get("range") or {}
+        segment_index = _int_or_null(decision.get("source_segment_index"))
+        edit_type = decision.get("edit_type")
+        decision_columns["decision_start_ms"].append(_int_or_null(range_data.get("start_ms")))
+        decision_columns["decision_end_ms"].append(_int_or_null(range_data.get("end_ms")))
+        decision_columns["decision_segment_index"].append(segment_index)
+        decision_columns["decision_edit_type"].append(labels.code(edit_type))
+        decision_columns["decision_reason"].append(labels.code(decision.get("reason")))
+        decision_columns["decision_track"].append(labels.code(decision.get("active_video_track_id")))
+        if segment_index != NULL_INT and edit_type in {"cut", "mute"}:
+            flag = SEGMENT_FLAG_CUT if edit_type == "cut" else SEGMENT_FLAG_MUTE
+            segment_flags_by_index[segment_index] = segment_flags_by_index.get(segment_index, 0) | flag
+
+    segment_columns: dict[str, list[int]] = {
+        "segment_position": [],
+        "segment_index": [],
+        "segment_start_ms": [],
+        "segment_end_ms": [],
+        "segment_speaker": [],
+        "segment_flags": [],
+    }
+    text_chunks: list[bytes] = []
+    text_offsets = [0]
+    word_offsets = [0]
+    word_start_ms: list[int] = []
+    word_end_ms: list[int] = []
+    transcription = project_data.get("transcription") or {}
+    for position, segment in enumerate(transcription.get("segments") or []):
+        if not isinstance(segment, dict):
+            continue
+        segment_index = _int_or_null(segment.get("index"))
+        speaker = segment.get("speaker")
+        segment_columns["segment_position"].append(position)
+        segment_columns["segment_index"].append(segment_index)
+        segment_columns["segment_start_ms"].append(_int_or_null(segment.get("start_ms")))
+        segment_columns["segment_end_ms"].append(_int_or_null(segment.get("end_ms")))
+        segment_columns["segment_speaker"].append(speakers.code(str(speaker) if speaker else None))
+        segment_columns["segment_flags"].append(segment_flags_by_index.get(segment_index, 0))
+
+        text = str(segment.get("text") or "").strip().encode("utf-8")
+        text_chunks.append(text)
+        text_offsets.append(text_offsets[-1] + len(text))
+
+        for word in segment.get("words") or []:
+            if not isinstance(word, dict):
+                continue
+            word_start_ms.append(_int_or_null(word.get("start_ms")))
+            word_end_ms.append(_int_or_null(word.get("end_ms")))
+        word_offsets.append(len(word_start_ms))
+
+    meta = {
+        "version": TRANSCRIPT_SIDECAR_VERSION,
+        "source_files": [
+            [source_file.get("id"), _nullable(_int_or_null((source_file.get("info") or {}).get("duration_ms")))]
+            for source_file in project_data.get("source_files") or []
+            if isinstance(source_file, dict)
+        ],
+        "tracks": [
+            {
+                "id": track.get("id"),
+                "track_type": track.get("track_type"),
+                "source_file_id": track.get("source_file_id"),
+            }
+            for track in project_data.get("tracks") or []
+            if isinstance(track, dict)
+        ],
+        "segmentation_boundary_rule": project_data.get("segmentation_boundary_rule"),
+        "project_json_digest": source_digest,
+    }
+
+    arrays: dict[str, np.ndarray] = {
+        "version": np.array(TRANSCRIPT_SIDECAR_VERSION, dtype=np.int64),
+        "meta": np.frombuffer(orjson.dumps(meta), dtype=np.uint8),
+        "labels": labels.array(),
+        "speakers": speakers.array(),
+        "segment_text": np.frombuffer(b"".join(text_chunks), dtype=np.uint8),
+        "segment_text_offsets": np.array(text_offsets, dtype=np.int64),
+        "word_offsets": np.array(word_offsets, dtype=np.int64),
+        "word_start_ms": np.array(word_start_ms, dtype=np.int64),
+        "word_end_ms": np.array(word_end_ms, dtype=np.int64),
+    }
+    for name, values in {**segment_columns, **decision_columns}.items():
+        dtype = np.int32 if name in _INT32_COLUMNS else np.int64
+        arrays[name] = np.array(values, dtype=dtype)
+    arrays["segment_flags"] = arrays["segment_flags"].astype(np.uint8)
+    return arrays
+
+
+def write_transcript_sidecar(project_json_path: Path, output_path: Path | None = None) -> Path:
+    """Write the sidecar for a project JSON file and return its path."""
+    project_json_path = Path(project_json_path)
+    if output_path is None:
+        output_path = project_json_path.with_name(project_json_path.stem + TRANSCRIPT_SIDECAR_SUFFIX)
+    raw = project_json_path.read_bytes()
+    arrays = build_transcript_sidecar(orjson.loads(raw), project_json_digest(raw))
+    with open(output_path, "wb") as handle:
+        np.savez(handle, **arrays)
+    return output_path
+
+
+class TranscriptSidecar:
+    """Arrays from a loaded sidecar plus the equivalent ProjectDocument."""
+
+    __slots__ = ("arrays", "document", "project_json_digest")
+
+    def __init__(
+        self,
+        arrays: dict[str, np.ndarray],
+        document: ProjectDocument,
+        project_json_digest: str | None = None,
+    ):
+        self.arrays = arrays
+        self.document = document
+        self.project_json_digest = project_json_digest
+
+    @property
+    def segment_flags(self) -> np.ndarray:
+        return self.arrays["segment_flags"]
+
+    def word_timings(self, segment_offset: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return word start/end arrays for the segment at ``segment_offset``."""
+        start = int(self.arrays["word_offsets"][segment_offset])
+        end = int(self.arrays["word_offsets"][segment_offset + 1])
+        return self.arrays["word_start_ms"][start:end], self.arrays["word_end_ms"][start:end]
+
+
+def read_transcript_sidecar(source: bytes | Path) -> TranscriptSidecar:
+    """Load a sidecar from bytes or a local file path."""
+    try:
+        return _read_transcript_sidecar(source)
+    except TranscriptSidecarError:
+        raise
+    except (OSError, KeyError, IndexError, ValueError, zipfile.BadZipFile) as exc:
+        raise TranscriptSidecarError(f"unreadable transcript sidecar: {exc}") from exc
+
+
+def _read_transcript_sidecar(source: bytes | Path) -> TranscriptSidecar:
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else open(source, "rb")
+    try:
+        with np.load(stream, allow_pickle=False) as archive:
+            version = int(archive["version"]) if "version" in archive.files else None
+            if version != TRANSCRIPT_SIDECAR_VERSION:
+                raise TranscriptSidecarError(f"unsupported transcript sidecar version: {version}")
+            arrays = {name: archive[name] for name in archive.files}
+    finally:
+        stream.close()
+
+    meta = orjson.loads(arrays["meta"].tobytes())
+    labels = arrays["labels"]
+    speakers = arrays["speakers"]
+    text_blob = arrays["segment_text"].tobytes()
+    text_offsets = arrays["segment_text_offsets"].tolist()
+
+    segments = [
+        SegmentRecord(
+            position,
+            _nullable(index),
+            _nullable(start_ms),
+            _nullable(end_ms),
+            _label(speakers, speaker),
+            text_blob[text_offsets[offset]:text_offsets[offset + 1]].decode("utf-8"),
+        )
+        for offset, (position, index, start_ms, end_ms, speaker) in enumerate(zip(
+            arrays["segment_position"].tolist(),
+            arrays["segment_index"].tolist(),
+            arrays["segment_start_ms"].tolist(),
+            arrays["segment_end_ms"].tolist(),
+            arrays["segment_speaker"].tolist(),
+        ))
+    ]
+    edit_decisions = [
+        EditDecisionRecord(
+            _nullable(start_ms),
+            _nullable(end_ms),
+            _label(labels, edit_type),
+            _label(labels, reason),
+            _label(labels, track),
+            _nullable(segment_index),
+        )
+        for start_ms, end_ms, segment_index, edit_type, reason, track in zip(
+            arrays["decision_start_ms"].tolist(),
+            arrays["decision_end_ms"].tolist(),
+            arrays["decision_segment_index"].tolist(),
+            arrays["decision_edit_type"].tolist(),
+            arrays["decision_reason"].tolist(),
+            arrays["decision_track"].tolist(),
+        )
+    ]
+    document = ProjectDocument(
+        [(file_id, duration_ms) for file_id, duration_ms in meta.get("source_files") or []],
+        list(meta.get("tracks") or []),
+        meta.get("segmentation_boundary_rule"),
+        segments,
+        edit_decisions,
+    )
+    return TranscriptSidecar(arrays, document, meta.get("project_json_digest"))
+
+
+def load_transcript_sidecar(result_r2_keys: dict) -> TranscriptSidecar | None:
+    """Download and read an artifact's sidecar; ``None`` when missing or unusable."""
+    sidecar_key = result_r2_keys.get(TRANSCRIPT_SIDECAR_RESULT_KEY)
+    if not sidecar_key:
+        return None
+    try:
+        return read_transcript_sidecar(r2.download_to_bytes(sidecar_key))
+    except TranscriptSidecarError as exc:
+        logger.warning("Ignoring transcript sidecar %s: %s", sidecar_key, exc)
+    except Exception:
+        logger.warning("Could not load transcript sidecar %s", sidecar_key, exc_info=True)
+    return None
+
+
+def load_transcript_document(result_r2_keys: dict, project_json_bytes: bytes | None = None) -> ProjectDocument:
+    """Return an artifact's transcript document, preferring the sidecar.
+
+    Falls back to parsing ``project_json`` when the artifact predates the
+    sidecar or the sidecar cannot be downloaded or read. Callers that already
+    hold the project JSON pass it as ``project_json_bytes`` so the fallback
+    does not download it again.
+    """
+    sidecar_key = result_r2_keys.get(TRANSCRIPT_SIDECAR_RESULT_KEY)
+    if sidecar_key:
+        try:
+            return cached_document(
+                sidecar_key,
+                r2.download_to_bytes(sidecar_key),
+                lambda raw: read_transcript_sidecar(raw).document,
+            )
+        except TranscriptSidecarError as exc:
+            logger.warning("Ignoring transcript sidecar %s: %s", sidecar_key, exc)
+        except Exception:
+            logger.warning("Could not load transcript sidecar %s", sidecar_key, exc_info=True)
+
+    project_json_key = result_r2_keys.get("project_json")
+    if not project_json_key:
+        raise FileNotFoundError("artifact has no project_json")
+    if project_json_bytes is None:
+        project_json_bytes = r2.download_to_bytes(project_json_key)
+    return load_project_document(project_json_key, project_json_bytes)
@@ -1,20 +1,85 @@
-"""YouTube download service using yt-dlp."""
+"""YouTube download service using yt-dlp.
+
+By default a download never lands on disk: yt-dlp resolves the media
+URLs, ffmpeg muxes them into fragmented MP4 on stdout, and the bytes are
+uploaded to R2 as multipart parts while they arrive, hashed on the way for
+the ``source_assets`` registry. ``YOUTUBE_STREAMING_IMPORT=false`` falls
+back to downloading the whole file and uploading it afterwards.
+
+Metadata is cached per canonical video id and format selector, in an
+in-process LRU backed by ``youtube_video_cache``. Imports are registered in
+``source_assets`` with their video id, so importing the same video again
+completes immediately with the existing R2 object.
+
+Downloads run on a bounded thread pool (``YOUTUBE_DOWNLOAD_CONCURRENCY``)
+so a burst of imports queues instead of running dozens of yt-dlp/ffmpeg
+processes at once. Each task is also a ``youtube_download`` row in ``jobs``:
+the in-memory task is the live view on the node doing the download, and the
+row lets any node answer status polls and lets startup recovery requeue
+downloads a restart interrupted. The row names its owner node, which
+refreshes ``heartbeat_at`` while the download is unfinished; recovery only
+claims rows whose heartbeat has gone stale.
+"""
 
 import json
 import logging
+import os
+import re
+import shutil
+import socket
 import subprocess
 import threading
+import time
 import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
 
 from eogum.config import settings
 from eogum.services import r2
+from eogum.services.database import get_db
+from eogum.services.source_cache import (
+    delete_source_asset,
+    link_source_asset_youtube_video,
+    lookup_source_asset,
+    lookup_source_asset_by_youtube_video,
+    sha256_file,
+    touch_source_asset,
+    upsert_source_asset,
+)
 
 logger = logging.getLogger(__name__)
 
-# In-memory download task tracking
+YOUTUBE_DOWNLOAD_JOB_TYPE = "youtube_download"
+_TASK_COLUMNS = "id, user_id, status, progress, error_message, input_payload, processing_metadata, result_r2_keys"
+_JOB_STATUS_BY_TASK_STATUS = {
+    "pending": "queued",
+    "downloading": "running",
+    "uploading": "running",
+    "completed": "completed",
+    "failed": "failed",
+}
+_PROGRESS_PERSIST_STEP = 5  # percent between progress writes to the jobs row
+_FILE_FORMAT = "bestvideo+bestaudio/best"
+# Stream copy into MP4 needs MP4-compatible codecs.
+_STREAM_FORMAT = "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/bestvideo+bestaudio/best"
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_VIDEO_ID_PATH_PREFIXES = {"shorts", "embed", "live", "v"}
+_INFO_FIELDS = ("title", "duration_seconds", "filesize_approx_bytes", "thumbnail", "uploader", "upload_date")
+
+_info_cache: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+_info_cache_lock = threading.Lock()
+_NODE_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Live tasks on this node; finished ones are evicted after YOUTUBE_TASK_TTL_SECONDS.
 _tasks: dict[str, "DownloadTask"] = {}
+_pending: deque[str] = deque()
 _lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_heartbeat_thread: threading.Thread | None = None
 
 
 @dataclass
@@ -32,17 +97,62 @@ class DownloadTask:
     filename: str = ""
     # Result (filled after completion)
     r2_key: str = ""
+    sha256: str = ""
     local_path: str = ""
+    # Scheduling
+    queue_position: int | None = None  # 1-based while pending on this node
+    finished_at: float | None = None
+    persisted_progress: int = 0
+
+
+def canonical_video_id(url: str) -> str | None:
+    """The 11-character YouTube video id in ``url``, or None for other URLs."""
+    url = url.strip()
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    host = (parsed.hostname or "").lower()
+    for prefix in ("www.", "m.", "music."):
+        host = host.removeprefix(prefix)
+
+    candidate = ""
+    if host == "youtu.be":
+        candidate = parsed.path.strip("/").split("/")[0]
+    elif host in {"youtube.com", "youtube-nocookie.com"}:
+        parts = parsed.path.strip("/").split("/")
+        if parts[0] == "watch":
+            candidate = parse_qs(parsed.query).get("v", [""])[0]
+        elif len(parts) >= 2 and parts[0] in _VIDEO_ID_PATH_PREFIXES:
+            candidate = parts[1]
+    return candidate if _VIDEO_ID.match(candidate) else None
+
+
+def import_format() -> str:
+    """yt-dlp format selector of the active import mode; it decides the bytes."""
+    return _STREAM_FORMAT if settings.youtube_streaming_import else _FILE_FORMAT
 
 
 def get_video_info(url: str) -> dict:
-    """Fetch YouTube video metadata without downloading."""
+    """YouTube video metadata without downloading, cached by video id."""
+    video_id = canonical_video_id(url)
+    if video_id is None:
+        return _fetch_video_info(url)
+
+    key = (video_id, import_format())
+    info = _cached_info(key) or _load_info(key)
+    if info is None:
+        info = _fetch_video_info(url)
+        _store_info(key, info)
+    else:
+        _remember_info(key, info)
+    return {**info, "video_id": video_id}
+
+
+def _fetch_video_info(url: str) -> dict:
     result = subprocess.run(
         [
             str(settings.resolved_yt_dlp_bin),
             "--dump-json",
             "--no-download",
-            "-f", "bestvideo+bestaudio/best",
+            "-f", import_format(),
             "--merge-output-format", "mp4",
             url,
         ],
@@ -64,8 +174,88 @@ def get_video_info(url: str) -> dict:
     }
 
 
+def _cached_info(key: tuple[str, str]) -> dict | None:
+    with _info_cache_lock:
+        entry = _info_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, info = entry
+        if expires_at <= time.monotonic():
+            del _info_cache[key]
+            return None
+        _info_cache.move_to_end(key)
+        return dict(info)
+
+
+def _remember_info(key: tuple[str, str], info: dict) -> None:
+    with _info_cache_lock:
+        _info_cache[key] = (time.monotonic() + settings.youtube_info_cache_ttl_seconds, dict(info))
+        _info_cache.move_to_end(key)
+        while len(_info_cache) > settings.youtube_info_cache_max_entries:
+            _info_cache.popitem(last=False)
+
+
+def _load_info(key: tuple[str, str]) -> dict | None:
+    """Metadata another node fetched recently, from youtube_video_cache."""
+    fresh_after = datetime.now(timezone.utc) - timedelta(seconds=settings.youtube_info_cache_ttl_seconds)
+    try:
+        rows = (
+            get_db()
+            .table("youtube_video_cache")
+            .select("metadata")
+            .eq("video_id", key[0])
+            .eq("format_selector", key[1])
+            .gt("fetched_at", fresh_after.isoformat())
+            .limit(1)
+            .execute()
+            .data
+        )
+    except Exception:
+        logger.exception("Failed to read cached YouTube metadata for %s", key[0])
+        return None
+    if not rows or not isinstance(rows[0].get("metadata"), dict):
+        return None
+    metadata = rows[0]["metadata"]
+    return {field: metadata[field] for field in _INFO_FIELDS if field in metadata}
+
+
+def _store_info(key: tuple[str, str], info: dict) -> None:
+    _remember_info(key, info)
+    try:
+        get_db().table("youtube_video_cache").upsert(
+            {"video_id": key[0], "format_selector": key[1], "metadata": info, "fetched_at": "now()"},
+            on_conflict="video_id,format_selector",
+        ).execute()
+    except Exception:
+        logger.exception("Failed to cache YouTube metadata for %s", key[0])
+
+
+def _imported_source(video_id: str | None) -> dict | None:
+    """A source asset already imported from this video with the same format."""
+    if not video_id:
+        return None
+    db = get_db()
+    try:
+        asset = lookup_source_asset_by_youtube_video(db, video_id=video_id, format_selector=import_format())
+        if not asset:
+            return None
+        if not asset.get("r2_key") or not r2.object_exists(asset["r2_key"]):
+            delete_source_asset(db, asset_id=asset["id"])
+            logger.warning("Deleted stale source asset %s for YouTube video %s", asset["id"], video_id)
+            return None
+        touch_source_asset(db, asset_id=asset["id"])
+    except Exception:
+        logger.exception("Failed to look up imported source for YouTube video %s", video_id)
+        return None
+    return asset
+
+
 def start_download(url: str, user_id: str, info: dict) -> str:
-    """Start background download and return task_id."""
+    """Record the download as a job, queue it and return task_id.
+
+    A video already imported with the same format completes immediately
+    with the existing R2 object instead of being downloaded again.
+    """
     task_id = str(uuid.uuid4())
     task = DownloadTask(
         id=task_id,
@@ -76,16 +266,46 @@ def start_download(url: str, user_id: str, info: dict) -> str:
         filesize_bytes=info.get("filesize_approx_bytes", 0),
     )
 
-    with _lock:
-        _tasks[task_id] = task
-
-    thread = threading.Thread(target=_download_worker, args=(task,), daemon=True)
-    thread.start()
+    asset = _imported_source(info.get("video_id"))
+    if asset is not None:
+        task.status = "completed"
+        task.progress = 100
+        task.r2_key = asset["r2_key"]
+        task.sha256 = asset.get("sha256") or ""
+        task.filesize_bytes = asset.get("size_bytes") or task.filesize_bytes
+        task.filename = asset.get("filename") or ""
+        task.duration_seconds = asset.get("duration_seconds") or task.duration_seconds
+        task.finished_at = time.monotonic()
+        logger.info("Reusing imported source %s for %s", asset["id"], url)
+
+    get_db().table("jobs").insert({
+        "id": task_id,
+        "project_id": None,
+        "user_id": user_id,
+        "type": YOUTUBE_DOWNLOAD_JOB_TYPE,
+        "input_payload": {"url": url},
+        "owner_node": _NODE_ID,
+        "heartbeat_at": "now()",
+        **_job_fields(task),
+        **({"completed_at": "now()"} if asset is not None else {}),
+    }).execute()
+    if asset is not None:
+        with _lock:
+            _tasks[task_id] = task
+    else:
+        _submit(task)
     return task_id
 
 
 def get_task(task_id: str) -> DownloadTask | None:
-    return _tasks.get(task_id)
+    """Live task on this node, else the durable job record from any node."""
+    _evict_finished()
+    with _lock:
+        task = _tasks.get(task_id)
+        if task is not None:
+            task.queue_position = _pending.index(task_id) + 1 if task_id in _pending else None
+            return task
+    return _load_task(task_id)
 
 
 def remove_task(task_id: str) -> None:
@@ -93,20 +313,343 @@ def remove_task(task_id: str) -> None:
         _tasks.pop(task_id, None)
 
 
+def recover_stuck_downloads(*, recover_running: bool = True) -> int:
+    """Requeue unfinished downloads whose owner node stopped sending heartbeats.
+
+    Each row is claimed by a conditional update on the heartbeat value that
+    was read, so a live owner that just checked in keeps its download and
+    two recovering nodes never requeue the same row.
+    """
+    statuses = ["queued", "pending", "running"] if recover_running else ["queued", "pending"]
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.youtube_heartbeat_stale_seconds)
+    db = get_db()
+    rows = (
+        db.table("jobs")
+        .select(f"{_TASK_COLUMNS}, owner_node, heartbeat_at")
+        .eq("type", YOUTUBE_DOWNLOAD_JOB_TYPE)
+        .in_("status", statuses)
+        .lt("heartbeat_at", stale_before.isoformat())
+        .execute()
+        .data
+        or []
+    )
+    recovered = 0
+    for row in rows:
+        with _lock:
+            if row["id"] in _tasks:
+                continue
+        claimed = (
+            db.table("jobs")
+            .update({"owner_node": _NODE_ID, "heartbeat_at": "now()"})
+            .eq("id", row["id"])
+            .eq("heartbeat_at", row["heartbeat_at"])
+            .execute()
+            .data
+        )
+        if not claimed:
+            continue
+        task = _task_from_row(row)
+        if not task.url:
+            task.status = "failed"
+            task.error = "다운로드 URL이 없어 재시작할 수 없습니다"
+            _persist(task, completed=True)
+            continue
+        task.status = "pending"
+        task.progress = 0.0
+        task.error = None
+        _persist(task)
+        _submit(task)
+        recovered += 1
+        logger.info("Requeued YouTube download %s from stale node %s", task.id, row.get("owner_node"))
+    return recovered
+
+
+def download_queue_stats() -> dict:
+    with _lock:
+        return {
+            "concurrency": settings.youtube_download_concurrency,
+            "pending": len(_pending),
+            "active": sum(1 for task in _tasks.values() if task.status in {"downloading", "uploading"}),
+            "tracked": len(_tasks),
+        }
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.youtube_download_concurrency),
+            thread_name_prefix="youtube-download",
+        )
+    return _executor
+
+
+def _submit(task: DownloadTask) -> None:
+    global _heartbeat_thread
+    with _lock:
+        _tasks[task.id] = task
+        _pending.append(task.id)
+        executor = _get_executor()
+        if _heartbeat_thread is None:
+            _heartbeat_thread = threading.Thread(target=_heartbeat_loop, name="youtube-heartbeat", daemon=True)
+            _heartbeat_thread.start()
+    executor.submit(_run_task, task)
+
+
+def _heartbeat_loop() -> None:
+    """Refresh ``heartbeat_at`` on this node's unfinished downloads until none are left."""
+    global _heartbeat_thread
+    while True:
+        time.sleep(settings.youtube_heartbeat_interval_seconds)
+        with _lock:
+            task_ids = [task_id for task_id, task in _tasks.items() if task.finished_at is None]
+            if not task_ids:
+                _heartbeat_thread = None
+                return
+        _send_heartbeat(task_ids)
+
+
+def _send_heartbeat(task_ids: list[str]) -> None:
+    try:
+        (
+            get_db()
+            .table("jobs")
+            .update({"heartbeat_at": "now()"})
+            .in_("id", task_ids)
+            .eq("owner_node", _NODE_ID)
+            .execute()
+        )
+    except Exception:
+        logger.exception("Failed to refresh the heartbeat of %d YouTube download(s)", len(task_ids))
+
+
+def _run_task(task: DownloadTask) -> None:
+    with _lock:
+        try:
+            _pending.remove(task.id)
+        except ValueError:
+            pass
+    try:
+        _download_worker(task)
+    finally:
+        task.finished_at = time.monotonic()
+        _persist(task, completed=True)
+
+
+def _evict_finished() -> None:
+    cutoff = time.monotonic() - settings.youtube_task_ttl_seconds
+    with _lock:
+        expired = [
+            task_id for task_id, task in _tasks.items()
+            if task.finished_at is not None and task.finished_at < cutoff
+        ]
+        for task_id in expired:
+            del _tasks[task_id]
+
+
+def _job_fields(task: DownloadTask) -> dict:
+    return {
+        "status": _JOB_STATUS_BY_TASK_STATUS.get(task.status, "running"),
+        "progress": int(task.progress),
+        "error_message": task.error,
+        "processing_metadata": {
+            "phase": task.status,
+            "title": task.title,
+            "filename": task.filename,
+            "duration_seconds": task.duration_seconds,
+            "filesize_bytes": task.filesize_bytes,
+            "sha256": task.sha256,
+        },
+        "result_r2_keys": {"source": task.r2_key} if task.r2_key else None,
+    }
+
+
+def _persist(task: DownloadTask, *, started: bool = False, completed: bool = False) -> None:
+    """Mirror the task onto its job row; a failed write never fails the download.
+
+    Writes are scoped to this node, so a node that lost the row to recovery
+    cannot overwrite the new owner's progress.
+    """
+    fields = {**_job_fields(task), "heartbeat_at": "now()"}
+    if started:
+        fields["started_at"] = "now()"
+    if completed:
+        fields["completed_at"] = "now()"
+    try:
+        get_db().table("jobs").update(fields).eq("id", task.id).eq("owner_node", _NODE_ID).execute()
+    except Exception:
+        logger.exception("Failed to persist YouTube download task %s", task.id)
+        return
+    task.persisted_progress = int(task.progress)
+
+
+def _persist_progress(task: DownloadTask) -> None:
+    if task.progress - task.persisted_progress >= _PROGRESS_PERSIST_STEP:
+        _persist(task)
+
+
+def _load_task(task_id: str) -> DownloadTask | None:
+    try:
+        uuid.UUID(task_id)
+    except ValueError:
+        return None
+    rows = (
+        get_db()
+        .table("jobs")
+        .select(_TASK_COLUMNS)
+        .eq("id", task_id)
+        .eq("type", YOUTUBE_DOWNLOAD_JOB_TYPE)
+        .limit(1)
+        .execute()
+        .data
+    )
+    return _task_from_row(rows[0]) if rows else None
+
+
+def _task_from_row(row: dict) -> DownloadTask:
+    metadata = row.get("processing_metadata") or {}
+    job_status = row.get("status")
+    if job_status in {"completed", "failed"}:
+        status = job_status
+    elif job_status == "running":
+        status = metadata.get("phase") or "downloading"
+    else:
+        status = "pending"
+    return DownloadTask(
+        id=row["id"],
+        url=(row.get("input_payload") or {}).get("url", ""),
+        user_id=row["user_id"],
+        status=status,
+        progress=float(row.get("progress") or 0),
+        error=row.get("error_message"),
+        title=metadata.get("title", ""),
+        duration_seconds=metadata.get("duration_seconds", 0),
+        filesize_bytes=metadata.get("filesize_bytes", 0),
+        filename=metadata.get("filename", ""),
+        r2_key=(row.get("result_r2_keys") or {}).get("source", ""),
+        sha256=metadata.get("sha256", ""),
+    )
+
+
 def _download_worker(task: DownloadTask) -> None:
-    """Download video with yt-dlp, then upload to R2."""
+    """Import the video into R2 and register it as a source asset."""
+    try:
+        task.status = "downloading"
+        _persist(task, started=True)
+        if settings.youtube_streaming_import:
+            _stream_to_r2(task)
+        else:
+            _download_then_upload(task)
+        _register_source_asset(task)
+
+        task.status = "completed"
+        task.progress = 100
+        logger.info("YouTube download completed: %s -> %s", task.url, task.r2_key)
+
+    except Exception as e:
+        logger.exception("YouTube download failed for task %s", task.id)
+        task.status = "failed"
+        task.error = str(e)[:500]
+
+
+def _stream_to_r2(task: DownloadTask) -> None:
+    """Mux the selected formats to stdout and upload the bytes as they arrive."""
+    info = _resolve_formats(task.url)
+    formats = info.get("requested_formats") or [info]
+    task.filename = _safe_filename(info.get("title") or task.title or "youtube") + ".mp4"
+    expected_bytes = sum(fmt.get("filesize") or fmt.get("filesize_approx") or 0 for fmt in formats)
+    expected_bytes = expected_bytes or task.filesize_bytes
+    r2_key = f"sources/{uuid.uuid4()}.mp4"
+
+    def on_progress(uploaded_bytes: int) -> None:
+        if expected_bytes:
+            task.progress = min(95.0, uploaded_bytes / expected_bytes * 95)  # Stream = 0-95%
+            _persist_progress(task)
+
+    proc = subprocess.Popen(_mux_command(formats), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr_tail: deque[bytes] = deque(maxlen=20)
+    drain = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+    drain.start()
+    try:
+        size_bytes, sha256 = r2.upload_stream(
+            proc.stdout,  # type: ignore[arg-type]
+            r2_key,
+            "video/mp4",
+            part_size=settings.youtube_stream_part_size_bytes,
+            max_in_flight=settings.youtube_stream_parts_in_flight,
+            on_progress=on_progress,
+        )
+        returncode = proc.wait(timeout=7200)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        drain.join(timeout=5)
+
+    if returncode != 0:
+        logger.error(
+            "ffmpeg exited %s for task %s: %s",
+            returncode,
+            task.id,
+            b"".join(stderr_tail).decode(errors="replace")[-2000:],
+        )
+        r2.delete_objects([r2_key])
+        raise RuntimeError("yt-dlp 다운로드 실패")
+
+    task.r2_key = r2_key
+    task.sha256 = sha256
+    task.filesize_bytes = size_bytes
+    task.status = "uploading"
+    task.progress = 95
+    if task.duration_seconds == 0:
+        task.duration_seconds = int(info.get("duration") or 0) or _get_duration(r2.generate_presigned_stream(r2_key))
+
+
+def _resolve_formats(url: str) -> dict:
+    """Ask yt-dlp for the selected formats' media URLs without downloading."""
+    result = subprocess.run(
+        [str(settings.resolved_yt_dlp_bin), "-J", "--no-playlist", "-f", _STREAM_FORMAT, url],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if result.returncode != 0:
+        raise RuntimeError("영상 정보를 가져올 수 없습니다")
+    return json.loads(result.stdout)
+
+
+def _mux_command(formats: list[dict]) -> list[str]:
+    """ffmpeg stream-copying the formats into fragmented MP4 on stdout."""
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
+    for fmt in formats:
+        headers = "".join(f"{name}: {value}\r\n" for name, value in (fmt.get("http_headers") or {}).items())
+        if headers:
+            cmd += ["-headers", headers]
+        cmd += ["-i", fmt["url"]]
+    if len(formats) > 1:
+        cmd += ["-map", "0:v:0", "-map", "1:a:0"]
+    cmd += [
+        "-c", "copy",
+        "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+        "-f", "mp4",
+        "pipe:1",
+    ]
+    return cmd
+
+
+def _download_then_upload(task: DownloadTask) -> None:
+    """Download the whole file with yt-dlp, then upload it to R2."""
     temp_dir = settings.avid_temp_dir / f"yt_{task.id}"
     temp_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        task.status = "downloading"
         output_template = str(temp_dir / "%(title).80s.%(ext)s")
 
         # Download with progress
         proc = subprocess.Popen(
             [
                 str(settings.resolved_yt_dlp_bin),
-                "-f", "bestvideo+bestaudio/best",
+                "-f", _FILE_FORMAT,
                 "--merge-output-format", "mp4",
                 "--newline",  # Progress on new lines for parsing
                 "-o", output_template,
@@ -126,7 +669,8 @@ def _download_worker(task: DownloadTask) -> None:
                     pct = float(pct_str)
                     task.progress = pct * 0.8  # Download = 0-80%
                 except (ValueError, IndexError):
-                    pass
+                    continue
+                _persist_progress(task)
 
         proc.wait(timeout=7200)
         if proc.returncode != 0:
@@ -149,29 +693,55 @@ def _download_worker(task: DownloadTask) -> None:
         # Upload to R2
         task.status = "uploading"
         task.progress = 80
+        _persist(task)
 
+        task.sha256 = sha256_file(local_path)
         ext = downloaded[0].suffix or ".mp4"
         r2_key = f"sources/{uuid.uuid4()}{ext}"
 
         r2.upload_file(local_path, r2_key, "video/mp4")
-
         task.r2_key = r2_key
-        task.status = "completed"
-        task.progress = 100
-
-        logger.info("YouTube download completed: %s -> %s", task.url, r2_key)
-
-    except Exception as e:
-        logger.exception("YouTube download failed for task %s", task.id)
-        task.status = "failed"
-        task.error = str(e)[:500]
 
     finally:
         # Cleanup local files
-        import shutil
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def _register_source_asset(task: DownloadTask) -> None:
+    """Record the upload in source_assets, reusing an identical existing object."""
+    db = get_db()
+    video_id = canonical_video_id(task.url)
+    try:
+        existing = lookup_source_asset(db, sha256=task.sha256, size_bytes=task.filesize_bytes)
+        existing_key = (existing or {}).get("r2_key")
+        if existing_key and existing_key != task.r2_key and r2.object_exists(existing_key):
+            r2.delete_objects([task.r2_key])
+            task.r2_key = existing_key
+            if video_id:
+                link_source_asset_youtube_video(
+                    db, asset_id=existing["id"], video_id=video_id, format_selector=import_format()
+                )
+            else:
+                touch_source_asset(db, asset_id=existing["id"])
+            return
+        upsert_source_asset(
+            db,
+            sha256=task.sha256,
+            size_bytes=task.filesize_bytes,
+            r2_key=task.r2_key,
+            filename=task.filename,
+            duration_seconds=task.duration_seconds or None,
+            youtube_video_id=video_id,
+            youtube_format=import_format() if video_id else None,
+        )
+    except Exception:
+        logger.exception("Failed to register source asset for YouTube task %s", task.id)
+
+
+def _safe_filename(title: str) -> str:
+    return _UNSAFE_FILENAME_CHARS.sub("_", title).strip()[:80] or "youtube"
+
+
 def _get_duration(path: str) -> int:
     """Get video duration in seconds via ffprobe."""
     try:
@@ -0,0 +1,106 @@
+"""Startup phases and readiness.
+
+The API starts serving as soon as the app is built. Recovery of work left
+behind by a previous process (requeueing stuck projects, previews, renders,
+source derivatives and YouTube downloads) scans several tables, so it runs on a background
+thread afterwards; ``/health`` reports its progress.
+"""
+
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# (step name, module, function, log label)
+RECOVERY_STEPS = (
+    ("projects", "eogum.services.job_runner", "recover_stuck_projects", "stuck project(s)"),
+    ("final_previews", "eogum.services.job_runner", "recover_stuck_final_previews", "stuck final-preview job(s)"),
+    ("ai_cut_renders", "eogum.services.job_runner", "recover_stuck_ai_cut_renders", "stuck AI-cut render job(s)"),
+    (
+        "source_derivatives",
+        "eogum.services.job_runner",
+        "recover_stuck_source_derivatives",
+        "stuck source-derive job(s)",
+    ),
+    ("youtube_downloads", "eogum.services.youtube", "recover_stuck_downloads", "interrupted YouTube download(s)"),
+)
+
+
+class StartupState:
+    """Where the process is in its startup, for readiness reporting."""
+
+    STARTING = "starting"
+    RECOVERING = "recovering"
+    READY = "ready"
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        self.phase = self.STARTING
+        self.serving_after_seconds: float | None = None
+        self.recovery_seconds: float | None = None
+        self.recovered: dict[str, int] = {}
+        self.failed_steps: list[str] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.phase == self.READY
+
+    def mark_serving(self) -> None:
+        with self._lock:
+            self.serving_after_seconds = round(self._clock() - self._started, 3)
+
+    def mark_recovering(self) -> None:
+        with self._lock:
+            self.phase = self.RECOVERING
+
+    def record_step(self, name: str, recovered: int | None) -> None:
+        with self._lock:
+            if recovered is None:
+                self.failed_steps.append(name)
+            else:
+                self.recovered[name] = recovered
+
+    def mark_ready(self) -> None:
+        with self._lock:
+            self.phase = self.READY
+            self.recovery_seconds = round(self._clock() - self._started, 3)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "phase": self.phase,
+                "serving_after_seconds": self.serving_after_seconds,
+                "recovery_seconds": self.recovery_seconds,
+                "recovered": dict(self.recovered),
+                "failed_steps": list(self.failed_steps),
+            }
+
+
+startup_state = StartupState()
+
+
+def run_startup_recovery(state: StartupState = startup_state) -> None:
+    """Requeue work a previous process left behind; each step fails independently."""
+    state.mark_recovering()
+    for name, module_name, function_name, label in RECOVERY_STEPS:
+        try:
+            recovered = getattr(importlib.import_module(module_name), function_name)(recover_running=True)
+        except Exception:
+            logger.exception("Startup recovery of %s failed", label)
+            state.record_step(name, None)
+            continue
+        state.record_step(name, recovered)
+        if recovered:
+            logger.info("Recovered %d %s on startup", recovered, label)
+    state.mark_ready()
+    logger.info("Startup recovery finished in %.2fs", state.recovery_seconds)
+
+
+def start_startup_recovery(state: StartupState = startup_state) -> threading.Thread:
+    thread = threading.Thread(target=run_startup_recovery, args=(state,), name="startup-recovery", daemon=True)
+    thread.start()
+    return thread
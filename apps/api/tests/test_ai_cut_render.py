@@ -1,6 +1,7 @@
 import json
 import os
 from pathlib import Path
+import shutil
 import subprocess
 import sys
 from types import SimpleNamespace
@@ -19,7 +20,7 @@ os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
 
 from eogum.auth import CurrentUser  # noqa: E402
 from eogum.routes import projects, renders  # noqa: E402
-from eogum.services import ai_cut_render, job_runner, media_render  # noqa: E402
+from eogum.services import ai_cut_render, job_runner, media_render, transcript_sidecar  # noqa: E402
 
 
 NOW = "2026-07-13T00:00:00+00:00"
@@ -295,7 +296,7 @@ def test_project_delete_cleans_render_mp4(monkeypatch):
     deleted_keys = []
     monkeypatch.setattr(projects, "get_db", lambda: db)
     monkeypatch.setattr(projects, "_source_r2_key_is_shared", lambda *_args, **_kwargs: False)
-    monkeypatch.setattr(projects, "delete_objects", lambda keys: deleted_keys.extend(keys))
+    monkeypatch.setattr(projects, "enqueue_deletions", lambda db, keys, **kwargs: deleted_keys.extend(keys))
 
     projects.delete_project("project-1", OWNER)
 
@@ -365,13 +366,27 @@ def test_ai_cut_render_uses_review_timeline_planner(monkeypatch, tmp_path: Path)
     })
     source_path = tmp_path / "source.mp4"
     source_path.write_bytes(b"source")
-    project_payload = {"timeline": "from-ai-project-json"}
+    project_json_path = tmp_path / "ai-1.project.json"
+    project_json_path.write_text(json.dumps({
+        "transcription": {"segments": [{"index": 1, "start_ms": 0, "end_ms": 900, "text": "from the sidecar"}]},
+    }))
+    sidecar_path = transcript_sidecar.write_transcript_sidecar(project_json_path)
+    source_job["result_r2_keys"] = {
+        "project_json": "results/ai-1.project.json",
+        "transcript_sidecar": "results/ai-1.transcript.npz",
+    }
     planned_intervals = [(1.0, 2.0), (4.0, 1.0)]
     captured = {}
+    downloaded = []
+
+    def download_to_bytes(key):
+        downloaded.append(key)
+        assert key == "results/ai-1.transcript.npz", "planning must not download the project JSON"
+        return sidecar_path.read_bytes()
 
     monkeypatch.setattr(job_runner, "get_db", lambda: db)
     monkeypatch.setattr(job_runner.settings, "avid_temp_dir", tmp_path)
-    monkeypatch.setattr(job_runner.r2, "download_to_bytes", lambda _key: json.dumps(project_payload).encode())
+    monkeypatch.setattr(job_runner.r2, "download_to_bytes", download_to_bytes)
     monkeypatch.setattr(job_runner, "_get_cached_source_video", lambda *_args: source_path)
     monkeypatch.setattr(
         job_runner.media_render,
@@ -383,11 +398,11 @@ def test_ai_cut_render_uses_review_timeline_planner(monkeypatch, tmp_path: Path)
         },
     )
 
-    def plan_intervals(path: Path):
-        captured["project_payload"] = json.loads(path.read_text())
+    def plan_intervals(document):
+        captured["segment_texts"] = [segment.text for segment in document.segments]
         return planned_intervals
 
-    monkeypatch.setattr(job_runner, "_review_timeline_intervals_from_project_json", plan_intervals)
+    monkeypatch.setattr(job_runner, "_review_timeline_intervals", plan_intervals)
 
     def render_intervals(_source, intervals, output, **kwargs):
         captured["intervals"] = intervals
@@ -424,7 +439,8 @@ def test_ai_cut_render_uses_review_timeline_planner(monkeypatch, tmp_path: Path)
 
     render_job = next(row for row in db.jobs if row["id"] == "render-pending")
     assert render_job["status"] == "completed"
-    assert captured["project_payload"] == project_payload
+    assert captured["segment_texts"] == ["from the sidecar"]
+    assert downloaded == ["results/ai-1.transcript.npz"]
     assert captured["intervals"] == planned_intervals
     assert captured["profile"] == media_render.WEB_1080P_PROFILE
     assert captured["upload"][2] == "video/mp4"
@@ -492,6 +508,12 @@ def test_restart_recovery_requeues_pending_and_running_jobs(monkeypatch):
     assert next(row for row in db.jobs if row["id"] == "render-running")["status"] == "pending"
 
 
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="ffmpeg/ffprobe not installed",
+)
+
+
 def _make_fixture(
     path: Path,
     *,
@@ -542,6 +564,7 @@ def _make_fixture(
     subprocess.run(command + [str(path)], check=True, capture_output=True)
 
 
+@requires_ffmpeg
 @pytest.mark.parametrize("with_audio", [True, False])
 def test_web_1080p_ffmpeg_render_profile(tmp_path: Path, with_audio: bool):
     source = tmp_path / "source.mp4"
@@ -577,6 +600,7 @@ def test_web_1080p_ffmpeg_render_profile(tmp_path: Path, with_audio: bool):
         assert metadata["av_sync_diff_ms"] <= 200
 
 
+@requires_ffmpeg
 def test_web_profile_downscales_to_1080p(tmp_path: Path):
     source = tmp_path / "source-2k.mp4"
     output = tmp_path / "output-1080p.mp4"
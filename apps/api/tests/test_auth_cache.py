@@ -0,0 +1,124 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from fastapi import HTTPException
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum import auth  # noqa: E402
+
+_PRIVATE_KEY = ec.generate_private_key(ec.SECP256R1())
+
+
+class _SigningKey:
+    key = _PRIVATE_KEY.public_key()
+
+
+class _FakeJwksClient:
+    def __init__(self):
+        self.lookups = 0
+        self.refreshes = 0
+
+    def get_signing_key_from_jwt(self, token: str):
+        self.lookups += 1
+        return _SigningKey()
+
+    def get_jwk_set(self, refresh: bool = False):
+        self.refreshes += 1
+
+
+class _Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _token(exp: float, sub: str = "user-1") -> str:
+    return jwt.encode({"sub": sub, "aud": "authenticated", "exp": int(exp)}, _PRIVATE_KEY, algorithm="ES256")
+
+
+@pytest.fixture
+def jwks(monkeypatch):
+    client = _FakeJwksClient()
+    monkeypatch.setattr(auth, "_jwks_client", client)
+    monkeypatch.setattr(auth, "auth_metrics", auth.AuthMetrics())
+    monkeypatch.setattr(auth, "_token_cache", auth.VerifiedTokenCache(max_entries=2, max_ttl_seconds=300))
+    return client
+
+
+def test_verified_token_is_served_from_cache(jwks):
+    token = _token(time.time() + 3600)
+
+    first = auth._decode_token(token)
+    first["sub"] = "tampered"
+    second = auth._decode_token(token)
+
+    assert second["sub"] == "user-1"
+    assert jwks.lookups == 1
+    stats = auth.auth_stats()
+    assert stats["cache_hits"] == 1 and stats["verifications"] == 1 and stats["hit_rate"] == 0.5
+
+
+def test_cache_entry_expires_with_the_token():
+    clock = _Clock(1000.0)
+    cache = auth.VerifiedTokenCache(max_entries=8, max_ttl_seconds=300, clock=clock)
+    cache.put("short", {"sub": "user-1", "exp": 1010})
+    cache.put("long", {"sub": "user-1", "exp": 9999})
+
+    clock.now = 1010
+    assert cache.get("short") is None
+    assert cache.get("long") is not None
+    clock.now = 1300
+    assert cache.get("long") is None
+
+
+def test_cache_is_lru_bounded(jwks):
+    tokens = [_token(time.time() + 3600, sub=f"user-{index}") for index in range(3)]
+    auth._decode_token(tokens[0])
+    auth._decode_token(tokens[1])
+    auth._decode_token(tokens[0])
+    auth._decode_token(tokens[2])  # evicts tokens[1], the least recently used
+
+    auth._decode_token(tokens[0])
+    auth._decode_token(tokens[1])
+
+    assert jwks.lookups == 4
+
+
+def test_rejected_tokens_are_not_cached(jwks):
+    token = _token(time.time() - 10)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            auth._decode_token(token)
+        assert exc_info.value.status_code == 401
+
+    assert jwks.lookups == 2
+    assert auth.auth_stats()["failures"] == 2
+
+
+def test_jwks_refresher_refreshes_in_background(jwks):
+    stop = auth.start_jwks_refresher(interval_seconds=0.01)
+    try:
+        deadline = time.monotonic() + 2
+        while jwks.refreshes < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+
+    assert jwks.refreshes >= 2
+    assert auth.auth_stats()["jwks_refreshes"] >= 2
@@ -2,6 +2,11 @@ import os
 import sys
 import threading
 from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import supabase
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -15,8 +20,18 @@ os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
 from eogum.services import database  # noqa: E402
 
 
+class _UnbufferedStream(httpx.SyncByteStream):
+    """Body read lazily like a real connection, unlike httpx.ByteStream."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def __iter__(self):
+        yield self._body
+
+
 def test_get_db_reuses_client_within_thread(monkeypatch):
-    monkeypatch.setattr(database, "_thread_local", threading.local())
+    monkeypatch.setattr(database, "_client", None)
     created = []
 
     def fake_create_client():
@@ -33,11 +48,12 @@ def test_get_db_reuses_client_within_thread(monkeypatch):
     assert created == [first]
 
 
-def test_get_db_uses_distinct_clients_across_threads(monkeypatch):
-    monkeypatch.setattr(database, "_thread_local", threading.local())
+def test_get_db_shares_one_client_across_threads(monkeypatch):
+    monkeypatch.setattr(database, "_client", None)
     created = []
     results = []
     lock = threading.Lock()
+    start = threading.Barrier(8)
 
     def fake_create_client():
         client = object()
@@ -46,26 +62,42 @@ def test_get_db_uses_distinct_clients_across_threads(monkeypatch):
         return client
 
     def load_client():
+        start.wait()
         client = database.get_db()
         with lock:
             results.append(client)
 
     monkeypatch.setattr(database, "_create_db_client", fake_create_client)
-    threads = [threading.Thread(target=load_client) for _ in range(2)]
+    threads = [threading.Thread(target=load_client) for _ in range(8)]
     for thread in threads:
         thread.start()
     for thread in threads:
         thread.join()
 
-    assert len(created) == 2
-    assert len(results) == 2
-    assert results[0] is not results[1]
+    assert len(created) == 1
+    assert results == created * 8
+
 
+def test_close_db_closes_connections_and_reconnects_lazily(monkeypatch):
+    closed = []
+    http_client = SimpleNamespace(close=lambda: closed.append(True))
+    monkeypatch.setattr(database, "_client", SimpleNamespace(options=SimpleNamespace(httpx_client=http_client)))
+    monkeypatch.setattr(database, "_create_db_client", lambda: "new-client")
 
-def test_create_db_client_disables_http2_and_sets_timeouts(monkeypatch):
+    database.close_db()
+
+    assert closed == [True]
+    assert database.get_db() == "new-client"
+
+
+def test_create_db_client_bounds_shared_pool_and_sets_timeouts(monkeypatch):
     captured = {}
     fake_http_client = object()
 
+    def fake_http_transport(**kwargs):
+        captured["transport"] = kwargs
+        return httpx.MockTransport(lambda request: httpx.Response(200))
+
     def fake_httpx_client(**kwargs):
         captured["httpx"] = kwargs
         return fake_http_client
@@ -78,17 +110,75 @@ def test_create_db_client_disables_http2_and_sets_timeouts(monkeypatch):
         captured["create_client"] = (url, key, options)
         return "db-client"
 
+    monkeypatch.setattr(database.settings, "supabase_max_connections", 12)
+    monkeypatch.setattr(database.settings, "supabase_http2", False)
+    monkeypatch.setattr(database.httpx, "HTTPTransport", fake_http_transport)
     monkeypatch.setattr(database.httpx, "Client", fake_httpx_client)
-    monkeypatch.setattr(database, "ClientOptions", fake_client_options)
-    monkeypatch.setattr(database, "create_client", fake_create_client)
+    monkeypatch.setattr(supabase, "ClientOptions", fake_client_options)
+    monkeypatch.setattr(supabase, "create_client", fake_create_client)
 
     result = database._create_db_client()
 
-    assert result == "db-client"
-    assert captured["httpx"]["http2"] is False
+    assert isinstance(result, database.ResilientClient)
+    assert result.client == "db-client"
+    assert captured["transport"]["http2"] is False
+    assert captured["transport"]["limits"].max_connections == 12
+    assert isinstance(captured["httpx"]["transport"], database.MeteredTransport)
     assert captured["httpx"]["timeout"].read == 120.0
     assert captured["options"]["postgrest_client_timeout"].read == 120.0
     assert captured["options"]["storage_client_timeout"] == 120
     assert captured["options"]["httpx_client"] is fake_http_client
     assert captured["create_client"][0] == database.settings.supabase_url
     assert captured["create_client"][1] == database.settings.supabase_service_key
+
+
+def test_metered_transport_bounds_requests_and_records_waits():
+    metrics = database.PoolMetrics()
+    release_first = threading.Event()
+    first_started = threading.Event()
+
+    def handler(request):
+        if request.url.path == "/slow":
+            first_started.set()
+            release_first.wait(5)
+        return httpx.Response(200, stream=_UnbufferedStream(b'{"ok": true}'))
+
+    transport = database.MeteredTransport(
+        httpx.MockTransport(handler),
+        max_requests=1,
+        pool_timeout_seconds=5,
+        metrics=metrics,
+    )
+    client = httpx.Client(transport=transport, base_url="http://supabase.test")
+    slow = threading.Thread(target=lambda: client.get("/slow"))
+    slow.start()
+    first_started.wait(5)
+    threading.Timer(0.05, release_first.set).start()
+
+    assert client.get("/fast").json() == {"ok": True}
+    slow.join()
+
+    stats = metrics.snapshot(capacity=1)
+    assert stats["requests"] == 2
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 1
+    assert stats["waited_requests"] == 1
+    assert stats["max_wait_ms"] > 0
+
+
+def test_metered_transport_times_out_when_saturated():
+    metrics = database.PoolMetrics()
+    transport = database.MeteredTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200, stream=_UnbufferedStream(b"{}"))),
+        max_requests=1,
+        pool_timeout_seconds=0.01,
+        metrics=metrics,
+    )
+    client = httpx.Client(transport=transport, base_url="http://supabase.test")
+
+    with client.stream("GET", "/held"):
+        with pytest.raises(httpx.PoolTimeout):
+            client.get("/blocked")
+
+    assert metrics.snapshot(capacity=1)["timeouts"] == 1
+    assert client.get("/after").status_code == 200
@@ -0,0 +1,223 @@
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.main import app  # noqa: E402
+from eogum.routes import projects  # noqa: E402
+from eogum.services import database  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _fast_retries(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(database.time, "sleep", sleeps.append)
+    monkeypatch.setattr(database.settings, "supabase_retry_max_attempts", 4)
+    monkeypatch.setattr(database.settings, "supabase_retry_base_delay_seconds", 0.25)
+    monkeypatch.setattr(database.settings, "supabase_retry_max_delay_seconds", 5.0)
+    monkeypatch.setattr(database.settings, "supabase_operation_deadline_seconds", 60.0)
+    monkeypatch.setattr(database, "supabase_breaker", database.CircuitBreaker(failure_threshold=3, cooldown_seconds=10))
+    monkeypatch.setattr(database, "retry_metrics", database.RetryMetrics())
+    return sleeps
+
+
+def _flaky(failures: list[Exception], result="ok"):
+    calls = []
+
+    def operation():
+        calls.append(1)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return result
+
+    return operation, calls
+
+
+def test_backoff_is_full_jitter_and_capped(monkeypatch):
+    monkeypatch.setattr(database.random, "uniform", lambda low, high: high)
+
+    assert [database._backoff_delay(attempt) for attempt in range(1, 8)] == [0.25, 0.5, 1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_transient_errors_are_retried_with_jittered_backoff(_fast_retries):
+    operation, calls = _flaky([httpx.ReadTimeout("slow"), httpx.ConnectError("down")])
+
+    assert database.execute_with_retry(operation, operation_name="test") == "ok"
+
+    assert len(calls) == 3
+    assert len(_fast_retries) == 2
+    assert 0 <= _fast_retries[0] <= 0.25 and 0 <= _fast_retries[1] <= 0.5
+    assert database.retry_metrics.snapshot()["retries"] == 2
+
+
+def test_non_idempotent_write_is_resent_only_when_never_sent():
+    operation, calls = _flaky([httpx.ConnectError("refused")])
+    assert database.execute_with_retry(operation, operation_name="insert", idempotent=False) == "ok"
+    assert len(calls) == 2
+
+    operation, calls = _flaky([httpx.ReadTimeout("response lost")])
+    with pytest.raises(httpx.ReadTimeout):
+        database.execute_with_retry(operation, operation_name="insert", idempotent=False)
+    assert len(calls) == 1
+
+
+def test_deadline_stops_retrying_before_the_budget_runs_out(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(database.random, "uniform", lambda low, high: high)
+    monkeypatch.setattr(database.time, "monotonic", clock)
+    monkeypatch.setattr(database.time, "sleep", lambda seconds: setattr(clock, "now", clock.now + seconds))
+    operation, calls = _flaky([httpx.ReadTimeout("slow")] * 4)
+
+    with pytest.raises(httpx.ReadTimeout):
+        database.execute_with_retry(operation, operation_name="test", deadline_seconds=0.6)
+
+    # 0.25s after the first failure fits; 0.5s more after the second does not.
+    assert len(calls) == 2
+    assert clock.now == 0.25
+    assert database.retry_metrics.snapshot()["deadline_exhausted"] == 1
+
+    calls.clear()
+    with database.operation_deadline(0.1), pytest.raises(httpx.ReadTimeout):
+        database.execute_with_retry(operation, operation_name="test")
+    assert len(calls) == 1
+
+
+def test_breaker_opens_fails_fast_and_recovers_through_one_probe():
+    clock = _Clock()
+    breaker = database.CircuitBreaker(failure_threshold=3, cooldown_seconds=10, clock=clock)
+    operation, calls = _flaky([httpx.ConnectError("down")] * 4)
+
+    with pytest.raises(httpx.ConnectError):
+        database.execute_with_retry(operation, operation_name="test", breaker=breaker)
+    # The failure that opens the breaker ends the retries as well.
+    assert len(calls) == 3
+    assert breaker.snapshot()["state"] == "open"
+
+    with pytest.raises(database.DatabaseUnavailable):
+        database.execute_with_retry(operation, operation_name="test", breaker=breaker)
+    assert len(calls) == 3
+
+    clock.now = 10
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # a single half-open probe at a time
+    breaker.record_success()
+    assert breaker.snapshot()["state"] == "closed"
+
+
+def test_client_errors_do_not_trip_the_breaker():
+    breaker = database.CircuitBreaker(failure_threshold=1, cooldown_seconds=10)
+    operation, calls = _flaky([ValueError("bad request")])
+
+    with pytest.raises(ValueError):
+        database.execute_with_retry(operation, operation_name="test", breaker=breaker)
+
+    assert len(calls) == 1
+
+    assert breaker.snapshot()["state"] == "closed"
+
+
+def test_slow_read_is_hedged_and_the_fast_copy_wins(monkeypatch):
+    monkeypatch.setattr(database.settings, "supabase_hedge_after_seconds", 0.05)
+    release_first = threading.Event()
+    calls = []
+
+    def read():
+        calls.append(1)
+        if len(calls) == 1:
+            release_first.wait(2)
+            return "slow"
+        return "fast"
+
+    started = time.monotonic()
+    assert database.execute_with_retry(read, operation_name="read", hedge=True) == "fast"
+    release_first.set()
+
+    assert time.monotonic() - started < 1
+    stats = database.db_retry_stats()
+    assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+
+
+def test_expired_deadline_runs_reads_inline_without_tripping_the_breaker(monkeypatch):
+    monkeypatch.setattr(database.settings, "supabase_hedge_after_seconds", 0.05)
+    calls = []
+
+    def read():
+        calls.append(1)
+        return "ok"
+
+    with database.operation_deadline(0):
+        results = [database.execute_with_retry(read, operation_name="read", hedge=True) for _ in range(3)]
+
+    assert results == ["ok"] * 3
+    assert len(calls) == 3
+    stats = database.db_retry_stats()
+    assert stats["hedges"] == 0
+    assert stats["breaker"]["consecutive_failures"] == 0
+
+
+def test_read_still_running_at_the_deadline_is_not_a_breaker_failure(monkeypatch):
+    monkeypatch.setattr(database.settings, "supabase_hedge_after_seconds", 0.01)
+    release = threading.Event()
+    calls = []
+
+    def read():
+        calls.append(1)
+        release.wait(2)
+        return "late"
+
+    for _ in range(3):
+        with pytest.raises(database.DatabaseDeadlineExceeded):
+            database.execute_with_retry(read, operation_name="read", hedge=True, deadline_seconds=0.05)
+    release.set()
+
+    # Primary plus one hedge per read, and no retries once time is up.
+    assert len(calls) == 6
+    stats = database.db_retry_stats()
+    assert stats["deadline_exhausted"] == 3
+    assert stats["breaker"] == {**stats["breaker"], "state": "closed", "consecutive_failures": 0}
+
+
+def test_open_breaker_returns_503(monkeypatch):
+    breaker = database.supabase_breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    class _Query:
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: self
+
+        request = type("Request", (), {"http_method": "GET"})()
+
+    class _Client:
+        def table(self, name):
+            return _Query()
+
+    monkeypatch.setattr(projects, "get_db", lambda: database.ResilientClient(_Client()))
+    monkeypatch.setattr(projects, "is_public_project_id", lambda project_id: True)
+
+    response = TestClient(app).get("/api/v1/projects/project-1")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "10"
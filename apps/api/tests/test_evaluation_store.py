@@ -0,0 +1,285 @@
+import copy
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.auth import CurrentUser  # noqa: E402
+from eogum.models.schemas import EvaluationDeltaSave  # noqa: E402
+from eogum.routes import evaluations  # noqa: E402
+from eogum.services import evaluation_store  # noqa: E402
+
+
+class _FakeQuery:
+    def __init__(self, db, table_name: str):
+        self.db = db
+        self.table_name = table_name
+        self.operation = "select"
+        self.values = None
+        self.filters = []
+        self.order_column = None
+        self.limit_value = None
+        self.single_result = False
+
+    def select(self, _select: str):
+        self.operation = "select"
+        return self
+
+    def update(self, values: dict):
+        self.operation = "update"
+        self.values = values
+        return self
+
+    def delete(self):
+        self.operation = "delete"
+        return self
+
+    def eq(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def gt(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) > value)
+        return self
+
+    def lte(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) <= value)
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self.order_column = column
+        return self
+
+    def limit(self, value: int):
+        self.limit_value = value
+        return self
+
+    def single(self):
+        self.single_result = True
+        return self
+
+    def execute(self):
+        rows = self.db.tables[self.table_name]
+        matched = [row for row in rows if all(check(row) for check in self.filters)]
+        if self.operation == "delete":
+            self.db.tables[self.table_name] = [row for row in rows if row not in matched]
+            return SimpleNamespace(data=matched)
+        if self.operation == "update":
+            for row in matched:
+                row.update(copy.deepcopy(self.values))
+            return SimpleNamespace(data=copy.deepcopy(matched))
+        if self.order_column:
+            matched.sort(key=lambda row: row[self.order_column])
+        if self.limit_value is not None:
+            matched = matched[: self.limit_value]
+        if self.single_result:
+            return SimpleNamespace(data=copy.deepcopy(matched[0]) if matched else None)
+        return SimpleNamespace(data=copy.deepcopy(matched))
+
+
+class _FakeDb:
+    """In-memory evaluations store that mirrors the evaluation RPCs."""
+
+    def __init__(self):
+        self.tables = {"evaluations": [], "evaluation_deltas": [], "projects": []}
+
+    def table(self, table_name: str):
+        return _FakeQuery(self, table_name)
+
+    def rpc(self, name: str, params: dict):
+        handler = {"append_evaluation_delta": self._append, "save_evaluation_snapshot": self._save}[name]
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=handler(params)))
+
+    def _save(self, params: dict) -> list[dict]:
+        rows = self.tables["evaluations"]
+        row = next(
+            (
+                row for row in rows
+                if row["project_id"] == params["p_project_id"] and row["evaluator_id"] == params["p_evaluator_id"]
+            ),
+            None,
+        )
+        if row is None:
+            row = {
+                "id": f"evaluation-{len(rows) + 1}",
+                "project_id": params["p_project_id"],
+                "evaluator_id": params["p_evaluator_id"],
+                "version": "1.0",
+                "revision": 0,
+                "snapshot_revision": 0,
+            }
+            rows.append(row)
+        else:
+            row["revision"] += 1
+            row["snapshot_revision"] = row["revision"]
+        row.update({
+            "segments": copy.deepcopy(params["p_segments"]),
+            "avid_version": params["p_avid_version"],
+            "eogum_version": params["p_eogum_version"],
+        })
+        self.tables["evaluation_deltas"] = [
+            delta for delta in self.tables["evaluation_deltas"]
+            if delta["evaluation_id"] != row["id"] or delta["revision"] > row["revision"]
+        ]
+        return [copy.deepcopy(row)]
+
+    def _append(self, params: dict) -> list[dict]:
+        for row in self.tables["evaluations"]:
+            if row["project_id"] != params["p_project_id"] or row["evaluator_id"] != params["p_evaluator_id"]:
+                continue
+            applied = row["revision"] == params["p_expected_revision"]
+            if applied:
+                row["revision"] += 1
+                self.tables["evaluation_deltas"].append({
+                    "evaluation_id": row["id"],
+                    "revision": row["revision"],
+                    "changes": copy.deepcopy(params["p_changes"]),
+                })
+            return [{
+                "id": row["id"],
+                "revision": row["revision"],
+                "snapshot_revision": row["snapshot_revision"],
+                "applied": applied,
+                "updated_at": "2026-07-01T00:00:00+00:00",
+            }]
+        return []
+
+
+def _segments(count: int) -> dict:
+    return {
+        "schema_version": "review-segments/v1",
+        "segments": [
+            {
+                "index": index + 1,
+                "start_ms": index * 1000,
+                "end_ms": index * 1000 + 900,
+                "text": f"segment {index + 1}",
+                "ai": {"action": "keep", "reason": "", "confidence": 0.9},
+                "human": None,
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def _saved_db(count: int = 3) -> _FakeDb:
+    db = _FakeDb()
+    evaluation_store.save_evaluation_snapshot(db, "project-1", "user-1", _segments(count))
+    return db
+
+
+def _cut(reason: str = "filler") -> dict:
+    return {"action": "cut", "reason": reason, "note": ""}
+
+
+def test_apply_segment_deltas_replays_in_order_without_mutating_input():
+    payload = _segments(3)
+    original = copy.deepcopy(payload)
+
+    merged = evaluation_store.apply_segment_deltas(payload, [
+        [{"index": 2, "human": _cut()}],
+        [{"index": 2, "human": None}, {"index": 3, "human": _cut("dup")}],
+        [{"index": 99, "human": _cut()}],
+    ])
+
+    assert payload == original
+    assert merged["segments"][0] is payload["segments"][0]
+    assert merged["segments"][1]["human"] is None
+    assert merged["segments"][2]["human"] == _cut("dup")
+    assert merged["segments"][2]["ai"] == payload["segments"][2]["ai"]
+
+
+def test_apply_segment_deltas_handles_legacy_segment_lists():
+    segments = _segments(2)["segments"]
+
+    merged = evaluation_store.apply_segment_deltas(segments, [[{"index": 1, "ai": {"action": "cut"}}]])
+
+    assert isinstance(merged, list)
+    assert merged[0]["ai"] == {"action": "cut"}
+    assert evaluation_store.apply_segment_deltas(segments, []) is segments
+
+
+def test_fetch_replays_pending_deltas_above_snapshot():
+    db = _saved_db()
+    first = evaluation_store.append_evaluation_delta(db, "project-1", "user-1", 0, [{"index": 1, "human": _cut()}])
+    second = evaluation_store.append_evaluation_delta(db, "project-1", "user-1", 1, [{"index": 3, "human": _cut()}])
+
+    row = evaluation_store.fetch_evaluation_row(db, "project-1", "user-1", "segments")
+
+    assert (first["revision"], second["revision"]) == (1, 2)
+    assert row["revision"] == 2
+    assert [segment["human"] for segment in row["segments"]["segments"]] == [_cut(), None, _cut()]
+    assert db.tables["evaluations"][0]["segments"]["segments"][0]["human"] is None
+
+
+def test_stale_base_revision_is_rejected():
+    db = _saved_db()
+    evaluation_store.append_evaluation_delta(db, "project-1", "user-1", 0, [{"index": 1, "human": _cut()}])
+
+    stale = evaluation_store.append_evaluation_delta(db, "project-1", "user-1", 0, [{"index": 2, "human": _cut()}])
+
+    assert stale["applied"] is False
+    assert stale["revision"] == 1
+    assert len(db.tables["evaluation_deltas"]) == 1
+    assert evaluation_store.append_evaluation_delta(db, "project-1", "missing", 0, []) is None
+
+
+def test_deltas_are_compacted_into_the_snapshot(monkeypatch):
+    monkeypatch.setattr(evaluation_store, "EVALUATION_COMPACTION_THRESHOLD", 3)
+    db = _saved_db()
+    for revision, index in enumerate([1, 2, 3]):
+        evaluation_store.append_evaluation_delta(
+            db, "project-1", "user-1", revision, [{"index": index, "human": _cut()}]
+        )
+
+    stored = db.tables["evaluations"][0]
+    assert stored["snapshot_revision"] == 3
+    assert [segment["human"] for segment in stored["segments"]["segments"]] == [_cut()] * 3
+    assert db.tables["evaluation_deltas"] == []
+
+    evaluation_store.append_evaluation_delta(db, "project-1", "user-1", 3, [{"index": 1, "human": None}])
+    row = evaluation_store.fetch_evaluation_row(db, "project-1", "user-1")
+    assert [segment["human"] for segment in row["segments"]["segments"]] == [None, _cut(), _cut()]
+
+
+def test_full_save_supersedes_pending_deltas():
+    db = _saved_db()
+    evaluation_store.append_evaluation_delta(db, "project-1", "user-1", 0, [{"index": 1, "human": _cut()}])
+
+    row = evaluation_store.save_evaluation_snapshot(db, "project-1", "user-1", _segments(3))
+
+    assert (row["revision"], row["snapshot_revision"]) == (2, 2)
+    assert db.tables["evaluation_deltas"] == []
+    fetched = evaluation_store.fetch_evaluation_row(db, "project-1", "user-1")
+    assert fetched["segments"]["segments"][0]["human"] is None
+
+
+def test_patch_route_returns_new_revision_and_conflicts(monkeypatch):
+    db = _saved_db()
+    db.tables["projects"].append({"id": "project-1", "user_id": "user-1"})
+    monkeypatch.setattr(evaluations, "get_db", lambda: db)
+    user = CurrentUser(id="user-1", email="owner@example.com", is_admin=False)
+    request = EvaluationDeltaSave.model_validate({
+        "base_revision": 0,
+        "changes": [{"index": 2, "human": _cut()}],
+    })
+
+    response = evaluations.patch_evaluation("project-1", request, current_user=user)
+
+    assert response.revision == 1
+    assert db.tables["evaluation_deltas"][0]["changes"] == [{"index": 2, "human": _cut()}]
+    with pytest.raises(HTTPException) as exc_info:
+        evaluations.patch_evaluation("project-1", request, current_user=user)
+    assert exc_info.value.status_code == 409
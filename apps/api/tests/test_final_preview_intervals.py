@@ -211,3 +211,45 @@ def test_final_preview_word_boundary_alignment_matches_review_segments(tmp_path:
     )
 
     assert _intervals_ms(path) == [(2500, 4000)]
+
+
+def test_final_preview_captions_split_across_cut_boundaries(tmp_path: Path):
+    project_json = _write_project_json(
+        tmp_path,
+        segments=[_segment(0, 0, 3000), _segment(1, 3000, 6000), _segment(2, 9000, 9500)],
+    )
+    manifest = {
+        "version": 1,
+        "intervals": [
+            {
+                "source_start_ms": 1000,
+                "source_end_ms": 4000,
+                "requested_duration_ms": 3000,
+                "actual_duration_ms": 3000,
+                "preview_start_ms": 0,
+                "preview_end_ms": 3000,
+            },
+            {
+                "source_start_ms": 5000,
+                "source_end_ms": 7000,
+                "requested_duration_ms": 2000,
+                "actual_duration_ms": 2000,
+                "preview_start_ms": 3000,
+                "preview_end_ms": 5000,
+            },
+        ],
+    }
+    output_path = tmp_path / "captions.vtt"
+
+    job_runner._write_final_preview_webvtt_from_source_segments(
+        job_runner.ProjectDocument.from_path(project_json),
+        job_runner.TimelineMap.from_manifest(manifest),
+        output_path,
+    )
+
+    assert output_path.read_text(encoding="utf-8") == (
+        "WEBVTT\n\n"
+        "1\n00:00:00.000 --> 00:00:02.000\nsegment 0\n\n"
+        "2\n00:00:02.000 --> 00:00:03.000\nsegment 1\n\n"
+        "3\n00:00:03.000 --> 00:00:04.000\nsegment 1\n"
+    )
@@ -0,0 +1,185 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.services import final_preview_plan  # noqa: E402
+
+
+class _FakeRenderer:
+    """Stands in for media_render.render_intervals and records what it encodes."""
+
+    def __init__(self, fail: bool = False):
+        self.encoded: list[list[int]] = []
+        self.streamed: list[bool] = []
+        self.fail = fail
+
+    def __call__(
+        self,
+        _source,
+        intervals,
+        output_path,
+        *,
+        profile,
+        streaming=False,
+        segment_paths=None,
+        reused_durations_ms=None,
+    ):
+        reused_durations_ms = reused_durations_ms or {}
+        self.streamed.append(segment_paths is None)
+        encoded = []
+        for position in range(len(intervals)):
+            if position in reused_durations_ms:
+                assert segment_paths[position].is_file()
+                continue
+            if segment_paths is not None:
+                segment_paths[position].write_bytes(b"segment")
+            encoded.append(position)
+        self.encoded.append(encoded)
+        if self.fail:
+            raise RuntimeError("concat failed")
+        output_path.write_bytes(b"preview")
+
+        manifest_intervals = []
+        cursor_ms = 0
+        for position, (start, duration) in enumerate(intervals):
+            requested_ms = int(round(duration * 1000))
+            actual_ms = reused_durations_ms.get(position, requested_ms + 7)
+            manifest_intervals.append({
+                "source_start_ms": int(round(start * 1000)),
+                "source_end_ms": int(round(start * 1000)) + requested_ms,
+                "requested_duration_ms": requested_ms,
+                "actual_duration_ms": actual_ms,
+                "preview_start_ms": cursor_ms,
+                "preview_end_ms": cursor_ms + actual_ms,
+            })
+            cursor_ms += actual_ms
+        return {"version": 1, "intervals": manifest_intervals}
+
+
+@pytest.fixture
+def plan_env(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(final_preview_plan.settings, "final_preview_cache_dir", tmp_path / "previews")
+    renderer = _FakeRenderer()
+    monkeypatch.setattr(final_preview_plan.media_render, "render_intervals", renderer)
+    source_path = tmp_path / "source.mp4"
+    source_path.write_bytes(b"source")
+    return renderer, source_path, tmp_path
+
+
+def test_diff_intervals_finds_common_prefix_and_suffix():
+    previous = [(0, 10), (20, 10), (40, 10), (60, 10)]
+
+    assert final_preview_plan.diff_intervals(previous, previous) == (4, 0)
+    assert final_preview_plan.diff_intervals(previous, [(0, 10), (20, 30), (60, 10)]) == (1, 1)
+    assert final_preview_plan.diff_intervals(previous, [(0, 10), (60, 10)]) == (1, 1)
+    assert final_preview_plan.diff_intervals([], previous) == (0, 0)
+    assert final_preview_plan.diff_intervals([(0, 10), (0, 10)], [(0, 10)]) == (1, 0)
+
+
+def test_render_with_plan_reencodes_only_the_changed_middle(plan_env):
+    renderer, source_path, tmp_path = plan_env
+    first = [(0.0, 1.0), (2.0, 1.0), (4.0, 1.0), (6.0, 1.0)]
+    final_preview_plan.render_with_plan("project-1", source_path, first, tmp_path / "first.mp4")
+    final_preview_plan.render_with_plan("project-1", source_path, first, tmp_path / "again.mp4")
+
+    second = [(0.0, 1.0), (2.0, 2.5), (6.0, 1.0)]
+    manifest = final_preview_plan.render_with_plan("project-1", source_path, second, tmp_path / "second.mp4")
+
+    assert renderer.streamed == [True, False, False]
+    assert renderer.encoded == [[0, 1, 2, 3], [0, 1, 2, 3], [1]]
+    assert manifest["reused_intervals"] == 2
+    assert [item["preview_start_ms"] for item in manifest["intervals"]] == [0, 1007, 3514]
+    plan_dir = final_preview_plan.preview_plan_dir("project-1")
+    assert len(list(plan_dir.glob("*.mp4"))) == 3
+
+
+def test_render_with_plan_ignores_plan_for_a_different_source(plan_env):
+    renderer, source_path, tmp_path = plan_env
+    intervals = [(0.0, 1.0), (2.0, 1.0)]
+    final_preview_plan.render_with_plan("project-1", source_path, intervals, tmp_path / "first.mp4")
+
+    final_preview_plan.render_with_plan("project-1", source_path, intervals, tmp_path / "second.mp4")
+
+    source_path.write_bytes(b"replaced source")
+    final_preview_plan.render_with_plan("project-1", source_path, intervals, tmp_path / "third.mp4")
+
+    assert renderer.streamed == [True, False, True]
+    assert not list(final_preview_plan.preview_plan_dir("project-1").glob("*.mp4"))
+
+
+def test_failed_render_keeps_the_previous_plan(plan_env, monkeypatch):
+    renderer, source_path, tmp_path = plan_env
+    first = [(0.0, 1.0), (2.0, 1.0), (4.0, 1.0)]
+    final_preview_plan.render_with_plan("project-1", source_path, first, tmp_path / "first.mp4")
+    final_preview_plan.render_with_plan("project-1", source_path, first, tmp_path / "seeded.mp4")
+    plan_dir = final_preview_plan.preview_plan_dir("project-1")
+    kept_segments = sorted(path.name for path in plan_dir.glob("*.mp4"))
+
+    monkeypatch.setattr(final_preview_plan.media_render, "render_intervals", _FakeRenderer(fail=True))
+    with pytest.raises(RuntimeError):
+        final_preview_plan.render_with_plan("project-1", source_path, [(0.0, 1.0), (2.0, 9.0)], tmp_path / "x.mp4")
+
+    assert sorted(path.name for path in plan_dir.glob("*.mp4")) == kept_segments
+    monkeypatch.setattr(final_preview_plan.media_render, "render_intervals", renderer)
+    final_preview_plan.render_with_plan("project-1", source_path, first, tmp_path / "again.mp4")
+    assert renderer.encoded[-1] == []
+
+
+def test_unrelated_render_streams_instead_of_keeping_segments(plan_env):
+    renderer, source_path, tmp_path = plan_env
+    first = [(0.0, 1.0), (2.0, 1.0)]
+    final_preview_plan.render_with_plan("project-1", source_path, first, tmp_path / "first.mp4")
+    final_preview_plan.render_with_plan("project-1", source_path, first, tmp_path / "seeded.mp4")
+
+    manifest = final_preview_plan.render_with_plan(
+        "project-1", source_path, [(10.0, 1.0)], tmp_path / "unrelated.mp4"
+    )
+
+    assert renderer.streamed == [True, False, True]
+    assert manifest["reused_intervals"] == 0
+    assert not list(final_preview_plan.preview_plan_dir("project-1").glob("*.mp4"))
+
+
+def test_plan_budget_evicts_least_recently_rendered_plans(plan_env, monkeypatch):
+    _renderer, source_path, tmp_path = plan_env
+    intervals = [(0.0, 1.0), (2.0, 1.0)]
+    for project_id in ("old", "recent"):
+        for name in ("first", "seeded"):
+            final_preview_plan.render_with_plan(
+                project_id, source_path, intervals, tmp_path / f"{project_id}-{name}.mp4"
+            )
+    old_dir = final_preview_plan.preview_plan_dir("old")
+    for path in old_dir.iterdir():
+        os.utime(path, (1, 1))
+    monkeypatch.setattr(final_preview_plan.settings, "final_preview_plan_max_bytes", 1)
+
+    assert final_preview_plan.enforce_plan_budget(keep_project_id="recent") == 1
+    assert not old_dir.exists()
+    assert final_preview_plan.preview_plan_dir("recent").is_dir()
+
+
+def test_cached_review_segments_rebuilds_when_project_json_changes(plan_env):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"segments": [{"index": len(calls)}]}
+
+    first = final_preview_plan.cached_review_segments("project-1", "digest-v1", build)
+    again = final_preview_plan.cached_review_segments("project-1", "digest-v1", build)
+    changed = final_preview_plan.cached_review_segments("project-1", "digest-v2", build)
+
+    assert first == again == {"segments": [{"index": 1}]}
+    assert changed == {"segments": [{"index": 2}]}
+    assert len(calls) == 2
@@ -0,0 +1,227 @@
+import os
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.services import overlap_protection, overlap_speaker_mapping  # noqa: E402
+from eogum.services.interval_set import IntervalSet, overlap_pairs  # noqa: E402
+
+
+# Reference implementations: the scalar helpers IntervalSet replaced.
+
+
+def _reference_merge(ranges):
+    valid_ranges = sorted((start, end) for start, end in ranges if end > start)
+    if not valid_ranges:
+        return []
+    merged = []
+    current_start, current_end = valid_ranges[0]
+    for start, end in valid_ranges[1:]:
+        if start <= current_end:
+            current_end = max(current_end, end)
+            continue
+        merged.append((current_start, current_end))
+        current_start, current_end = start, end
+    merged.append((current_start, current_end))
+    return merged
+
+
+def _reference_subtract(start_ms, end_ms, protected_ranges):
+    pieces = []
+    cursor = start_ms
+    for protected_start, protected_end in protected_ranges:
+        if protected_end <= cursor:
+            continue
+        if protected_start >= end_ms:
+            break
+        if protected_start > cursor:
+            pieces.append((cursor, min(protected_start, end_ms)))
+        cursor = max(cursor, protected_end)
+        if cursor >= end_ms:
+            break
+    if cursor < end_ms:
+        pieces.append((cursor, end_ms))
+    return pieces
+
+
+def _reference_overlaps_any(start_ms, end_ms, ranges):
+    return any(range_start < end_ms and start_ms < range_end for range_start, range_end in ranges)
+
+
+def _reference_invert(removed_ranges, total_duration_ms):
+    keep_ranges = []
+    cursor = 0
+    for start_ms, end_ms in _reference_merge(removed_ranges):
+        start_ms = max(0, min(start_ms, total_duration_ms))
+        end_ms = max(0, min(end_ms, total_duration_ms))
+        if end_ms <= start_ms:
+            continue
+        if start_ms > cursor:
+            keep_ranges.append((cursor, start_ms))
+        cursor = max(cursor, end_ms)
+    if cursor < total_duration_ms:
+        keep_ranges.append((cursor, total_duration_ms))
+    return keep_ranges
+
+
+def _reference_infer_overlaps(turns):
+    events = []
+    for index, turn in enumerate(turns):
+        events.append((turn["start_ms"], 1, index))
+        events.append((turn["end_ms"], -1, index))
+    events.sort(key=lambda event: (event[0], event[1]))
+
+    active = set()
+    previous_time = None
+    overlaps = []
+    for current_time, kind, index in events:
+        if previous_time is not None and current_time > previous_time and len(active) >= 2:
+            speakers = sorted({str(turns[i]["speaker"]) for i in active if turns[i].get("speaker")})
+            overlaps.append(
+                overlap_protection._interval(previous_time / 1000.0, current_time / 1000.0, speakers=speakers)
+            )
+        if kind == -1:
+            active.discard(index)
+        else:
+            active.add(index)
+        previous_time = current_time
+    return _reference_merge_intervals(overlaps)
+
+
+def _reference_merge_intervals(intervals):
+    merged = []
+    for interval in sorted(intervals, key=lambda item: (item["start_ms"], item["end_ms"])):
+        if interval["end_ms"] <= interval["start_ms"]:
+            continue
+        models = set(interval.get("models") or [])
+        if not merged:
+            merged.append({**interval, "models": sorted(models)})
+            continue
+        previous = merged[-1]
+        previous_models = set(previous.get("models") or [])
+        if interval["start_ms"] <= previous["end_ms"]:
+            previous["end_ms"] = max(previous["end_ms"], interval["end_ms"])
+            previous["end"] = round(previous["end_ms"] / 1000.0, 3)
+            previous["duration_ms"] = previous["end_ms"] - previous["start_ms"]
+            previous["models"] = sorted(previous_models | models)
+            if interval.get("speakers"):
+                previous["speakers"] = sorted(set(previous.get("speakers") or []) | set(interval["speakers"]))
+        else:
+            merged.append({**interval, "models": sorted(models)})
+    return merged
+
+
+def _random_ranges(rng: random.Random, count: int, horizon: int = 2000, max_length: int = 120):
+    ranges = []
+    for _ in range(count):
+        start = rng.randrange(-50, horizon)
+        ranges.append((start, start + rng.randrange(-10, max_length)))
+    return ranges
+
+
+def test_interval_set_algebra_matches_scalar_helpers():
+    rng = random.Random(31)
+    for _ in range(300):
+        ranges = _random_ranges(rng, rng.randrange(0, 40))
+        protected = _random_ranges(rng, rng.randrange(0, 20))
+        merged = IntervalSet.from_ranges(ranges)
+        protected_set = IntervalSet.from_ranges(protected)
+        assert merged.to_list() == _reference_merge(ranges)
+
+        expected_subtract = _reference_merge([
+            piece
+            for start, end in ranges
+            if end > start
+            for piece in _reference_subtract(start, end, _reference_merge(protected))
+        ])
+        assert merged.subtract(protected_set).to_list() == expected_subtract
+
+        total = rng.randrange(-10, 2200)
+        assert merged.invert(0, total).to_list() == _reference_invert(ranges, total)
+
+        queries = [(start, end) for start, end in _random_ranges(rng, 50) if end > start]
+        assert merged.overlaps([start for start, _end in queries], [end for _start, end in queries]).tolist() == [
+            _reference_overlaps_any(start, end, _reference_merge(ranges)) for start, end in queries
+        ]
+
+        expected_intersection = _reference_merge([
+            (max(left_start, right_start), min(left_end, right_end))
+            for left_start, left_end in merged
+            for right_start, right_end in protected_set
+        ])
+        assert merged.intersect(protected_set).to_list() == expected_intersection
+
+
+def test_overlap_pairs_matches_brute_force_join():
+    rng = random.Random(3101)
+    for _ in range(200):
+        left = _random_ranges(rng, rng.randrange(0, 30))
+        right = _random_ranges(rng, rng.randrange(0, 30), max_length=rng.choice([20, 400]))
+        left_index, right_index = overlap_pairs(
+            np.array([start for start, _end in left], dtype=np.int64),
+            np.array([end for _start, end in left], dtype=np.int64),
+            np.array([start for start, _end in right], dtype=np.int64),
+            np.array([end for _start, end in right], dtype=np.int64),
+        )
+        expected = {
+            (i, j)
+            for i, (left_start, left_end) in enumerate(left)
+            for j, (right_start, right_end) in enumerate(right)
+            if left_start < left_end and right_start < right_end and right_start < left_end and left_start < right_end
+        }
+        assert set(zip(left_index.tolist(), right_index.tolist())) == expected
+        assert len(left_index) == len(expected)
+
+
+def test_overlap_inference_and_merge_match_scalar_sweep():
+    rng = random.Random(3102)
+    speakers = ["SPEAKER_00", "SPEAKER_01", "SPEAKER_02", None]
+    for _ in range(200):
+        turns = []
+        for start, end in _random_ranges(rng, rng.randrange(0, 25)):
+            if end > start:
+                turns.append({"start_ms": start, "end_ms": end, "speaker": rng.choice(speakers)})
+        turns.sort(key=lambda item: (item["start_ms"], item["end_ms"], item.get("speaker") or ""))
+        assert overlap_protection._infer_overlaps_from_turns(turns) == _reference_infer_overlaps(turns)
+
+        model_intervals = [
+            {
+                **overlap_protection._interval(start / 1000.0, end / 1000.0),
+                "models": [rng.choice(["community1", "other"])],
+                **({"speakers": [rng.choice(speakers[:3])]} if rng.random() < 0.5 else {}),
+            }
+            for start, end in _random_ranges(rng, rng.randrange(0, 25))
+        ]
+        assert overlap_protection._merge_intervals(model_intervals) == _reference_merge_intervals(model_intervals)
+
+
+def test_batched_speaker_mapping_matches_per_interval_scan():
+    rng = random.Random(3103)
+    for _ in range(100):
+        segments = [
+            {"start_ms": start, "end_ms": end, "speakers": [rng.choice(["a", "b", "c"])]}
+            for start, end in _random_ranges(rng, rng.randrange(0, 30))
+            if end > start
+        ]
+        intervals = [(start, end) for start, end in _random_ranges(rng, rng.randrange(0, 20)) if end > start]
+        expected = [
+            sorted({
+                speaker
+                for segment in segments
+                if segment["start_ms"] < end and segment["end_ms"] > start
+                for speaker in segment["speakers"]
+            })
+            for start, end in intervals
+        ]
+        assert overlap_speaker_mapping._mapped_speakers_for_intervals(intervals, segments) == expected
@@ -0,0 +1,132 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.auth import CurrentUser  # noqa: E402
+from eogum.routes import projects  # noqa: E402
+from eogum.services import database  # noqa: E402
+from eogum.services.job_events import JobEventBroker, job_event_broker  # noqa: E402
+
+
+class _FakeQuery:
+    def __init__(self, rows: list[dict], method: str = "GET"):
+        self.rows = rows
+        self.request = SimpleNamespace(http_method=method)
+        self.single_result = False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def update(self, values: dict):
+        return _FakeQuery([{**row, **values} for row in self.rows], "PATCH")
+
+    def single(self):
+        self.single_result = True
+        return self
+
+    def execute(self):
+        rows = [dict(row) for row in self.rows]
+        return SimpleNamespace(data=rows[0] if self.single_result else rows)
+
+
+class _FakeClient:
+    def __init__(self, jobs: list[dict]):
+        self.jobs = jobs
+
+    def table(self, name: str):
+        if name == "projects":
+            return _FakeQuery([{"id": "project-1", "user_id": "owner-1"}])
+        return _FakeQuery(self.jobs)
+
+
+def _job(**overrides) -> dict:
+    return {
+        "id": "job-1",
+        "project_id": "project-1",
+        "type": "subtitle_cut",
+        "status": "running",
+        "progress": 10,
+        "pipeline_stages": [],
+        "result_r2_keys": {"project_json": "private/key.json"},
+        **overrides,
+    }
+
+
+def test_subscription_coalesces_to_latest_state_per_job():
+    async def scenario():
+        broker = JobEventBroker()
+        subscription = broker.subscribe("project-1")
+        other = broker.subscribe("project-2")
+
+        publisher = threading.Thread(
+            target=lambda: [broker.publish_rows([_job(progress=progress)]) for progress in (20, 40, 60)]
+        )
+        publisher.start()
+        publisher.join()
+        await asyncio.sleep(0)
+
+        events = await subscription.next_events(timeout=1)
+        assert [(event["id"], event["progress"]) for event in events] == [("job-1", 60)]
+        assert "result_r2_keys" not in events[0]
+        assert await other.next_events(timeout=0.01) == []
+
+        broker.unsubscribe(subscription)
+        broker.unsubscribe(other)
+        assert broker.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_job_writes_through_the_shared_client_publish_events(monkeypatch):
+    received = []
+    monkeypatch.setattr(database, "_write_listeners", {"jobs": [received.extend]})
+    client = database.ResilientClient(_FakeClient([_job()]))
+
+    client.table("jobs").select("*").eq("id", "job-1").execute()
+    client.table("jobs").update({"progress": 55}).eq("id", "job-1").execute()
+
+    assert [row["progress"] for row in received] == [55]
+
+
+def test_event_stream_sends_snapshot_then_changes(monkeypatch):
+    fake = _FakeClient([_job()])
+    monkeypatch.setattr(projects, "get_db", lambda: database.ResilientClient(fake))
+    monkeypatch.setattr(projects.settings, "job_events_keepalive_seconds", 0.05)
+    owner = CurrentUser(id="owner-1", email=None, is_admin=False)
+
+    async def scenario():
+        response = await projects.stream_project_events("project-1", current_user=owner)
+        stream = response.body_iterator
+        snapshot = await anext(stream)
+
+        worker = threading.Thread(
+            target=lambda: database.ResilientClient(fake).table("jobs").update({"progress": 80}).execute()
+        )
+        worker.start()
+        worker.join()
+        change = await anext(stream)
+        while change.startswith(":"):
+            change = await anext(stream)
+        await stream.aclose()
+        return response, snapshot, change
+
+    response, snapshot, change = asyncio.run(scenario())
+
+    assert response.media_type == "text/event-stream"
+    assert snapshot.startswith("event: jobs\n")
+    assert change.startswith("event: job\n")
+    assert json.loads(change.split("data: ", 1)[1])["progress"] == 80
+    assert job_event_broker.stats()["subscribers"] == 0
@@ -94,3 +94,44 @@ def test_project_lane_can_run_multiple_workers(monkeypatch):
         _reset_scheduler()
 
     assert set(started) == {"project-1", "project-2"}
+
+
+def test_render_lane_prefers_regular_jobs_over_speculative_previews():
+    _reset_scheduler()
+    try:
+        with job_runner._lock:
+            job_runner._queues["final_preview"].extend([
+                {"kind": "speculative_final_preview", "project_id": "project-1", "job_id": "job-1"},
+                {"kind": "final_preview", "project_id": "project-2", "job_id": "job-2"},
+            ])
+            first = job_runner._pop_next_item("final_preview")
+            second = job_runner._pop_next_item("final_preview")
+    finally:
+        _reset_scheduler()
+
+    assert first["job_id"] == "job-2"
+    assert second["job_id"] == "job-1"
+
+
+def test_speculative_preview_is_skipped_while_render_lane_is_busy(monkeypatch):
+    _reset_scheduler()
+    monkeypatch.setattr(job_runner.settings, "final_preview_speculative_enabled", True)
+
+    class _Db:
+        def table(self, _name):
+            raise AssertionError("no job should be recorded")
+
+    try:
+        with job_runner._lock:
+            job_runner._running_lanes["final_preview"] = 1
+        job_runner._schedule_speculative_final_preview(
+            _Db(),
+            "project-1",
+            "owner-1",
+            "artifact-1",
+            {"project_json": "results/project-1/source.project.json"},
+        )
+        with job_runner._lock:
+            assert not job_runner._queues["final_preview"]
+    finally:
+        _reset_scheduler()
@@ -0,0 +1,217 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.services import media_render, source_derivatives  # noqa: E402
+
+
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="ffmpeg/ffprobe not installed",
+)
+
+
+def _psnr(distorted: Path, reference: Path) -> float:
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-i", str(distorted), "-i", str(reference), "-lavfi", "psnr", "-f", "null", "-"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    line = next(line for line in result.stderr.splitlines() if "PSNR" in line)
+    return float(line.split("average:")[1].split()[0])
+
+
+def test_interval_subtitles_are_clipped_and_rebased(tmp_path: Path):
+    srt_path = tmp_path / "source.srt"
+    srt_path.write_text(
+        "1\n00:00:00,500 --> 00:00:02,500\nfirst\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nsecond\nline\n\n"
+        "3\n00:00:09,000 --> 00:00:10,000\nlater\n",
+        encoding="utf-8",
+    )
+    cues = media_render.read_srt_cues(srt_path)
+    assert cues[1] == (3000, 4000, "second\nline")
+
+    output_path = tmp_path / "interval.srt"
+    assert media_render._write_interval_subtitles(cues, 2000, 5000, output_path)
+    assert media_render.read_srt_cues(output_path) == [
+        (0, 500, "first"),
+        (1000, 2000, "second\nline"),
+    ]
+    assert not media_render._write_interval_subtitles(cues, 5000, 8000, tmp_path / "empty.srt")
+
+
+def test_subtitles_join_the_web_profile_filter_chain():
+    args = media_render._encoding_args(
+        media_render.WEB_1080P_PROFILE,
+        has_audio=False,
+        target_video_bitrate=800_000,
+        video_filters=["subtitles=cues.srt"],
+    )
+
+    video_filter = args[args.index("-vf") + 1]
+    assert video_filter.startswith("scale=")
+    assert video_filter.endswith(",subtitles=cues.srt")
+
+
+@requires_ffmpeg
+def test_single_pass_burn_in_matches_two_pass_output(tmp_path: Path):
+    source_path = tmp_path / "source.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc2=duration=6:size=320x180:rate=24",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", str(source_path),
+        ],
+        check=True,
+    )
+    srt_path = tmp_path / "source.srt"
+    srt_path.write_text("1\n00:00:02,000 --> 00:00:04,500\nhello\n", encoding="utf-8")
+    intervals = [(1.0, 2.0), (3.5, 2.0)]
+
+    plain_path = tmp_path / "plain.mp4"
+    media_render.render_intervals(source_path, intervals, plain_path, profile=media_render.FINAL_PREVIEW_PROFILE)
+    preview_srt_path = tmp_path / "preview.srt"
+    preview_srt_path.write_text(
+        "1\n00:00:01,000 --> 00:00:02,000\nhello\n\n2\n00:00:02,000 --> 00:00:03,000\nhello\n",
+        encoding="utf-8",
+    )
+    two_pass_path = tmp_path / "two_pass.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", str(plain_path),
+            "-vf", f"subtitles={preview_srt_path}:charenc=UTF-8",
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "26", str(two_pass_path),
+        ],
+        check=True,
+    )
+
+    single_pass_path = tmp_path / "single_pass.mp4"
+    media_render.render_intervals(
+        source_path,
+        intervals,
+        single_pass_path,
+        profile=media_render.FINAL_PREVIEW_PROFILE,
+        subtitles_path=srt_path,
+    )
+
+    assert _psnr(single_pass_path, two_pass_path) > 35
+    assert _psnr(single_pass_path, two_pass_path) > _psnr(single_pass_path, plain_path)
+
+
+@requires_ffmpeg
+def test_streaming_render_muxes_intervals_into_one_file(tmp_path: Path):
+    source_path = tmp_path / "source.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc2=duration=6:size=320x180:rate=24",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=6:sample_rate=48000",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-c:a", "aac", "-shortest", str(source_path),
+        ],
+        check=True,
+    )
+    output_path = tmp_path / "streamed.mp4"
+    progress = []
+
+    manifest = media_render.render_intervals(
+        source_path,
+        [(0.5, 1.5), (3.0, 1.5)],
+        output_path,
+        profile=media_render.FINAL_PREVIEW_PROFILE,
+        progress_callback=progress.append,
+        streaming=True,
+    )
+
+    streams = json.loads(
+        subprocess.run(
+            ["ffprobe", "-v", "error", "-show_streams", "-show_format", "-of", "json", str(output_path)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    )
+    assert [stream["codec_type"] for stream in streams["streams"]] == ["video", "audio"]
+    assert streams["streams"][0]["codec_name"] == "h264"
+    assert streams["streams"][1]["codec_name"] == "aac"
+    assert float(streams["format"]["duration"]) * 1000 == pytest.approx(3000, abs=150)
+    assert [interval["preview_start_ms"] for interval in manifest["intervals"]] == [
+        0,
+        manifest["intervals"][0]["actual_duration_ms"],
+    ]
+    assert progress[-1] == 1
+    assert not list((tmp_path / "streamed_segments").glob("*.mp4"))
+
+
+def test_progress_duration_prefers_the_final_frame_count():
+    progress = "frame=48\nout_time_us=1900000\nprogress=continue\nframe=60\nout_time_us=1933333\nprogress=end\n"
+
+    assert media_render._progress_duration_ms(progress, 30.0) == 2000
+    assert media_render._progress_duration_ms(progress, None) == 1933
+    assert media_render._progress_duration_ms("progress=end\n", 30.0) is None
+
+
+def test_probe_cache_reuses_metadata_until_the_file_changes(monkeypatch, tmp_path: Path):
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"x" * 1000)
+    payload = {
+        "format": {"duration": "2.0"},
+        "streams": [{"codec_type": "video", "codec_name": "h264", "duration": "2.0", "avg_frame_rate": "24/1"}],
+    }
+    calls = []
+
+    def fake_run(*_args, **_kwargs):
+        calls.append(1)
+        return SimpleNamespace(stdout=json.dumps(payload))
+
+    monkeypatch.setattr(media_render, "_run", fake_run)
+    media_render.clear_probe_cache()
+
+    assert media_render.probe_media(source)["duration_ms"] == 2000
+    assert media_render.probe_duration_ms(source) == 2000
+    assert len(calls) == 1
+
+    source.write_bytes(b"y" * 2000)
+    media_render.probe_media(source)
+    assert len(calls) == 2
+
+
+def test_probe_cache_is_seeded_from_stored_media_info(monkeypatch, tmp_path: Path):
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"x" * 1000)
+    media_info_doc = {
+        "size_bytes": 1000,
+        "ffprobe": {
+            "format": {"duration": "3.5"},
+            "streams": [{"codec_type": "video", "codec_name": "h264", "duration": "3.5"}],
+        },
+    }
+    derived = {
+        "status": source_derivatives.READY_STATUS,
+        "media_info_version": source_derivatives.MEDIA_INFO_SCHEMA_VERSION,
+        "media_info_r2_key": "derived/source/media_info.json",
+        "audio_proxy_r2_key": "derived/source/audio_proxy.flac",
+    }
+    monkeypatch.setattr(source_derivatives.r2, "download_to_bytes", lambda _key: json.dumps(media_info_doc).encode())
+    monkeypatch.setattr(media_render, "_run", lambda *_args, **_kwargs: pytest.fail("unexpected ffprobe"))
+    media_render.clear_probe_cache()
+
+    assert source_derivatives.seed_probe_cache_from_media_info(source, derived)
+    assert media_render.probe_duration_ms(source) == 3500
+    assert not source_derivatives.seed_probe_cache_from_media_info(source, derived)
@@ -110,3 +110,45 @@ def test_overlap_interval_without_matching_segment_is_marked_unmapped():
     assert enriched_segments["segments"][0]["speaker_id"] == "speaker_0"
     assert summary["mapped_intervals"] == 0
     assert summary["enriched_segments"] == 0
+
+
+def test_enrichment_copies_only_touched_segments():
+    overlap_meta = {
+        "speaker_ids": ["speaker_0", "speaker_1"],
+        "overlap_intervals_ms": [{"start_ms": 1000, "end_ms": 1400}],
+    }
+    untouched = {"index": 1, "start_ms": 0, "end_ms": 800, "speaker_id": "speaker_0", "words": [{"text": "hi"}]}
+    touched = {"index": 2, "start_ms": 900, "end_ms": 1600, "speaker_id": "mixed", "overlap_protection": overlap_meta}
+    segments_payload = {"segments": [untouched, touched]}
+    overlap_payload = {"intervals": [{"start_ms": 1000, "end_ms": 1400, "speakers": ["SPEAKER_00"]}]}
+
+    enriched_overlap, enriched_segments, _summary = enrich_overlap_speaker_mapping(overlap_payload, segments_payload)
+
+    assert enriched_segments["segments"][0] is untouched
+    assert enriched_segments["segments"][1] is not touched
+    assert enriched_segments["segments"][1]["overlap_protection"]["mapped_speakers"] == ["speaker_0", "speaker_1"]
+    assert "mapped_speakers" not in overlap_meta
+    assert "mapped_speakers" not in overlap_meta["overlap_intervals_ms"][0]
+    assert segments_payload["segments"][1] is touched
+    assert "speaker_mapping" not in overlap_payload
+    assert enriched_overlap["intervals"][0]["pyannote_speakers"] == ["SPEAKER_00"]
+
+
+def test_long_segment_does_not_hide_short_neighbours():
+    segments = [{"index": 0, "start_ms": 0, "end_ms": 3_600_000, "speaker_id": "host"}]
+    segments += [
+        {"index": index, "start_ms": index * 1000, "end_ms": index * 1000 + 900, "speaker_id": f"speaker_{index % 3}"}
+        for index in range(1, 2000)
+    ]
+    intervals = [{"start_ms": 1_500_000 + offset, "end_ms": 1_500_500 + offset} for offset in (0, 200_000)]
+
+    enriched_overlap, _segments, summary = enrich_overlap_speaker_mapping(
+        {"intervals": intervals},
+        {"segments": segments},
+    )
+
+    assert [item["mapped_speakers"] for item in enriched_overlap["intervals"]] == [
+        ["host", "speaker_0"],
+        ["host", "speaker_2"],
+    ]
+    assert summary["mapped_intervals"] == 2
@@ -0,0 +1,231 @@
+import base64
+import json
+import os
+import re
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.auth import CurrentUser  # noqa: E402
+from eogum.pagination import decode_cursor, encode_cursor  # noqa: E402
+from eogum.routes import projects  # noqa: E402
+
+_KEYSET_FILTER = re.compile(
+    r'^created_at\.lt\."(?P<created_at>[^"]+)",and\(created_at\.eq\."(?P=created_at)",id\.lt\."(?P<id>[^"]+)"\)$'
+)
+
+
+class _FakeQuery:
+    """Just enough of the PostgREST builder for keyset reads."""
+
+    def __init__(self, db, table_name: str):
+        self.db = db
+        self.table_name = table_name
+        self.eq_filters = {}
+        self.keyset = None
+        self.orders = []
+        self.limit_value = None
+        self.single_result = False
+
+    def select(self, columns: str):
+        self.db.selects.append((self.table_name, columns))
+        return self
+
+    def eq(self, column: str, value):
+        self.eq_filters[column] = value
+        return self
+
+    def or_(self, expression: str):
+        match = _KEYSET_FILTER.match(expression)
+        assert match, expression
+        self.keyset = (match["created_at"], match["id"])
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, value: int):
+        self.limit_value = value
+        return self
+
+    def single(self):
+        self.single_result = True
+        return self
+
+    def execute(self):
+        rows = [
+            row for row in self.db.tables.get(self.table_name, [])
+            if all(row.get(column) == value for column, value in self.eq_filters.items())
+        ]
+        if self.keyset:
+            rows = [row for row in rows if (row["created_at"], row["id"]) < self.keyset]
+        for column, desc in reversed(self.orders):
+            rows.sort(key=lambda row: row[column], reverse=desc)
+        if self.limit_value is not None:
+            rows = rows[: self.limit_value]
+        if self.single_result:
+            return SimpleNamespace(data=rows[0] if rows else None)
+        return SimpleNamespace(data=rows)
+
+
+class _FakeDb:
+    def __init__(self, **tables):
+        self.tables = tables
+        self.selects = []
+
+    def table(self, name: str):
+        return _FakeQuery(self, name)
+
+
+def _request() -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/projects",
+        "headers": [],
+        "scheme": "http",
+        "server": ("testserver", 80),
+    })
+
+
+def _project(index: int, user_id: str = "user-1") -> dict:
+    return {
+        "id": str(uuid.UUID(int=index)),
+        "user_id": user_id,
+        "name": f"project {index}",
+        "status": "completed",
+        "cut_type": "subtitle_cut",
+        "language": "ko",
+        "source_filename": "source.mp4",
+        "source_duration_seconds": 60,
+        "source_sha256": "shared" if index % 10 == 0 else f"sha-{index}",
+        "settings": {"edit_intensity": "normal"},
+        # Several projects share a timestamp so the id tiebreaker matters.
+        "created_at": f"2026-06-{1 + index // 5:02d}T00:00:00+00:00",
+        "updated_at": "2026-07-01T00:00:00+00:00",
+    }
+
+
+def _user(user_id: str = "user-1") -> CurrentUser:
+    return CurrentUser(id=user_id, email="user@example.com", is_admin=False)
+
+
+def _list(db, monkeypatch, **params) -> dict:
+    monkeypatch.setattr(projects, "get_db", lambda: db)
+    response = projects.list_projects(_request(), current_user=_user(), **params)
+    return json.loads(response.body)
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    row = {"created_at": "2026-06-01T00:00:00+00:00", "id": str(uuid.UUID(int=7))}
+
+    assert decode_cursor(encode_cursor(row)) == (row["created_at"], row["id"])
+    wrong_types = base64.urlsafe_b64encode(json.dumps([row["created_at"], 5]).encode()).decode("ascii")
+    for cursor in ("not-a-cursor", encode_cursor({"created_at": 'x")', "id": row["id"]}), wrong_types):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+        assert exc_info.value.status_code == 400
+
+
+def test_list_projects_walks_every_page_once(monkeypatch):
+    rows = [_project(index) for index in range(120)] + [_project(500, user_id="user-2")]
+    db = _FakeDb(projects=rows)
+
+    seen = []
+    cursor = None
+    while True:
+        page = _list(db, monkeypatch, limit=50, cursor=cursor, source_sha256=None)
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    expected = sorted(rows[:120], key=lambda row: (row["created_at"], row["id"]), reverse=True)
+    assert seen == [row["id"] for row in expected]
+    assert all("project_json" not in columns for _, columns in db.selects)
+    assert page["items"][0]["settings"] == {"edit_intensity": "normal"}
+
+
+def test_list_projects_filters_by_source_hash(monkeypatch):
+    db = _FakeDb(projects=[_project(index) for index in range(30)])
+
+    page = _list(db, monkeypatch, limit=50, cursor=None, source_sha256="shared")
+
+    assert [item["name"] for item in page["items"]] == ["project 20", "project 10", "project 0"]
+    assert page["next_cursor"] is None
+
+
+def test_project_job_detail_is_sanitized_for_public_viewers(monkeypatch):
+    project = _project(1, user_id="owner")
+    job = {
+        "id": "job-1",
+        "project_id": project["id"],
+        "type": "subtitle_cut",
+        "status": "completed",
+        "progress": 100,
+        "error_message": None,
+        "started_at": None,
+        "completed_at": None,
+        "created_at": "2026-06-01T00:00:00+00:00",
+        "external_task_ids": {"cut": "task-1"},
+        "result_r2_keys": {"project_json": "private/key.json"},
+        "input_payload": {"source_r2_key": "private/source.mp4"},
+    }
+    db = _FakeDb(projects=[project], jobs=[job])
+    monkeypatch.setattr(projects, "get_db", lambda: db)
+    monkeypatch.setattr(projects, "is_public_project_id", lambda project_id: True)
+
+    owner_view = json.loads(projects.get_project_job(project["id"], "job-1", _request(), _user("owner")).body)
+    public_view = json.loads(projects.get_project_job(project["id"], "job-1", _request(), None).body)
+
+    assert owner_view["input_payload"] == {"source_r2_key": "private/source.mp4"}
+    assert public_view["input_payload"] is None
+    assert public_view["result_r2_keys"] is None
+    assert public_view["external_task_ids"] == {}
+    with pytest.raises(HTTPException) as exc_info:
+        projects.get_project_job(project["id"], "job-2", _request(), _user("owner"))
+    assert exc_info.value.status_code == 404
+
+
+def test_project_detail_lists_job_summaries_only(monkeypatch):
+    project = {**_project(1, user_id="owner"), "source_r2_key": "sources/a.mp4", "source_size_bytes": 10}
+    job = {
+        "id": "job-1",
+        "project_id": project["id"],
+        "type": "subtitle_cut",
+        "status": "completed",
+        "progress": 100,
+        "error_message": None,
+        "started_at": None,
+        "completed_at": None,
+        "created_at": "2026-06-01T00:00:00+00:00",
+        "pipeline_stages": [{"id": "transcribe", "status": "completed"}],
+        "processing_metadata": {"segmentation_label": "Full compact"},
+        "result_r2_keys": {"project_json": "private/key.json"},
+    }
+    db = _FakeDb(projects=[project], jobs=[job], edit_reports=[])
+    monkeypatch.setattr(projects, "get_db", lambda: db)
+
+    detail = json.loads(projects.get_project(project["id"], _request(), _user("owner")).body)
+
+    job_columns = [columns for table, columns in db.selects if table == "jobs"]
+    assert job_columns == [projects.JOB_SUMMARY_COLUMNS]
+    for heavy in ("pipeline_stages", "processing_metadata", "result_r2_keys", "input_payload"):
+        assert heavy not in job_columns[0]
+        assert heavy not in detail["jobs"][0]
+    assert detail["jobs"][0]["status"] == "completed"
@@ -0,0 +1,67 @@
+import json
+
+from eogum.services import project_document
+from eogum.services.project_document import ProjectDocument, load_project_document
+
+
+def _project_bytes(segment_count: int, *, duration_ms: int = 60_000) -> bytes:
+    return json.dumps({
+        "source_files": [{"id": "source", "info": {"duration_ms": duration_ms}}],
+        "tracks": [{"id": "source_video", "source_file_id": "source", "track_type": "video", "offset_ms": 0}],
+        "transcription": {
+            "segments": [
+                {
+                    "index": index + 1,
+                    "start_ms": index * 1000,
+                    "end_ms": index * 1000 + 800,
+                    "text": f" segment {index} ",
+                    "speaker": "speaker_0",
+                    "words": [{"text": "segment", "start_ms": index * 1000, "end_ms": index * 1000 + 400}],
+                }
+                for index in range(segment_count)
+            ],
+        },
+        "edit_decisions": [
+            {
+                "range": {"start_ms": "1000", "end_ms": 1800},
+                "edit_type": "cut",
+                "reason": "filler",
+                "source_segment_index": 2,
+            },
+        ],
+    }).encode()
+
+
+def test_document_keeps_compact_segment_and_decision_records():
+    document = ProjectDocument.from_bytes(_project_bytes(3))
+
+    assert [(segment.index, segment.start_ms, segment.end_ms, segment.text) for segment in document.segments] == [
+        (1, 0, 800, "segment 0"),
+        (2, 1000, 1800, "segment 1"),
+        (3, 2000, 2800, "segment 2"),
+    ]
+    assert not hasattr(document.segments[0], "__dict__")
+    assert document.edit_decisions[0].start_ms == 1000
+    assert document.primary_video_track()["id"] == "source_video"
+    assert document.max_source_file_duration_ms() == 60_000
+
+
+def test_documents_are_cached_per_artifact_contents(monkeypatch):
+    project_document.clear_project_document_cache()
+    parses = []
+    original_from_bytes = ProjectDocument.from_bytes.__func__
+
+    def counting_from_bytes(cls, raw: bytes) -> ProjectDocument:
+        parses.append(len(raw))
+        return original_from_bytes(cls, raw)
+
+    monkeypatch.setattr(ProjectDocument, "from_bytes", classmethod(counting_from_bytes))
+    first = load_project_document("results/project/project.avid.json", _project_bytes(3))
+
+    assert load_project_document("results/project/project.avid.json", _project_bytes(3)) is first
+    assert len(parses) == 1
+
+    rewritten = load_project_document("results/project/project.avid.json", _project_bytes(4))
+    assert rewritten is not first
+    assert len(rewritten.segments) == 4
+    assert len(parses) == 2
@@ -20,6 +20,13 @@ os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
 from eogum.auth import CurrentUser  # noqa: E402
 from eogum.models.schemas import FinalPreviewRequest  # noqa: E402
 from eogum.routes import evaluations  # noqa: E402
+from eogum.services import transcript_sidecar  # noqa: E402
+from eogum.services.request_db import RequestDb  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_preview_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(evaluations.settings, "final_preview_cache_dir", tmp_path / "final-previews")
 
 
 class _FakeQuery:
@@ -45,21 +52,27 @@ class _FakeQuery:
         self.insert_values = values
         return self
 
+    # Filters, order and limit on embedded resources are ignored: the fake
+    # never returns embeds, so RequestDb falls back to separate queries.
     def eq(self, column: str, value):
-        self.eq_filters[column] = value
+        if "." not in column:
+            self.eq_filters[column] = value
         return self
 
     def in_(self, column: str, values: list):
-        self.in_filters[column] = set(values)
+        if "." not in column:
+            self.in_filters[column] = set(values)
         return self
 
-    def order(self, column: str, desc: bool = False):
-        self.order_column = column
-        self.order_desc = desc
+    def order(self, column: str, desc: bool = False, foreign_table: str | None = None):
+        if foreign_table is None:
+            self.order_column = column
+            self.order_desc = desc
         return self
 
-    def limit(self, value: int):
-        self.limit_value = value
+    def limit(self, value: int, foreign_table: str | None = None):
+        if foreign_table is None:
+            self.limit_value = value
         return self
 
     def single(self):
@@ -289,7 +302,7 @@ def test_canonical_preview_overlays_only_saved_junction_repair_preference(monkey
         },
     )
 
-    payload = evaluations._canonical_final_preview_payload(db, "project-1", "owner-1")
+    payload = evaluations._canonical_final_preview_payload(RequestDb(db), "project-1", "owner-1")
 
     merged_repair = payload["segments"][0]["ai"]["junction_repair"]
     assert merged_repair["user_apply_junction_repair"] is False
@@ -323,7 +336,7 @@ def test_owner_final_preview_still_saves_requested_payload(monkeypatch):
     monkeypatch.setattr(
         evaluations,
         "_save_evaluation_payload",
-        lambda _db, _project_id, _user_id, payload: saved_payloads.append(payload),
+        lambda _db, _project_id, _user_id, payload: saved_payloads.append(payload) or SimpleNamespace(revision=4),
     )
     monkeypatch.setattr(evaluations, "enqueue_final_preview", lambda project_id, job_id: enqueued.append((project_id, job_id)))
 
@@ -341,7 +354,123 @@ def test_owner_final_preview_still_saves_requested_payload(monkeypatch):
     )
 
     assert response.status == "pending"
+    assert response.evaluation_revision == 4
     assert saved_payloads == [req.model_dump()]
     assert enqueued == [("project-1", "job-1")]
     assert db.inserted_jobs[0]["input_payload"] == req.model_dump()
     assert db.inserted_jobs[0]["result_r2_keys"]["preview_scope"] == "owner"
+
+
+def _cached_speculative_job(monkeypatch, tmp_path) -> dict:
+    monkeypatch.setattr(evaluations.settings, "final_preview_cache_dir", tmp_path)
+    hash_value = evaluations.ai_decision_preview_hash("results/project-1/source.project.json")
+    for path in evaluations.preview_cache_paths("project-1", hash_value):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"cached")
+    speculative_job = {
+        "id": "speculative-1",
+        "project_id": "project-1",
+        "user_id": "owner-1",
+        "type": "final_preview",
+        "status": "completed",
+        "progress": 100,
+        "result_r2_keys": {
+            "decision_hash": hash_value,
+            "cache_token": "token",
+            "duration_ms": 500,
+            "preview_kind": "speculative_ai",
+            "artifact_job_id": "artifact-1",
+        },
+        "created_at": "2026-06-30T00:00:01+00:00",
+    }
+    return speculative_job
+
+
+def test_unmodified_owner_preview_reuses_speculative_ai_render(monkeypatch, tmp_path):
+    speculative_job = _cached_speculative_job(monkeypatch, tmp_path)
+    db = _FakeDb(project=_project(), jobs=[_artifact_job(), speculative_job])
+    monkeypatch.setattr(evaluations, "get_db", lambda: db)
+    monkeypatch.setattr(evaluations, "_save_evaluation_payload", lambda *_args: SimpleNamespace(revision=1))
+    monkeypatch.setattr(evaluations, "enqueue_final_preview", lambda *_args: pytest.fail("unexpected render"))
+
+    response = evaluations.start_final_preview(
+        "project-1",
+        FinalPreviewRequest(segments=[_segment(1)]),
+        _request(),
+        current_user=CurrentUser(id="owner-1", email="owner@example.com", is_admin=False),
+    )
+
+    assert response.job_id == "speculative-1"
+    assert response.status == "completed"
+    assert response.evaluation_revision == 1
+    assert response.video_url is not None
+    assert db.inserted_jobs == []
+
+
+@pytest.mark.parametrize(
+    ("join_strategy", "reuses_speculative"),
+    [("engine-join", True), ("client-join", False)],
+)
+def test_owner_preview_metadata_must_match_base_to_reuse_speculative_render(
+    monkeypatch, tmp_path, join_strategy, reuses_speculative
+):
+    speculative_job = _cached_speculative_job(monkeypatch, tmp_path)
+    db = _FakeDb(project=_project(), jobs=[_artifact_job(), speculative_job])
+    enqueued = []
+    monkeypatch.setattr(evaluations, "get_db", lambda: db)
+    monkeypatch.setattr(evaluations, "_save_evaluation_payload", lambda *_args: SimpleNamespace(revision=1))
+    monkeypatch.setattr(evaluations, "enqueue_final_preview", lambda project_id, job_id: enqueued.append(job_id))
+    monkeypatch.setattr(
+        evaluations,
+        "_base_review_payload",
+        lambda *_args: {"join_strategy": "engine-join", "segments": [_segment(1)]},
+    )
+
+    response = evaluations.start_final_preview(
+        "project-1",
+        FinalPreviewRequest(join_strategy=join_strategy, segments=[_segment(1)]),
+        _request(),
+        current_user=CurrentUser(id="owner-1", email="owner@example.com", is_admin=False),
+    )
+
+    assert (response.job_id == "speculative-1") is reuses_speculative
+    assert bool(enqueued) is not reuses_speculative
+
+
+def test_review_segments_run_avid_once_and_warm_reads_skip_the_project_json(monkeypatch, tmp_path):
+    raw = _project_json_bytes()
+    project_json_path = tmp_path / "source.project.json"
+    project_json_path.write_bytes(raw)
+    storage = {
+        "results/project-1/source.project.json": raw,
+        "results/project-1/source.transcript.npz": transcript_sidecar.write_transcript_sidecar(
+            project_json_path
+        ).read_bytes(),
+    }
+    downloads = []
+    calls = []
+
+    def download(key):
+        downloads.append(key)
+        return storage[key]
+
+    def review_segments(path):
+        calls.append(path)
+        return {"schema_version": "review-segments/v1", "segments": [_segment(1)]}
+
+    monkeypatch.setattr(evaluations, "download_to_bytes", download)
+    monkeypatch.setattr(transcript_sidecar.r2, "download_to_bytes", download)
+    monkeypatch.setattr(evaluations.avid, "review_segments", review_segments)
+    r2_keys = {
+        "project_json": "results/project-1/source.project.json",
+        "transcript_sidecar": "results/project-1/source.transcript.npz",
+    }
+
+    first = evaluations._review_segments_payload("project-1", r2_keys)
+    downloads.clear()
+    second = evaluations._review_segments_payload("project-1", r2_keys)
+
+    assert len(calls) == 1
+    assert first == second
+    assert second["source_duration_ms"] == 10_000
+    assert downloads == ["results/project-1/source.transcript.npz"]
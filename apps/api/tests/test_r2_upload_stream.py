@@ -0,0 +1,109 @@
+import hashlib
+import io
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.services import r2  # noqa: E402
+
+
+class _TrickleStream(io.RawIOBase):
+    """Returns short reads, like a pipe."""
+
+    def __init__(self, data: bytes, max_read: int):
+        self._data = io.BytesIO(data)
+        self._max_read = max_read
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return self._data.read(min(size, self._max_read))
+
+
+class _MultipartClient:
+    def __init__(self, fail_part: int | None = None):
+        self.fail_part = fail_part
+        self.parts: dict[int, bytes] = {}
+        self.completed = None
+        self.aborted = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, **kwargs):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, *, PartNumber, Body, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if PartNumber == self.fail_part:
+                raise RuntimeError("part rejected")
+            self.parts[PartNumber] = Body
+            return {"ETag": f"etag-{PartNumber}"}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def complete_multipart_upload(self, *, MultipartUpload, **kwargs):
+        self.completed = MultipartUpload["Parts"]
+
+    def abort_multipart_upload(self, **kwargs):
+        self.aborted = True
+
+
+def test_stream_is_uploaded_in_equal_parts_with_size_and_hash(monkeypatch):
+    client = _MultipartClient()
+    monkeypatch.setattr(r2, "get_r2_client", lambda: client)
+    data = os.urandom(10 * 1024 + 123)
+    progress = []
+
+    size, sha256 = r2.upload_stream(
+        _TrickleStream(data, max_read=700),
+        "sources/a.mp4",
+        part_size=1024,
+        max_in_flight=2,
+        on_progress=progress.append,
+    )
+
+    assert (size, sha256) == (len(data), hashlib.sha256(data).hexdigest())
+    assert [len(client.parts[number]) for number in sorted(client.parts)] == [1024] * 10 + [123]
+    assert b"".join(client.parts[number] for number in sorted(client.parts)) == data
+    assert client.completed == [{"PartNumber": n, "ETag": f"etag-{n}"} for n in range(1, 12)]
+    assert client.max_in_flight <= 2
+    assert progress[-1] == len(data)
+
+
+def test_failed_part_aborts_the_upload(monkeypatch):
+    client = _MultipartClient(fail_part=2)
+    monkeypatch.setattr(r2, "get_r2_client", lambda: client)
+
+    with pytest.raises(RuntimeError, match="part rejected"):
+        r2.upload_stream(io.BytesIO(b"x" * 5000), "sources/a.mp4", part_size=1024)
+
+    assert client.aborted is True
+    assert client.completed is None
+
+
+def test_empty_stream_is_rejected(monkeypatch):
+    client = _MultipartClient()
+    monkeypatch.setattr(r2, "get_r2_client", lambda: client)
+
+    with pytest.raises(ValueError):
+        r2.upload_stream(io.BytesIO(b""), "sources/a.mp4", part_size=1024)
+
+    assert client.aborted is True
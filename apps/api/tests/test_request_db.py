@@ -0,0 +1,225 @@
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.auth import CurrentUser  # noqa: E402
+from eogum.main import app  # noqa: E402
+from eogum.routes import evaluations  # noqa: E402
+from eogum.services.request_db import RequestDb, track_round_trips  # noqa: E402
+
+
+class _FakeQuery:
+    """PostgREST builder fake that answers embedded selects on ``projects``."""
+
+    def __init__(self, db, table_name: str):
+        self.db = db
+        self.table_name = table_name
+        self.select_value = "*"
+        self.filters = []
+        self.order_column = None
+        self.order_desc = False
+        self.limit_value = None
+
+    def select(self, value: str):
+        self.select_value = value
+        return self
+
+    def eq(self, column: str, value):
+        if "." not in column:
+            self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column: str, values: list):
+        if "." not in column:
+            self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def gt(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) > value)
+        return self
+
+    def lte(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) <= value)
+        return self
+
+    def order(self, column: str, desc: bool = False, foreign_table: str | None = None):
+        if foreign_table is None:
+            self.order_column = column
+            self.order_desc = desc
+        return self
+
+    def limit(self, value: int, foreign_table: str | None = None):
+        if foreign_table is None:
+            self.limit_value = value
+        return self
+
+    def execute(self):
+        self.db.queries.append((self.table_name, self.select_value))
+        rows = [dict(row) for row in self.db.tables.get(self.table_name, []) if all(f(row) for f in self.filters)]
+        if self.order_column:
+            rows.sort(key=lambda row: row[self.order_column], reverse=self.order_desc)
+        if self.limit_value is not None:
+            rows = rows[: self.limit_value]
+        if self.table_name == "projects":
+            rows = [self._with_embeds(row) for row in rows]
+        return SimpleNamespace(data=rows)
+
+    def _with_embeds(self, row: dict) -> dict:
+        if "artifact_jobs:jobs(" in self.select_value:
+            jobs = sorted(self.db.tables["jobs"], key=lambda job: job["created_at"], reverse=True)
+            row["artifact_jobs"] = [dict(job) for job in jobs if job["status"] == "completed"][:1]
+        if "evaluations(" in self.select_value:
+            row["evaluations"] = [
+                {
+                    **evaluation,
+                    "evaluation_deltas": [
+                        delta for delta in self.db.tables["evaluation_deltas"]
+                        if delta["evaluation_id"] == evaluation["id"]
+                    ],
+                }
+                for evaluation in self.db.tables["evaluations"]
+            ]
+        return row
+
+
+class _FakeDb:
+    def __init__(self, *, job_user_id: str = "owner-1"):
+        self.queries = []
+        self.tables = {
+            "projects": [{"id": "project-1", "user_id": "owner-1", "source_duration_seconds": 10}],
+            "jobs": [
+                {
+                    "id": "job-1",
+                    "project_id": "project-1",
+                    "user_id": job_user_id,
+                    "type": "podcast_cut",
+                    "status": "completed",
+                    "created_at": "2026-06-30T00:00:00+00:00",
+                    "result_r2_keys": {"project_json": "results/project-1/source.project.json"},
+                },
+            ],
+            "evaluations": [
+                {
+                    "id": "eval-1",
+                    "project_id": "project-1",
+                    "evaluator_id": "owner-1",
+                    "version": "1.0",
+                    "revision": 2,
+                    "snapshot_revision": 0,
+                    "segments": {"segments": [
+                        {"index": 1, "start_ms": 0, "end_ms": 900, "text": "one", "human": None},
+                        {"index": 2, "start_ms": 1000, "end_ms": 1900, "text": "two", "human": None},
+                    ]},
+                    "created_at": "2026-06-30T00:00:00+00:00",
+                    "updated_at": "2026-06-30T00:00:00+00:00",
+                },
+            ],
+            "evaluation_deltas": [
+                {"evaluation_id": "eval-1", "revision": 1, "changes": [{"index": 1, "human": _human("cut")}]},
+                {"evaluation_id": "eval-1", "revision": 2, "changes": [{"index": 2, "human": _human("keep")}]},
+            ],
+        }
+
+    def table(self, name: str):
+        return _FakeQuery(self, name)
+
+
+def _human(action: str) -> dict:
+    return {"action": action, "reason": "reviewer", "note": ""}
+
+
+def _owner() -> CurrentUser:
+    return CurrentUser(id="owner-1", email="owner@example.com", is_admin=False)
+
+
+def _request() -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/projects/project-1/evaluation",
+        "headers": [],
+        "scheme": "http",
+        "server": ("testserver", 80),
+    })
+
+
+def test_completed_job_lookup_is_one_embedded_query_and_memoized():
+    db = RequestDb(_FakeDb())
+
+    r2_keys, project = evaluations._get_completed_job(db, "project-1", _owner())
+    assert r2_keys == {"project_json": "results/project-1/source.project.json"}
+
+    assert db.latest_artifact_job("project-1", project["user_id"])["id"] == "job-1"
+    assert db.project("project-1", "id, user_id")["user_id"] == "owner-1"
+    assert db.round_trips == 1
+
+
+def test_project_is_refetched_only_for_missing_columns():
+    fake = _FakeDb()
+    db = RequestDb(fake)
+
+    db.project("project-1", "id, user_id")
+    db.project("project-1", "user_id")
+    db.project("project-1", "id, source_duration_seconds")
+
+    assert db.round_trips == 2
+    assert fake.queries[-1] == ("projects", "id, user_id, source_duration_seconds")
+
+
+def test_artifact_job_of_another_user_falls_back_to_owner_query():
+    db = RequestDb(_FakeDb(job_user_id="someone-else"))
+
+    db.project("project-1", "id, user_id", with_artifact_job=True)
+
+    assert db.latest_artifact_job("project-1", "owner-1") is None
+    assert db.round_trips == 2
+
+
+def test_get_evaluation_replays_embedded_deltas_in_one_round_trip(monkeypatch):
+    fake = _FakeDb()
+    monkeypatch.setattr(evaluations, "get_db", lambda: fake)
+
+    with track_round_trips() as counter:
+        response = evaluations.get_evaluation("project-1", _request(), current_user=_owner())
+
+    assert counter.count == 1
+    body = json.loads(response.body)
+    assert [segment["human"] for segment in body["segments"]] == [_human("cut"), _human("keep")]
+    assert body["revision"] == 2
+
+
+def test_get_evaluation_normalizes_stored_rows_through_the_response_model(monkeypatch):
+    fake = _FakeDb()
+    row = fake.tables["evaluations"][0]
+    row.update({"id": "eval-legacy", "revision": 0})
+    row["segments"]["segments"][0]["start_ms"] = "0"
+    monkeypatch.setattr(evaluations, "get_db", lambda: fake)
+
+    body = json.loads(evaluations.get_evaluation("project-1", _request(), current_user=_owner()).body)
+
+    assert body["segments"][0]["start_ms"] == 0
+
+
+def test_api_reports_round_trips_per_request(monkeypatch):
+    fake = _FakeDb()
+    monkeypatch.setattr(evaluations, "get_db", lambda: fake)
+    monkeypatch.setattr(evaluations, "is_public_project_id", lambda project_id: True)
+
+    response = TestClient(app).get("/api/v1/projects/project-1/evaluation")
+
+    assert response.status_code == 200
+    assert response.headers["x-db-round-trips"] == "1"
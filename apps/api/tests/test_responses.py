@@ -0,0 +1,125 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.models.schemas import SegmentsResponse  # noqa: E402
+from eogum.responses import cached_json_body, clear_response_body_cache, encode_json, json_response  # noqa: E402
+
+
+def _payload(segment_count: int) -> dict:
+    return {
+        "schema_version": "review-segments/v1",
+        "source_duration_ms": segment_count * 1000,
+        "segments": [
+            {
+                "index": index + 1,
+                "start_ms": index * 1000,
+                "end_ms": index * 1000 + 900,
+                "text": "안녕하세요 오늘은 편집 테스트를 합니다",
+                "ai": {"action": "keep", "reason": "", "confidence": 0.9},
+                "human": None,
+            }
+            for index in range(segment_count)
+        ],
+    }
+
+
+def _client(payload: dict) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/segments", response_model=SegmentsResponse)
+    def segments(request: Request):
+        return json_response(request, payload, SegmentsResponse)
+
+    @app.get("/reference", response_model=SegmentsResponse)
+    def reference():
+        return payload
+
+    return TestClient(app)
+
+
+def test_fast_path_matches_response_model_serialization():
+    client = _client(_payload(3))
+
+    fast = client.get("/segments", headers={"Accept-Encoding": "identity"})
+    reference = client.get("/reference", headers={"Accept-Encoding": "identity"})
+
+    assert fast.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == reference.json()
+
+
+def test_unchanged_payload_revalidates_with_304():
+    client = _client(_payload(3))
+
+    first = client.get("/segments", headers={"Accept-Encoding": "identity"})
+    second = client.get(
+        "/segments",
+        headers={"Accept-Encoding": "identity", "If-None-Match": first.headers["etag"]},
+    )
+
+    assert first.headers["etag"].startswith('"') and first.headers["etag"].endswith('"')
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
+
+
+def test_large_payload_is_gzipped_with_its_own_etag():
+    payload = _payload(200)
+    client = _client(payload)
+
+    response = client.get("/segments", headers={"Accept-Encoding": "gzip"})
+    raw = client.get("/segments", headers={"Accept-Encoding": "identity"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(raw.content)
+    assert response.json() == raw.json()
+    assert response.headers["etag"] != raw.headers["etag"]
+    not_modified = client.get(
+        "/segments",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f'W/{response.headers["etag"]}'},
+    )
+    assert not_modified.status_code == 304
+
+
+def test_small_payload_is_not_compressed():
+    client = _client(_payload(1))
+
+    response = client.get("/segments", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_prevalidated_dicts_encode_without_the_model():
+    payload = _payload(2)
+
+    assert json.loads(encode_json(payload)) == payload
+    assert json.loads(encode_json(payload, SegmentsResponse))["segments"][0]["speaker"] is None
+
+
+def test_cached_json_body_builds_once_per_key():
+    clear_response_body_cache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return b"{}"
+
+    assert cached_json_body(("segments", "a", "digest"), build) == b"{}"
+    assert cached_json_body(("segments", "a", "digest"), build) == b"{}"
+    cached_json_body(("segments", "a", "other"), build)
+    assert len(calls) == 2
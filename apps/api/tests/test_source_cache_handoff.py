@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.services import final_preview_cache, job_runner  # noqa: E402
+
+
+def test_initial_download_leaves_a_warm_cache_entry(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(final_preview_cache.settings, "source_cache_dir", tmp_path / "sources")
+    downloads = []
+
+    def fake_download(r2_key: str, local_path: str) -> None:
+        downloads.append(r2_key)
+        Path(local_path).write_bytes(b"source-bytes")
+
+    monkeypatch.setattr(job_runner.r2, "download_file", fake_download)
+    job_dir = tmp_path / "project-1"
+    job_dir.mkdir()
+    job_runner._download_source_via_cache("sources/user/source.mp4", job_dir / "source.mp4")
+    (job_dir / "source.mp4").unlink()
+
+    project = {"source_r2_key": "sources/user/source.mp4", "source_filename": "source.mp4"}
+    cached_path = job_runner._get_cached_source_video(project, tmp_path)
+
+    assert cached_path.read_bytes() == b"source-bytes"
+    assert downloads == ["sources/user/source.mp4"]
+
+    job_runner._download_source_via_cache("sources/user/source.mp4", tmp_path / "rerun" / "source.mp4")
+    assert downloads == ["sources/user/source.mp4"]
+
+
+def test_source_cache_budget_evicts_idle_entries_first(monkeypatch, tmp_path: Path):
+    cache_dir = tmp_path / "sources"
+    cache_dir.mkdir()
+    monkeypatch.setattr(final_preview_cache.settings, "source_cache_dir", cache_dir)
+    monkeypatch.setattr(final_preview_cache.settings, "source_cache_max_bytes", 25)
+    now = time.time()
+    old_idle = cache_dir / "old.mp4"
+    newer_idle = cache_dir / "newer.mp4"
+    in_use = cache_dir / "in-use.mp4"
+    for path, age in ((old_idle, 10 * 3600), (newer_idle, 5 * 3600), (in_use, 60)):
+        path.write_bytes(b"x" * 10)
+        os.utime(path, (now - age, now - age))
+
+    assert final_preview_cache.enforce_source_cache_budget() == 1
+
+    assert not old_idle.exists()
+    assert newer_idle.exists()
+    assert in_use.exists()
@@ -0,0 +1,77 @@
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.auth import get_user_id  # noqa: E402
+from eogum.main import app  # noqa: E402
+from eogum.routes import sources  # noqa: E402
+from eogum.services import source_cache  # noqa: E402
+
+
+BLOCK = source_cache.FINGERPRINT_BLOCK_BYTES
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.write_bytes(data)
+    return path
+
+
+def test_small_files_are_fingerprinted_whole(tmp_path):
+    data = os.urandom(4096)
+    expected = hashlib.sha256(b"fp1:4096:" + data).hexdigest()
+
+    assert source_cache.sample_fingerprint_file(_write(tmp_path / "a.bin", data)) == f"fp1:{expected}"
+    assert source_cache.fingerprint_ranges(4096) == [(0, 4096)]
+
+
+def test_large_files_read_only_head_tail_and_strided_blocks(tmp_path):
+    size = BLOCK * 40 + 17
+    ranges = source_cache.fingerprint_ranges(size)
+
+    assert len(ranges) == source_cache.FINGERPRINT_STRIDED_BLOCKS + 2
+    assert ranges[0] == (0, BLOCK) and ranges[-1] == (size - BLOCK, BLOCK)
+    assert [offset for offset, _ in ranges] == sorted(offset for offset, _ in ranges)
+    assert sum(length for _, length in ranges) == 18 * BLOCK
+
+    data = bytearray(os.urandom(size))
+    original = source_cache.sample_fingerprint_file(_write(tmp_path / "a.bin", bytes(data)))
+    sampled_offset = ranges[5][0] + 10
+    data[sampled_offset] ^= 0xFF
+    assert source_cache.sample_fingerprint_file(_write(tmp_path / "b.bin", bytes(data))) != original
+    assert source_cache.sample_fingerprint_file(_write(tmp_path / "c.bin", bytes(data[:-1]))) != original
+
+
+def test_lookup_by_fingerprint_returns_the_authoritative_sha(monkeypatch):
+    queries = []
+
+    def lookup_by_fingerprint(db, *, fingerprint, size_bytes):
+        queries.append((fingerprint, size_bytes))
+        return {"id": "asset-1", "r2_key": "sources/a.mp4", "sha256": "abc"}
+
+    monkeypatch.setattr(sources, "get_db", lambda: object())
+    monkeypatch.setattr(sources, "lookup_source_asset_by_fingerprint", lookup_by_fingerprint)
+    monkeypatch.setattr(sources, "object_exists", lambda key: True)
+    monkeypatch.setattr(sources, "touch_source_asset", lambda db, asset_id: None)
+    app.dependency_overrides[get_user_id] = lambda: "user-1"
+    try:
+        client = TestClient(app)
+        hit = client.post("/api/v1/sources/lookup", json={"fingerprint": "fp1:xyz", "size_bytes": 10})
+        missing = client.post("/api/v1/sources/lookup", json={"size_bytes": 10})
+    finally:
+        app.dependency_overrides.pop(get_user_id, None)
+
+    assert hit.json() == {"hit": True, "r2_key": "sources/a.mp4", "source_asset_id": "asset-1", "sha256": "abc"}
+    assert queries == [("fp1:xyz", 10)]
+    assert missing.status_code == 400
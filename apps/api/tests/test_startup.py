@@ -0,0 +1,105 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum import main, startup  # noqa: E402
+from eogum.routes import health  # noqa: E402
+from eogum.services import job_runner, youtube  # noqa: E402
+
+# Deferred until first use; importing any of them at startup is a regression.
+HEAVY_MODULES = ("boto3", "botocore", "supabase", "postgrest", "resend", "jwt", "cryptography", "uvicorn", "torch")
+# Generous for slow CI runners; importing eogum.main takes well under a second locally.
+IMPORT_BUDGET_SECONDS = float(os.environ.get("EOGUM_STARTUP_IMPORT_BUDGET_SECONDS", "2.5"))
+
+_MEASURE_IMPORT = """
+import json, sys, time
+started = time.perf_counter()
+import eogum.main
+print(json.dumps({
+    "seconds": time.perf_counter() - started,
+    "heavy": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def _measure_import() -> dict:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    output = subprocess.run(
+        [sys.executable, "-c", _MEASURE_IMPORT],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_app_import_is_fast_and_defers_heavy_modules():
+    runs = [_measure_import() for _ in range(2)]
+
+    assert runs[0]["heavy"] == []
+    assert min(run["seconds"] for run in runs) < IMPORT_BUDGET_SECONDS, runs
+
+
+def test_app_serves_while_recovery_runs_in_background(monkeypatch):
+    state = startup.StartupState()
+    release = threading.Event()
+    recovered = []
+
+    def slow_recovery(*, recover_running: bool) -> int:
+        release.wait(5)
+        recovered.append(recover_running)
+        return 1
+
+    def failing_recovery(*, recover_running: bool) -> int:
+        raise RuntimeError("table scan failed")
+
+    monkeypatch.setattr(job_runner, "recover_stuck_projects", slow_recovery)
+    monkeypatch.setattr(job_runner, "recover_stuck_final_previews", failing_recovery)
+    monkeypatch.setattr(job_runner, "recover_stuck_ai_cut_renders", lambda *, recover_running: 0)
+    monkeypatch.setattr(job_runner, "recover_stuck_source_derivatives", lambda *, recover_running: 0)
+    monkeypatch.setattr(youtube, "recover_stuck_downloads", lambda *, recover_running: 0)
+    monkeypatch.setattr(job_runner, "start_stuck_project_sweeper", lambda interval_seconds: threading.Event())
+    monkeypatch.setattr(main, "start_jwks_refresher", threading.Event)
+    monkeypatch.setattr(main, "start_storage_gc", threading.Event)
+    monkeypatch.setattr(main, "startup_state", state)
+    monkeypatch.setattr(health, "startup_state", state)
+    threads = []
+    monkeypatch.setattr(main, "start_startup_recovery", lambda: threads.append(startup.start_startup_recovery(state)))
+
+    with TestClient(main.app) as client:
+        body = client.get("/api/v1/health").json()
+        assert body["ready"] is False
+        assert body["startup"]["phase"] == "recovering"
+        assert client.get("/api/v1/health/ready").status_code == 503
+
+        release.set()
+        threads[0].join(5)
+
+        assert client.get("/api/v1/health/ready").status_code == 200
+        snapshot = client.get("/api/v1/health").json()["startup"]
+
+    assert recovered == [True]
+    assert snapshot["phase"] == "ready"
+    assert snapshot["recovered"] == {
+        "projects": 1,
+        "ai_cut_renders": 0,
+        "source_derivatives": 0,
+        "youtube_downloads": 0,
+    }
+    assert snapshot["failed_steps"] == ["final_previews"]
@@ -0,0 +1,297 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.services import storage_gc  # noqa: E402
+
+
+OLD = datetime.now(timezone.utc) - timedelta(days=3)
+NEW = datetime.now(timezone.utc)
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.action = "select"
+        self.payload = None
+        self.filters = []
+        self.order_by = None
+        self.max_rows = None
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def upsert(self, rows, on_conflict):
+        self.action, self.payload = "upsert", rows
+        return self
+
+    def update(self, payload):
+        self.action, self.payload = "update", payload
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(lambda row: str(row.get(column, "")) <= value)
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: str(row.get(column, "")) > value)
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and str(row[column]) >= value)
+        return self
+
+    def order(self, column, **kwargs):
+        self.order_by = column
+        return self
+
+    def limit(self, count):
+        self.max_rows = count
+        return self
+
+    def execute(self):
+        rows = self.db.tables.setdefault(self.table, [])
+        if self.action == "upsert":
+            for payload in self.payload:
+                existing = next((row for row in rows if row["r2_key"] == payload["r2_key"]), None)
+                if existing:
+                    existing.update(payload)
+                else:
+                    rows.append({"id": f"q{len(rows) + 1}", **payload, "not_before": "0"})
+            return _Result(self.payload)
+        matched = [row for row in rows if all(check(row) for check in self.filters)]
+        if self.action == "update":
+            for row in matched:
+                row.update(self.payload)
+        elif self.action == "delete":
+            self.db.tables[self.table] = [row for row in rows if row not in matched]
+        if self.order_by:
+            matched.sort(key=lambda row: str(row.get(self.order_by, "")))
+        if self.max_rows is not None:
+            matched = matched[: self.max_rows]
+        return _Result([dict(row) for row in matched])
+
+
+class _DB:
+    def __init__(self, **tables):
+        self.tables = {name: list(rows) for name, rows in tables.items()}
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+@pytest.fixture(autouse=True)
+def _settings(monkeypatch):
+    monkeypatch.setattr(storage_gc.settings, "storage_gc_delete_batch_size", 2)
+    monkeypatch.setattr(storage_gc.settings, "storage_gc_max_deletes_per_minute", 120)
+    monkeypatch.setattr(storage_gc.settings, "storage_gc_max_attempts", 2)
+
+
+def test_queue_drains_in_paced_batches_and_skips_sources_in_use(monkeypatch):
+    db = _DB(projects=[{"id": "p2", "source_r2_key": "sources/shared.mp4"}])
+    deleted, sleeps = [], []
+    monkeypatch.setattr(storage_gc.r2, "delete_objects", lambda keys: deleted.append(list(keys)) or {})
+
+    keys = ["results/p1/a.json", "results/p1/b.srt", "sources/shared.mp4", "results/p1/c.mp4", "results/p1/a.json"]
+    assert storage_gc.enqueue_deletions(db, keys, reason="project_delete", project_id="p1") == 4
+
+    result = storage_gc.drain_deletion_queue(db, sleep=sleeps.append)
+
+    assert deleted == [["results/p1/a.json", "results/p1/b.srt"], ["results/p1/c.mp4"]]
+    assert result == {"deleted": 3, "skipped_in_use": 1, "failed": 0, "batches": 2}
+    assert sleeps == [1.0, 1.0]  # 2 keys per batch at 120 keys per minute
+    assert db.tables["r2_deletion_queue"] == []
+
+
+def test_failed_batches_back_off_then_give_up(monkeypatch):
+    db = _DB()
+
+    def fail(keys):
+        raise RuntimeError("R2 unavailable")
+
+    monkeypatch.setattr(storage_gc.r2, "delete_objects", fail)
+    storage_gc.enqueue_deletions(db, ["results/p1/a.json"], reason="project_delete")
+
+    assert storage_gc.drain_deletion_queue(db)["failed"] == 1
+    row = db.tables["r2_deletion_queue"][0]
+    assert (row["status"], row["attempts"], row["last_error"]) == ("pending", 1, "R2 unavailable")
+    assert row["not_before"] > datetime.now(timezone.utc).isoformat()
+
+    row["not_before"] = "0"
+    storage_gc.drain_deletion_queue(db)
+    assert db.tables["r2_deletion_queue"][0]["status"] == "failed"
+
+
+def test_r2_refusals_are_deferred_and_the_rest_deleted(monkeypatch):
+    db = _DB()
+    monkeypatch.setattr(
+        storage_gc.r2,
+        "delete_objects",
+        lambda keys: {"results/p1/b.srt": "AccessDenied: Access Denied"},
+    )
+    storage_gc.enqueue_deletions(db, ["results/p1/a.json", "results/p1/b.srt"], reason="project_delete")
+
+    result = storage_gc.drain_deletion_queue(db)
+
+    assert (result["deleted"], result["failed"]) == (1, 1)
+    [row] = db.tables["r2_deletion_queue"]
+    assert (row["r2_key"], row["attempts"], row["last_error"]) == ("results/p1/b.srt", 1, "AccessDenied: Access Denied")
+
+
+def test_queued_orphans_are_rechecked_against_rows_changed_since_the_scan(monkeypatch):
+    monkeypatch.setattr(storage_gc.settings, "storage_gc_delete_batch_size", 10)
+    db = _DB(
+        jobs=[{"id": "j1", "processing_metadata": {}, "created_at": OLD.isoformat(), "completed_at": None}],
+        source_assets=[],
+    )
+    deleted = []
+    monkeypatch.setattr(storage_gc.r2, "delete_objects", lambda keys: deleted.extend(keys) or {})
+    storage_gc.enqueue_deletions(
+        db,
+        [
+            "results/p1/renders/x/main.mp4",
+            "results/p1/renders/x/main.mp4.part",
+            "derived/sources/a/media_info.json",
+        ],
+        reason="orphan",
+        scanned_at=(NEW - timedelta(minutes=1)).isoformat(),
+    )
+    # A render finished and a source asset was probed after the reconciler scanned.
+    db.tables["jobs"][0].update(
+        processing_metadata={"output_r2_key": "results/p1/renders/x/main.mp4"},
+        completed_at=datetime.now(timezone.utc).isoformat(),
+    )
+    db.tables["source_assets"].append({"id": "a1", "media_info_r2_key": "derived/sources/a/media_info.json"})
+
+    result = storage_gc.drain_deletion_queue(db)
+
+    assert deleted == ["results/p1/renders/x/main.mp4.part"]
+    assert (result["deleted"], result["skipped_in_use"]) == (1, 2)
+    assert db.tables["r2_deletion_queue"] == []
+
+
+def test_reference_scan_walks_keyset_pages(monkeypatch):
+    monkeypatch.setattr(storage_gc, "_SCAN_PAGE_ROWS", 2)
+    jobs = [
+        {"id": f"j{index}", "result_r2_keys": {"srt": f"results/p{index}/a.srt"}, "processing_metadata": {}}
+        for index in (3, 1, 5, 2, 4)
+    ]
+    db = _DB(jobs=jobs)
+
+    referenced = storage_gc.collect_referenced_keys(db, ["results/"])
+
+    assert referenced == {f"results/p{index}/a.srt" for index in range(1, 6)}
+
+
+def _bucket(monkeypatch, objects: dict[str, list[dict]]):
+    def list_objects(prefix, *, page_size):
+        listed = objects.get(prefix, [])
+        for start in range(0, len(listed), page_size):
+            yield listed[start : start + page_size]
+
+    monkeypatch.setattr(storage_gc.r2, "list_objects", list_objects)
+
+
+def test_reconciler_finds_unreferenced_old_objects(monkeypatch):
+    db = _DB(
+        projects=[{
+            "id": "p1",
+            "source_r2_key": "sources/a.mp4",
+            "extra_sources": [{
+                "r2_key": "sources/b.mp4",
+                "derived": {"audio_proxy_r2_key": "derived/sources/b/audio_proxy.flac"},
+            }],
+            "source_derived": {},
+            "multicam_state": None,
+        }],
+        jobs=[{
+            "id": "j1",
+            "result_r2_keys": {"srt": "results/p1/a.srt"},
+            "processing_metadata": {"output_r2_key": "results/p1/renders/x/main.mp4"},
+            "input_payload": None,
+        }],
+        scribe_v2_cache_entries=[{"id": "s1", "raw_json_r2_key": "cache/scribe-v2/k/raw.json", "raw_srt_r2_key": None}],
+    )
+    _bucket(monkeypatch, {
+        "results/": [
+            {"Key": "results/p1/a.srt", "Size": 10, "LastModified": OLD},
+            {"Key": "results/p1/renders/x/main.mp4", "Size": 10, "LastModified": OLD},
+            {"Key": "results/p1/renders/failed/main.mp4", "Size": 500, "LastModified": OLD},
+            {"Key": "results/p9/a.srt", "Size": 20, "LastModified": NEW},
+        ],
+        "cache/": [
+            {"Key": "cache/scribe-v2/k/raw.json", "Size": 5, "LastModified": OLD},
+            {"Key": "cache/scribe-v2/k/attempts/lost/raw.json", "Size": 5, "LastModified": OLD},
+        ],
+        "sources/": [
+            {"Key": "sources/a.mp4", "Size": 1, "LastModified": OLD},
+            {"Key": "sources/b.mp4", "Size": 1, "LastModified": OLD},
+        ],
+        "derived/": [{"Key": "derived/sources/b/audio_proxy.flac", "Size": 1, "LastModified": OLD}],
+    })
+
+    report = storage_gc.reconcile_orphans(
+        db,
+        prefixes=["results/", "cache/", "sources/", "derived/"],
+        dry_run=True,
+        min_age_seconds=86400,
+        page_size=2,
+    )
+
+    assert report["scanned"] == 9
+    assert report["too_new"] == 1
+    assert report["sample"] == ["results/p1/renders/failed/main.mp4", "cache/scribe-v2/k/attempts/lost/raw.json"]
+    assert report["orphan_bytes"] == 505
+    assert report["enqueued"] == 0
+    assert "r2_deletion_queue" not in db.tables or db.tables["r2_deletion_queue"] == []
+
+    applied = storage_gc.reconcile_orphans(db, prefixes=["results/", "cache/"], dry_run=False, min_age_seconds=86400)
+
+    assert applied["enqueued"] == 2
+    assert {row["r2_key"] for row in db.tables["r2_deletion_queue"]} == {
+        "results/p1/renders/failed/main.mp4",
+        "cache/scribe-v2/k/attempts/lost/raw.json",
+    }
+    assert all(row["scanned_at"] < NEW.isoformat() for row in db.tables["r2_deletion_queue"])
+    # Already queued keys are not reported again.
+    assert storage_gc.reconcile_orphans(db, prefixes=["results/"], dry_run=False, min_age_seconds=86400)["orphans"] == 0
+
+
+def test_reconciler_respects_the_delete_budget(monkeypatch):
+    db = _DB()
+    objects = [{"Key": f"results/p/{index}", "Size": 1, "LastModified": OLD} for index in range(5)]
+    _bucket(monkeypatch, {"results/": objects})
+
+    report = storage_gc.reconcile_orphans(db, prefixes=["results/"], dry_run=False, min_age_seconds=0, max_deletes=3)
+
+    assert (report["orphans"], report["enqueued"]) == (5, 3)
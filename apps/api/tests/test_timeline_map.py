@@ -0,0 +1,70 @@
+import random
+
+from eogum.services.timeline_map import TimelineMap, map_source_cues
+
+
+def _manifest(intervals: list[tuple[int, int, int]]) -> dict:
+    entries = []
+    preview_cursor_ms = 0
+    for source_start_ms, requested_duration_ms, actual_duration_ms in intervals:
+        entries.append({
+            "source_start_ms": source_start_ms,
+            "source_end_ms": source_start_ms + requested_duration_ms,
+            "requested_duration_ms": requested_duration_ms,
+            "actual_duration_ms": actual_duration_ms,
+            "preview_start_ms": preview_cursor_ms,
+            "preview_end_ms": preview_cursor_ms + actual_duration_ms,
+        })
+        preview_cursor_ms += actual_duration_ms
+    return {"version": 1, "intervals": entries}
+
+
+def _scan_cues(manifest: dict, cues: list[tuple[int, int, str]]) -> list[tuple[float, float, str]]:
+    mapped = []
+    for cue_start_ms, cue_end_ms, text in cues:
+        for interval in manifest["intervals"]:
+            source_start_ms = interval["source_start_ms"]
+            overlap_start_ms = max(cue_start_ms, source_start_ms)
+            overlap_end_ms = min(cue_end_ms, interval["source_end_ms"])
+            if overlap_end_ms <= overlap_start_ms:
+                continue
+            scale = interval["actual_duration_ms"] / interval["requested_duration_ms"]
+            start = interval["preview_start_ms"] + (overlap_start_ms - source_start_ms) * scale
+            end = interval["preview_start_ms"] + (overlap_end_ms - source_start_ms) * scale
+            mapped.append((start, end if end > start else start + 1, text))
+    return mapped
+
+
+def test_cue_mapping_matches_interval_scan():
+    rng = random.Random(33)
+    for _ in range(200):
+        cursor = 0
+        intervals = []
+        for _interval in range(rng.randrange(0, 20)):
+            cursor += rng.randrange(0, 2000)
+            requested = rng.randrange(100, 4000)
+            intervals.append((cursor, requested, requested + rng.randrange(-40, 40)))
+            cursor += requested
+        manifest = _manifest(intervals)
+        cues = []
+        for index in range(rng.randrange(0, 40)):
+            start = rng.randrange(0, cursor + 1000)
+            cues.append((start, start + rng.randrange(1, 6000), f"cue {index}"))
+        cues.sort()
+
+        assert list(map_source_cues(TimelineMap.from_manifest(manifest), cues)) == _scan_cues(manifest, cues)
+
+
+def test_seek_lookups_snap_cut_regions_to_the_next_kept_interval():
+    timeline_map = TimelineMap.from_manifest(_manifest([(1000, 2000, 2000), (5000, 1000, 1000)]))
+
+    assert timeline_map.source_to_preview(0) == 0
+    assert timeline_map.source_to_preview(1500) == 500
+    assert timeline_map.source_to_preview(4000) == 2000
+    assert timeline_map.source_to_preview(5500) == 2500
+    assert timeline_map.source_to_preview(9000) == 3000
+    assert timeline_map.preview_to_source(500) == 1500
+    assert timeline_map.preview_to_source(2500) == 5500
+    assert timeline_map.preview_to_source(3000) == 6000
+    assert timeline_map.duration_ms == 3000
+    assert TimelineMap.from_manifest({"intervals": []}).source_to_preview(10) is None
@@ -0,0 +1,154 @@
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.services import project_document, transcript_sidecar  # noqa: E402
+from eogum.services.project_document import ProjectDocument  # noqa: E402
+
+
+PROJECT = {
+    "source_files": [{"id": "source", "info": {"duration_ms": 9000}}, {"id": "extra", "info": {}}],
+    "tracks": [{"id": "source_video", "source_file_id": "source", "track_type": "video", "offset_ms": 0}],
+    "segmentation_boundary_rule": "word_boundary",
+    "transcription": {
+        "segments": [
+            {
+                "index": 1,
+                "start_ms": 0,
+                "end_ms": 1200,
+                "text": " 안녕하세요 ",
+                "speaker": "speaker_0",
+                "words": [{"text": "안녕하세요", "start_ms": 100, "end_ms": 900}],
+            },
+            {"index": None, "start_ms": "1300", "end_ms": None, "text": "", "speaker": None},
+            {"index": 3, "start_ms": 2000, "end_ms": 3000, "text": "둘", "speaker": "speaker_1", "words": []},
+        ],
+    },
+    "edit_decisions": [
+        {
+            "range": {"start_ms": 2000, "end_ms": 3000},
+            "edit_type": "cut",
+            "reason": "filler",
+            "active_video_track_id": "source_video",
+            "source_segment_index": 3,
+        },
+        {"range": {"start_ms": 1200, "end_ms": 1300}, "edit_type": "mute", "reason": "silence"},
+    ],
+}
+
+
+def _document_fields(document: ProjectDocument) -> tuple:
+    return (
+        document.source_files,
+        document.tracks,
+        document.segmentation_boundary_rule,
+        [
+            (segment.position, segment.index, segment.start_ms, segment.end_ms, segment.speaker, segment.text)
+            for segment in document.segments
+        ],
+        [
+            (
+                decision.start_ms,
+                decision.end_ms,
+                decision.edit_type,
+                decision.reason,
+                decision.active_video_track_id,
+                decision.source_segment_index,
+            )
+            for decision in document.edit_decisions
+        ],
+    )
+
+
+def _sidecar_bytes(project: dict) -> bytes:
+    buffer = io.BytesIO()
+    np.savez(buffer, **transcript_sidecar.build_transcript_sidecar(project))
+    return buffer.getvalue()
+
+
+def test_sidecar_round_trips_to_the_same_document(tmp_path: Path):
+    project_json_path = tmp_path / "project.avid.json"
+    project_json_path.write_text(json.dumps(PROJECT, ensure_ascii=False), encoding="utf-8")
+
+    sidecar_path = transcript_sidecar.write_transcript_sidecar(project_json_path)
+    loaded = transcript_sidecar.read_transcript_sidecar(sidecar_path)
+
+    assert sidecar_path.name == "project.avid.transcript.npz"
+    assert _document_fields(loaded.document) == _document_fields(ProjectDocument.from_data(PROJECT))
+    assert loaded.segment_flags.tolist() == [0, 0, transcript_sidecar.SEGMENT_FLAG_CUT]
+    starts, ends = loaded.word_timings(0)
+    assert (starts.tolist(), ends.tolist()) == ([100], [900])
+
+
+def test_loader_prefers_sidecar_and_falls_back_to_project_json(monkeypatch):
+    project_document.clear_project_document_cache()
+    storage = {
+        "results/p/project.avid.json": json.dumps(PROJECT).encode(),
+        "results/p/project.avid.transcript.npz": _sidecar_bytes(PROJECT),
+        "results/p/stale.transcript.npz": b"not an npz",
+    }
+    downloads = []
+
+    def fake_download(key: str) -> bytes:
+        downloads.append(key)
+        return storage[key]
+
+    monkeypatch.setattr(transcript_sidecar.r2, "download_to_bytes", fake_download)
+
+    document = transcript_sidecar.load_transcript_document({
+        "project_json": "results/p/project.avid.json",
+        "transcript_sidecar": "results/p/project.avid.transcript.npz",
+    })
+    assert len(document.segments) == 3
+    assert downloads == ["results/p/project.avid.transcript.npz"]
+
+    fallback = transcript_sidecar.load_transcript_document({
+        "project_json": "results/p/project.avid.json",
+        "transcript_sidecar": "results/p/stale.transcript.npz",
+    })
+    assert _document_fields(fallback) == _document_fields(document)
+    assert downloads[-1] == "results/p/project.avid.json"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"not an npz", b"PK\x03\x04truncated", _sidecar_bytes(PROJECT)[:200]],
+)
+def test_corrupt_sidecar_is_a_sidecar_error(payload):
+    with pytest.raises(transcript_sidecar.TranscriptSidecarError):
+        transcript_sidecar.read_transcript_sidecar(payload)
+
+
+def test_sidecar_records_the_project_json_digest(tmp_path: Path):
+    project_json_path = tmp_path / "project.avid.json"
+    project_json_path.write_bytes(json.dumps(PROJECT).encode())
+
+    sidecar = transcript_sidecar.read_transcript_sidecar(
+        transcript_sidecar.write_transcript_sidecar(project_json_path)
+    )
+
+    assert sidecar.project_json_digest == project_document.project_json_digest(project_json_path.read_bytes())
+
+
+def test_sidecar_from_another_schema_version_is_rejected():
+    arrays = transcript_sidecar.build_transcript_sidecar(PROJECT)
+    arrays["version"] = np.array(transcript_sidecar.TRANSCRIPT_SIDECAR_VERSION + 1)
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+
+    with pytest.raises(transcript_sidecar.TranscriptSidecarError, match="version"):
+        transcript_sidecar.read_transcript_sidecar(buffer.getvalue())
@@ -0,0 +1,378 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+
+from eogum.services import youtube  # noqa: E402
+
+
+INFO = {"title": "Talk", "duration_seconds": 60, "filesize_approx_bytes": 1000}
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, rows: dict):
+        self.rows = rows
+        self.action = "select"
+        self.payload = None
+        self.filters = []
+        self.max_rows = None
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def insert(self, payload):
+        self.action, self.payload = "insert", payload
+        return self
+
+    def upsert(self, payload, on_conflict):
+        key = "|".join(str(payload[column]) for column in on_conflict.split(","))
+        self.action, self.payload = "insert", {"id": key, **payload}
+        return self
+
+    def update(self, payload):
+        self.action, self.payload = "update", payload
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def lt(self, column, value):
+        self.filters.append(lambda row: row.get(column, "") < value)
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: row.get(column, "") > value)
+        return self
+
+    def limit(self, count):
+        self.max_rows = count
+        return self
+
+    def execute(self):
+        if self.action == "insert":
+            row = {"created_at": "9999", **self.payload}
+            self.rows[row["id"]] = row
+            return _Result([dict(row)])
+        matched = [row for row in self.rows.values() if all(check(row) for check in self.filters)]
+        if self.action == "update":
+            for row in matched:
+                row.update(self.payload)
+        return _Result([dict(row) for row in matched[: self.max_rows]])
+
+
+class _DB:
+    def __init__(self):
+        self.tables: dict[str, dict[str, dict]] = {}
+        self.jobs = self.tables.setdefault("jobs", {})
+
+    def table(self, name):
+        return _Query(self.tables.setdefault(name, {}))
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = _DB()
+    monkeypatch.setattr(youtube, "get_db", lambda: fake)
+    monkeypatch.setattr(youtube, "_tasks", {})
+    monkeypatch.setattr(youtube, "_pending", deque())
+    monkeypatch.setattr(youtube, "_executor", None)
+    monkeypatch.setattr(youtube, "_heartbeat_thread", None)
+    monkeypatch.setattr(youtube, "_info_cache", youtube.OrderedDict())
+    monkeypatch.setattr(youtube.settings, "youtube_download_concurrency", 1)
+    monkeypatch.setattr(youtube, "lookup_source_asset_by_youtube_video", lambda db, **kwargs: None)
+    return fake
+
+
+def _blocking_worker(monkeypatch):
+    release = threading.Event()
+    started = []
+
+    def worker(task):
+        task.status = "downloading"
+        started.append(task.id)
+        release.wait(5)
+        task.status = "completed"
+        task.progress = 100
+        task.r2_key = f"sources/{task.user_id}/{task.id}.mp4"
+
+    monkeypatch.setattr(youtube, "_download_worker", worker)
+    return release, started
+
+
+def _wait_for(predicate):
+    event = threading.Event()
+    for _ in range(200):
+        if predicate():
+            return
+        event.wait(0.01)
+    raise AssertionError("condition not met")
+
+
+def test_downloads_share_a_bounded_pool_and_report_queue_positions(db, monkeypatch):
+    release, started = _blocking_worker(monkeypatch)
+
+    task_ids = [youtube.start_download(f"https://youtu.be/{index}", "user-1", INFO) for index in range(3)]
+    _wait_for(lambda: len(started) == 1)
+
+    tasks = [youtube.get_task(task_id) for task_id in task_ids]
+    assert [task.status for task in tasks] == ["downloading", "pending", "pending"]
+    assert [task.queue_position for task in tasks] == [None, 1, 2]
+    assert [db.jobs[task_id]["status"] for task_id in task_ids] == ["queued"] * 3
+    assert db.jobs[task_ids[0]]["type"] == "youtube_download"
+    assert db.jobs[task_ids[0]]["project_id"] is None
+
+    release.set()
+    _wait_for(lambda: all(db.jobs[task_id]["status"] == "completed" for task_id in task_ids))
+    youtube._executor.shutdown(wait=True)
+    assert started == task_ids
+
+
+def test_finished_tasks_are_evicted_and_served_from_the_jobs_row(db, monkeypatch):
+    release, _ = _blocking_worker(monkeypatch)
+    release.set()
+    task_id = youtube.start_download("https://youtu.be/a", "user-1", INFO)
+    _wait_for(lambda: db.jobs[task_id]["status"] == "completed")
+    youtube._executor.shutdown(wait=True)
+
+    monkeypatch.setattr(youtube.settings, "youtube_task_ttl_seconds", -1)
+    task = youtube.get_task(task_id)
+
+    assert task_id not in youtube._tasks
+    assert task.status == "completed"
+    assert task.user_id == "user-1"
+    assert task.r2_key == f"sources/user-1/{task_id}.mp4"
+    assert task.title == "Talk"
+    assert youtube.get_task("not-a-uuid") is None
+
+
+def test_running_row_from_another_node_reports_its_phase(db):
+    task_id = "00000000-0000-0000-0000-000000000001"
+    db.jobs[task_id] = {
+        "id": task_id,
+        "user_id": "user-1",
+        "type": "youtube_download",
+        "status": "running",
+        "progress": 85,
+        "input_payload": {"url": "https://youtu.be/a"},
+        "processing_metadata": {"phase": "uploading", "filename": "Talk.mp4"},
+    }
+
+    task = youtube.get_task(task_id)
+
+    assert (task.status, task.progress, task.filename) == ("uploading", 85.0, "Talk.mp4")
+
+
+def _download_row(index: int, status: str, *, heartbeat_at: str, owner_node: str = "dead-node") -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-00000000000{index}",
+        "user_id": "user-1",
+        "type": "youtube_download",
+        "status": status,
+        "owner_node": owner_node,
+        "heartbeat_at": heartbeat_at,
+        "input_payload": {"url": f"https://youtu.be/{index}"},
+    }
+
+
+def test_startup_recovery_requeues_downloads_with_stale_heartbeats(db, monkeypatch):
+    release, started = _blocking_worker(monkeypatch)
+    release.set()
+    stale = "2000-01-01T00:00:00+00:00"
+    rows = [
+        _download_row(0, "running", heartbeat_at=stale),
+        _download_row(1, "queued", heartbeat_at=stale),
+        _download_row(2, "completed", heartbeat_at=stale),
+        _download_row(3, "running", heartbeat_at="9999-01-01T00:00:00+00:00", owner_node="live-node"),
+    ]
+    db.jobs.update({row["id"]: row for row in rows})
+
+    assert youtube.recover_stuck_downloads(recover_running=True) == 2
+    youtube._executor.shutdown(wait=True)
+
+    assert sorted(started) == [rows[0]["id"], rows[1]["id"]]
+    assert [db.jobs[row["id"]]["status"] for row in rows] == ["completed", "completed", "completed", "running"]
+    assert db.jobs[rows[0]["id"]]["owner_node"] == youtube._NODE_ID
+    assert db.jobs[rows[3]["id"]]["owner_node"] == "live-node"
+
+
+def test_recovery_skips_rows_whose_heartbeat_moved_before_the_claim(db, monkeypatch):
+    release, started = _blocking_worker(monkeypatch)
+    release.set()
+    row = _download_row(0, "running", heartbeat_at="2000-01-01T00:00:00+00:00")
+    db.jobs[row["id"]] = row
+    select_execute = _Query.execute
+
+    def execute(query):
+        result = select_execute(query)
+        if query.action == "select":
+            # The owner checks in between recovery's read and its claim.
+            row["heartbeat_at"] = "2000-01-01T00:00:30+00:00"
+        return result
+
+    monkeypatch.setattr(_Query, "execute", execute)
+
+    assert youtube.recover_stuck_downloads(recover_running=True) == 0
+    assert started == []
+    assert row["owner_node"] == "dead-node"
+
+
+def test_node_that_lost_a_download_stops_writing_its_row(db):
+    row = _download_row(0, "running", heartbeat_at="2000-01-01T00:00:00+00:00", owner_node="new-owner")
+    db.jobs[row["id"]] = dict(row, progress=40)
+    task = youtube._task_from_row(db.jobs[row["id"]])
+    task.progress = 90
+
+    youtube._persist(task)
+    youtube._send_heartbeat([task.id])
+
+    assert db.jobs[row["id"]]["progress"] == 40
+    assert db.jobs[row["id"]]["heartbeat_at"] == row["heartbeat_at"]
+
+
+def test_streaming_import_uploads_while_muxing_and_registers_the_asset(db, monkeypatch):
+    payload = bytes(range(256)) * 40
+    uploaded = {}
+    registered = []
+
+    def upload_stream(stream, r2_key, content_type, *, part_size, max_in_flight, on_progress):
+        uploaded[r2_key] = stream.read()
+        on_progress(len(uploaded[r2_key]))
+        return len(uploaded[r2_key]), hashlib.sha256(uploaded[r2_key]).hexdigest()
+
+    info = {"title": "Talk/1", "duration": 60, "requested_formats": [{"filesize": len(payload)}]}
+    monkeypatch.setattr(youtube, "_resolve_formats", lambda url: info)
+    monkeypatch.setattr(
+        youtube,
+        "_mux_command",
+        lambda formats: [sys.executable, "-c", "import sys; sys.stdout.buffer.write(bytes(range(256)) * 40)"],
+    )
+    monkeypatch.setattr(youtube.r2, "upload_stream", upload_stream)
+    monkeypatch.setattr(youtube, "lookup_source_asset", lambda db, **kwargs: None)
+    monkeypatch.setattr(youtube, "upsert_source_asset", lambda db, **kwargs: registered.append(kwargs))
+    monkeypatch.setattr(youtube.settings, "youtube_streaming_import", True)
+    task = youtube.DownloadTask(id="task-1", url="https://youtu.be/dQw4w9WgXcQ", user_id="user-1")
+
+    youtube._download_worker(task)
+
+    assert task.status == "completed", task.error
+    assert uploaded[task.r2_key] == payload
+    assert task.filename == "Talk_1.mp4"
+    assert task.sha256 == hashlib.sha256(payload).hexdigest()
+    assert registered == [{
+        "sha256": task.sha256,
+        "size_bytes": len(payload),
+        "r2_key": task.r2_key,
+        "filename": "Talk_1.mp4",
+        "duration_seconds": 60,
+        "youtube_video_id": "dQw4w9WgXcQ",
+        "youtube_format": youtube._STREAM_FORMAT,
+    }]
+
+
+def test_identical_upload_reuses_the_registered_object(db, monkeypatch):
+    deleted = []
+    existing = {"id": "asset-1", "r2_key": "sources/old.mp4"}
+    monkeypatch.setattr(youtube, "lookup_source_asset", lambda db, **kwargs: existing)
+    linked = []
+    monkeypatch.setattr(youtube, "link_source_asset_youtube_video", lambda db, **kwargs: linked.append(kwargs))
+    monkeypatch.setattr(youtube.r2, "object_exists", lambda key: True)
+    monkeypatch.setattr(youtube.r2, "delete_objects", deleted.extend)
+    task = youtube.DownloadTask(
+        id="task-1",
+        url="https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10",
+        user_id="user-1",
+        r2_key="sources/new.mp4",
+        sha256="abc",
+    )
+
+    youtube._register_source_asset(task)
+
+    assert task.r2_key == "sources/old.mp4"
+    assert deleted == ["sources/new.mp4"]
+    assert linked == [{"asset_id": "asset-1", "video_id": "dQw4w9WgXcQ", "format_selector": youtube.import_format()}]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://m.youtube.com/watch?v=dQw4w9WgXcQ&list=PL1",
+        "https://youtu.be/dQw4w9WgXcQ?t=42",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://music.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ",
+    ],
+)
+def test_canonical_video_id_ignores_url_variations(url):
+    assert youtube.canonical_video_id(url) == "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("url", ["https://vimeo.com/123", "https://www.youtube.com/watch?v=short", "not a url"])
+def test_canonical_video_id_rejects_other_urls(url):
+    assert youtube.canonical_video_id(url) is None
+
+
+def test_video_info_is_fetched_once_per_video_and_shared_through_the_db(db, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(youtube, "_fetch_video_info", lambda url: fetched.append(url) or dict(INFO))
+
+    first = youtube.get_video_info("https://youtu.be/dQw4w9WgXcQ")
+    second = youtube.get_video_info("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=5")
+    assert first == second == {**INFO, "video_id": "dQw4w9WgXcQ"}
+    assert len(fetched) == 1
+
+    # Another node: empty LRU, warm DB row.
+    youtube._info_cache.clear()
+    assert youtube.get_video_info("https://youtu.be/dQw4w9WgXcQ")["title"] == "Talk"
+    assert len(fetched) == 1
+
+    # A different format selector is a different cache entry.
+    monkeypatch.setattr(youtube.settings, "youtube_streaming_import", not youtube.settings.youtube_streaming_import)
+    youtube.get_video_info("https://youtu.be/dQw4w9WgXcQ")
+    assert len(fetched) == 2
+
+
+def test_repeat_import_completes_with_the_existing_object(db, monkeypatch):
+    asset = {
+        "id": "asset-1",
+        "r2_key": "sources/old.mp4",
+        "sha256": "abc",
+        "size_bytes": 1234,
+        "filename": "Talk.mp4",
+        "duration_seconds": 61,
+    }
+    monkeypatch.setattr(youtube, "lookup_source_asset_by_youtube_video", lambda db, **kwargs: asset)
+    monkeypatch.setattr(youtube, "touch_source_asset", lambda db, asset_id: None)
+    monkeypatch.setattr(youtube.r2, "object_exists", lambda key: True)
+    monkeypatch.setattr(youtube, "_download_worker", lambda task: pytest.fail("should not download"))
+
+    task_id = youtube.start_download("https://youtu.be/dQw4w9WgXcQ", "user-1", {**INFO, "video_id": "dQw4w9WgXcQ"})
+    task = youtube.get_task(task_id)
+
+    assert (task.status, task.r2_key, task.sha256, task.filesize_bytes) == ("completed", "sources/old.mp4", "abc", 1234)
+    assert db.jobs[task_id]["status"] == "completed"
+    assert db.jobs[task_id]["result_r2_keys"] == {"source": "sources/old.mp4"}
@@ -10,7 +10,7 @@ import {
   type SegmentationBoundaryRule,
   type YouTubeInfoResponse,
 } from "@/lib/api";
-import { sha256File } from "@/lib/hash";
+import { sampledFingerprint } from "@/lib/hash";
 import { useRouter } from "next/navigation";
 import { useCallback, useRef, useState, type ReactNode } from "react";
 
@@ -226,7 +226,11 @@ export default function NewProjectPage() {
       try {
         const task = await api.getYouTubeDownloadStatus(token, taskId);
 
-        if (task.status === "downloading") {
+        if (task.status === "pending") {
+          setProgressLabel(
+            task.queue_position ? `다운로드 대기 중... (${task.queue_position}번째)` : "다운로드 대기 중...",
+          );
+        } else if (task.status === "downloading") {
           setProgressLabel("다운로드 중...");
           setUploadProgress(Math.round(task.progress));
         } else if (task.status === "uploading") {
@@ -245,6 +249,7 @@ export default function NewProjectPage() {
             source_filename: task.filename || "youtube.mp4",
             source_duration_seconds: task.duration_seconds,
             source_size_bytes: task.filesize_bytes,
+            source_sha256: task.source_sha256,
             settings: buildProjectSettings(),
           });
 
@@ -309,13 +314,13 @@ export default function NewProjectPage() {
       const token = session.access_token;
 
       const duration = await getVideoDuration(file);
-      const sourceSha256 = await sha256File(file, (loaded, total) => {
-        setUploadProgress(Math.round((loaded / total) * 10));
-      });
+      // The server computes the full SHA-256 while processing; the sampled
+      // fingerprint is enough to find an identical upload.
+      const fingerprint = await sampledFingerprint(file);
 
       setProgressLabel("기존 원본 확인 중...");
       const cachedSource = await api.lookupSource(token, {
-        sha256: sourceSha256,
+        fingerprint,
         size_bytes: file.size,
       });
 
@@ -342,7 +347,7 @@ export default function NewProjectPage() {
         source_filename: file.name,
         source_duration_seconds: duration,
         source_size_bytes: file.size,
-        source_sha256: sourceSha256,
+        source_sha256: cachedSource.hit ? cachedSource.sha256 : null,
         settings: buildProjectSettings(),
       });
 
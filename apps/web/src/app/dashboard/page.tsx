@@ -6,7 +6,7 @@ import { createClient } from "@/lib/supabase/client";
 import { api, type CreditBalance, type CutType, type Project } from "@/lib/api";
 import type { MouseEvent, ReactNode } from "react";
 import { useRouter } from "next/navigation";
-import { useCallback, useEffect, useRef, useState } from "react";
+import { useCallback, useEffect, useState } from "react";
 import Image from "next/image";
 
 function formatDuration(seconds: number): string {
@@ -25,12 +25,7 @@ const STATUS_CONFIG: Record<string, { label: string; color: string; icon: string
 };
 
 type EditIntensity = "light" | "normal" | "heavy";
-type ProjectSettingsCacheEntry = {
-  updated_at: string;
-  settings: Record<string, unknown>;
-};
-
-const PROJECT_DETAIL_CONCURRENCY = 4;
+const PROJECT_PAGE_SIZE = 30;
 
 const EDIT_INTENSITY_LABELS: Record<EditIntensity, string> = {
   light: "적게 편집",
@@ -66,57 +61,16 @@ function normalizeEditIntensity(value: unknown): EditIntensity {
   return value === "light" || value === "normal" || value === "heavy" ? value : "normal";
 }
 
-async function hydrateProjectSettings(
-  projectList: Project[],
-  token: string,
-  cache: Map<string, ProjectSettingsCacheEntry>
-): Promise<Project[]> {
-  const activeProjectIds = new Set(projectList.map((project) => project.id));
-  for (const projectId of cache.keys()) {
-    if (!activeProjectIds.has(projectId)) cache.delete(projectId);
-  }
-
-  const hydratedProjects = [...projectList];
-  const detailRequests: { project: Project; index: number }[] = [];
-
-  projectList.forEach((project, index) => {
-    if (project.settings) {
-      cache.set(project.id, {
-        updated_at: project.updated_at,
-        settings: project.settings,
-      });
-      return;
-    }
-
-    const cached = cache.get(project.id);
-    if (cached && cached.updated_at === project.updated_at) {
-      hydratedProjects[index] = { ...project, settings: cached.settings };
-      return;
-    }
-
-    detailRequests.push({ project, index });
-  });
-
-  for (let i = 0; i < detailRequests.length; i += PROJECT_DETAIL_CONCURRENCY) {
-    const chunk = detailRequests.slice(i, i + PROJECT_DETAIL_CONCURRENCY);
-    await Promise.all(
-      chunk.map(async ({ project, index }) => {
-        try {
-          const detail = await api.getProject(token, project.id);
-          cache.set(project.id, {
-            updated_at: project.updated_at,
-            settings: detail.settings,
-          });
-          hydratedProjects[index] = { ...project, settings: detail.settings };
-        } catch (error) {
-          console.warn("Project detail preload failed:", project.id, error);
-          hydratedProjects[index] = project;
-        }
-      })
-    );
-  }
-
-  return hydratedProjects;
+function mergeFirstProjectPage(first: Project[], previous: Project[], hasMore: boolean): Project[] {
+  if (!hasMore || first.length === 0) return first;
+  // Keep pages loaded with "더 보기" that sort after the refreshed first page.
+  const firstIds = new Set(first.map((project) => project.id));
+  const last = first[first.length - 1];
+  const older = previous.filter((project) =>
+    !firstIds.has(project.id) &&
+    (project.created_at < last.created_at || (project.created_at === last.created_at && project.id < last.id))
+  );
+  return [...first, ...older];
 }
 
 function StatusBadge({ status }: { status: string }) {
@@ -327,8 +281,9 @@ function EmptyState({ onNew }: { onNew: () => void }) {
 export default function DashboardPage() {
   const router = useRouter();
   const supabase = createClient();
-  const projectSettingsCache = useRef<Map<string, ProjectSettingsCacheEntry>>(new Map());
   const [projects, setProjects] = useState<Project[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [currentUserId, setCurrentUserId] = useState<string | null>(null);
   const [credits, setCredits] = useState<CreditBalance | null>(null);
   const [loading, setLoading] = useState(true);
@@ -380,16 +335,13 @@ export default function DashboardPage() {
 
     try {
       const token = session.access_token;
-      const [projectList, creditBalance] = await Promise.all([
-        api.listProjects(token),
+      const [projectPage, creditBalance] = await Promise.all([
+        api.listProjects(token, { limit: PROJECT_PAGE_SIZE }),
         api.getCredits(token),
       ]);
-      const projectsWithSettings = await hydrateProjectSettings(
-        projectList,
-        token,
-        projectSettingsCache.current
-      );
-      setProjects(projectsWithSettings);
+      setProjects((prev) => mergeFirstProjectPage(projectPage.items, prev, Boolean(projectPage.next_cursor)));
+      // Polling refreshes only the first page; an already loaded tail keeps its cursor.
+      setNextCursor((prev) => (projectPage.next_cursor && prev ? prev : projectPage.next_cursor));
       setCredits(creditBalance);
       setError(null);
     } catch (e) {
@@ -406,6 +358,25 @@ export default function DashboardPage() {
     return () => clearInterval(interval);
   }, [loadData]);
 
+  const handleLoadMore = async () => {
+    const { data: { session } } = await supabase.auth.getSession();
+    if (!session || !nextCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const page = await api.listProjects(session.access_token, { cursor: nextCursor, limit: PROJECT_PAGE_SIZE });
+      setProjects((prev) => {
+        const loadedIds = new Set(prev.map((project) => project.id));
+        return [...prev, ...page.items.filter((project) => !loadedIds.has(project.id))];
+      });
+      setNextCursor(page.next_cursor);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : "프로젝트를 더 불러오지 못했습니다");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleLogout = async () => {
     await supabase.auth.signOut();
     router.replace("/");
@@ -502,6 +473,17 @@ export default function DashboardPage() {
                 currentUserId={currentUserId}
               />
             ))}
+            {nextCursor && (
+              <div className="flex justify-center pt-3">
+                <button
+                  onClick={handleLoadMore}
+                  disabled={loadingMore}
+                  className="px-4 py-2 text-sm font-medium rounded-lg border border-white/10 text-gray-300 hover:bg-white/5 transition disabled:opacity-50"
+                >
+                  {loadingMore ? "불러오는 중..." : "더 보기"}
+                </button>
+              </div>
+            )}
           </div>
         )}
       </main>
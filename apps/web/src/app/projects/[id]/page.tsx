@@ -5,6 +5,9 @@ export const dynamic = "force-dynamic";
 import { createClient } from "@/lib/supabase/client";
 import {
   api,
+  sleep,
+  subscribeProjectEvents,
+  type JobEvent,
   type ProjectDetail,
   type PipelineStage,
   type MulticamState,
@@ -206,6 +209,8 @@ function hasScribeV2CacheHit(project: ProjectDetail): boolean {
 
 type ProjectJob = ProjectDetail["jobs"][number];
 
+const EVENT_STREAM_BASE_RETRY_MS = 1000;
+const EVENT_STREAM_MAX_RETRY_MS = 30000;
 const ACTIVE_JOB_STATUSES = new Set(["pending", "queued", "running", "cancel_requested"]);
 const ARTIFACT_JOB_TYPES = new Set([
   "subtitle_cut",
@@ -223,6 +228,25 @@ function newestJobFirst(a: ProjectJob, b: ProjectJob): number {
   return new Date(b.created_at).getTime() - new Date(a.created_at).getTime();
 }
 
+// Project detail lists job summaries only. Load stages, metadata and result
+// keys for the jobs this page reads them from: the newest completed artifact
+// job and any job still running.
+async function withJobDetails(
+  token: string | null,
+  projectId: string,
+  jobs: ProjectJob[],
+): Promise<ProjectJob[]> {
+  const latestArtifactJob = jobs
+    .filter((job) => job.status === "completed" && ARTIFACT_JOB_TYPES.has(job.type))
+    .sort(newestJobFirst)[0];
+  const wanted = jobs.filter((job) => job === latestArtifactJob || isActiveJob(job));
+  const details = await Promise.all(
+    wanted.map((job) => api.getJob(token, projectId, job.id).catch(() => null))
+  );
+  const byId = new Map(details.flatMap((detail) => (detail ? [[detail.id, detail] as const] : [])));
+  return jobs.map((job) => byId.get(job.id) ?? job);
+}
+
 function jobAttemptNumber(job: ProjectJob): number {
   return Number.isInteger(job.attempt_number) && job.attempt_number > 0
     ? job.attempt_number
@@ -575,6 +599,7 @@ export default function ProjectDetailPage() {
   const [aiCutRenderLoading, setAiCutRenderLoading] = useState(false);
   const [aiCutRenderInitialized, setAiCutRenderInitialized] = useState(false);
   const [aiCutRenderError, setAiCutRenderError] = useState("");
+  const [jobEventsConnected, setJobEventsConnected] = useState(false);
 
   // Multicam state
   const [pendingFiles, setPendingFiles] = useState<File[]>([]);
@@ -605,11 +630,12 @@ export default function ProjectDetailPage() {
     if (!token && !isPublicProjectId(projectId)) { router.replace("/"); return; }
     setSessionUserId(session?.user?.id ?? null);
     try {
-      const [data, projectList] = await Promise.all([
-        api.getProject(token, projectId),
-        token ? api.listProjects(token).catch(() => []) : Promise.resolve([]),
-      ]);
-      const sourceReused = Boolean(data.source_sha256) && projectList.some((item) =>
+      const project = await api.getProject(token, projectId);
+      const data = { ...project, jobs: await withJobDetails(token, projectId, project.jobs) };
+      const projectList = token && data.source_sha256
+        ? (await api.listProjects(token, { sourceSha256: data.source_sha256 }).catch(() => null))?.items ?? []
+        : [];
+      const sourceReused = projectList.some((item) =>
         item.id !== data.id &&
         item.source_sha256 === data.source_sha256 &&
         new Date(item.created_at).getTime() <= new Date(data.created_at).getTime()
@@ -637,13 +663,70 @@ export default function ProjectDetailPage() {
     }
   }, [projectId, supabase.auth]);
 
+  const projectIsActive = project?.status === "processing" || project?.status === "queued";
+
+  // Job progress arrives over the project's event stream; polling below only
+  // covers project-level state and fills in while the stream is down.
+  useEffect(() => {
+    if (!projectIsActive) return;
+    const controller = new AbortController();
+    const applyJobEvent = (event: JobEvent) => {
+      setProject((current) => {
+        if (!current) return current;
+        const index = current.jobs.findIndex((job) => job.id === event.id);
+        if (index === -1) return current;
+        const jobs = [...current.jobs];
+        jobs[index] = {
+          ...jobs[index],
+          ...event,
+          pipeline_stages: event.pipeline_stages ?? jobs[index].pipeline_stages,
+        };
+        return { ...current, jobs };
+      });
+    };
+    // A dropped stream is reopened with jittered exponential backoff; polling
+    // fills in until the next snapshot arrives.
+    const connect = async () => {
+      let failures = 0;
+      while (!controller.signal.aborted) {
+        const { data: { session } } = await supabase.auth.getSession();
+        try {
+          await subscribeProjectEvents(session?.access_token ?? null, projectId, {
+            onSnapshot: (jobs) => {
+              failures = 0;
+              setJobEventsConnected(true);
+              jobs.forEach(applyJobEvent);
+            },
+            onJob: (event) => {
+              applyJobEvent(event);
+              // A finished job changes project status and report; reload those.
+              if (["completed", "failed", "canceled"].includes(event.status)) void loadProject();
+            },
+          }, controller.signal);
+        } catch {
+          // Aborted or dropped; reconnect below unless aborted.
+        } finally {
+          setJobEventsConnected(false);
+        }
+        const delay = Math.min(EVENT_STREAM_MAX_RETRY_MS, EVENT_STREAM_BASE_RETRY_MS * 2 ** failures);
+        failures += 1;
+        try {
+          await sleep(delay / 2 + Math.random() * (delay / 2), controller.signal);
+        } catch {
+          return;
+        }
+      }
+    };
+    void connect();
+    return () => controller.abort();
+  }, [loadProject, projectId, projectIsActive, supabase.auth]);
+
   useEffect(() => {
     loadProject();
     const interval = setInterval(() => {
       const multicamStatus = project?.multicam_state?.status;
       if (
-        project?.status === "processing" ||
-        project?.status === "queued" ||
+        (projectIsActive && !jobEventsConnected) ||
         multicamStatus === "queued" ||
         multicamStatus === "running" ||
         multicamStatus === "canceling" ||
@@ -653,7 +736,14 @@ export default function ProjectDetailPage() {
       }
     }, 5000);
     return () => clearInterval(interval);
-  }, [loadProject, project?.status, project?.multicam_state?.status, hasActiveSourceDerivatives, derivativePollingKey]);
+  }, [
+    loadProject,
+    projectIsActive,
+    jobEventsConnected,
+    project?.multicam_state?.status,
+    hasActiveSourceDerivatives,
+    derivativePollingKey,
+  ]);
 
   useEffect(() => {
     if (!project?.viewer_can_edit || project.status !== "completed") {
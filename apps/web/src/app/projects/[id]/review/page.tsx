@@ -6,6 +6,8 @@ import { createClient } from "@/lib/supabase/client";
 import { isPublicProjectId } from "@/lib/public-projects";
 import {
   api,
+  ApiError,
+  subscribeProjectEvents,
   type EvalSegment,
   type EvalReportResponse,
   type EvaluationSavePayload,
@@ -222,6 +224,10 @@ export default function ReviewPage() {
 
   const videoRef = useRef<HTMLVideoElement>(null);
   const segmentRefs = useRef<Map<number, HTMLDivElement>>(new Map());
+  // Revision of the saved evaluation this page last synced with, and the
+  // segments changed since then. Saves send only those segments as a delta.
+  const evaluationRevisionRef = useRef<number | null>(null);
+  const changedSegmentIndexesRef = useRef<Set<number>>(new Set());
 
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
@@ -328,6 +334,8 @@ export default function ReviewPage() {
         join_strategy: evalRes?.join_strategy ?? segRes.join_strategy ?? null,
         stats: segRes.stats ?? evalRes?.stats ?? null,
       });
+      evaluationRevisionRef.current = evalRes?.revision ?? null;
+      changedSegmentIndexesRef.current = new Set();
       setSegments(merged);
     } catch (err) {
       setError(err instanceof Error ? err.message : "데이터 로딩 실패");
@@ -379,10 +387,44 @@ export default function ReviewPage() {
       }
     };
 
+    // Progress arrives over the job-event stream; polling only runs while
+    // the stream is down, and once more to fetch URLs when the job ends.
+    let streaming = false;
+    const events = new AbortController();
+    const subscribe = async () => {
+      const {
+        data: { session },
+      } = await supabase.auth.getSession();
+      try {
+        await subscribeProjectEvents(session?.access_token ?? null, projectId, {
+          onSnapshot: () => {
+            streaming = true;
+          },
+          onJob: (job) => {
+            if (job.id !== finalPreviewJobId || canceled) return;
+            if (job.status === "completed" || job.status === "failed") {
+              void poll();
+              return;
+            }
+            setFinalPreviewStatus(job.status);
+            setFinalPreviewProgress(job.progress);
+          },
+        }, events.signal);
+      } catch {
+        // Aborted or dropped; polling takes over.
+      } finally {
+        streaming = false;
+      }
+    };
+
     void poll();
-    const interval = window.setInterval(poll, 3000);
+    void subscribe();
+    const interval = window.setInterval(() => {
+      if (!streaming) void poll();
+    }, 3000);
     return () => {
       canceled = true;
+      events.abort();
       window.clearInterval(interval);
     };
   }, [finalPreviewJobId, finalPreviewStatus, previewJobKind, projectId, supabase]);
@@ -574,6 +616,7 @@ export default function ReviewPage() {
 
   // Set human decision
   const setHumanAction = (index: number, action: "keep" | "cut") => {
+    changedSegmentIndexesRef.current.add(index);
     setSegments((prev) =>
       prev.map((seg) => {
         if (seg.index !== index) return seg;
@@ -596,6 +639,7 @@ export default function ReviewPage() {
   };
 
   const setHumanReason = (index: number, reason: string) => {
+    changedSegmentIndexesRef.current.add(index);
     setSegments((prev) =>
       prev.map((seg) => {
         if (seg.index !== index || !seg.human) return seg;
@@ -606,6 +650,7 @@ export default function ReviewPage() {
   };
 
   const setHumanNote = (index: number, note: string) => {
+    changedSegmentIndexesRef.current.add(index);
     setSegments((prev) =>
       prev.map((seg) => {
         if (seg.index !== index || !seg.human) return seg;
@@ -616,6 +661,7 @@ export default function ReviewPage() {
   };
 
   const setJunctionRepairApplied = (index: number, applied: boolean) => {
+    changedSegmentIndexesRef.current.add(index);
     setSegments((prev) =>
       prev.map((seg) => {
         if (seg.index !== index || !seg.ai) return seg;
@@ -656,10 +702,36 @@ export default function ReviewPage() {
 
   // Save
   const saveCurrentEvaluation = async (token: string) => {
-    return api.saveEvaluation(token, projectId, {
-      ...reviewMetadata,
-      segments,
-    });
+    const changedIndexes = changedSegmentIndexesRef.current;
+    const baseRevision = evaluationRevisionRef.current;
+    changedSegmentIndexesRef.current = new Set();
+    try {
+      if (baseRevision !== null && changedIndexes.size > 0) {
+        try {
+          const res = await api.patchEvaluation(token, projectId, {
+            base_revision: baseRevision,
+            changes: segments
+              .filter((seg) => changedIndexes.has(seg.index))
+              .map((seg) => ({ index: seg.index, human: seg.human ?? null, ai: seg.ai ?? null })),
+          });
+          evaluationRevisionRef.current = res.revision;
+          return;
+        } catch (err) {
+          // The server revision moved on (another tab or a preview save).
+          // This page holds the whole review, so replace the snapshot once
+          // instead of retrying a delta against a revision we no longer know.
+          if (!(err instanceof ApiError && err.status === 409)) throw err;
+        }
+      }
+      const res = await api.saveEvaluation(token, projectId, {
+        ...reviewMetadata,
+        segments,
+      });
+      evaluationRevisionRef.current = res.revision ?? null;
+    } catch (err) {
+      for (const index of changedIndexes) changedSegmentIndexesRef.current.add(index);
+      throw err;
+    }
   };
 
   const handleSave = async () => {
@@ -720,6 +792,11 @@ export default function ReviewPage() {
         ...reviewMetadata,
         segments,
       });
+      if (viewerCanEdit) {
+        // The preview request saved a full snapshot under a new revision.
+        evaluationRevisionRef.current = job.evaluation_revision ?? null;
+        changedSegmentIndexesRef.current = new Set();
+      }
       setFinalPreviewJobId(job.job_id);
       setFinalPreviewStatus(job.status);
       setFinalPreviewProgress(job.progress);
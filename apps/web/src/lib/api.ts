@@ -1,5 +1,16 @@
 const API_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000/api/v1";
 
+/** Error thrown for a non-2xx API response; keeps the HTTP status. */
+export class ApiError extends Error {
+  status: number;
+
+  constructor(message: string, status: number) {
+    super(message);
+    this.name = "ApiError";
+    this.status = status;
+  }
+}
+
 export async function apiFetch<T>(
   path: string,
   token: string | null | undefined,
@@ -16,13 +27,55 @@ export async function apiFetch<T>(
 
   if (!res.ok) {
     const body = await res.json().catch(() => ({}));
-    throw new Error(body.detail || `API error: ${res.status} ${res.statusText}`);
+    throw new ApiError(body.detail || `API error: ${res.status} ${res.statusText}`, res.status);
   }
 
   if (res.status === 204) return undefined as T;
   return res.json();
 }
 
+/**
+ * Read the project's job-event stream (Server-Sent Events) until `signal`
+ * aborts or the server closes it. Uses fetch so the bearer token travels in
+ * a header; EventSource cannot set one.
+ */
+export async function subscribeProjectEvents(
+  token: string | null | undefined,
+  projectId: string,
+  handlers: { onSnapshot?: (jobs: JobEvent[]) => void; onJob: (job: JobEvent) => void },
+  signal: AbortSignal
+): Promise<void> {
+  const headers = new Headers({ Accept: "text/event-stream" });
+  if (token) headers.set("Authorization", `Bearer ${token}`);
+  const res = await fetch(`${API_URL}/projects/${projectId}/events`, { headers, signal });
+  if (!res.ok || !res.body) throw new Error(`API error: ${res.status} ${res.statusText}`);
+
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) return;
+    buffer += value;
+    let boundary = buffer.indexOf("\n\n");
+    while (boundary !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf("\n\n");
+
+      let event = "message";
+      const data: string[] = [];
+      for (const line of block.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data.push(line.slice(6));
+      }
+      if (!data.length) continue; // keepalive comment
+      const payload = JSON.parse(data.join("\n"));
+      if (event === "jobs") handlers.onSnapshot?.(payload as JobEvent[]);
+      else if (event === "job") handlers.onJob(payload as JobEvent);
+    }
+  }
+}
+
 // ── Types ──
 export interface SourceDerived {
   status?: "queued" | "processing" | "ready" | "failed" | string | null;
@@ -81,6 +134,11 @@ export interface Project {
   updated_at: string;
 }
 
+export interface ProjectPage {
+  items: Project[];
+  next_cursor: string | null;
+}
+
 export interface ProjectDetail extends Project {
   source_r2_key: string | null;
   source_size_bytes: number | null;
@@ -110,10 +168,27 @@ export interface Job {
   started_at: string | null;
   completed_at: string | null;
   created_at: string;
+  // Not part of project detail; present once the job is loaded with getJob.
+  pipeline_stages?: PipelineStage[];
+  processing_metadata?: Record<string, unknown>;
+  result_r2_keys?: Record<string, string> | null;
+}
+
+export type JobEvent = Pick<
+  Job,
+  "id" | "type" | "status" | "progress" | "error_message" | "started_at" | "completed_at" | "created_at"
+> & {
+  project_id: string;
+  pipeline_stages?: PipelineStage[];
+};
+
+export interface JobDetail extends Job {
   pipeline_stages: PipelineStage[];
   external_task_ids: Record<string, string>;
   processing_metadata: Record<string, unknown>;
   result_r2_keys: Record<string, string> | null;
+  source_job_id: string | null;
+  input_payload: Record<string, unknown> | null;
 }
 
 export interface CreditBalance {
@@ -185,6 +260,7 @@ export interface SourceLookupResponse {
   hit: boolean;
   r2_key: string | null;
   source_asset_id: string | null;
+  sha256: string | null;
 }
 
 // ── Evaluation ──
@@ -256,6 +332,7 @@ export interface EvaluationResponse {
   version: string;
   avid_version: string | null;
   eogum_version: string | null;
+  revision?: number | null;
   schema_version: string | null;
   review_scope: string | null;
   join_strategy: string | null;
@@ -286,6 +363,23 @@ export interface EvaluationSavePayload {
   segments: EvalSegment[];
 }
 
+export interface EvaluationSegmentChange {
+  index: number;
+  human?: HumanDecision | null;
+  ai?: AiDecision | null;
+}
+
+export interface EvaluationDeltaPayload {
+  base_revision: number;
+  changes: EvaluationSegmentChange[];
+}
+
+export interface EvaluationDeltaResponse {
+  id: string;
+  revision: number;
+  updated_at: string;
+}
+
 export interface VideoUrlResponse {
   video_url: string;
   duration_ms: number;
@@ -300,6 +394,7 @@ export interface FinalPreviewJobResponse {
   captions_url: string | null;
   timeline_map_url: string | null;
   duration_ms: number | null;
+  evaluation_revision?: number | null;
 }
 
 export interface FinalPreviewTimelineInterval {
@@ -403,6 +498,8 @@ export interface YouTubeTaskResponse {
   filename: string | null;
   duration_seconds: number;
   filesize_bytes: number;
+  source_sha256: string | null;
+  queue_position: number | null;
 }
 
 // ── API Functions ──
@@ -442,17 +539,33 @@ export const api = {
     }),
 
   // Projects
-  lookupSource: (token: string, data: { sha256: string; size_bytes: number }) =>
+  lookupSource: (
+    token: string,
+    data: { sha256?: string; fingerprint?: string; size_bytes: number },
+  ) =>
     apiFetch<SourceLookupResponse>("/sources/lookup", token, {
       method: "POST",
       body: JSON.stringify(data),
     }),
 
-  listProjects: (token: string) => apiFetch<Project[]>("/projects", token),
+  listProjects: (
+    token: string,
+    options: { cursor?: string | null; limit?: number; sourceSha256?: string } = {}
+  ) => {
+    const params = new URLSearchParams();
+    if (options.cursor) params.set("cursor", options.cursor);
+    if (options.limit) params.set("limit", String(options.limit));
+    if (options.sourceSha256) params.set("source_sha256", options.sourceSha256);
+    const query = params.toString();
+    return apiFetch<ProjectPage>(query ? `/projects?${query}` : "/projects", token);
+  },
 
   getProject: (token: string | null | undefined, id: string) =>
     apiFetch<ProjectDetail>(`/projects/${id}`, token),
 
+  getJob: (token: string | null | undefined, projectId: string, jobId: string) =>
+    apiFetch<JobDetail>(`/projects/${projectId}/jobs/${jobId}`, token),
+
   createProject: (
     token: string,
     data: {
@@ -584,6 +697,12 @@ export const api = {
       body: JSON.stringify(payload),
     }),
 
+  patchEvaluation: (token: string, projectId: string, payload: EvaluationDeltaPayload) =>
+    apiFetch<EvaluationDeltaResponse>(`/projects/${projectId}/evaluation`, token, {
+      method: "PATCH",
+      body: JSON.stringify(payload),
+    }),
+
   startFinalPreview: (token: string | null | undefined, projectId: string, payload: EvaluationSavePayload) =>
     apiFetch<FinalPreviewJobResponse>(`/projects/${projectId}/final-preview`, token, {
       method: "POST",
@@ -629,7 +748,7 @@ export interface UploadFileOptions {
   signal?: AbortSignal;
 }
 
-function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+export function sleep(ms: number, signal?: AbortSignal): Promise<void> {
   return new Promise((resolve, reject) => {
     if (signal?.aborted) {
       reject(new DOMException("Aborted", "AbortError"));
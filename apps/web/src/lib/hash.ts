@@ -19,3 +19,31 @@ export async function sha256File(
 
   return hasher.digest("hex");
 }
+
+// Sampled fingerprint; must match eogum.services.source_cache.sample_fingerprint_file.
+const FINGERPRINT_VERSION = "fp1";
+const FINGERPRINT_BLOCK_BYTES = 1024 * 1024;
+const FINGERPRINT_STRIDED_BLOCKS = 16;
+
+function fingerprintRanges(size: number): Array<[number, number]> {
+  const block = FINGERPRINT_BLOCK_BYTES;
+  if (size <= block * (FINGERPRINT_STRIDED_BLOCKS + 2)) return [[0, size]];
+  const last = size - block;
+  const strides = FINGERPRINT_STRIDED_BLOCKS + 1;
+  const ranges: Array<[number, number]> = [[0, block]];
+  for (let index = 1; index < strides; index++) {
+    ranges.push([Math.floor((last * index) / strides), block]);
+  }
+  ranges.push([last, block]);
+  return ranges;
+}
+
+export async function sampledFingerprint(file: File): Promise<string> {
+  const hasher = await createSHA256();
+  hasher.init();
+  hasher.update(new TextEncoder().encode(`${FINGERPRINT_VERSION}:${file.size}:`));
+  for (const [offset, length] of fingerprintRanges(file.size)) {
+    hasher.update(new Uint8Array(await file.slice(offset, offset + length).arrayBuffer()));
+  }
+  return `${FINGERPRINT_VERSION}:${hasher.digest("hex")}`;
+}
@@ -0,0 +1,86 @@
+-- 평가 델타 저장
+-- Review actions append small per-segment deltas instead of rewriting the
+-- whole segments snapshot. `revision` counts every accepted write and is
+-- used for optimistic concurrency; `snapshot_revision` is the revision the
+-- `segments` column already includes. Deltas above it are replayed on read
+-- and periodically folded back into `segments` by the API.
+
+alter table public.evaluations
+  add column if not exists revision bigint not null default 0,
+  add column if not exists snapshot_revision bigint not null default 0;
+
+create table public.evaluation_deltas (
+  id uuid primary key default uuid_generate_v4(),
+  evaluation_id uuid not null references public.evaluations(id) on delete cascade,
+  revision bigint not null,
+  changes jsonb not null default '[]',
+  created_at timestamptz not null default now()
+);
+
+create unique index idx_evaluation_deltas_evaluation_revision
+  on public.evaluation_deltas(evaluation_id, revision);
+
+alter table public.evaluation_deltas enable row level security;
+
+create policy "Users can read own evaluation deltas"
+  on public.evaluation_deltas for select
+  using (
+    exists (
+      select 1 from public.evaluations e
+      where e.id = evaluation_id and e.evaluator_id = auth.uid()
+    )
+  );
+
+-- Appends one delta if `p_expected_revision` is still current.
+-- Returns no row when the evaluation does not exist; otherwise returns the
+-- evaluation's revision after the call and whether the delta was applied.
+create or replace function public.append_evaluation_delta(
+  p_project_id uuid,
+  p_evaluator_id uuid,
+  p_expected_revision bigint,
+  p_changes jsonb
+)
+returns table (
+  id uuid,
+  revision bigint,
+  snapshot_revision bigint,
+  applied boolean,
+  updated_at timestamptz
+)
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_evaluation public.evaluations%rowtype;
+begin
+  select * into v_evaluation
+  from public.evaluations e
+  where e.project_id = p_project_id
+    and e.evaluator_id = p_evaluator_id
+  for update;
+
+  if not found then
+    return;
+  end if;
+
+  if v_evaluation.revision <> p_expected_revision then
+    return query select
+      v_evaluation.id,
+      v_evaluation.revision,
+      v_evaluation.snapshot_revision,
+      false,
+      v_evaluation.updated_at;
+    return;
+  end if;
+
+  insert into public.evaluation_deltas (evaluation_id, revision, changes)
+  values (v_evaluation.id, v_evaluation.revision + 1, p_changes);
+
+  return query
+  update public.evaluations e
+  set revision = e.revision + 1
+  where e.id = v_evaluation.id
+  returning e.id, e.revision, e.snapshot_revision, true, e.updated_at;
+end;
+$$;
@@ -0,0 +1,23 @@
+-- Composite indexes for keyset-paginated listings and slim detail reads.
+
+create index if not exists idx_projects_user_created_id
+  on public.projects(user_id, created_at desc, id desc);
+
+-- Admin listings page over every user's projects.
+create index if not exists idx_projects_created_id
+  on public.projects(created_at desc, id desc);
+
+create index if not exists idx_projects_user_source_sha256
+  on public.projects(user_id, source_sha256)
+  where source_sha256 is not null;
+
+create index if not exists idx_jobs_project_created
+  on public.jobs(project_id, created_at);
+
+create index if not exists idx_credit_transactions_user_created_id
+  on public.credit_transactions(user_id, created_at desc, id desc);
+
+-- Superseded by the composite indexes above, which share their leading column.
+drop index if exists public.idx_projects_user;
+drop index if exists public.idx_jobs_project;
+drop index if exists public.idx_credit_transactions_user;
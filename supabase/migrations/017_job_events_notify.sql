@@ -0,0 +1,35 @@
+-- Broadcast job progress to every API node over LISTEN/NOTIFY.
+-- API nodes with SUPABASE_DB_URL set listen on `job_events` and relay each
+-- payload to their Server-Sent Events subscribers.
+
+create or replace function public.notify_job_event()
+returns trigger as $$
+declare
+  payload jsonb;
+begin
+  payload := jsonb_build_object(
+    'id', new.id,
+    'project_id', new.project_id,
+    'type', new.type,
+    'status', new.status,
+    'progress', new.progress,
+    'error_message', new.error_message,
+    'pipeline_stages', new.pipeline_stages,
+    'started_at', new.started_at,
+    'completed_at', new.completed_at,
+    'created_at', new.created_at
+  );
+  -- NOTIFY payloads are capped at 8000 bytes; drop the stage list rather
+  -- than the event when it does not fit.
+  if octet_length(payload::text) > 7900 then
+    payload := payload - 'pipeline_stages';
+  end if;
+  perform pg_notify('job_events', payload::text);
+  return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists jobs_notify_job_event on public.jobs;
+create trigger jobs_notify_job_event
+  after insert or update of status, progress, error_message, pipeline_stages on public.jobs
+  for each row execute function public.notify_job_event();
@@ -0,0 +1,34 @@
+-- Persist YouTube import downloads as jobs so any API node can report their
+-- status and a restarted node can requeue them. Downloads happen before a
+-- project exists, so these rows have no project_id.
+
+alter table public.jobs
+  alter column project_id drop not null;
+
+alter table public.jobs
+  drop constraint if exists jobs_type_check;
+
+alter table public.jobs
+  add constraint jobs_type_check
+  check (type in (
+    'transcribe',
+    'transcript_overview',
+    'subtitle_cut',
+    'podcast_cut',
+    'ai_frontier_cut',
+    'reprocess_multicam',
+    'final_preview',
+    'cut_decision',
+    'source_derive',
+    'ai_cut_render',
+    'youtube_download'
+  ));
+
+alter table public.jobs
+  add constraint jobs_project_required
+  check (project_id is not null or type = 'youtube_download');
+
+create index if not exists idx_jobs_youtube_download_active
+  on public.jobs(created_at)
+  where type = 'youtube_download'
+    and status in ('queued', 'pending', 'running');
@@ -0,0 +1,29 @@
+-- Cache YouTube metadata and imported sources by canonical video id so a
+-- repeat import reuses the R2 object instead of downloading it again.
+
+create table if not exists public.youtube_video_cache (
+  video_id text not null,
+  format_selector text not null,
+  metadata jsonb not null,
+  fetched_at timestamptz not null default now(),
+  primary key (video_id, format_selector)
+);
+
+alter table public.youtube_video_cache enable row level security;
+
+alter table public.source_assets
+  add column if not exists youtube_video_id text,
+  add column if not exists youtube_format text;
+
+create index if not exists idx_source_assets_youtube_video
+  on public.source_assets(youtube_video_id, youtube_format)
+  where youtube_video_id is not null;
+
+comment on table public.youtube_video_cache is
+  'yt-dlp metadata per video id and format selector; read by the API only.';
+
+comment on column public.source_assets.youtube_video_id is
+  'YouTube video id this source was imported from, for repeat-import reuse.';
+
+comment on column public.source_assets.youtube_format is
+  'yt-dlp format selector used for the import; different selectors give different bytes.';
@@ -0,0 +1,13 @@
+-- Sampled fingerprint for source lookup before the full SHA-256 is known.
+-- The browser sends it to /sources/lookup instead of hashing the whole file;
+-- the server fills it in next to sha256 whenever it reads a source.
+
+alter table public.source_assets
+  add column if not exists fingerprint text;
+
+create index if not exists idx_source_assets_fingerprint_size
+  on public.source_assets(fingerprint, size_bytes)
+  where fingerprint is not null;
+
+comment on column public.source_assets.fingerprint is
+  'fp1:<sha256 of size, head, tail and 16 strided 1 MiB blocks>; a lookup hint, sha256 stays authoritative.';
@@ -0,0 +1,28 @@
+-- Durable queue of R2 objects to delete. Project deletion and the orphan
+-- reconciler enqueue keys; a background worker on each API node deletes
+-- them in rate-limited batches and removes the rows.
+
+create table if not exists public.r2_deletion_queue (
+  id uuid primary key default gen_random_uuid(),
+  r2_key text not null unique,
+  reason text not null,
+  project_id uuid,
+  status text not null default 'pending'
+    check (status in ('pending', 'failed')),
+  attempts integer not null default 0,
+  last_error text,
+  not_before timestamptz not null default now(),
+  created_at timestamptz not null default now()
+);
+
+create index if not exists idx_r2_deletion_queue_due
+  on public.r2_deletion_queue(not_before)
+  where status = 'pending';
+
+alter table public.r2_deletion_queue enable row level security;
+
+comment on table public.r2_deletion_queue is
+  'R2 keys awaiting deletion; rows are removed once the object is gone. API only.';
+
+comment on column public.r2_deletion_queue.project_id is
+  'Project whose deletion queued the key, for auditing; not a foreign key since the project is gone.';
@@ -0,0 +1,70 @@
+-- 평가 스냅샷 저장 RPC
+-- A full review save used to read `revision`, upsert the snapshot and then
+-- prune deltas in three separate requests, so a delta appended in between
+-- could be pruned without ever reaching the snapshot. The whole save now
+-- runs in one function under the same row lock `append_evaluation_delta`
+-- takes.
+
+-- Both functions are security definer and must only be reachable with the
+-- service role key, like the credit functions in 011.
+revoke all on function public.append_evaluation_delta(uuid, uuid, bigint, jsonb) from public, anon, authenticated;
+grant execute on function public.append_evaluation_delta(uuid, uuid, bigint, jsonb) to service_role;
+
+-- Replaces the snapshot, bumps `revision` (so clients holding an older
+-- revision conflict on their next delta) and drops the superseded deltas.
+create or replace function public.save_evaluation_snapshot(
+  p_project_id uuid,
+  p_evaluator_id uuid,
+  p_segments jsonb,
+  p_avid_version text,
+  p_eogum_version text
+)
+returns setof public.evaluations
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_evaluation public.evaluations%rowtype;
+begin
+  select * into v_evaluation
+  from public.evaluations e
+  where e.project_id = p_project_id
+    and e.evaluator_id = p_evaluator_id
+  for update;
+
+  if found then
+    update public.evaluations e
+    set segments = p_segments,
+        avid_version = p_avid_version,
+        eogum_version = p_eogum_version,
+        revision = e.revision + 1,
+        snapshot_revision = e.revision + 1
+    where e.id = v_evaluation.id
+    returning e.* into v_evaluation;
+  else
+    -- A concurrent first save may insert the row first; the conflict branch
+    -- locks that row, so this still behaves like the update above.
+    insert into public.evaluations as e (
+      project_id, evaluator_id, segments, avid_version, eogum_version
+    )
+    values (p_project_id, p_evaluator_id, p_segments, p_avid_version, p_eogum_version)
+    on conflict (project_id, evaluator_id) do update
+    set segments = excluded.segments,
+        avid_version = excluded.avid_version,
+        eogum_version = excluded.eogum_version,
+        revision = e.revision + 1,
+        snapshot_revision = e.revision + 1
+    returning e.* into v_evaluation;
+  end if;
+
+  delete from public.evaluation_deltas d
+  where d.evaluation_id = v_evaluation.id
+    and d.revision <= v_evaluation.revision;
+
+  return next v_evaluation;
+end;
+$$;
+
+revoke all on function public.save_evaluation_snapshot(uuid, uuid, jsonb, text, text) from public, anon, authenticated;
+grant execute on function public.save_evaluation_snapshot(uuid, uuid, jsonb, text, text) to service_role;
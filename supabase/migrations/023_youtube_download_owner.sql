@@ -0,0 +1,18 @@
+-- Record which API node owns a YouTube download and when it last checked in.
+-- The owner refreshes heartbeat_at while the download is queued or running;
+-- recovery only claims rows whose heartbeat is stale, so downloads still
+-- running on another live node are left alone.
+
+-- The default stamps existing rows (and rows inserted by nodes that predate
+-- this migration) as checked in now, so they become claimable only once the
+-- stale window passes without a refresh.
+alter table public.jobs
+  add column if not exists owner_node text,
+  add column if not exists heartbeat_at timestamptz not null default now();
+
+drop index if exists public.idx_jobs_youtube_download_active;
+
+create index if not exists idx_jobs_youtube_download_heartbeat
+  on public.jobs(heartbeat_at)
+  where type = 'youtube_download'
+    and status in ('queued', 'pending', 'running');
@@ -0,0 +1,12 @@
+-- When the reconciler read the database references that showed a queued
+-- orphan as unreferenced. Before deleting, the drain worker re-checks the
+-- JSON reference columns only on rows that changed after this time.
+-- Null for keys queued by project deletion.
+
+alter table public.r2_deletion_queue
+  add column if not exists scanned_at timestamptz;
+
+-- The re-check filters reference rows by these timestamps.
+create index if not exists idx_projects_updated_at on public.projects(updated_at);
+create index if not exists idx_jobs_created_at on public.jobs(created_at);
+create index if not exists idx_jobs_completed_at on public.jobs(completed_at);